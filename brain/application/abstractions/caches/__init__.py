@@ -0,0 +1,2 @@
+from .principals import IPrincipalCache
+from .suggestions import IWikilinkSuggestionIndex
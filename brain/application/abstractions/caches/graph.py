@@ -0,0 +1,122 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.caches.models import (
+    CacheStats,
+    GraphChangeLog,
+    NoteLinksChange,
+)
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.domain.entities.graph import GraphData, GraphDelta
+
+
+class INotesGraphIndex(Protocol):
+    """
+    Интерфейс графа заметок пользователя в памяти процесса.
+
+    Актуальность проверяется по версии пользователя, общей для всех
+    процессов: граф, загруженный для другой версии, не используется.
+    """
+
+    @abstractmethod
+    async def get_version(self, user_id: UUID) -> int | None:
+        """
+        Текущая версия графа пользователя или None, если она недоступна.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_graph(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None = None,
+        depth: int = 1,
+        max_nodes: int | None = None,
+    ) -> GraphData | None:
+        """
+        Граф из памяти или None, если графа этой версии нет. Обход
+        останавливается после `max_nodes` посещённых вершин.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, user_id: UUID, version: int, notes: Sequence[NoteLinks]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apply_changes(
+        self,
+        user_id: UUID,
+        updated: Sequence[NoteLinks] = (),
+        deleted_ids: Sequence[UUID] = (),
+        previous: Sequence[NoteLinks] = (),
+    ) -> None:
+        """
+        Вызывается после фиксации транзакции: повышает версию пользователя,
+        записывает изменение в журнал и, если локальный граф был актуален,
+        обновляет его на месте. `previous` — состояние изменённых и
+        удалённых заметок до транзакции, новые заметки в нём не указываются.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_change_log(self, user_id: UUID, since: int) -> GraphChangeLog | None:
+        """
+        Текущая версия и изменения заметок после версии `since`,
+        или None, если версия недоступна.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_delta(
+        self,
+        user_id: UUID,
+        version: int,
+        changes: Sequence[NoteLinksChange],
+    ) -> GraphDelta | None:
+        """
+        Изменения полного графа, вызванные `changes`, или None,
+        если графа этой версии нет.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, CacheStats]:
+        raise NotImplementedError
+
+
+class IGraphCache(Protocol):
+    """
+    Интерфейс общего для всех процессов кэша готовых графов.
+
+    Записи привязаны к версии графа пользователя, поэтому не
+    инвалидируются: после изменения заметок они просто не запрашиваются.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None,
+        depth: int,
+    ) -> GraphData | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None,
+        depth: int,
+        graph: GraphData,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, CacheStats]:
+        raise NotImplementedError
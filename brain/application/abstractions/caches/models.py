@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from brain.application.abstractions.repositories.models import NoteLinks
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class NoteLinksChange:
+    note_id: UUID
+    # None when the note did not exist before or does not exist after.
+    before: NoteLinks | None
+    after: NoteLinks | None
+
+
+@dataclass
+class GraphChangeLog:
+    version: int
+    # Net change of every note touched after the requested version, or
+    # None when the log no longer reaches back that far.
+    changes: list[NoteLinksChange] | None
@@ -0,0 +1,31 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.caches.models import CacheStats
+from brain.domain.entities.user import User
+
+
+class IPrincipalCache(Protocol):
+    """
+    Интерфейс кэша пользователей для авторизации запросов
+    """
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> User | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, user: User) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, user_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, CacheStats]:
+        """
+        Счётчики попаданий по уровням кэша в текущем процессе.
+        """
+        raise NotImplementedError
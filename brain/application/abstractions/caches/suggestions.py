@@ -0,0 +1,86 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.caches.models import CacheStats
+from brain.application.abstractions.repositories.models import (
+    WikilinkCandidates,
+    WikilinkSuggestion,
+)
+
+
+class IWikilinkSuggestionIndex(Protocol):
+    """
+    Интерфейс индекса подсказок wikilink в памяти процесса.
+
+    Актуальность проверяется по версии пользователя, общей для всех
+    процессов: индекс, построенный для другой версии, не используется.
+    """
+
+    @abstractmethod
+    async def get_version(self, user_id: UUID) -> int | None:
+        """
+        Текущая версия данных пользователя или None, если она недоступна.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str,
+        limit: int,
+    ) -> list[WikilinkSuggestion] | None:
+        """
+        Подсказки из памяти или None, если индекса этой версии нет.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def search_fuzzy(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str,
+        limit: int,
+        threshold: float,
+    ) -> list[WikilinkSuggestion] | None:
+        """
+        Подсказки с триграммной близостью к `query` не ниже `threshold`,
+        лучшие первыми. None, если индекса этой версии нет или триграммный
+        индекс не помещается в лимит памяти.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def fits_fuzzy(self, user_id: UUID, version: int) -> bool:
+        """
+        Хватает ли памяти на триграммный индекс пользователя. Если нет,
+        search_fuzzy возвращает None, и нечёткий поиск нужно выполнять в БД.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, user_id: UUID, version: int, candidates: WikilinkCandidates) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apply_changes(
+        self,
+        user_id: UUID,
+        added_titles: Sequence[str] = (),
+        removed_titles: Sequence[str] = (),
+        added_keywords: Sequence[str] = (),
+        removed_keywords: Sequence[str] = (),
+    ) -> None:
+        """
+        Вызывается после фиксации транзакции: повышает версию пользователя
+        и, если локальный индекс был актуален, обновляет его на месте.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, CacheStats]:
+        raise NotImplementedError
@@ -0,0 +1,54 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.repositories.models import GraphSyncOutboxStats
+from brain.domain.entities.graph_sync import GraphSyncEvent
+
+
+class IGraphSyncOutboxRepository(Protocol):
+    """
+    Интерфейс outbox-очереди синхронизации графа
+    """
+
+    @abstractmethod
+    async def add(self, entity: GraphSyncEvent) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_pending(
+        self, limit: int, max_attempts: int, ready_before: datetime
+    ) -> list[GraphSyncEvent]:
+        """
+        Блокирует все необработанные события для не более чем `limit`
+        заметок, у которых самое раннее событие создано не позже
+        `ready_before`, пропуская уже заблокированные другими воркерами.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_processed(
+        self, event_ids: list[UUID], coalesced: bool = False
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_attempts(self, event_ids: list[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_stats(self, user_id: UUID, max_attempts: int) -> GraphSyncOutboxStats:
+        """
+        Статистика событий пользователя. Счётчики processed/coalesced охватывают только ещё не удалённые
+        обработанные события.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_processed_before(self, before: datetime) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_all(self) -> None:
+        raise NotImplementedError
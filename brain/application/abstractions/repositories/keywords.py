@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from brain.domain.entities.keyword import Keyword
+from brain.domain.entities.note_keyword import NoteKeyword
 
 
 class IKeywordsRepository(Protocol):
@@ -18,13 +19,41 @@ class IKeywordsRepository(Protocol):
     async def ensure_keywords(self, user_id: UUID, names: list[str]) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_keyword(self, user_id: UUID, name: str) -> UUID:
+        """
+        Создаёт ключевое слово, если его нет, и возвращает его id
+        одним запросом.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ensure_keyword_ids(
+        self,
+        user_id: UUID,
+        names: list[str],
+    ) -> dict[str, UUID]:
+        """
+        Пакетный вариант `upsert_keyword`: возвращает отображение
+        нормализованное имя -> id.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_note_keywords(self, entities: list[NoteKeyword]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def replace_note_keywords(
         self,
         note_id: UUID,
         user_id: UUID,
         names: list[str],
-    ) -> None:
+    ) -> list[str]:
+        """
+        Приводит ссылки заметки на ключевые слова к `names`, затрагивая
+        только добавленные и удалённые строки. Возвращает имена удалённых.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -36,5 +65,9 @@ class IKeywordsRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_unused_keywords(self, user_id: UUID, names: list[str]) -> None:
+    async def delete_unused_keywords(self, user_id: UUID, names: list[str]) -> list[str]:
+        """
+        Удаляет ключевые слова из `names`, на которые больше не ссылается
+        ни одна заметка. Возвращает имена удалённых.
+        """
         raise NotImplementedError
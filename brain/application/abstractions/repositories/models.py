@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
 
 
 @dataclass
@@ -8,7 +10,90 @@ class WikilinkSuggestion:
     represents_keyword: bool
 
 
+@dataclass
+class WikilinkCandidates:
+    note_titles: list[str]
+    keyword_names: list[str]
+
+
 @dataclass
 class NoteCreationStat:
     date: date
     count: int
+
+
+@dataclass
+class GraphSyncOutboxStats:
+    pending: int
+    failed: int
+    oldest_pending_at: datetime | None
+    processed: int
+    coalesced: int
+
+
+class NoteListOrder(str, Enum):
+    UPDATED_AT = "updated_at"
+    CREATED_AT = "created_at"
+
+
+class NoteListFields(str, Enum):
+    FULL = "full"
+    PREVIEW = "preview"
+    SUMMARY = "summary"
+
+
+@dataclass
+class NoteCursor:
+    sort_value: datetime
+    note_id: UUID
+
+
+@dataclass
+class NoteListItem:
+    id: UUID
+    title: str
+    text: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass
+class NoteSearchCursor:
+    rank: float
+    note_id: UUID
+
+
+@dataclass
+class NoteSearchHit:
+    id: UUID
+    title: str
+    snippet: str
+    rank: float
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass
+class BacklinkSource:
+    note_id: UUID
+    title: str
+    text: str | None
+    # Target title as written in the link, to find it in the text.
+    target_title: str
+    updated_at: datetime
+
+
+@dataclass
+class Backlink:
+    note_id: UUID
+    title: str
+    snippet: str
+    updated_at: datetime
+
+
+@dataclass
+class NoteLinks:
+    note_id: UUID
+    title: str
+    # Titles the note links to, as written in its text.
+    targets: list[str]
@@ -0,0 +1,54 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.repositories.models import BacklinkSource, NoteLinks
+
+
+class INoteLinksRepository(Protocol):
+    """
+    Интерфейс таблицы разрешённых wikilink-ссылок между заметками
+    """
+
+    @abstractmethod
+    async def replace_links(self, user_id: UUID, links: dict[UUID, list[str]]) -> None:
+        """
+        Заменяет исходящие ссылки заметок-ключей на ссылки на заголовки
+        из значений, сразу связывая их с существующими заметками.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def resolve_targets(self, user_id: UUID, note_ids_by_title: dict[str, UUID]) -> None:
+        """
+        Направляет ссылки на заголовок на заметку с этим заголовком.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unresolve_target(self, note_id: UUID) -> None:
+        """
+        Отвязывает ссылки от заметки, например после её переименования.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_backlinks(
+        self,
+        user_id: UUID,
+        note_id: UUID,
+        limit: int,
+        after: UUID | None = None,
+    ) -> list[BacklinkSource]:
+        """
+        Заметки пользователя, ссылающиеся на `note_id`, с их текстом, по
+        возрастанию id и начиная после `after`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_links(self, user_id: UUID) -> list[NoteLinks]:
+        """
+        Все заметки пользователя с заголовками, на которые они ссылаются.
+        """
+        raise NotImplementedError
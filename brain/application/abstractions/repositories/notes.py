@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 from uuid import UUID
 
 from brain.domain.entities.note import Note
 from brain.application.abstractions.repositories.models import (
+    WikilinkCandidates,
     WikilinkSuggestion,
     NoteCreationStat,
+    NoteCursor,
+    NoteListFields,
+    NoteListItem,
+    NoteListOrder,
+    NoteSearchCursor,
+    NoteSearchHit,
 )
 
 
@@ -19,6 +26,10 @@ class INotesRepository(Protocol):
     async def create(self, entity: Note):
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, entities: list[Note]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_user_telegram_id(
         self,
@@ -28,6 +39,28 @@ class INotesRepository(Protocol):
     ) -> list[Note]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_page(
+        self,
+        user_id: UUID,
+        order_by: NoteListOrder,
+        fields: NoteListFields,
+        limit: int | None = None,
+        after: NoteCursor | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        preview_length: int = 0,
+    ) -> list[NoteListItem]:
+        """
+        Страница заметок, новые первыми, строго после курсора `after`.
+        Из БД читаются только колонки, нужные для `fields`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_by_user_id(self, user_id: UUID) -> AsyncIterator[Note]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, entity_id: UUID) -> Note:
         raise NotImplementedError
@@ -42,7 +75,27 @@ class INotesRepository(Protocol):
         user_id: UUID,
         query: str,
         exact_match: bool = False,
+        fuzzy_threshold: float | None = None,
+        limit: int | None = None,
     ) -> list[Note]:
+        """
+        С `fuzzy_threshold` ищет заголовки с триграммной близостью не ниже
+        порога, лучшие первыми, вместо поиска подстроки.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_text(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        after: NoteSearchCursor | None = None,
+    ) -> list[NoteSearchHit]:
+        """
+        Полнотекстовый поиск по заголовку и тексту (синтаксис websearch_to_tsquery).
+        Результаты упорядочены по (rank, id) по убыванию, строго после `after`.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -66,6 +119,22 @@ class INotesRepository(Protocol):
     ) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_first_free_title_index(self, user_id: UUID, prefix: str) -> int:
+        """
+        Возвращает наименьшее N >= 1, для которого у пользователя нет заметки
+        "{prefix} N". Блокирует выделение для пользователя до конца транзакции.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_titles(
+        self,
+        user_id: UUID,
+        titles: list[str],
+    ) -> set[str]:
+        raise NotImplementedError
+
     @abstractmethod
     async def count_keyword_notes_by_user_and_title(
         self,
@@ -84,12 +153,28 @@ class INotesRepository(Protocol):
     ) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_wikilink_candidates(self, user_id: UUID) -> WikilinkCandidates:
+        """
+        Все заголовки заметок-ключевых слов и все ключевые слова пользователя
+        для построения индекса подсказок.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_wikilink_suggestions(
         self,
         user_id: UUID,
         query: str,
+        limit: int = 20,
+        fuzzy_threshold: float | None = None,
     ) -> list[WikilinkSuggestion]:
+        """
+        Заголовки заметок-ключевых слов и ключевые слова без заметок, содержащие
+        `query`. Сначала совпадения по префиксу, затем по триграммной близости.
+        С `fuzzy_threshold` подстрока не требуется: отбор и порядок только
+        по близости.
+        """
         raise NotImplementedError
 
     @abstractmethod
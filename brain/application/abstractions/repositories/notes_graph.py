@@ -11,6 +11,14 @@ class INotesGraphRepository(Protocol):
     async def upsert_note(self, note: Note):
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_notes_bulk(
+        self,
+        notes: list[Note],
+        link_targets: dict[UUID, list[str]],
+    ):
+        raise NotImplementedError
+
     @abstractmethod
     async def sync_connections(
         self,
@@ -19,6 +27,7 @@ class INotesGraphRepository(Protocol):
         previous_title: str | None = None,
         previous_represents_keyword_id: UUID | None = None,
     ):
+        """Upsert the note node and rebuild its connections atomically."""
         raise NotImplementedError
 
     @abstractmethod
@@ -41,5 +50,11 @@ class INotesGraphRepository(Protocol):
         user_id: UUID,
         query: str | None = None,
         depth: int = 1,
+        max_nodes: int | None = None,
     ) -> GraphData:
+        """
+        The whole graph, or the nodes within `depth` hops of those matching
+        `query`. The walk stops once it has visited `max_nodes` nodes and
+        marks the result as truncated.
+        """
         raise NotImplementedError
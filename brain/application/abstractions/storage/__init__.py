@@ -1 +1,2 @@
+from .related_notes import IRelatedNotesIndex
 from .user_profile_pictures import IProfilePictureStorage
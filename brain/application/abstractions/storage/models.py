@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass
+class RelatedNote:
+    note_id: UUID
+    title: str
+    score: float
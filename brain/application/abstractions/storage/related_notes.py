@@ -0,0 +1,50 @@
+from abc import abstractmethod
+from collections.abc import Iterable, Sequence
+from typing import Protocol
+from uuid import UUID
+
+from brain.application.abstractions.storage.models import RelatedNote
+from brain.domain.entities.note import Note
+
+
+class IRelatedNotesIndex(Protocol):
+    """
+    Интерфейс хранилища TF-IDF векторов заметок пользователя.
+
+    Векторы строит и обновляет воркер; API только читает их.
+    """
+
+    @abstractmethod
+    def find_related(self, user_id: UUID, note_id: UUID, limit: int) -> list[RelatedNote] | None:
+        """
+        Самые похожие по тексту заметки, лучшие первыми.
+        None, если заметки ещё нет в индексе.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, user_id: UUID) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild(self, user_id: UUID, notes: Iterable[Note]) -> None:
+        """
+        Строит индекс пользователя заново из всех его заметок.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply_changes(
+        self,
+        user_id: UUID,
+        updated: Sequence[Note] = (),
+        deleted_ids: Sequence[UUID] = (),
+    ) -> None:
+        """
+        Пересчитывает векторы изменённых заметок и убирает удалённые.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def drop(self, user_id: UUID) -> None:
+        raise NotImplementedError
@@ -0,0 +1,54 @@
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from types import TracebackType
+from typing import Protocol
+
+
+class IUnitOfWork(Protocol):
+    """
+    Интерфейс единицы работы: одна транзакция на use case.
+
+    Репозитории внутри неё только отправляют изменения в БД (flush),
+    фиксирует их выход из самого внешнего `async with`. Вложенные
+    `async with` (use case, вызывающий другой use case) транзакцию
+    не завершают.
+    """
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """
+        Выполнить `hook` после успешной фиксации транзакции; при откате
+        он отбрасывается.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """
+        Вложенная транзакция (SAVEPOINT) внутри текущей: ошибка в блоке
+        откатывает только его изменения и хуки, добавленные в нём, а
+        внешняя транзакция остаётся рабочей.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aenter__(self) -> "IUnitOfWork":
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
@@ -1,12 +1,21 @@
+from .notes.backfill_related_notes import BackfillRelatedNotesInteractor
 from .notes.create_note import CreateNoteInteractor
 from .notes.delete_note import DeleteNoteInteractor
+from .notes.get_backlinks import GetBacklinksInteractor
 from .notes.get_note import GetNoteInteractor
 from .notes.get_notes import GetNotesInteractor
+from .notes.get_related_notes import GetRelatedNotesInteractor
+from .notes.list_notes import ListNotesInteractor
 from .notes.get_note_creation_stats import GetNoteCreationStatsInteractor
+from .notes.search_notes import SearchNotesInteractor
 from .notes.search_notes_by_title import SearchNotesByTitleInteractor
 from .notes.search_wikilink_suggestions import SearchWikilinkSuggestionsInteractor
 from .notes.update_note import UpdateNoteInteractor
 from .graph.get_graph import GetGraphInteractor
+from .graph.get_graph_changes import GetGraphChangesInteractor
+from .graph.get_sync_status import GetGraphSyncStatusInteractor
+from .graph.process_sync_outbox import ProcessGraphSyncOutboxInteractor
+from .metrics.get_cache_metrics import GetCacheMetricsInteractor
 from .users.get_user import GetUserInteractor
 from .users.interactor import UserInteractor
 from .users.upload_profile_picture import UploadUserProfilePictureInteractor
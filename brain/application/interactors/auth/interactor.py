@@ -16,6 +16,8 @@ from brain.application.abstractions.token_verifier import (
 from brain.application.abstractions.repositories.jwt import (
     IJwtRefreshTokensRepository,
 )
+from brain.application.abstractions.unit_of_work import IUnitOfWork
+from brain.application.abstractions.caches.principals import IPrincipalCache
 
 from brain.config.models import AuthenticationConfig
 from brain.domain.entities.jwt import JwtAccessToken, FullJwtToken, JwtRefreshToken
@@ -29,11 +31,15 @@ class AuthInteractor:
         auth_config: AuthenticationConfig,
         jwt_service: TokenVerifier,
         jwt_repo: IJwtRefreshTokensRepository,
+        principal_cache: IPrincipalCache,
+        uow: IUnitOfWork,
     ):
         self._user_interactor = user_interactor
         self._auth_config = auth_config
         self._jwt_service = jwt_service
         self._jwt_repo = jwt_repo
+        self._principal_cache = principal_cache
+        self._uow = uow
 
     def _create_jwt_token(
         self,
@@ -100,11 +106,13 @@ class AuthInteractor:
         self, telegram_id: int
     ) -> JwtRefreshToken:
         user = await self._user_interactor.get_user_by_telegram_id(telegram_id)
-        return await self._create_refresh_token_for_user(user.id)
+        async with self._uow:
+            return await self._create_refresh_token_for_user(user.id)
 
     async def login(self, telegram_id: int) -> FullJwtToken:
         user = await self._user_interactor.get_user_by_telegram_id(telegram_id)
-        tokens, _ = await self._issue_tokens_for_user_id(user.id)
+        async with self._uow:
+            tokens, _ = await self._issue_tokens_for_user_id(user.id)
         return tokens
 
     async def refresh_tokens(self, refresh_token: str) -> FullJwtToken:
@@ -117,12 +125,14 @@ class AuthInteractor:
         if token_record.user_id != payload.user_id:
             raise JwtTokenInvalidException()
 
-        await self._jwt_repo.delete_by_id(token_record.id)
-        tokens, _ = await self._issue_tokens_for_user_id(token_record.user_id)
+        async with self._uow:
+            await self._jwt_repo.delete_by_id(token_record.id)
+            tokens, _ = await self._issue_tokens_for_user_id(token_record.user_id)
         return tokens
 
     async def revoke_refresh_token(self, token_id: UUID) -> None:
-        await self._jwt_repo.delete_by_id(token_id)
+        async with self._uow:
+            await self._jwt_repo.delete_by_id(token_id)
 
     async def build_tokens_for_refresh_token_id(
         self, token_id: UUID
@@ -143,5 +153,8 @@ class AuthInteractor:
 
     async def authorize_by_token(self, token: str) -> User:
         payload = self._decode_jwt_token(token)
-        user = await self._user_interactor.get_user_by_id(payload.user_id)
+        user = await self._principal_cache.get(payload.user_id)
+        if user is None:
+            user = await self._user_interactor.get_user_by_id(payload.user_id)
+            await self._principal_cache.set(user)
         return user
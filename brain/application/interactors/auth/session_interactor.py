@@ -3,6 +3,7 @@ from uuid import uuid4
 from brain.application.abstractions.repositories.tg_bot_auth import (
     ITelegramBotAuthSessionsRepository,
 )
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.auth.exceptions import (
     TelegramBotAuthSessionNotFoundException,
 )
@@ -16,9 +17,11 @@ class TelegramBotAuthSessionInteractor:
         self,
         sessions_repo: ITelegramBotAuthSessionsRepository,
         auth_interactor: AuthInteractor,
+        uow: IUnitOfWork,
     ):
         self._sessions_repo = sessions_repo
         self._auth_interactor = auth_interactor
+        self._uow = uow
 
     def _generate_session_id(self) -> str:
         return uuid4().hex[:16]
@@ -32,7 +35,8 @@ class TelegramBotAuthSessionInteractor:
                     id=session_id,
                     telegram_id=None,
                 )
-                await self._sessions_repo.create(session)
+                async with self._uow:
+                    await self._sessions_repo.create(session)
                 return session
             session_id = self._generate_session_id()
 
@@ -40,7 +44,8 @@ class TelegramBotAuthSessionInteractor:
             id=session_id,
             telegram_id=None,
         )
-        await self._sessions_repo.create(session)
+        async with self._uow:
+            await self._sessions_repo.create(session)
         return session
 
     async def get_session(self, session_id: str) -> TelegramBotAuthSession:
@@ -50,16 +55,17 @@ class TelegramBotAuthSessionInteractor:
         return session
 
     async def attach_user_to_session(self, session_id: str, telegram_id: int) -> bool:
-        refresh_token = await self._auth_interactor.issue_refresh_token_for_telegram_id(
-            telegram_id
-        )
-        updated = await self._sessions_repo.attach_user_if_empty(
-            session_id=session_id,
-            telegram_id=telegram_id,
-            jwt_token_id=refresh_token.id,
-        )
-        if not updated:
-            await self._auth_interactor.revoke_refresh_token(refresh_token.id)
+        async with self._uow:
+            refresh_token = await self._auth_interactor.issue_refresh_token_for_telegram_id(
+                telegram_id
+            )
+            updated = await self._sessions_repo.attach_user_if_empty(
+                session_id=session_id,
+                telegram_id=telegram_id,
+                jwt_token_id=refresh_token.id,
+            )
+            if not updated:
+                await self._auth_interactor.revoke_refresh_token(refresh_token.id)
         return updated
 
     async def get_session_with_tokens(
@@ -1,13 +1,20 @@
 from dishka import Provider, Scope, provide
 
 from brain.application.interactors import (
+    BackfillRelatedNotesInteractor,
     CreateNoteInteractor,
     DeleteNoteInteractor,
+    GetBacklinksInteractor,
     GetGraphInteractor,
+    GetGraphChangesInteractor,
+    GetGraphSyncStatusInteractor,
     GetUserInteractor,
     GetNoteInteractor,
     GetNotesInteractor,
+    GetRelatedNotesInteractor,
+    ListNotesInteractor,
     GetNoteCreationStatsInteractor,
+    SearchNotesInteractor,
     SearchNotesByTitleInteractor,
     SearchWikilinkSuggestionsInteractor,
     UpdateNoteInteractor,
@@ -15,6 +22,8 @@ from brain.application.interactors import (
     ExportNotesInteractor,
     ImportNotesInteractor,
     UploadUserProfilePictureInteractor,
+    ProcessGraphSyncOutboxInteractor,
+    GetCacheMetricsInteractor,
 )
 from brain.application.interactors.users.update_all_profile_pictures import (
     UpdateAllUsersProfilePicturesInteractor,
@@ -22,6 +31,7 @@ from brain.application.interactors.users.update_all_profile_pictures import (
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_titles import NoteTitleService
 from brain.application.services.note_keyword_sync import NoteKeywordSyncService
+from brain.application.services.related_notes import RelatedNotesService
 from brain.application.interactors.auth.interactor import AuthInteractor
 from brain.application.interactors.auth.session_interactor import (
     TelegramBotAuthSessionInteractor,
@@ -40,14 +50,24 @@ class InteractorProvider(Provider):
     get_keyword_note_service = provide(KeywordNoteService, scope=Scope.REQUEST)
     get_note_title_service = provide(NoteTitleService, scope=Scope.REQUEST)
     get_note_keyword_sync_service = provide(NoteKeywordSyncService, scope=Scope.REQUEST)
+    get_related_notes_service = provide(RelatedNotesService, scope=Scope.REQUEST)
     get_create_note_interactor = provide(CreateNoteInteractor, scope=Scope.REQUEST)
     get_update_note_interactor = provide(UpdateNoteInteractor, scope=Scope.REQUEST)
     get_delete_note_interactor = provide(DeleteNoteInteractor, scope=Scope.REQUEST)
     get_get_notes_interactor = provide(GetNotesInteractor, scope=Scope.REQUEST)
+    get_list_notes_interactor = provide(ListNotesInteractor, scope=Scope.REQUEST)
+    get_get_backlinks_interactor = provide(GetBacklinksInteractor, scope=Scope.REQUEST)
+    get_get_related_notes_interactor = provide(
+        GetRelatedNotesInteractor, scope=Scope.REQUEST
+    )
+    get_backfill_related_notes_interactor = provide(
+        BackfillRelatedNotesInteractor, scope=Scope.REQUEST
+    )
     get_get_note_creation_stats_interactor = provide(
         GetNoteCreationStatsInteractor, scope=Scope.REQUEST
     )
     get_get_note_interactor = provide(GetNoteInteractor, scope=Scope.REQUEST)
+    get_search_notes_interactor = provide(SearchNotesInteractor, scope=Scope.REQUEST)
     get_search_notes_by_title_interactor = provide(
         SearchNotesByTitleInteractor, scope=Scope.REQUEST
     )
@@ -55,6 +75,18 @@ class InteractorProvider(Provider):
         SearchWikilinkSuggestionsInteractor, scope=Scope.REQUEST
     )
     get_get_graph_interactor = provide(GetGraphInteractor, scope=Scope.REQUEST)
+    get_get_graph_changes_interactor = provide(
+        GetGraphChangesInteractor, scope=Scope.REQUEST
+    )
+    get_get_graph_sync_status_interactor = provide(
+        GetGraphSyncStatusInteractor, scope=Scope.REQUEST
+    )
+    get_process_graph_sync_outbox_interactor = provide(
+        ProcessGraphSyncOutboxInteractor, scope=Scope.REQUEST
+    )
+    get_get_cache_metrics_interactor = provide(
+        GetCacheMetricsInteractor, scope=Scope.REQUEST
+    )
     get_auth_interactor = provide(AuthInteractor, scope=Scope.REQUEST)
     get_telegram_bot_auth_session_interactor = provide(
         TelegramBotAuthSessionInteractor, scope=Scope.REQUEST
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from brain.domain.entities.graph import GraphData, GraphDelta
+
+
+@dataclass
+class GraphSyncStatus:
+    pending: int
+    failed: int
+    oldest_pending_at: datetime | None
+    lag_seconds: float
+    processed: int
+    # Syncs skipped because a later edit of the same note superseded them.
+    coalesced: int
+
+
+@dataclass
+class VersionedGraph:
+    # None when the graph is unchanged since the version the caller knows.
+    graph: GraphData | None
+    # None when the graph could not be tied to a version: Redis is down or
+    # it was read from the graph backend, which lags behind note writes.
+    version: int | None
+
+
+@dataclass
+class GraphChanges:
+    # None when the version could not be read; the snapshot then comes
+    # from the graph backend.
+    version: int | None
+    # Exactly one is set: the delta since the requested version, or the
+    # full graph when the change log does not reach back that far.
+    delta: GraphDelta | None
+    snapshot: GraphData | None
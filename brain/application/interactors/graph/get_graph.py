@@ -1,21 +1,89 @@
 from uuid import UUID
 
+from brain.application.abstractions.caches.graph import IGraphCache, INotesGraphIndex
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
-from brain.domain.entities.graph import GraphData
+from brain.application.interactors.graph.dto import VersionedGraph
+from brain.config.models import GraphConfig
 
 
 class GetGraphInteractor:
-    def __init__(self, notes_graph_repo: INotesGraphRepository):
+    def __init__(
+        self,
+        notes_graph_repo: INotesGraphRepository,
+        note_links_repo: INoteLinksRepository,
+        graph_index: INotesGraphIndex,
+        graph_cache: IGraphCache,
+        graph_config: GraphConfig,
+    ):
         self._notes_graph_repo = notes_graph_repo
+        self._note_links_repo = note_links_repo
+        self._graph_index = graph_index
+        self._graph_cache = graph_cache
+        self._max_depth = graph_config.max_depth
+        self._max_nodes = graph_config.max_nodes
 
     async def get_graph(
         self,
         user_id: UUID,
         query: str | None = None,
         depth: int = 1,
-    ) -> GraphData:
-        return await self._notes_graph_repo.get_graph(
+        known_version: int | None = None,
+    ) -> VersionedGraph:
+        """
+        Graph of the user and its version. The graph is left out, and
+        nothing is computed, when the version equals `known_version`.
+        """
+        depth_capped = bool(query) and depth > self._max_depth
+        depth = min(depth, self._max_depth)
+        version = await self._graph_index.get_version(user_id)
+        if version is not None and version == known_version:
+            return VersionedGraph(graph=None, version=version)
+
+        result = await self._get_graph(user_id, version, query, depth)
+        if depth_capped:
+            result.graph.truncated = True
+        return result
+
+    async def _get_graph(
+        self,
+        user_id: UUID,
+        version: int | None,
+        query: str | None,
+        depth: int,
+    ) -> VersionedGraph:
+        if version is None:
+            # Without a shared version the in-memory graph could be stale.
+            return await self._get_graph_from_repo(user_id, query, depth)
+
+        graph = await self._graph_cache.get(user_id, version, query, depth)
+        if graph is not None:
+            return VersionedGraph(graph=graph, version=version)
+
+        graph = self._graph_index.get_graph(user_id, version, query, depth, self._max_nodes)
+        if graph is None:
+            # note_links is written with the note itself, so unlike the
+            # graph backend it never lags behind the outbox worker.
+            notes = await self._note_links_repo.get_user_links(user_id)
+            self._graph_index.load(user_id, version, notes)
+            graph = self._graph_index.get_graph(user_id, version, query, depth, self._max_nodes)
+        if graph is None:
+            # A graph larger than the whole memory budget is never kept.
+            return await self._get_graph_from_repo(user_id, query, depth)
+
+        await self._graph_cache.set(user_id, version, query, depth, graph)
+        return VersionedGraph(graph=graph, version=version)
+
+    async def _get_graph_from_repo(
+        self,
+        user_id: UUID,
+        query: str | None,
+        depth: int,
+    ) -> VersionedGraph:
+        graph = await self._notes_graph_repo.get_graph(
             user_id=user_id,
             query=query,
             depth=depth,
+            max_nodes=self._max_nodes,
         )
+        return VersionedGraph(graph=graph, version=None)
@@ -0,0 +1,63 @@
+from collections.abc import Callable
+from typing import TypeVar
+from uuid import UUID
+
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.application.interactors.graph.dto import GraphChanges
+
+T = TypeVar("T")
+
+
+class GetGraphChangesInteractor:
+    def __init__(
+        self,
+        notes_graph_repo: INotesGraphRepository,
+        note_links_repo: INoteLinksRepository,
+        graph_index: INotesGraphIndex,
+    ):
+        self._notes_graph_repo = notes_graph_repo
+        self._note_links_repo = note_links_repo
+        self._graph_index = graph_index
+
+    async def get_changes(self, user_id: UUID, since: int) -> GraphChanges:
+        """
+        Changes of the full graph after version `since`, or the full graph
+        itself when they are no longer logged.
+        """
+        log = await self._graph_index.get_change_log(user_id, since)
+        if log is not None and log.changes is not None:
+            delta = await self._from_index(
+                user_id,
+                log.version,
+                lambda: self._graph_index.get_delta(user_id, log.version, log.changes),
+            )
+            if delta is not None:
+                return GraphChanges(version=log.version, delta=delta, snapshot=None)
+        elif log is not None:
+            snapshot = await self._from_index(
+                user_id,
+                log.version,
+                lambda: self._graph_index.get_graph(user_id, log.version),
+            )
+            if snapshot is not None:
+                return GraphChanges(version=log.version, delta=None, snapshot=snapshot)
+
+        # Redis is unavailable or the graph exceeds the memory budget. The
+        # graph backend may lag behind the log, so no version is given.
+        snapshot = await self._notes_graph_repo.get_graph(user_id=user_id)
+        return GraphChanges(version=None, delta=None, snapshot=snapshot)
+
+    async def _from_index(
+        self,
+        user_id: UUID,
+        version: int,
+        read: Callable[[], T | None],
+    ) -> T | None:
+        result = read()
+        if result is None:
+            notes = await self._note_links_repo.get_user_links(user_id)
+            self._graph_index.load(user_id, version, notes)
+            result = read()
+        return result
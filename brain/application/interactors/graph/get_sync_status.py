@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
+from brain.application.interactors.graph.dto import GraphSyncStatus
+from brain.application.interactors.graph.process_sync_outbox import MAX_ATTEMPTS
+
+
+class GetGraphSyncStatusInteractor:
+    def __init__(self, outbox_repo: IGraphSyncOutboxRepository):
+        self._outbox_repo = outbox_repo
+
+    async def get_status(self, user_id: UUID) -> GraphSyncStatus:
+        stats = await self._outbox_repo.get_stats(user_id=user_id, max_attempts=MAX_ATTEMPTS)
+        lag_seconds = 0.0
+        if stats.oldest_pending_at is not None:
+            lag_seconds = max(
+                (datetime.utcnow() - stats.oldest_pending_at).total_seconds(),
+                0.0,
+            )
+        return GraphSyncStatus(
+            pending=stats.pending,
+            failed=stats.failed,
+            oldest_pending_at=stats.oldest_pending_at,
+            lag_seconds=lag_seconds,
+            processed=stats.processed,
+            coalesced=stats.coalesced,
+        )
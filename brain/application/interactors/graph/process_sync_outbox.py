@@ -0,0 +1,160 @@
+import logging
+from datetime import datetime, timedelta
+from functools import partial
+from uuid import UUID
+
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.notes_graph import (
+    INotesGraphRepository,
+)
+from brain.application.abstractions.unit_of_work import IUnitOfWork
+from brain.application.services.note_keyword_sync import NoteKeywordSyncService
+from brain.application.services.related_notes import RelatedNotesService
+from brain.config.models import GraphSyncConfig
+from brain.domain.entities.graph_sync import GraphSyncEvent
+from brain.domain.entities.note import Note
+from brain.domain.services.wikilinks import extract_link_targets
+
+logger = logging.getLogger(__name__)
+
+# Notes claimed per Postgres transaction.
+PROCESS_BATCH_SIZE = 100
+# Events failing this many times stay in the outbox for inspection.
+MAX_ATTEMPTS = 5
+# How long processed events are kept before being purged.
+PROCESSED_RETENTION = timedelta(days=1)
+
+
+class ProcessGraphSyncOutboxInteractor:
+    def __init__(
+        self,
+        outbox_repo: IGraphSyncOutboxRepository,
+        notes_repo: INotesRepository,
+        notes_graph_repo: INotesGraphRepository,
+        keyword_sync_service: NoteKeywordSyncService,
+        related_notes_service: RelatedNotesService,
+        graph_sync_config: GraphSyncConfig,
+        suggestion_index: IWikilinkSuggestionIndex,
+        uow: IUnitOfWork,
+    ):
+        self._outbox_repo = outbox_repo
+        self._notes_repo = notes_repo
+        self._notes_graph_repo = notes_graph_repo
+        self._keyword_sync_service = keyword_sync_service
+        self._related_notes_service = related_notes_service
+        self._coalesce_window = timedelta(
+            seconds=graph_sync_config.coalesce_window_seconds
+        )
+        self._suggestion_index = suggestion_index
+        self._uow = uow
+
+    async def process(self) -> int:
+        """Apply pending events to the graph, returns how many succeeded."""
+        processed = 0
+        while True:
+            async with self._uow:
+                events = await self._outbox_repo.claim_pending(
+                    limit=PROCESS_BATCH_SIZE,
+                    max_attempts=MAX_ATTEMPTS,
+                    ready_before=datetime.utcnow() - self._coalesce_window,
+                )
+                batches = self._group_by_note(events)
+                succeeded, coalesced, failed, changed = await self._apply_batches(batches)
+                await self._outbox_repo.mark_processed(succeeded)
+                await self._outbox_repo.mark_processed(coalesced, coalesced=True)
+            await self._refresh_related_notes(changed)
+            processed += len(succeeded) + len(coalesced)
+            if coalesced:
+                logger.debug("Collapsed %s graph sync events", len(coalesced))
+            # Failed events are retried by the next run rather than
+            # hammering a struggling graph in a tight loop.
+            if failed or len(batches) < PROCESS_BATCH_SIZE:
+                break
+
+        async with self._uow:
+            await self._outbox_repo.delete_processed_before(
+                datetime.utcnow() - PROCESSED_RETENTION
+            )
+        return processed
+
+    @staticmethod
+    def _group_by_note(
+        events: list[GraphSyncEvent],
+    ) -> list[list[GraphSyncEvent]]:
+        batches: dict[UUID, list[GraphSyncEvent]] = {}
+        for event in events:
+            batches.setdefault(event.note_id, []).append(event)
+        return list(batches.values())
+
+    async def _apply_batches(
+        self, batches: list[list[GraphSyncEvent]]
+    ) -> tuple[list[UUID], list[UUID], int, dict[UUID, dict[UUID, Note | None]]]:
+        succeeded: list[UUID] = []
+        coalesced: list[UUID] = []
+        failed = 0
+        # Current state of every synced note by user, None if deleted.
+        changed: dict[UUID, dict[UUID, Note | None]] = {}
+        for events in batches:
+            event_ids = [event.id for event in events]
+            # A savepoint per note: a failed write must not abort the
+            # transaction that records attempts and marks the others done.
+            try:
+                async with self._uow.savepoint():
+                    note = await self._apply(events)
+            except Exception:
+                logger.exception("Graph sync failed for note %s", events[0].note_id)
+                await self._outbox_repo.increment_attempts(event_ids)
+                failed += 1
+                continue
+            # The latest event stands for the sync that ran; earlier ones
+            # were collapsed into it.
+            succeeded.append(event_ids[-1])
+            coalesced.extend(event_ids[:-1])
+            changed.setdefault(events[0].user_id, {})[events[0].note_id] = note
+        return succeeded, coalesced, failed, changed
+
+    async def _refresh_related_notes(
+        self, changed: dict[UUID, dict[UUID, Note | None]]
+    ) -> None:
+        for user_id, notes in changed.items():
+            updated = [note for note in notes.values() if note is not None]
+            deleted_ids = [note_id for note_id, note in notes.items() if note is None]
+            try:
+                await self._related_notes_service.refresh(user_id, updated, deleted_ids)
+            except Exception:
+                # The events are processed already; without an index the
+                # next change for this user rebuilds it from scratch.
+                logger.exception("Related notes refresh failed for user %s", user_id)
+                await self._related_notes_service.drop(user_id)
+
+    async def _apply(self, events: list[GraphSyncEvent]) -> Note | None:
+        # Events only say which note changed; the graph is always rebuilt
+        # from its current Postgres state, so replays are harmless and a
+        # burst of edits needs a single sync.
+        first = events[0]
+        note = await self._notes_repo.get_by_id(first.note_id)
+        if note is None:
+            await self._notes_graph_repo.delete_note(first.note_id)
+            return None
+        elif any(event.links_changed for event in events):
+            link_targets = extract_link_targets(note.text or "")
+            removed_keywords = await self._keyword_sync_service.sync(note)
+            self._uow.add_commit_hook(partial(
+                self._suggestion_index.apply_changes,
+                user_id=note.user_id,
+                added_keywords=link_targets,
+                removed_keywords=removed_keywords,
+            ))
+            await self._notes_graph_repo.sync_connections(
+                note,
+                link_targets,
+                previous_title=first.previous_title,
+                previous_represents_keyword_id=first.previous_represents_keyword_id,
+            )
+        else:
+            await self._notes_graph_repo.upsert_note(note)
+        return note
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheMetric:
+    cache: str
+    tier: str
+    hits: int
+    misses: int
+    hit_rate: float
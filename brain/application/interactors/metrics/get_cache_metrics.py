@@ -0,0 +1,38 @@
+from brain.application.abstractions.caches.graph import IGraphCache, INotesGraphIndex
+from brain.application.abstractions.caches.principals import IPrincipalCache
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.interactors.metrics.dto import CacheMetric
+
+
+class GetCacheMetricsInteractor:
+    def __init__(
+        self,
+        principal_cache: IPrincipalCache,
+        suggestion_index: IWikilinkSuggestionIndex,
+        graph_index: INotesGraphIndex,
+        graph_cache: IGraphCache,
+    ):
+        self._principal_cache = principal_cache
+        self._suggestion_index = suggestion_index
+        self._graph_index = graph_index
+        self._graph_cache = graph_cache
+
+    async def get_metrics(self) -> list[CacheMetric]:
+        """Hit counters of this process, per cache and tier."""
+        caches = {
+            "principals": self._principal_cache.get_stats(),
+            "wikilink_suggestions": self._suggestion_index.get_stats(),
+            "notes_graph": self._graph_index.get_stats(),
+            "graph_responses": self._graph_cache.get_stats(),
+        }
+        return [
+            CacheMetric(
+                cache=cache,
+                tier=tier,
+                hits=stats.hits,
+                misses=stats.misses,
+                hit_rate=stats.hit_rate,
+            )
+            for cache, tiers in caches.items()
+            for tier, stats in tiers.items()
+        ]
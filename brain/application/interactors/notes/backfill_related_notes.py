@@ -0,0 +1,30 @@
+import logging
+
+from brain.application.abstractions.repositories.users import IUsersRepository
+from brain.application.services.related_notes import RelatedNotesService
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillRelatedNotesInteractor:
+    def __init__(
+        self,
+        users_repo: IUsersRepository,
+        related_notes_service: RelatedNotesService,
+    ):
+        self._users_repo = users_repo
+        self._related_notes_service = related_notes_service
+
+    async def backfill(self) -> int:
+        """
+        Builds related-notes indexes missing because no note of the user
+        changed since they were introduced, or since a failed refresh
+        dropped them. Returns how many were built.
+        """
+        built = 0
+        for user in await self._users_repo.get_all():
+            try:
+                built += await self._related_notes_service.backfill(user.id)
+            except Exception:
+                logger.exception("Related notes backfill failed for user %s", user.id)
+        return built
@@ -1,15 +1,22 @@
+from functools import partial
 from uuid import UUID, uuid4
 
-from brain.application.abstractions.repositories.notes import INotesRepository
-from brain.application.abstractions.repositories.notes_graph import (
-    INotesGraphRepository,
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
 )
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.notes.dto import CreateNote
 from brain.application.interactors.users.get_user import GetUserInteractor
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_titles import NoteTitleService
-from brain.application.services.note_keyword_sync import NoteKeywordSyncService
+from brain.domain.entities.graph_sync import GraphSyncEvent
 from brain.domain.entities.note import Note
+from brain.domain.services.wikilinks import extract_link_intervals, extract_link_targets
 
 
 class CreateNoteInteractor:
@@ -17,40 +24,70 @@ class CreateNoteInteractor:
         self,
         get_user_interactor: GetUserInteractor,
         notes_repo: INotesRepository,
-        notes_graph_repo: INotesGraphRepository,
         keyword_note_service: KeywordNoteService,
         note_title_service: NoteTitleService,
-        keyword_sync_service: NoteKeywordSyncService,
+        graph_sync_outbox_repo: IGraphSyncOutboxRepository,
+        note_links_repo: INoteLinksRepository,
+        graph_index: INotesGraphIndex,
+        suggestion_index: IWikilinkSuggestionIndex,
+        uow: IUnitOfWork,
     ):
         self._get_user_interactor = get_user_interactor
         self._notes_repo = notes_repo
-        self._notes_graph_repo = notes_graph_repo
         self._keyword_note_service = keyword_note_service
         self._note_title_service = note_title_service
-        self._keyword_sync_service = keyword_sync_service
+        self._graph_sync_outbox_repo = graph_sync_outbox_repo
+        self._note_links_repo = note_links_repo
+        self._graph_index = graph_index
+        self._suggestion_index = suggestion_index
+        self._uow = uow
 
     async def create_note(self, note_data: CreateNote) -> UUID:
         user = await self._get_user_interactor.get_user_by_telegram_id(
             note_data.by_user_telegram_id
         )
 
-        title = await self._note_title_service.resolve_create_title(
-            user_id=user.id,
-            title=note_data.title,
-        )
-        represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(
-            user_id=user.id,
-            title=title,
-        )
-        note = Note(
-            id=uuid4(),
-            user_id=user.id,
-            title=title,
-            text=note_data.text,
-            represents_keyword_id=represents_keyword_id,
-        )
-        await self._notes_repo.create(note)
-        await self._notes_graph_repo.upsert_note(note)
-        await self._keyword_sync_service.sync(note)
+        async with self._uow:
+            title = await self._note_title_service.resolve_create_title(
+                user_id=user.id,
+                title=note_data.title,
+            )
+            represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(
+                user_id=user.id,
+                title=title,
+            )
+            note = Note(
+                id=uuid4(),
+                user_id=user.id,
+                title=title,
+                text=note_data.text,
+                represents_keyword_id=represents_keyword_id,
+                link_intervals=extract_link_intervals(note_data.text or ""),
+            )
+            await self._notes_repo.create(note)
+            link_targets = extract_link_targets(note.text or "")
+            await self._note_links_repo.replace_links(
+                user_id=note.user_id,
+                links={note.id: link_targets},
+            )
+            # Links written before this note existed now have a target.
+            await self._note_links_repo.resolve_targets(
+                user_id=note.user_id,
+                note_ids_by_title={note.title: note.id},
+            )
+            await self._graph_sync_outbox_repo.add(
+                GraphSyncEvent(id=uuid4(), note_id=note.id, user_id=note.user_id)
+            )
+            self._uow.add_commit_hook(partial(
+                self._graph_index.apply_changes,
+                user_id=note.user_id,
+                updated=[NoteLinks(note_id=note.id, title=note.title, targets=link_targets)],
+            ))
+            self._uow.add_commit_hook(partial(
+                self._suggestion_index.apply_changes,
+                user_id=note.user_id,
+                added_titles=[note.title],
+                added_keywords=[note.title],
+            ))
 
         return note.id
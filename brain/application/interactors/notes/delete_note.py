@@ -1,13 +1,20 @@
-from uuid import UUID
+from functools import partial
+from uuid import UUID, uuid4
 
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
+from brain.application.abstractions.repositories.models import NoteLinks
 from brain.application.abstractions.repositories.notes import INotesRepository
-from brain.application.abstractions.repositories.notes_graph import (
-    INotesGraphRepository,
-)
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.notes.exceptions import NoteNotFoundException
+from brain.domain.entities.graph_sync import GraphSyncEvent
 
 from brain.domain.services.keywords import collect_cleanup_keyword_names
+from brain.domain.services.wikilinks import extract_link_targets
 
 
 class DeleteNoteInteractor:
@@ -15,11 +22,17 @@ class DeleteNoteInteractor:
         self,
         notes_repo: INotesRepository,
         keywords_repo: IKeywordsRepository,
-        notes_graph_repo: INotesGraphRepository,
+        graph_sync_outbox_repo: IGraphSyncOutboxRepository,
+        graph_index: INotesGraphIndex,
+        suggestion_index: IWikilinkSuggestionIndex,
+        uow: IUnitOfWork,
     ):
         self._notes_repo = notes_repo
         self._keywords_repo = keywords_repo
-        self._notes_graph_repo = notes_graph_repo
+        self._graph_sync_outbox_repo = graph_sync_outbox_repo
+        self._graph_index = graph_index
+        self._suggestion_index = suggestion_index
+        self._uow = uow
 
     async def delete_note(self, note_id: UUID) -> None:
         note = await self._notes_repo.get_by_id(note_id)
@@ -32,10 +45,29 @@ class DeleteNoteInteractor:
             represents_keyword_id=note.represents_keyword_id,
             title=note.title,
         )
-        await self._notes_repo.delete_by_id(note_id)
-        await self._keywords_repo.delete_note_keywords(note_id)
-        await self._keywords_repo.delete_unused_keywords(
-            user_id=note.user_id,
-            names=cleanup_names,
-        )
-        await self._notes_graph_repo.delete_note(note_id)
+        async with self._uow:
+            await self._notes_repo.delete_by_id(note_id)
+            await self._keywords_repo.delete_note_keywords(note_id)
+            removed_keywords = await self._keywords_repo.delete_unused_keywords(
+                user_id=note.user_id,
+                names=cleanup_names,
+            )
+            await self._graph_sync_outbox_repo.add(
+                GraphSyncEvent(id=uuid4(), note_id=note_id, user_id=note.user_id)
+            )
+            self._uow.add_commit_hook(partial(
+                self._graph_index.apply_changes,
+                user_id=note.user_id,
+                deleted_ids=[note_id],
+                previous=[NoteLinks(
+                    note_id=note_id,
+                    title=note.title,
+                    targets=extract_link_targets(note.text or ""),
+                )],
+            ))
+            self._uow.add_commit_hook(partial(
+                self._suggestion_index.apply_changes,
+                user_id=note.user_id,
+                removed_titles=[note.title],
+                removed_keywords=removed_keywords,
+            ))
@@ -1,5 +1,16 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
+
+from brain.application.abstractions.repositories.models import (
+    Backlink,
+    NoteCursor,
+    NoteListFields,
+    NoteListItem,
+    NoteListOrder,
+    NoteSearchCursor,
+    NoteSearchHit,
+)
 from brain.application.types import Unset, UnsetType
 
 
@@ -16,3 +27,54 @@ class UpdateNote:
     title: str | None | UnsetType = Unset
     text: str | None | UnsetType = Unset
     patch: str | None | UnsetType = Unset
+
+
+@dataclass
+class ImportNotesResult:
+    imported: int
+    skipped: int
+
+
+@dataclass
+class ListNotes:
+    user_id: UUID
+    order_by: NoteListOrder = NoteListOrder.UPDATED_AT
+    fields: NoteListFields = NoteListFields.FULL
+    limit: int = 20
+    cursor: NoteCursor | None = None
+    from_date: datetime | None = None
+    to_date: datetime | None = None
+
+
+@dataclass
+class NotesPage:
+    items: list[NoteListItem]
+    next_cursor: NoteCursor | None
+
+
+@dataclass
+class SearchNotes:
+    user_id: UUID
+    query: str
+    limit: int = 20
+    cursor: NoteSearchCursor | None = None
+
+
+@dataclass
+class NoteSearchPage:
+    items: list[NoteSearchHit]
+    next_cursor: NoteSearchCursor | None
+
+
+@dataclass
+class GetBacklinks:
+    user_id: UUID
+    note_id: UUID
+    limit: int = 20
+    cursor: UUID | None = None
+
+
+@dataclass
+class BacklinksPage:
+    items: list[Backlink]
+    next_cursor: UUID | None
@@ -2,12 +2,46 @@ import json
 import zipfile
 import io
 from dataclasses import asdict
+from typing import AsyncIterator
+from uuid import UUID
 
 from brain.application.abstractions.repositories.notes import INotesRepository
 from brain.application.interactors.users.get_user import GetUserInteractor
+from brain.domain.entities.note import Note
 from brain.domain.services import sanitize_filename
 
 
+class _ZipStreamBuffer(io.RawIOBase):
+    """
+    Write-only sink for ZipFile that hands out written bytes in chunks.
+
+    It reports its position but refuses to seek, so ZipFile writes entries
+    with data descriptors instead of rewinding to patch local headers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
 class ExportNotesInteractor:
     def __init__(
         self,
@@ -17,28 +51,38 @@ class ExportNotesInteractor:
         self._get_user_interactor = get_user_interactor
         self._notes_repo = notes_repo
 
-    async def export_notes(self, user_telegram_id: int) -> bytes:
+    async def export_notes(self, user_telegram_id: int) -> AsyncIterator[bytes]:
         user = await self._get_user_interactor.get_user_by_telegram_id(
             user_telegram_id
         )
-        notes = await self._notes_repo.get_by_user_telegram_id(user_telegram_id)
-
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for note in notes:
-                # Convert note to dict
-                note_dict = asdict(note)
-                # Serialize UUIDs and datetimes
-                note_dict["id"] = str(note_dict["id"])
-                note_dict["user_id"] = str(note_dict["user_id"])
-                note_dict["represents_keyword_id"] = str(note_dict["represents_keyword_id"]) if note_dict["represents_keyword_id"] else None
-                if note_dict["created_at"]:
-                    note_dict["created_at"] = note_dict["created_at"].isoformat()
-                if note_dict["updated_at"]:
-                    note_dict["updated_at"] = note_dict["updated_at"].isoformat()
+        return self._stream_archive(user.id)
 
+    async def _stream_archive(self, user_id: UUID) -> AsyncIterator[bytes]:
+        buffer = _ZipStreamBuffer()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            async for note in self._notes_repo.stream_by_user_id(user_id):
                 # Use title as filename, sanitized
                 filename = f"{sanitize_filename(note.title)}.json"
-                zip_file.writestr(filename, json.dumps(note_dict, indent=2))
+                zip_file.writestr(filename, json.dumps(self._serialize(note), indent=2))
+
+                chunk = buffer.drain()
+                if chunk:
+                    yield chunk
+
+        # Central directory is written when the archive is closed.
+        chunk = buffer.drain()
+        if chunk:
+            yield chunk
 
-        return zip_buffer.getvalue()
+    def _serialize(self, note: Note) -> dict:
+        # Convert note to dict
+        note_dict = asdict(note)
+        # Serialize UUIDs and datetimes
+        note_dict["id"] = str(note_dict["id"])
+        note_dict["user_id"] = str(note_dict["user_id"])
+        note_dict["represents_keyword_id"] = str(note_dict["represents_keyword_id"]) if note_dict["represents_keyword_id"] else None
+        if note_dict["created_at"]:
+            note_dict["created_at"] = note_dict["created_at"].isoformat()
+        if note_dict["updated_at"]:
+            note_dict["updated_at"] = note_dict["updated_at"].isoformat()
+        return note_dict
@@ -0,0 +1,30 @@
+from brain.application.abstractions.repositories.models import Backlink
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
+from brain.application.interactors.notes.dto import BacklinksPage, GetBacklinks
+from brain.domain.services.wikilinks import extract_link_context
+
+
+class GetBacklinksInteractor:
+    def __init__(self, note_links_repo: INoteLinksRepository):
+        self._note_links_repo = note_links_repo
+
+    async def get_backlinks(self, data: GetBacklinks) -> BacklinksPage:
+        # One extra row tells whether another page exists.
+        sources = await self._note_links_repo.get_backlinks(
+            user_id=data.user_id,
+            note_id=data.note_id,
+            limit=data.limit + 1,
+            after=data.cursor,
+        )
+        backlinks = [
+            Backlink(
+                note_id=source.note_id,
+                title=source.title,
+                snippet=extract_link_context(source.text or "", source.target_title),
+                updated_at=source.updated_at,
+            )
+            for source in sources[:data.limit]
+        ]
+        if len(sources) <= data.limit:
+            return BacklinksPage(items=backlinks, next_cursor=None)
+        return BacklinksPage(items=backlinks, next_cursor=backlinks[-1].note_id)
@@ -0,0 +1,13 @@
+from uuid import UUID
+
+from brain.application.abstractions.storage.models import RelatedNote
+from brain.application.abstractions.storage.related_notes import IRelatedNotesIndex
+
+
+class GetRelatedNotesInteractor:
+    def __init__(self, related_notes_index: IRelatedNotesIndex):
+        self._related_notes_index = related_notes_index
+
+    async def get_related(self, user_id: UUID, note_id: UUID, limit: int = 10) -> list[RelatedNote] | None:
+        """Returns None if the note is not indexed (yet)."""
+        return self._related_notes_index.find_related(user_id, note_id, limit)
@@ -1,19 +1,34 @@
 import json
 import zipfile
 import io
+from dataclasses import dataclass
 from uuid import uuid4, UUID
 from datetime import datetime
+from functools import partial
 
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.keywords import IKeywordsRepository
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
 from brain.application.abstractions.repositories.notes import INotesRepository
 from brain.application.abstractions.repositories.notes_graph import (
     INotesGraphRepository,
 )
+from brain.application.abstractions.unit_of_work import IUnitOfWork
+from brain.application.interactors.notes.dto import ImportNotesResult
 from brain.application.interactors.users.get_user import GetUserInteractor
-from brain.application.services.keyword_notes import KeywordNoteService
-from brain.application.services.note_titles import NoteTitleService
-from brain.application.services.note_keyword_sync import NoteKeywordSyncService
-from brain.application.interactors.notes.exceptions import NoteTitleAlreadyExistsException
 from brain.domain.entities.note import Note
+from brain.domain.entities.note_keyword import NoteKeyword
+from brain.domain.services.wikilinks import extract_link_targets, extract_link_intervals
+
+
+@dataclass
+class _ArchivedNote:
+    title: str
+    text: str | None
+    created_at: datetime | None
+    updated_at: datetime | None
 
 
 class ImportNotesInteractor:
@@ -21,84 +36,158 @@ class ImportNotesInteractor:
         self,
         get_user_interactor: GetUserInteractor,
         notes_repo: INotesRepository,
+        keywords_repo: IKeywordsRepository,
         notes_graph_repo: INotesGraphRepository,
-        keyword_note_service: KeywordNoteService,
-        note_title_service: NoteTitleService,
-        keyword_sync_service: NoteKeywordSyncService,
+        note_links_repo: INoteLinksRepository,
+        graph_index: INotesGraphIndex,
+        suggestion_index: IWikilinkSuggestionIndex,
+        uow: IUnitOfWork,
     ):
         self._get_user_interactor = get_user_interactor
         self._notes_repo = notes_repo
+        self._keywords_repo = keywords_repo
         self._notes_graph_repo = notes_graph_repo
-        self._keyword_note_service = keyword_note_service
-        self._note_title_service = note_title_service
-        self._keyword_sync_service = keyword_sync_service
+        self._note_links_repo = note_links_repo
+        self._graph_index = graph_index
+        self._suggestion_index = suggestion_index
+        self._uow = uow
 
-    async def import_notes(self, user_telegram_id: int, zip_bytes: bytes) -> None:
+    async def import_notes(self, user_telegram_id: int, zip_bytes: bytes) -> ImportNotesResult:
         user = await self._get_user_interactor.get_user_by_telegram_id(
             user_telegram_id
         )
 
+        archived_notes, skipped = self._read_archive(zip_bytes)
+
+        # Titles must be unique per user, both against stored notes
+        # and inside the archive itself. The first occurrence wins.
+        taken_titles = await self._notes_repo.get_existing_titles(
+            user_id=user.id,
+            titles=[archived.title for archived in archived_notes],
+        )
+        accepted: list[_ArchivedNote] = []
+        for archived in archived_notes:
+            if archived.title in taken_titles:
+                skipped += 1
+                continue
+            taken_titles.add(archived.title)
+            accepted.append(archived)
+
+        if not accepted:
+            return ImportNotesResult(imported=0, skipped=skipped)
+
+        targets_by_title = {
+            archived.title: extract_link_targets(archived.text or "")
+            for archived in accepted
+        }
+        keyword_names = [archived.title for archived in accepted]
+        for targets in targets_by_title.values():
+            keyword_names.extend(targets)
+
+        notes: list[Note] = []
+        note_keywords: list[NoteKeyword] = []
+        link_targets: dict[UUID, list[str]] = {}
+
+        async with self._uow:
+            keyword_ids = await self._keywords_repo.ensure_keyword_ids(
+                user_id=user.id,
+                names=keyword_names,
+            )
+            for archived in accepted:
+                note = Note(
+                    id=uuid4(),
+                    user_id=user.id,
+                    title=archived.title,
+                    text=archived.text,
+                    represents_keyword_id=keyword_ids[archived.title.strip()],
+                    created_at=archived.created_at,
+                    updated_at=archived.updated_at,
+                    link_intervals=extract_link_intervals(archived.text or ""),
+                )
+                notes.append(note)
+                link_targets[note.id] = targets_by_title[archived.title]
+                note_keywords.extend(
+                    NoteKeyword(
+                        note_id=note.id,
+                        keyword_id=keyword_ids[target],
+                        user_id=user.id,
+                    )
+                    for target in link_targets[note.id]
+                )
+
+            await self._notes_repo.create_many(notes)
+            await self._keywords_repo.create_note_keywords(note_keywords)
+            await self._note_links_repo.replace_links(user_id=user.id, links=link_targets)
+            await self._note_links_repo.resolve_targets(
+                user_id=user.id,
+                note_ids_by_title={note.title: note.id for note in notes},
+            )
+            self._uow.add_commit_hook(partial(
+                self._graph_index.apply_changes,
+                user_id=user.id,
+                updated=[
+                    NoteLinks(note_id=note.id, title=note.title, targets=link_targets[note.id])
+                    for note in notes
+                ],
+            ))
+            self._uow.add_commit_hook(partial(
+                self._suggestion_index.apply_changes,
+                user_id=user.id,
+                added_titles=[note.title for note in notes],
+                added_keywords=keyword_names,
+            ))
+
+        await self._notes_graph_repo.upsert_notes_bulk(notes, link_targets)
+
+        return ImportNotesResult(imported=len(notes), skipped=skipped)
+
+    def _read_archive(self, zip_bytes: bytes) -> tuple[list[_ArchivedNote], int]:
+        archived_notes: list[_ArchivedNote] = []
+        skipped = 0
         try:
             with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
                 for filename in zip_file.namelist():
                     if not filename.endswith(".json"):
                         continue
-                    
+
                     with zip_file.open(filename) as f:
                         try:
                             note_data = json.load(f)
-                            await self._import_single_note(user.id, note_data)
+                            archived = self._parse_note(note_data)
                         except Exception:
                             # Skip malformed files
+                            skipped += 1
                             continue
+                    if archived is None:
+                        skipped += 1
+                        continue
+                    archived_notes.append(archived)
         except zipfile.BadZipFile:
             raise ValueError("Invalid zip file")
+        return archived_notes, skipped
 
-    async def _import_single_note(self, user_id: UUID, note_data: dict) -> None:
-        title = note_data.get("title")
-        text = note_data.get("text")
+    def _parse_note(self, note_data: dict) -> _ArchivedNote | None:
         # We ignore ID from import, generate new one
         # We also ignore user_id from import, use current user
-        
-        if not title:
-            return
-
-        # Check title uniqueness
-        # If exists, we skip this note to avoid overwriting or errors
-        try:
-            await self._note_title_service.ensure_unique_title(user_id, title)
-        except NoteTitleAlreadyExistsException:
-            return
+        title = note_data.get("title")
+        if not isinstance(title, str) or not title.strip():
+            return None
 
-        represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(
-            user_id=user_id,
-            title=title,
-        )
+        text = note_data.get("text")
+        if text is not None and not isinstance(text, str):
+            return None
 
-        created_at = None
-        if note_data.get("created_at"):
-            try:
-                created_at = datetime.fromisoformat(note_data["created_at"])
-            except ValueError:
-                pass
-        
-        updated_at = None
-        if note_data.get("updated_at"):
-            try:
-                updated_at = datetime.fromisoformat(note_data["updated_at"])
-            except ValueError:
-                pass
-
-        note = Note(
-            id=uuid4(),
-            user_id=user_id,
+        return _ArchivedNote(
             title=title,
             text=text,
-            represents_keyword_id=represents_keyword_id,
-            created_at=created_at,
-            updated_at=updated_at,
+            created_at=self._parse_datetime(note_data.get("created_at")),
+            updated_at=self._parse_datetime(note_data.get("updated_at")),
         )
 
-        await self._notes_repo.create(note)
-        await self._notes_graph_repo.upsert_note(note)
-        await self._keyword_sync_service.sync(note)
+    def _parse_datetime(self, value: str | None) -> datetime | None:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,44 @@
+from brain.application.abstractions.repositories.models import (
+    NoteCursor,
+    NoteListItem,
+    NoteListOrder,
+)
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.interactors.notes.dto import ListNotes, NotesPage
+
+NOTE_PREVIEW_LENGTH = 200
+
+
+class ListNotesInteractor:
+    def __init__(self, notes_repo: INotesRepository):
+        self._notes_repo = notes_repo
+
+    async def list_notes(self, data: ListNotes) -> NotesPage:
+        # One extra row tells whether another page exists.
+        items = await self._notes_repo.get_page(
+            user_id=data.user_id,
+            order_by=data.order_by,
+            fields=data.fields,
+            limit=data.limit + 1,
+            after=data.cursor,
+            from_date=data.from_date,
+            to_date=data.to_date,
+            preview_length=NOTE_PREVIEW_LENGTH,
+        )
+        if len(items) <= data.limit:
+            return NotesPage(items=items, next_cursor=None)
+
+        items = items[:data.limit]
+        return NotesPage(
+            items=items,
+            next_cursor=self._make_cursor(items[-1], data.order_by),
+        )
+
+    @staticmethod
+    def _make_cursor(item: NoteListItem, order_by: NoteListOrder) -> NoteCursor:
+        sort_value = (
+            item.created_at
+            if order_by == NoteListOrder.CREATED_AT
+            else item.updated_at
+        )
+        return NoteCursor(sort_value=sort_value, note_id=item.id)
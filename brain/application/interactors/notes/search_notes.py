@@ -0,0 +1,28 @@
+from brain.application.abstractions.repositories.models import NoteSearchCursor
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.interactors.notes.dto import NoteSearchPage, SearchNotes
+
+
+class SearchNotesInteractor:
+    def __init__(self, notes_repo: INotesRepository):
+        self._notes_repo = notes_repo
+
+    async def search(self, data: SearchNotes) -> NoteSearchPage:
+        if not data.query.strip():
+            return NoteSearchPage(items=[], next_cursor=None)
+
+        # One extra row tells whether another page exists.
+        hits = await self._notes_repo.search_text(
+            user_id=data.user_id,
+            query=data.query,
+            limit=data.limit + 1,
+            after=data.cursor,
+        )
+        if len(hits) <= data.limit:
+            return NoteSearchPage(items=hits, next_cursor=None)
+
+        hits = hits[:data.limit]
+        return NoteSearchPage(
+            items=hits,
+            next_cursor=NoteSearchCursor(rank=hits[-1].rank, note_id=hits[-1].id),
+        )
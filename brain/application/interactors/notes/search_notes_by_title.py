@@ -1,19 +1,34 @@
 from uuid import UUID
 
 from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.config.models import FuzzySearchConfig
 from brain.domain.entities.note import Note
 
 
 class SearchNotesByTitleInteractor:
-    def __init__(self, notes_repo: INotesRepository):
+    def __init__(self, notes_repo: INotesRepository, fuzzy_config: FuzzySearchConfig):
         self._notes_repo = notes_repo
+        self._fuzzy_config = fuzzy_config
 
-    async def search(self, user_id: UUID, query: str, exact_match: bool = False) -> list[Note]:
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        exact_match: bool = False,
+        fuzzy: bool = False,
+    ) -> list[Note]:
         raw_query = query or ""
         normalized_query = raw_query if exact_match else raw_query.strip()
         if not normalized_query:
             return []
 
+        if fuzzy and not exact_match:
+            return await self._notes_repo.search_by_title(
+                user_id=user_id,
+                query=normalized_query,
+                fuzzy_threshold=self._fuzzy_config.similarity_threshold,
+                limit=self._fuzzy_config.max_results,
+            )
         return await self._notes_repo.search_by_title(
             user_id=user_id,
             query=normalized_query,
@@ -1,19 +1,73 @@
 from uuid import UUID
 
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
 from brain.application.abstractions.repositories.models import WikilinkSuggestion
 from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.config.models import FuzzySearchConfig
 
 
 class SearchWikilinkSuggestionsInteractor:
-    def __init__(self, notes_repo: INotesRepository):
+    def __init__(
+        self,
+        notes_repo: INotesRepository,
+        suggestion_index: IWikilinkSuggestionIndex,
+        fuzzy_config: FuzzySearchConfig,
+    ):
         self._notes_repo = notes_repo
+        self._suggestion_index = suggestion_index
+        self._fuzzy_config = fuzzy_config
 
     async def search_wikilink_suggestions(
         self,
         user_id: UUID,
         query: str,
+        limit: int = 20,
+        fuzzy: bool = False,
+    ) -> list[WikilinkSuggestion]:
+        threshold = self._fuzzy_config.similarity_threshold if fuzzy else None
+        if fuzzy:
+            limit = min(limit, self._fuzzy_config.max_results)
+
+        version = await self._suggestion_index.get_version(user_id)
+        if version is None:
+            # Without a shared version the index could serve stale titles.
+            return await self._search_repo(user_id, query, limit, threshold)
+        if threshold is not None and not self._suggestion_index.fits_fuzzy(user_id, version):
+            # The trigram postings would not fit next to the loaded index.
+            return await self._search_repo(user_id, query, limit, threshold)
+
+        suggestions = self._search_index(user_id, version, query, limit, threshold)
+        if suggestions is None:
+            candidates = await self._notes_repo.get_wikilink_candidates(user_id)
+            self._suggestion_index.load(user_id, version, candidates)
+            suggestions = self._search_index(user_id, version, query, limit, threshold)
+        if suggestions is None:
+            # An index larger than the whole memory budget is never kept.
+            suggestions = await self._search_repo(user_id, query, limit, threshold)
+        return suggestions
+
+    async def _search_repo(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        threshold: float | None,
     ) -> list[WikilinkSuggestion]:
         return await self._notes_repo.search_wikilink_suggestions(
             user_id=user_id,
             query=query,
+            limit=limit,
+            fuzzy_threshold=threshold,
         )
+
+    def _search_index(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str,
+        limit: int,
+        threshold: float | None,
+    ) -> list[WikilinkSuggestion] | None:
+        if threshold is None:
+            return self._suggestion_index.search(user_id, version, query, limit)
+        return self._suggestion_index.search_fuzzy(user_id, version, query, limit, threshold)
@@ -1,40 +1,59 @@
 from datetime import datetime
-from uuid import UUID
+from functools import partial
+from uuid import uuid4
 
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
 from brain.application.abstractions.repositories.notes import INotesRepository
-from brain.application.abstractions.repositories.notes_graph import (
-    INotesGraphRepository,
-)
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.notes.dto import UpdateNote
 from brain.application.interactors.notes.exceptions import NoteNotFoundException
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_titles import NoteTitleService
-from brain.application.services.note_keyword_sync import NoteKeywordSyncService
+from brain.domain.entities.graph_sync import GraphSyncEvent
 from brain.domain.entities.note import Note
-from brain.domain.services.wikilinks import extract_link_targets, extract_link_intervals
-from brain.domain.services.diffs import apply_patch, get_diffs, check_if_ranges_touched
+from brain.domain.services.wikilinks import (
+    extract_link_intervals,
+    extract_link_targets,
+    update_link_intervals,
+)
+from brain.domain.services.diffs import (
+    apply_patch,
+    apply_patch_exact,
+    check_if_ranges_touched,
+    get_diffs,
+)
 from brain.application.types import Unset
 
-from brain.domain.services.keywords import collect_cleanup_keyword_names
-
 
 class UpdateNoteInteractor:
     def __init__(
         self,
         notes_repo: INotesRepository,
-        notes_graph_repo: INotesGraphRepository,
         keywords_repo: IKeywordsRepository,
         keyword_note_service: KeywordNoteService,
         note_title_service: NoteTitleService,
-        keyword_sync_service: NoteKeywordSyncService,
+        graph_sync_outbox_repo: IGraphSyncOutboxRepository,
+        note_links_repo: INoteLinksRepository,
+        graph_index: INotesGraphIndex,
+        suggestion_index: IWikilinkSuggestionIndex,
+        uow: IUnitOfWork,
     ):
         self._notes_repo = notes_repo
-        self._notes_graph_repo = notes_graph_repo
         self._keywords_repo = keywords_repo
         self._keyword_note_service = keyword_note_service
         self._note_title_service = note_title_service
-        self._keyword_sync_service = keyword_sync_service
+        self._graph_sync_outbox_repo = graph_sync_outbox_repo
+        self._note_links_repo = note_links_repo
+        self._graph_index = graph_index
+        self._suggestion_index = suggestion_index
+        self._uow = uow
 
     async def update_note(self, note_data: UpdateNote) -> Note:
         note = await self._notes_repo.get_by_id(note_data.note_id)
@@ -52,84 +71,135 @@ class UpdateNoteInteractor:
             link_intervals=note.link_intervals,
         )
 
-        if note_data.title is not Unset:
-            title = await self._note_title_service.ensure_update_title(
-                user_id=note.user_id,
-                title=note_data.title,
-                exclude_note_id=note.id,
+        async with self._uow:
+            if note_data.title is not Unset:
+                title = await self._note_title_service.ensure_update_title(
+                    user_id=note.user_id,
+                    title=note_data.title,
+                    exclude_note_id=note.id,
+                )
+                note.title = title
+
+                note.represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(
+                    user_id=note.user_id,
+                    title=note.title,
+                )
+
+            note.updated_at = datetime.utcnow()
+
+            should_sync_graph = True
+            if note_data.patch and note_data.patch is not Unset:
+                should_sync_graph = self._apply_patch(note, note_data.patch)
+            elif note_data.text is not Unset:
+                note.text = note_data.text
+                note.link_intervals = extract_link_intervals(note.text or "")
+
+            await self._notes_repo.update(note)
+            await self._update_note_links(note, previous_state, should_sync_graph)
+
+            # Keyword and graph sync are deferred to the worker, which
+            # collapses bursts of autosave edits into a single run.
+            # A rename changes which notes link here, even if the text
+            # links are untouched.
+            links_changed = should_sync_graph or note.title != previous_state.title
+            await self._graph_sync_outbox_repo.add(
+                GraphSyncEvent(
+                    id=uuid4(),
+                    note_id=note.id,
+                    user_id=note.user_id,
+                    links_changed=links_changed,
+                    previous_title=previous_state.title,
+                    previous_represents_keyword_id=previous_state.represents_keyword_id,
+                )
             )
-            note.title = title
 
-            note.represents_keyword_id = await self._keyword_note_service.ensure_keyword_for_title(
+            # Link targets dropped from the text are cleaned up by the
+            # deferred keyword sync; only the old title keyword is left here.
+            if note.title != previous_state.title:
+                removed_keywords = await self._keywords_repo.delete_unused_keywords(
+                    user_id=note.user_id,
+                    names=[previous_state.title],
+                )
+                self._uow.add_commit_hook(partial(
+                    self._suggestion_index.apply_changes,
+                    user_id=note.user_id,
+                    added_titles=[note.title],
+                    removed_titles=[previous_state.title],
+                    added_keywords=[note.title],
+                    removed_keywords=removed_keywords,
+                ))
+
+        return note
+
+    async def _update_note_links(
+        self,
+        note: Note,
+        previous_state: Note,
+        links_changed: bool,
+    ) -> None:
+        renamed = note.title != previous_state.title
+        if not links_changed and not renamed:
+            # Autosaves away from links leave the graph as it is.
+            return
+
+        link_targets = extract_link_targets(note.text or "")
+        if links_changed:
+            await self._note_links_repo.replace_links(
                 user_id=note.user_id,
-                title=note.title,
+                links={note.id: link_targets},
             )
-
-        note.updated_at = datetime.utcnow()
-
-        # Apply patch if present
-        if note_data.patch and note_data.patch is not Unset:
-            try:
-                # NOTE: Logic - if patch provided, derive text.
-                # For safety, let's say we trust patch if provided.
-                current_text = apply_patch(note.text or "", note_data.patch)
-                note.text = current_text
-            except Exception:
-                # Fallback or error? For now let's error if patch fails.
-                raise ValueError("Failed to apply patch")
-        elif note_data.text is not Unset:
-             note.text = note_data.text
-
-        # Differential Update Optimization
-        # Check if we can skip Neo4j sync
-        should_sync_graph = True
-        
-        # If we have previous link intervals, check if they are safe
-        # We need diffs between OLD text and NEW text.
-        
-        # If we just derived text from patch, we implicitly have diffs (from patch).
-        # But get_diffs uses dmp which is what we want.
-        
-        if note.link_intervals and note_data.patch and note_data.patch is not Unset:
-             diffs = get_diffs(previous_state.text or "", note.text or "")
-             touched_old = check_if_ranges_touched(
-                 len(previous_state.text or ""), 
-                 diffs, 
-                 previous_state.link_intervals
-             )
-             has_new_brackets = any(("[" in text or "]" in text) for op, text in diffs if op == 1)
-             
-             if not touched_old and not has_new_brackets:
-                 should_sync_graph = False
-
-        note.link_intervals = extract_link_intervals(note.text or "")
-
-        await self._notes_repo.update(note)
-        await self._notes_graph_repo.upsert_note(note)
-        
-        if should_sync_graph:
-            await self._keyword_sync_service.sync(note, previous_state=previous_state)
-
-
-        previous_targets = extract_link_targets(previous_state.text or "")
-        current_targets = extract_link_targets(note.text or "")
-        previous_cleanup_names = collect_cleanup_keyword_names(
-            link_targets=previous_targets,
-            represents_keyword_id=previous_state.represents_keyword_id,
-            title=previous_state.title,
-        )
-        current_cleanup_names = collect_cleanup_keyword_names(
-            link_targets=current_targets,
-            represents_keyword_id=note.represents_keyword_id,
-            title=note.title,
+        if renamed:
+            # Links to the old title dangle until a note takes it again.
+            await self._note_links_repo.unresolve_target(note.id)
+            await self._note_links_repo.resolve_targets(
+                user_id=note.user_id,
+                note_ids_by_title={note.title: note.id},
+            )
+        previous_targets = (
+            extract_link_targets(previous_state.text or "") if links_changed else link_targets
         )
-        removed_targets = [
-            title for title in previous_cleanup_names
-            if title not in set(current_cleanup_names)
-        ]
-        await self._keywords_repo.delete_unused_keywords(
+        self._uow.add_commit_hook(partial(
+            self._graph_index.apply_changes,
             user_id=note.user_id,
-            names=removed_targets,
-        )
-
-        return note
+            updated=[NoteLinks(note_id=note.id, title=note.title, targets=link_targets)],
+            previous=[
+                NoteLinks(note_id=note.id, title=previous_state.title, targets=previous_targets)
+            ],
+        ))
+
+    @staticmethod
+    def _apply_patch(note: Note, patch: str) -> bool:
+        """Apply the patch to the note, returns whether its links may have changed."""
+        previous_text = note.text or ""
+        try:
+            exact = apply_patch_exact(previous_text, patch)
+        except ValueError:
+            raise ValueError("Failed to apply patch")
+
+        # Stored intervals can only be shifted if they were maintained for
+        # this text; rows written before intervals existed have none.
+        if exact is not None and (note.link_intervals or "[[" not in previous_text):
+            note.text, edits = exact
+            note.link_intervals, links_changed = update_link_intervals(
+                previous_text, note.text, note.link_intervals, edits
+            )
+            return links_changed
+
+        # Hunks had to be fuzzy-matched: diff the full texts instead.
+        try:
+            note.text = apply_patch(previous_text, patch)
+        except Exception:
+            raise ValueError("Failed to apply patch")
+
+        links_changed = True
+        if note.link_intervals:
+            diffs = get_diffs(previous_text, note.text)
+            touched_old = check_if_ranges_touched(
+                len(previous_text),
+                diffs,
+                note.link_intervals,
+            )
+            has_new_brackets = any(("[" in text or "]" in text) for op, text in diffs if op == 1)
+            links_changed = touched_old or has_new_brackets
+        note.link_intervals = extract_link_intervals(note.text)
+        return links_changed
@@ -1,6 +1,9 @@
+from functools import partial
 from uuid import uuid4
 
+from brain.application.abstractions.caches.principals import IPrincipalCache
 from brain.application.abstractions.repositories.users import IUsersRepository
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.users.dto import CreateOrUpdateUser
 from brain.domain.entities.user import User
 
@@ -9,8 +12,12 @@ class UserInteractor:
     def __init__(
         self,
         users_repo: IUsersRepository,
+        principal_cache: IPrincipalCache,
+        uow: IUnitOfWork,
     ):
         self._users_repo = users_repo
+        self._principal_cache = principal_cache
+        self._uow = uow
 
     async def create_or_update_user(self, user_data: CreateOrUpdateUser):
         user_entity = User(
@@ -20,11 +27,15 @@ class UserInteractor:
             first_name=user_data.first_name,
             last_name=user_data.last_name,
         )
-        user = await self._users_repo.get_by_telegram_id(user_data.telegram_id)
-        if user:
-            user_entity.id = user.id
-            user_entity.profile_picture_file_id = user.profile_picture_file_id
-            await self._users_repo.update(user_entity)
-        else:
-            await self._users_repo.create(user_entity)
+        async with self._uow:
+            user = await self._users_repo.get_by_telegram_id(user_data.telegram_id)
+            if user:
+                user_entity.id = user.id
+                user_entity.profile_picture_file_id = user.profile_picture_file_id
+                await self._users_repo.update(user_entity)
+                self._uow.add_commit_hook(
+                    partial(self._principal_cache.invalidate, user_entity.id)
+                )
+            else:
+                await self._users_repo.create(user_entity)
 
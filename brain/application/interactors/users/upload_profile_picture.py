@@ -1,10 +1,13 @@
+from functools import partial
 from uuid import uuid4
 
+from brain.application.abstractions.caches.principals import IPrincipalCache
 from brain.application.abstractions.repositories.s3_files import (
     IS3FilesRepository,
 )
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.application.abstractions.storage.user_profile_pictures import IProfilePictureStorage
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.application.interactors.users.exceptions import UserNotFoundException
 from brain.domain.entities.s3_file import S3File
 
@@ -15,10 +18,14 @@ class UploadUserProfilePictureInteractor:
         users_repo: IUsersRepository,
         s3_files_repo: IS3FilesRepository,
         profile_picture_storage: IProfilePictureStorage,
+        principal_cache: IPrincipalCache,
+        uow: IUnitOfWork,
     ):
         self._users_repo = users_repo
         self._s3_files_repo = s3_files_repo
         self._profile_picture_storage = profile_picture_storage
+        self._principal_cache = principal_cache
+        self._uow = uow
 
     async def upload_profile_picture(
         self,
@@ -42,15 +49,19 @@ class UploadUserProfilePictureInteractor:
             object_name=object_name,
             content_type=content_type,
         )
-        existing = await self._s3_files_repo.get_by_user_id(user.id)
-        if existing:
-            profile_picture.id = existing.id
-            await self._s3_files_repo.update(profile_picture)
-        else:
-            await self._s3_files_repo.create(profile_picture)
-
-        user.profile_picture_file_id = profile_picture.id
-        await self._users_repo.update(user)
+        async with self._uow:
+            existing = await self._s3_files_repo.get_by_user_id(user.id)
+            if existing:
+                profile_picture.id = existing.id
+                await self._s3_files_repo.update(profile_picture)
+            else:
+                await self._s3_files_repo.create(profile_picture)
+
+            user.profile_picture_file_id = profile_picture.id
+            await self._users_repo.update(user)
+            # Dropped after commit: a request that misses the cache before
+            # that would refill it with the old picture.
+            self._uow.add_commit_hook(partial(self._principal_cache.invalidate, user.id))
 
         return profile_picture
 
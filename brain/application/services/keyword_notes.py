@@ -18,14 +18,6 @@ class KeywordNoteService:
         user_id: UUID,
         title: str,
     ) -> UUID:
-        keyword = await self._keywords_repo.get_by_user_and_name(user_id, name=title)
-        if not keyword:
-            await self._keywords_repo.ensure_keywords(user_id=user_id, names=[title])
-            keyword = await self._keywords_repo.get_by_user_and_name(
-                user_id, name=title
-            )
-
-        if not keyword:
+        if not title.strip():
             raise KeywordNotFoundException()
-
-        return keyword.id
+        return await self._keywords_repo.upsert_keyword(user_id, name=title)
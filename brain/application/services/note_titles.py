@@ -6,6 +6,8 @@ from brain.application.interactors.notes.exceptions import (
     NoteTitleRequiredException,
 )
 
+UNTITLED_PREFIX = "Untitled"
+
 
 class NoteTitleService:
     def __init__(self, notes_repo: INotesRepository):
@@ -47,13 +49,8 @@ class NoteTitleService:
             raise NoteTitleAlreadyExistsException()
 
     async def _next_untitled(self, user_id: UUID) -> str:
-        index = 1
-        while True:
-            candidate = f"Untitled {index}"
-            existing_count = await self._notes_repo.count_notes_by_user_and_title(
-                user_id=user_id,
-                title=candidate,
-            )
-            if existing_count == 0:
-                return candidate
-            index += 1
+        index = await self._notes_repo.get_first_free_title_index(
+            user_id=user_id,
+            prefix=UNTITLED_PREFIX,
+        )
+        return f"{UNTITLED_PREFIX} {index}"
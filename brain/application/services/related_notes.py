@@ -0,0 +1,53 @@
+import asyncio
+from collections.abc import Sequence
+from uuid import UUID
+
+from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.storage.related_notes import IRelatedNotesIndex
+from brain.domain.entities.note import Note
+
+
+class RelatedNotesService:
+    """
+    Keeps the related-notes index of a user in step with their notes.
+
+    Building vectors and writing them out is CPU and disk work, so it runs
+    in a thread and leaves the worker's event loop free.
+    """
+
+    def __init__(
+        self,
+        notes_repo: INotesRepository,
+        related_notes_index: IRelatedNotesIndex,
+    ):
+        self._notes_repo = notes_repo
+        self._related_notes_index = related_notes_index
+
+    async def refresh(
+        self,
+        user_id: UUID,
+        updated: Sequence[Note] = (),
+        deleted_ids: Sequence[UUID] = (),
+    ) -> None:
+        if self._related_notes_index.exists(user_id):
+            await asyncio.to_thread(
+                self._related_notes_index.apply_changes, user_id, updated, deleted_ids
+            )
+            return
+        # First change since the index was dropped (or ever): start from
+        # the user's full note set instead of patching nothing.
+        await self._rebuild(user_id)
+
+    async def backfill(self, user_id: UUID) -> bool:
+        """Builds the index of a user who has none; True if it was built."""
+        if self._related_notes_index.exists(user_id):
+            return False
+        await self._rebuild(user_id)
+        return True
+
+    async def drop(self, user_id: UUID) -> None:
+        await asyncio.to_thread(self._related_notes_index.drop, user_id)
+
+    async def _rebuild(self, user_id: UUID) -> None:
+        notes = [note async for note in self._notes_repo.stream_by_user_id(user_id)]
+        await asyncio.to_thread(self._related_notes_index.rebuild, user_id, notes)
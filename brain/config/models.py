@@ -85,6 +85,80 @@ class S3Config:
     region_name: str = "us-east-1"
 
 
+class GraphBackend(Enum):
+    NEO4J = "neo4j"
+    # Reads the graph from the notes tables; no Neo4j instance is needed.
+    POSTGRES = "postgres"
+
+
+@dataclass
+class GraphConfig:
+    backend: GraphBackend = GraphBackend.NEO4J
+    # Caps of a search walk; deeper or larger neighbourhoods are cut off
+    # and returned as truncated.
+    max_depth: int = 3
+    max_nodes: int = 2000
+
+
+@dataclass
+class GraphSyncConfig:
+    # Graph and keyword sync run at most once per window for each note;
+    # edits arriving within it are collapsed into a single sync.
+    coalesce_window_seconds: float = 2.0
+
+
+@dataclass
+class PrincipalCacheConfig:
+    # Invalidation only reaches the local tier of the process that made the
+    # change, so the local TTL bounds staleness in the other workers.
+    local_ttl_seconds: float = 5.0
+    local_max_entries: int = 10_000
+    redis_ttl_seconds: float = 60.0
+
+
+@dataclass
+class WikilinkIndexConfig:
+    # 100k titles take about 60 MB, plus about 40 MB once fuzzy search
+    # builds their trigram postings.
+    max_memory_mb: float = 128.0
+    # Upper bound on staleness if a version bump in Redis was lost.
+    max_age_seconds: float = 300.0
+
+
+@dataclass
+class GraphIndexConfig:
+    max_memory_mb: float = 256.0
+    # Upper bound on staleness if a version bump in Redis was lost.
+    max_age_seconds: float = 300.0
+    # Versions a client can fall behind and still get a delta rather
+    # than the full graph from GET /graph/changes.
+    change_log_max_entries: int = 200
+    change_log_ttl_seconds: float = 86400.0
+
+
+@dataclass
+class GraphCacheConfig:
+    # Entries are keyed by graph version, so the TTL only reclaims memory.
+    redis_ttl_seconds: float = 600.0
+    # Larger graphs are cheaper to walk again than to ship through Redis.
+    max_entry_kb: int = 2048
+
+
+@dataclass
+class FuzzySearchConfig:
+    # pg_trgm similarity, 0..1; pg_trgm's own default is 0.3.
+    similarity_threshold: float = 0.3
+    max_results: int = 20
+
+
+@dataclass
+class RelatedNotesConfig:
+    # Must be shared by the API and the worker: the worker writes the
+    # vectors, API processes memory-map them.
+    storage_dir: str = "data/related_notes"
+    max_cached_users: int = 256
+
+
 @dataclass
 class Config:
     api: APIConfig
@@ -95,3 +169,11 @@ class Config:
     s3: S3Config
     bot: BotConfig
     environment: EnvironmentType
+    graph: GraphConfig = field(default_factory=GraphConfig)
+    graph_sync: GraphSyncConfig = field(default_factory=GraphSyncConfig)
+    principal_cache: PrincipalCacheConfig = field(default_factory=PrincipalCacheConfig)
+    wikilink_index: WikilinkIndexConfig = field(default_factory=WikilinkIndexConfig)
+    graph_index: GraphIndexConfig = field(default_factory=GraphIndexConfig)
+    graph_cache: GraphCacheConfig = field(default_factory=GraphCacheConfig)
+    fuzzy_search: FuzzySearchConfig = field(default_factory=FuzzySearchConfig)
+    related_notes: RelatedNotesConfig = field(default_factory=RelatedNotesConfig)
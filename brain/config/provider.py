@@ -1,7 +1,22 @@
 from dishka import Provider, Scope, provide, from_context
 
 from brain.application.abstractions.config.models import IDatabaseConfig, INeo4jConfig
-from brain.config.models import APIConfig, Config, BotConfig, AuthenticationConfig, RedisConfig, S3Config
+from brain.config.models import (
+    APIConfig,
+    Config,
+    BotConfig,
+    FuzzySearchConfig,
+    AuthenticationConfig,
+    GraphCacheConfig,
+    GraphConfig,
+    GraphIndexConfig,
+    GraphSyncConfig,
+    PrincipalCacheConfig,
+    RedisConfig,
+    RelatedNotesConfig,
+    S3Config,
+    WikilinkIndexConfig,
+)
 
 
 class ConfigProvider(Provider):
@@ -24,6 +39,38 @@ class ConfigProvider(Provider):
     def get_auth_config(self, config: Config) -> AuthenticationConfig:
         return config.auth
 
+    @provide
+    def get_graph_config(self, config: Config) -> GraphConfig:
+        return config.graph
+
+    @provide
+    def get_graph_sync_config(self, config: Config) -> GraphSyncConfig:
+        return config.graph_sync
+
+    @provide
+    def get_principal_cache_config(self, config: Config) -> PrincipalCacheConfig:
+        return config.principal_cache
+
+    @provide
+    def get_wikilink_index_config(self, config: Config) -> WikilinkIndexConfig:
+        return config.wikilink_index
+
+    @provide
+    def get_graph_index_config(self, config: Config) -> GraphIndexConfig:
+        return config.graph_index
+
+    @provide
+    def get_graph_cache_config(self, config: Config) -> GraphCacheConfig:
+        return config.graph_cache
+
+    @provide
+    def get_fuzzy_search_config(self, config: Config) -> FuzzySearchConfig:
+        return config.fuzzy_search
+
+    @provide
+    def get_related_notes_config(self, config: Config) -> RelatedNotesConfig:
+        return config.related_notes
+
 
 class DatabaseConfigProvider(Provider):
     scope = Scope.APP
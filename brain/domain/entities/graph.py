@@ -23,3 +23,14 @@ class GraphConnection(Entity):
 class GraphData(Entity):
     nodes: list[GraphNode]
     connections: list[GraphConnection]
+    # The walk stopped at a depth or node cap before reaching every node.
+    truncated: bool = False
+
+
+@dataclass
+class GraphDelta(Entity):
+    # Removals apply first: a renamed note is removed and added again.
+    added_nodes: list[GraphNode]
+    removed_node_ids: list[str]
+    added_connections: list[GraphConnection]
+    removed_connections: list[GraphConnection]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from brain.domain.entities.common import Entity
+
+
+@dataclass
+class GraphSyncEvent(Entity):
+    """
+    Pending graph update for a note, stored in the transactional outbox
+    """
+
+    id: UUID
+    note_id: UUID
+    user_id: UUID
+    links_changed: bool = field(default=True, kw_only=True)
+    previous_title: str | None = field(default=None, kw_only=True)
+    previous_represents_keyword_id: UUID | None = field(default=None, kw_only=True)
+    attempts: int = field(default=0, kw_only=True)
+    created_at: datetime = field(default_factory=datetime.utcnow, kw_only=True)
+    processed_at: datetime | None = field(default=None, kw_only=True)
+    # Processed together with a later event for the same note.
+    coalesced: bool = field(default=False, kw_only=True)
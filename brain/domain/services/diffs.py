@@ -1,6 +1,6 @@
 import diff_match_patch as dmp_module
 
-from brain.domain.value_objects import LinkInterval
+from brain.domain.value_objects import LinkInterval, TextEdit
 
 
 def apply_patch(text: str, patch_text: str) -> str:
@@ -11,6 +11,57 @@ def apply_patch(text: str, patch_text: str) -> str:
     return new_text
 
 
+def apply_patch_exact(
+    text: str,
+    patch_text: str,
+) -> tuple[str, list[TextEdit]] | None:
+    """
+    Apply a diff-match-patch string when every hunk matches verbatim at its
+    recorded location, returning the new text and the edits in original
+    text coordinates. Returns None if any hunk would need fuzzy matching.
+    """
+    dmp = dmp_module.diff_match_patch()
+    current = text
+    edits: list[TextEdit] = []
+    # Total length change of the edits applied so far, used to map
+    # positions in the partially patched text back to the original.
+    applied_delta = 0
+    for patch in dmp.patch_fromText(patch_text):
+        old_chunk = dmp.diff_text1(patch.diffs)
+        location = patch.start2
+        if current[location:location + len(old_chunk)] != old_chunk:
+            return None
+
+        hunk_delta = 0
+        position = location
+        for op, data in patch.diffs:
+            if op == dmp.DIFF_EQUAL:
+                position += len(data)
+                continue
+            start = position - applied_delta
+            if op == dmp.DIFF_DELETE:
+                position += len(data)
+                edit = TextEdit(start, start + len(data), "")
+                hunk_delta -= len(data)
+            else:
+                edit = TextEdit(start, start, data)
+                hunk_delta += len(data)
+            if edits and edit.start < edits[-1].end:
+                return None
+            if edits and edit.start == edits[-1].end:
+                previous = edits.pop()
+                edit = TextEdit(previous.start, edit.end, previous.text + edit.text)
+            edits.append(edit)
+
+        current = (
+            current[:location]
+            + dmp.diff_text2(patch.diffs)
+            + current[location + len(old_chunk):]
+        )
+        applied_delta += hunk_delta
+    return current, edits
+
+
 def get_patches_str(text1: str, text2: str) -> str:
     """Produce the serialized patch instructions needed to transform text1 into text2."""
     dmp = dmp_module.diff_match_patch()
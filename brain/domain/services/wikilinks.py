@@ -1,6 +1,7 @@
 import re
+from bisect import bisect_left
 
-from brain.domain.value_objects import LinkInterval
+from brain.domain.value_objects import LinkInterval, TextEdit
 
 
 # Example 1: [[Child]] -> ["Child"]
@@ -17,15 +18,52 @@ def extract_link_targets(text: str) -> list[str]:
     seen: set[str] = set()
     targets: list[str] = []
     for title in raw_titles:
-        cleaned = title.strip()
-        if "|" in cleaned:
-            cleaned = cleaned.split("|", 1)[0].strip()
+        cleaned = _clean_target(title)
         if cleaned and cleaned not in seen:
             seen.add(cleaned)
             targets.append(cleaned)
     return targets
 
 
+def _clean_target(raw_title: str) -> str:
+    cleaned = raw_title.strip()
+    if "|" in cleaned:
+        cleaned = cleaned.split("|", 1)[0].strip()
+    return cleaned
+
+
+def extract_link_context(text: str, target: str, radius: int = 80) -> str:
+    """
+    The line around the first wikilink to `target`, cut to about `radius`
+    characters on each side of the link. Empty if there is no such link.
+    """
+    for match in WIKILINK_PATTERN.finditer(text or ""):
+        if _clean_target(match.group(1)) != target:
+            continue
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+
+        start = max(line_start, match.start() - radius)
+        end = min(line_end, match.end() + radius)
+        # Cut at whitespace so the snippet does not start or end mid-word.
+        if start > line_start:
+            space = text.find(" ", start, match.start())
+            start = space + 1 if space != -1 else start
+        if end < line_end:
+            space = text.rfind(" ", match.end(), end)
+            end = space if space != -1 else end
+
+        snippet = text[start:end].strip()
+        if start > line_start:
+            snippet = "…" + snippet
+        if end < line_end:
+            snippet += "…"
+        return snippet
+    return ""
+
+
 def extract_wikilinks(text: str) -> list[str]:
     """Backward-compatible alias that returns the list of link targets."""
     return extract_link_targets(text)
@@ -45,3 +83,77 @@ def extract_link_intervals(text: str) -> list[LinkInterval]:
         start, end = match.span()
         intervals.append(LinkInterval(start=start, end=end))
     return intervals
+
+
+def update_link_intervals(
+    old_text: str,
+    new_text: str,
+    intervals: list[LinkInterval],
+    edits: list[TextEdit],
+) -> tuple[list[LinkInterval], bool]:
+    """
+    Maintain sorted link intervals across `edits` (sorted, in `old_text`
+    coordinates) by re-parsing only the lines they touch; wikilinks never
+    span a newline. Returns the new intervals and whether the set of link
+    targets on the touched lines changed.
+    """
+    updated: list[LinkInterval] = []
+    targets_changed = False
+    index = 0
+    shift = 0
+    for start, end, delta in _touched_line_ranges(old_text, edits):
+        first = bisect_left(intervals, start, lo=index, key=_interval_start)
+        last = bisect_left(intervals, end, lo=first, key=_interval_start)
+        updated.extend(_shift_intervals(intervals[index:first], shift))
+        index = last
+
+        old_targets = {
+            _clean_target(match.group(1))
+            for match in WIKILINK_PATTERN.finditer(old_text, start, end)
+        }
+        new_matches = list(
+            WIKILINK_PATTERN.finditer(new_text, start + shift, end + shift + delta)
+        )
+        new_targets = {_clean_target(match.group(1)) for match in new_matches}
+        if old_targets != new_targets:
+            targets_changed = True
+        updated.extend(LinkInterval(*match.span()) for match in new_matches)
+        shift += delta
+
+    updated.extend(_shift_intervals(intervals[index:], shift))
+    return updated, targets_changed
+
+
+def _interval_start(interval: LinkInterval) -> int:
+    return interval.start
+
+
+def _shift_intervals(intervals: list[LinkInterval], shift: int) -> list[LinkInterval]:
+    if not shift:
+        return intervals
+    return [
+        LinkInterval(interval.start + shift, interval.end + shift)
+        for interval in intervals
+    ]
+
+
+def _touched_line_ranges(
+    text: str,
+    edits: list[TextEdit],
+) -> list[tuple[int, int, int]]:
+    """Merge edits into (start, end, delta) ranges expanded to whole lines."""
+    ranges: list[tuple[int, int, int]] = []
+    for edit in edits:
+        start = text.rfind("\n", 0, edit.start) + 1
+        end = text.find("\n", edit.end)
+        if end == -1:
+            end = len(text)
+        if ranges and start <= ranges[-1][1]:
+            previous_start, previous_end, previous_delta = ranges.pop()
+            start = previous_start
+            end = max(end, previous_end)
+            delta = previous_delta + edit.delta
+        else:
+            delta = edit.delta
+        ranges.append((start, end, delta))
+    return ranges
@@ -13,3 +13,15 @@ class LinkInterval:
         if not isinstance(other, LinkInterval):
             return NotImplemented
         return self.start < other.start
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """Replacement of the [start, end) range of the original text with `text`."""
+    start: int
+    end: int
+    text: str
+
+    @property
+    def delta(self) -> int:
+        return len(self.text) - (self.end - self.start)
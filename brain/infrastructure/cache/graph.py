@@ -0,0 +1,643 @@
+import hashlib
+import logging
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from brain.application.abstractions.caches.graph import IGraphCache, INotesGraphIndex
+from brain.application.abstractions.caches.models import (
+    CacheStats,
+    GraphChangeLog,
+    NoteLinksChange,
+)
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.config.models import GraphCacheConfig, GraphIndexConfig
+from brain.domain.entities.graph import GraphConnection, GraphData, GraphDelta, GraphNode
+from brain.infrastructure.cache.mappers import (
+    map_graph_from_cache,
+    map_graph_to_cache,
+    map_note_changes_from_cache,
+    map_note_changes_to_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "graph-index:version:"
+CHANGE_LOG_KEY_PREFIX = "graph-index:changes:"
+# Larger writes, like imports, are logged as a gap: a client behind one
+# gets the full graph, which is about as large as the delta would be.
+CHANGE_LOG_MAX_NOTES = 100
+_CHANGE_LOG_GAP = b""
+GRAPH_KEY_PREFIX = "graph-cache:"
+# Rough cost of the UUID, key string, list slots and dict buckets behind
+# one note or name, and of one slot in a set of linking notes.
+NOTE_ENTRY_BYTES = 300
+NAME_ENTRY_BYTES = 150
+LINK_ENTRY_BYTES = 40
+_NO_TARGETS = array("l")
+
+
+class UserGraph:
+    """
+    Notes of one user and the titles they link to, as integer adjacency.
+
+    Notes live in numbered slots and every title, linked or owned, gets a
+    name id. A note keeps the name ids it links to in an array, a name the
+    set of slots linking to it and the slot of the note owning it, if any.
+    That is the whole graph: has_keyword edges go from a note to the names
+    it links to, links_to edges on to the notes owning those names. A name
+    owned by a note is a hidden keyword: it is walked, not returned.
+    """
+
+    def __init__(self, version: int, notes: Iterable[NoteLinks]):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.size_bytes = 0
+        self._slots: dict[UUID, int] = {}
+        self._free_slots: list[int] = []
+        self._note_keys: list[str | None] = []
+        self._titles: list[str] = []
+        self._lowered_titles: list[str] = []
+        self._title_name_ids: list[int] = []
+        self._targets: list[array] = []
+        self._name_ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lowered_names: list[str] = []
+        self._owners = array("l")
+        self._linked_by: list[set[int]] = []
+        for note in notes:
+            self.set_note(note)
+
+    def set_note(self, note: NoteLinks) -> None:
+        slot = self._slots.get(note.note_id)
+        if slot is None:
+            slot = self._allocate(note.note_id)
+        else:
+            self._clear(slot)
+
+        title_name_id = self._name_id(note.title)
+        self._titles[slot] = note.title
+        self._lowered_titles[slot] = note.title.lower()
+        self._title_name_ids[slot] = title_name_id
+        self._owners[title_name_id] = slot
+        targets = array("l", dict.fromkeys(
+            self._name_id(target) for target in note.targets if target
+        ))
+        for name_id in targets:
+            self._linked_by[name_id].add(slot)
+        self._targets[slot] = targets
+        self.size_bytes += self._note_size(slot)
+
+    def remove_note(self, note_id: UUID) -> None:
+        slot = self._slots.pop(note_id, None)
+        if slot is None:
+            return
+        self._clear(slot)
+        self._note_keys[slot] = None
+        self._titles[slot] = ""
+        self._lowered_titles[slot] = ""
+        self._free_slots.append(slot)
+
+    def get_graph(
+        self,
+        query: str | None,
+        depth: int,
+        max_nodes: int | None = None,
+    ) -> GraphData:
+        truncated = False
+        if query:
+            notes, names, truncated = self._walk(query.lower(), depth, max_nodes)
+        else:
+            notes = list(self._slots.values())
+            names = [name_id for name_id, linked_by in enumerate(self._linked_by) if linked_by]
+        graph = self._graph_data(notes, names)
+        graph.truncated = truncated
+        return graph
+
+    def _walk(
+        self,
+        needle: str,
+        depth: int,
+        max_nodes: int | None,
+    ) -> tuple[list[int], list[int], bool]:
+        """
+        Slots and name ids within `depth` hops of a note or linked name
+        containing `needle`, edges taken in both directions, and whether
+        the walk stopped at `max_nodes` visited nodes.
+
+        The walk goes level by level and never revisits a node, so its cost
+        is bounded by the edges of the visited nodes, not by paths.
+        """
+        linked_by = self._linked_by
+        notes = [slot for slot, lowered in enumerate(self._lowered_titles) if needle in lowered]
+        names = [
+            name_id
+            for name_id, lowered in enumerate(self._lowered_names)
+            if needle in lowered and linked_by[name_id]
+        ]
+        remaining = len(self._titles) + len(self._names) if max_nodes is None else max_nodes
+        if len(notes) + len(names) > remaining:
+            notes = notes[:remaining]
+            return notes, names[:remaining - len(notes)], True
+        remaining -= len(notes) + len(names)
+
+        seen_notes = bytearray(len(self._titles))
+        seen_names = bytearray(len(self._names))
+        for slot in notes:
+            seen_notes[slot] = 1
+        for name_id in names:
+            seen_names[name_id] = 1
+
+        owners, targets, title_name_ids = self._owners, self._targets, self._title_name_ids
+        notes_frontier, names_frontier = notes, names
+        for _ in range(depth):
+            reached_notes: list[int] = []
+            reached_names: list[int] = []
+            for slot in notes_frontier:
+                for name_id in targets[slot]:
+                    if not seen_names[name_id]:
+                        seen_names[name_id] = 1
+                        reached_names.append(name_id)
+                    owner = owners[name_id]
+                    if owner >= 0 and not seen_notes[owner]:
+                        seen_notes[owner] = 1
+                        reached_notes.append(owner)
+                for other in linked_by[title_name_ids[slot]]:
+                    if not seen_notes[other]:
+                        seen_notes[other] = 1
+                        reached_notes.append(other)
+            for name_id in names_frontier:
+                for other in linked_by[name_id]:
+                    if not seen_notes[other]:
+                        seen_notes[other] = 1
+                        reached_notes.append(other)
+            if not reached_notes and not reached_names:
+                break
+            if len(reached_notes) + len(reached_names) > remaining:
+                # Notes first: hidden keywords would take room and not show.
+                reached_notes = reached_notes[:remaining]
+                notes.extend(reached_notes)
+                names.extend(reached_names[:remaining - len(reached_notes)])
+                return notes, names, True
+            remaining -= len(reached_notes) + len(reached_names)
+            notes.extend(reached_notes)
+            names.extend(reached_names)
+            notes_frontier, names_frontier = reached_notes, reached_names
+        return notes, names, False
+
+    def get_delta(self, changes: Sequence[NoteLinksChange]) -> GraphDelta:
+        """
+        Nodes and connections of the full graph that `changes` added or
+        removed; the graph must hold their `after` states.
+
+        Only the neighbourhood of the changed notes can differ, so it is
+        collected once as is and once with the changes rolled back.
+        """
+        note_ids = [change.note_id for change in changes]
+        names: set[str] = set()
+        for change in changes:
+            for state in (change.before, change.after):
+                if state is not None:
+                    names.add(state.title)
+                    names.update(target for target in state.targets if target)
+
+        after_nodes, after_edges = self._neighbourhood(note_ids, names)
+        self._set_states((change.note_id, change.before) for change in changes)
+        before_nodes, before_edges = self._neighbourhood(note_ids, names)
+        self._set_states((change.note_id, change.after) for change in changes)
+
+        added_nodes = [
+            GraphNode(id=key, title=title, kind="note", represents_keyword=True)
+            if key.startswith("note:")
+            else GraphNode(id=key, title=title, kind="keyword", has_keyword_note=False)
+            for key, title in after_nodes.items()
+            if before_nodes.get(key) != title
+        ]
+        return GraphDelta(
+            added_nodes=added_nodes,
+            removed_node_ids=[
+                key for key, title in before_nodes.items() if after_nodes.get(key) != title
+            ],
+            added_connections=[
+                GraphConnection(from_id=from_id, to_id=to_id, kind=kind)
+                for from_id, to_id, kind in after_edges - before_edges
+            ],
+            removed_connections=[
+                GraphConnection(from_id=from_id, to_id=to_id, kind=kind)
+                for from_id, to_id, kind in before_edges - after_edges
+            ],
+        )
+
+    def _neighbourhood(
+        self,
+        note_ids: Sequence[UUID],
+        names: Iterable[str],
+    ) -> tuple[dict[str, str], set[tuple[str, str, str]]]:
+        """
+        Every node and connection a change of `note_ids` touching `names`
+        can affect: the notes themselves, keyword nodes of the names, the
+        notes' connections and the connections of notes linking to a name.
+        """
+        owners, note_keys, targets = self._owners, self._note_keys, self._targets
+        nodes: dict[str, str] = {}
+        changed_slots = {self._slots[note_id] for note_id in note_ids if note_id in self._slots}
+        for slot in changed_slots:
+            nodes[note_keys[slot]] = self._titles[slot]
+        name_ids = {self._name_ids[name] for name in names if name in self._name_ids}
+        linkers = set(changed_slots)
+        for name_id in name_ids:
+            if self._linked_by[name_id]:
+                linkers.update(self._linked_by[name_id])
+                if owners[name_id] < 0:
+                    nodes[f"keyword:{self._names[name_id]}"] = self._names[name_id]
+
+        edges: set[tuple[str, str, str]] = set()
+        for slot in linkers:
+            from_id = note_keys[slot]
+            for name_id in targets[slot]:
+                if slot not in changed_slots and name_id not in name_ids:
+                    continue
+                owner = owners[name_id]
+                if owner < 0:
+                    edges.add((from_id, f"keyword:{self._names[name_id]}", "has_keyword"))
+                elif owner != slot:
+                    edges.add((from_id, note_keys[owner], "links_to"))
+        return nodes, edges
+
+    def _set_states(self, states: Iterable[tuple[UUID, NoteLinks | None]]) -> None:
+        for note_id, state in states:
+            if state is None:
+                self.remove_note(note_id)
+            else:
+                self.set_note(state)
+
+    def _graph_data(self, notes: list[int], names: list[int]) -> GraphData:
+        owners, note_keys, titles = self._owners, self._note_keys, self._titles
+        in_scope = bytearray(len(titles))
+        for slot in notes:
+            in_scope[slot] = 1
+        keyword_keys: dict[int, str] = {
+            name_id: f"keyword:{self._names[name_id]}"
+            for name_id in names
+            if owners[name_id] < 0
+        }
+
+        nodes = [
+            GraphNode(id=note_keys[slot], title=titles[slot], kind="note", represents_keyword=True)
+            for slot in notes
+        ]
+        nodes.extend(
+            GraphNode(id=key, title=self._names[name_id], kind="keyword", has_keyword_note=False)
+            for name_id, key in keyword_keys.items()
+        )
+        connections: list[GraphConnection] = []
+        for slot in notes:
+            from_id = note_keys[slot]
+            for name_id in self._targets[slot]:
+                owner = owners[name_id]
+                if owner < 0:
+                    to_id = keyword_keys.get(name_id)
+                    if to_id is not None:
+                        connections.append(
+                            GraphConnection(from_id=from_id, to_id=to_id, kind="has_keyword")
+                        )
+                elif owner != slot and in_scope[owner]:
+                    connections.append(
+                        GraphConnection(from_id=from_id, to_id=note_keys[owner], kind="links_to")
+                    )
+        return GraphData(nodes=nodes, connections=connections)
+
+    def _allocate(self, note_id: UUID) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._note_keys[slot] = f"note:{note_id}"
+        else:
+            slot = len(self._note_keys)
+            self._note_keys.append(f"note:{note_id}")
+            self._titles.append("")
+            self._lowered_titles.append("")
+            self._title_name_ids.append(-1)
+            self._targets.append(_NO_TARGETS)
+        self._slots[note_id] = slot
+        return slot
+
+    def _clear(self, slot: int) -> None:
+        self.size_bytes -= self._note_size(slot)
+        for name_id in self._targets[slot]:
+            self._linked_by[name_id].discard(slot)
+        self._targets[slot] = _NO_TARGETS
+        title_name_id = self._title_name_ids[slot]
+        if title_name_id >= 0 and self._owners[title_name_id] == slot:
+            self._owners[title_name_id] = -1
+        self._title_name_ids[slot] = -1
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+            self._lowered_names.append(name.lower())
+            self._owners.append(-1)
+            self._linked_by.append(set())
+            self.size_bytes += NAME_ENTRY_BYTES + 2 * sys.getsizeof(name)
+        return name_id
+
+    def _note_size(self, slot: int) -> int:
+        targets = self._targets[slot]
+        return (
+            NOTE_ENTRY_BYTES
+            + 2 * sys.getsizeof(self._titles[slot])
+            + (targets.itemsize + LINK_ENTRY_BYTES) * len(targets)
+        )
+
+
+class NotesGraphIndex(INotesGraphIndex):
+    """
+    Per-process LRU of UserGraph, capped by estimated memory.
+
+    A per-user version counter in Redis is bumped after every committed
+    note write; a missing counter is seeded from the clock. The process
+    that made the write patches its own graph in place; other processes
+    see a newer version and reload on the next request. The same
+    transaction appends the write's note changes to a capped per-user log,
+    from which graph deltas between versions are computed.
+    """
+
+    def __init__(self, redis: Redis, config: GraphIndexConfig):
+        self._redis = redis
+        self._max_bytes = int(config.max_memory_mb * 1024 * 1024)
+        self._max_age_seconds = config.max_age_seconds
+        self._change_log_max_entries = config.change_log_max_entries
+        self._change_log_ttl_ms = int(config.change_log_ttl_seconds * 1000)
+        self._users: OrderedDict[UUID, UserGraph] = OrderedDict()
+        self._size_bytes = 0
+        self._stats = CacheStats(hits=0, misses=0)
+        # Users whose committed writes never made it into Redis.
+        self._lost_writes: set[UUID] = set()
+
+    async def get_version(self, user_id: UUID) -> int | None:
+        try:
+            await self._log_lost_writes()
+            raw = await self._redis.get(self._key(user_id))
+            if raw is None:
+                return await self._seed_version(user_id)
+        except RedisError:
+            logger.warning("Graph index version read failed", exc_info=True)
+            return None
+        return int(raw)
+
+    def get_graph(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None = None,
+        depth: int = 1,
+        max_nodes: int | None = None,
+    ) -> GraphData | None:
+        entry = self._users.get(user_id)
+        if (
+            entry is None
+            or entry.version != version
+            or time.monotonic() - entry.loaded_at > self._max_age_seconds
+        ):
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._users.move_to_end(user_id)
+        return entry.get_graph(query, depth, max_nodes)
+
+    def load(self, user_id: UUID, version: int, notes: Sequence[NoteLinks]) -> None:
+        self._drop(user_id)
+        entry = UserGraph(version, notes)
+        self._users[user_id] = entry
+        self._size_bytes += entry.size_bytes
+        self._evict()
+
+    async def apply_changes(
+        self,
+        user_id: UUID,
+        updated: Sequence[NoteLinks] = (),
+        deleted_ids: Sequence[UUID] = (),
+        previous: Sequence[NoteLinks] = (),
+    ) -> None:
+        before = {note.note_id: note for note in previous}
+        changes = [
+            NoteLinksChange(note_id=note.note_id, before=before.get(note.note_id), after=note)
+            for note in updated
+        ]
+        changes.extend(
+            NoteLinksChange(note_id=note_id, before=before.get(note_id), after=None)
+            for note_id in deleted_ids
+        )
+        if user_id in self._lost_writes:
+            # The log misses an earlier write, so it cannot go on from there.
+            changes = None
+        try:
+            version = await self._bump_version(user_id, changes)
+        except RedisError:
+            logger.warning("Graph index version bump failed", exc_info=True)
+            self._lost_writes.add(user_id)
+            self._drop(user_id)
+            return
+        self._lost_writes.discard(user_id)
+
+        entry = self._users.get(user_id)
+        if entry is None:
+            return
+        if entry.version != version - 1:
+            # Another process changed the notes in between.
+            self._drop(user_id)
+            return
+
+        self._size_bytes -= entry.size_bytes
+        for note_id in deleted_ids:
+            entry.remove_note(note_id)
+        for note in updated:
+            entry.set_note(note)
+        entry.version = version
+        self._size_bytes += entry.size_bytes
+        self._evict()
+
+    async def get_change_log(self, user_id: UUID, since: int) -> GraphChangeLog | None:
+        try:
+            await self._log_lost_writes()
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.get(self._key(user_id))
+                pipe.lrange(self._log_key(user_id), 0, -1)
+                raw_version, entries = await pipe.execute()
+            if raw_version is None:
+                version = await self._seed_version(user_id)
+                return GraphChangeLog(version=version, changes=None)
+        except RedisError:
+            logger.warning("Graph change log read failed", exc_info=True)
+            return None
+
+        # The log is appended in the transaction bumping the version, so
+        # its last entry is always the current version.
+        version = int(raw_version)
+        behind = version - since
+        if behind < 0 or behind > len(entries):
+            return GraphChangeLog(version=version, changes=None)
+
+        net: dict[UUID, NoteLinksChange] = {}
+        for raw in entries[len(entries) - behind:]:
+            if raw == _CHANGE_LOG_GAP:
+                return GraphChangeLog(version=version, changes=None)
+            for change in map_note_changes_from_cache(raw):
+                first = net.get(change.note_id)
+                if first is not None:
+                    change.before = first.before
+                net[change.note_id] = change
+        return GraphChangeLog(
+            version=version,
+            changes=[change for change in net.values() if change.before != change.after],
+        )
+
+    def get_delta(
+        self,
+        user_id: UUID,
+        version: int,
+        changes: Sequence[NoteLinksChange],
+    ) -> GraphDelta | None:
+        entry = self._users.get(user_id)
+        if entry is None or entry.version != version:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._users.move_to_end(user_id)
+        # Rolling the changes back and forth may intern new names.
+        self._size_bytes -= entry.size_bytes
+        delta = entry.get_delta(changes)
+        self._size_bytes += entry.size_bytes
+        return delta
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        return {"memory": CacheStats(hits=self._stats.hits, misses=self._stats.misses)}
+
+    def _drop(self, user_id: UUID) -> None:
+        entry = self._users.pop(user_id, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_bytes and self._users:
+            _, entry = self._users.popitem(last=False)
+            self._size_bytes -= entry.size_bytes
+
+    async def _log_lost_writes(self) -> None:
+        # Until a lost write bumps the version, ETags and deltas of the user
+        # would keep describing the graph from before it.
+        for user_id in list(self._lost_writes):
+            await self._bump_version(user_id, None)
+            self._lost_writes.discard(user_id)
+
+    async def _bump_version(
+        self,
+        user_id: UUID,
+        changes: list[NoteLinksChange] | None,
+    ) -> int:
+        if changes is None or len(changes) > CHANGE_LOG_MAX_NOTES:
+            raw = _CHANGE_LOG_GAP
+        else:
+            raw = map_note_changes_to_cache(changes).encode()
+        log_key = self._log_key(user_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(user_id), _version_seed(), nx=True)
+            pipe.incr(self._key(user_id))
+            pipe.rpush(log_key, raw)
+            pipe.ltrim(log_key, -self._change_log_max_entries, -1)
+            pipe.pexpire(log_key, self._change_log_ttl_ms)
+            _, version, *_ = await pipe.execute()
+        return version
+
+    async def _seed_version(self, user_id: UUID) -> int:
+        key = self._key(user_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, _version_seed(), nx=True)
+            pipe.get(key)
+            _, raw = await pipe.execute()
+        return int(raw)
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"{VERSION_KEY_PREFIX}{user_id}"
+
+    @staticmethod
+    def _log_key(user_id: UUID) -> str:
+        return f"{CHANGE_LOG_KEY_PREFIX}{user_id}"
+
+
+def _version_seed() -> int:
+    # A counter lost to a flush or eviction restarts from the clock, above
+    # every version handed out before, so an old ETag never matches again.
+    # Microseconds leave room for a million writes per second.
+    return time.time_ns() // 1000
+
+
+class GraphCache(IGraphCache):
+    """
+    Computed graphs in Redis, keyed by user, graph version, query and depth.
+
+    The version is the one NotesGraphIndex bumps on every note write, so
+    an entry is never stale: a write makes the next request ask for a new
+    key, and old keys expire. Redis failures degrade to a miss.
+    """
+
+    def __init__(self, redis: Redis, config: GraphCacheConfig):
+        self._redis = redis
+        self._ttl_ms = int(config.redis_ttl_seconds * 1000)
+        self._max_entry_bytes = config.max_entry_kb * 1024
+        self._stats = CacheStats(hits=0, misses=0)
+
+    async def get(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None,
+        depth: int,
+    ) -> GraphData | None:
+        try:
+            raw = await self._redis.get(self._key(user_id, version, query, depth))
+        except RedisError:
+            logger.warning("Graph cache read failed", exc_info=True)
+            raw = None
+        if raw is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return map_graph_from_cache(raw)
+
+    async def set(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str | None,
+        depth: int,
+        graph: GraphData,
+    ) -> None:
+        raw = map_graph_to_cache(graph)
+        if len(raw) > self._max_entry_bytes:
+            return
+        try:
+            await self._redis.set(
+                self._key(user_id, version, query, depth), raw, px=self._ttl_ms
+            )
+        except RedisError:
+            logger.warning("Graph cache write failed", exc_info=True)
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        return {"redis": CacheStats(hits=self._stats.hits, misses=self._stats.misses)}
+
+    @staticmethod
+    def _key(user_id: UUID, version: int, query: str | None, depth: int) -> str:
+        if not query:
+            # Depth only applies to filtered graphs.
+            return f"{GRAPH_KEY_PREFIX}{user_id}:{version}"
+        digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+        return f"{GRAPH_KEY_PREFIX}{user_id}:{version}:{depth}:{digest}"
@@ -0,0 +1,129 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+from brain.application.abstractions.caches.models import NoteLinksChange
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.domain.entities.graph import GraphConnection, GraphData, GraphNode
+from brain.domain.entities.s3_file import S3File
+from brain.domain.entities.user import User
+
+
+def _dump_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _load_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _load_uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value else None
+
+
+def map_user_to_cache(user: User) -> str:
+    picture = user.profile_picture
+    return json.dumps({
+        "id": str(user.id),
+        "telegram_id": user.telegram_id,
+        "username": user.username,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "profile_picture_file_id": str(user.profile_picture_file_id)
+        if user.profile_picture_file_id
+        else None,
+        "profile_picture": {
+            "id": str(picture.id) if picture.id else None,
+            "object_name": picture.object_name,
+            "content_type": picture.content_type,
+            "created_at": _dump_datetime(picture.created_at),
+            "updated_at": _dump_datetime(picture.updated_at),
+        } if picture else None,
+        "created_at": _dump_datetime(user.created_at),
+        "updated_at": _dump_datetime(user.updated_at),
+    })
+
+
+def map_user_from_cache(raw: str | bytes) -> User:
+    data = json.loads(raw)
+    picture = data["profile_picture"]
+    return User(
+        id=_load_uuid(data["id"]),
+        telegram_id=data["telegram_id"],
+        username=data["username"],
+        first_name=data["first_name"],
+        last_name=data["last_name"],
+        profile_picture_file_id=_load_uuid(data["profile_picture_file_id"]),
+        profile_picture=S3File(
+            id=_load_uuid(picture["id"]),
+            object_name=picture["object_name"],
+            content_type=picture["content_type"],
+            created_at=_load_datetime(picture["created_at"]),
+            updated_at=_load_datetime(picture["updated_at"]),
+        ) if picture else None,
+        created_at=_load_datetime(data["created_at"]),
+        updated_at=_load_datetime(data["updated_at"]),
+    )
+
+
+def map_graph_to_cache(graph: GraphData) -> str:
+    # Positional rows: a full graph has tens of thousands of them.
+    return json.dumps({
+        "nodes": [
+            [node.id, node.title, node.kind, node.represents_keyword, node.has_keyword_note]
+            for node in graph.nodes
+        ],
+        "connections": [
+            [connection.from_id, connection.to_id, connection.kind]
+            for connection in graph.connections
+        ],
+        "truncated": graph.truncated,
+    }, separators=(",", ":"))
+
+
+def map_graph_from_cache(raw: str | bytes) -> GraphData:
+    data = json.loads(raw)
+    return GraphData(
+        nodes=[
+            GraphNode(
+                id=node_id,
+                title=title,
+                kind=kind,
+                represents_keyword=represents_keyword,
+                has_keyword_note=has_keyword_note,
+            )
+            for node_id, title, kind, represents_keyword, has_keyword_note in data["nodes"]
+        ],
+        connections=[
+            GraphConnection(from_id=from_id, to_id=to_id, kind=kind)
+            for from_id, to_id, kind in data["connections"]
+        ],
+        truncated=data["truncated"],
+    )
+
+
+def _dump_note_links(note: NoteLinks | None) -> list | None:
+    return [note.title, note.targets] if note else None
+
+
+def _load_note_links(note_id: UUID, value: list | None) -> NoteLinks | None:
+    return NoteLinks(note_id=note_id, title=value[0], targets=value[1]) if value else None
+
+
+def map_note_changes_to_cache(changes: list[NoteLinksChange]) -> str:
+    return json.dumps([
+        [str(change.note_id), _dump_note_links(change.before), _dump_note_links(change.after)]
+        for change in changes
+    ], separators=(",", ":"))
+
+
+def map_note_changes_from_cache(raw: str | bytes) -> list[NoteLinksChange]:
+    changes = []
+    for raw_note_id, before, after in json.loads(raw):
+        note_id = UUID(raw_note_id)
+        changes.append(NoteLinksChange(
+            note_id=note_id,
+            before=_load_note_links(note_id, before),
+            after=_load_note_links(note_id, after),
+        ))
+    return changes
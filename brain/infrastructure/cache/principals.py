@@ -0,0 +1,85 @@
+import logging
+from dataclasses import replace
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from brain.application.abstractions.caches.models import CacheStats
+from brain.application.abstractions.caches.principals import IPrincipalCache
+from brain.config.models import PrincipalCacheConfig
+from brain.domain.entities.user import User
+from brain.infrastructure.cache.lru import TTLLRUCache
+from brain.infrastructure.cache.mappers import map_user_from_cache, map_user_to_cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "principal:"
+
+
+class PrincipalCache(IPrincipalCache):
+    """
+    Two tiers: a per-process LRU in front of Redis shared by all workers.
+    Redis failures degrade to a miss so authorization falls back to Postgres.
+    """
+
+    def __init__(self, redis: Redis, config: PrincipalCacheConfig):
+        self._redis = redis
+        self._redis_ttl_ms = int(config.redis_ttl_seconds * 1000)
+        self._local: TTLLRUCache[UUID, User] = TTLLRUCache(
+            max_entries=config.local_max_entries,
+            ttl_seconds=config.local_ttl_seconds,
+        )
+        self._local_stats = CacheStats(hits=0, misses=0)
+        self._redis_stats = CacheStats(hits=0, misses=0)
+
+    async def get(self, user_id: UUID) -> User | None:
+        user = self._local.get(user_id)
+        if user is not None:
+            self._local_stats.hits += 1
+            return replace(user)
+        self._local_stats.misses += 1
+
+        try:
+            raw = await self._redis.get(self._key(user_id))
+        except RedisError:
+            logger.warning("Principal cache read failed", exc_info=True)
+            raw = None
+        if raw is None:
+            self._redis_stats.misses += 1
+            return None
+
+        self._redis_stats.hits += 1
+        user = map_user_from_cache(raw)
+        self._local.set(user_id, user)
+        return replace(user)
+
+    async def set(self, user: User) -> None:
+        self._local.set(user.id, replace(user))
+        try:
+            await self._redis.set(
+                self._key(user.id), map_user_to_cache(user), px=self._redis_ttl_ms
+            )
+        except RedisError:
+            logger.warning("Principal cache write failed", exc_info=True)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self._local.delete(user_id)
+        try:
+            await self._redis.delete(self._key(user_id))
+        except RedisError:
+            logger.warning("Principal cache invalidation failed", exc_info=True)
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        return {
+            "local": replace(self._local_stats),
+            "redis": replace(self._redis_stats),
+            "total": CacheStats(
+                hits=self._local_stats.hits + self._redis_stats.hits,
+                misses=self._redis_stats.misses,
+            ),
+        }
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"{KEY_PREFIX}{user_id}"
@@ -0,0 +1,50 @@
+from typing import AsyncIterable
+
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from brain.application.abstractions.caches.graph import IGraphCache, INotesGraphIndex
+from brain.application.abstractions.caches.principals import IPrincipalCache
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.config.models import (
+    GraphCacheConfig,
+    GraphIndexConfig,
+    PrincipalCacheConfig,
+    RedisConfig,
+    WikilinkIndexConfig,
+)
+from brain.infrastructure.cache.graph import GraphCache, NotesGraphIndex
+from brain.infrastructure.cache.principals import PrincipalCache
+from brain.infrastructure.cache.suggestions import WikilinkSuggestionIndex
+
+
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_redis(self, config: RedisConfig) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(config.uri)
+        yield redis
+        await redis.aclose()
+
+    @provide(provides=IPrincipalCache)
+    def get_principal_cache(
+        self, redis: Redis, config: PrincipalCacheConfig
+    ) -> PrincipalCache:
+        return PrincipalCache(redis=redis, config=config)
+
+    @provide(provides=IWikilinkSuggestionIndex)
+    def get_wikilink_suggestion_index(
+        self, redis: Redis, config: WikilinkIndexConfig
+    ) -> WikilinkSuggestionIndex:
+        return WikilinkSuggestionIndex(redis=redis, config=config)
+
+    @provide(provides=INotesGraphIndex)
+    def get_notes_graph_index(
+        self, redis: Redis, config: GraphIndexConfig
+    ) -> NotesGraphIndex:
+        return NotesGraphIndex(redis=redis, config=config)
+
+    @provide(provides=IGraphCache)
+    def get_graph_cache(self, redis: Redis, config: GraphCacheConfig) -> GraphCache:
+        return GraphCache(redis=redis, config=config)
@@ -0,0 +1,318 @@
+import heapq
+import logging
+import sys
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from brain.application.abstractions.caches.models import CacheStats
+from brain.application.abstractions.caches.suggestions import IWikilinkSuggestionIndex
+from brain.application.abstractions.repositories.models import (
+    WikilinkCandidates,
+    WikilinkSuggestion,
+)
+from brain.config.models import WikilinkIndexConfig
+from brain.infrastructure.cache.trigrams import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "wikilink-index:version:"
+# Rough per-entry cost of the tuples, list slots and dict/set buckets.
+ENTRY_OVERHEAD_BYTES = 60
+
+
+class UserSuggestions:
+    """
+    Keyword-note titles and keyword names of one user.
+
+    Every word start of every name is kept in a sorted array, so prefix
+    lookups ("rev" -> "Weekly review") are a bisect. Infix matches inside a
+    word fall back to a scan and are only needed when prefixes run short.
+    Fuzzy search uses a trigram index, built on its first use.
+    """
+
+    def __init__(self, version: int, candidates: WikilinkCandidates):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self._names_bytes = 0
+        self._titles: set[str] = set(_clean(candidates.note_titles))
+        self._keywords: set[str] = set(_clean(candidates.keyword_names))
+        self._lowered: dict[str, str] = {}
+        self._word_starts: list[tuple[str, str]] = []
+        self._trigrams: TrigramIndex | None = None
+
+        # Sorting once is far cheaper than inserting every suffix in order.
+        for name in self._titles | self._keywords:
+            lowered = name.lower()
+            self._lowered[name] = lowered
+            self._word_starts.extend((suffix, name) for suffix in _word_suffixes(lowered))
+            self._names_bytes += self._name_size(name, lowered)
+        self._word_starts.sort()
+
+    @property
+    def size_bytes(self) -> int:
+        trigrams_bytes = self._trigrams.size_bytes if self._trigrams is not None else 0
+        return self._names_bytes + trigrams_bytes
+
+    @property
+    def fuzzy_extra_bytes(self) -> int:
+        """Estimated growth once the trigram index is built; 0 if it is."""
+        if self._trigrams is not None:
+            return 0
+        return TrigramIndex.estimate_size_bytes(self._lowered.values())
+
+    def add_titles(self, titles: Iterable[str]) -> None:
+        for title in _clean(titles):
+            self._titles.add(title)
+            self._add_name(title)
+
+    def remove_titles(self, titles: Iterable[str]) -> None:
+        for title in _clean(titles):
+            self._titles.discard(title)
+            if title not in self._keywords:
+                self._remove_name(title)
+
+    def add_keywords(self, names: Iterable[str]) -> None:
+        for name in _clean(names):
+            self._keywords.add(name)
+            self._add_name(name)
+
+    def remove_keywords(self, names: Iterable[str]) -> None:
+        for name in _clean(names):
+            self._keywords.discard(name)
+            if name not in self._titles:
+                self._remove_name(name)
+
+    def search(self, query: str, limit: int) -> list[WikilinkSuggestion]:
+        needle = query.strip().lower()
+        if not needle:
+            return []
+
+        matches: dict[str, int] = {}
+        start = bisect_left(self._word_starts, (needle,))
+        for suffix, name in self._word_starts[start:]:
+            if not suffix.startswith(needle):
+                break
+            lowered = self._lowered[name]
+            matches[name] = 0 if lowered.startswith(needle) else 1
+        if len(matches) < limit:
+            for name in [name for name, lowered in self._lowered.items() if needle in lowered]:
+                matches.setdefault(name, 2)
+
+        # Same order as the SQL path: prefix matches first, then the closest
+        # (here: shortest) names, keyword notes before bare keywords.
+        best = heapq.nsmallest(
+            limit,
+            matches,
+            key=lambda name: (matches[name], len(name), name not in self._titles, name),
+        )
+        return self._suggestions(best)
+
+    def search_fuzzy(
+        self,
+        query: str,
+        limit: int,
+        threshold: float,
+    ) -> list[WikilinkSuggestion]:
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex(self._lowered)
+        best = self._trigrams.search(query, threshold, limit, preferred=self._titles.__contains__)
+        return self._suggestions(name for _, name in best)
+
+    def _suggestions(self, names: Iterable[str]) -> list[WikilinkSuggestion]:
+        return [
+            WikilinkSuggestion(title=name, represents_keyword=name in self._titles)
+            for name in names
+        ]
+
+    def _add_name(self, name: str) -> None:
+        if name in self._lowered:
+            return
+        lowered = name.lower()
+        self._lowered[name] = lowered
+        for suffix in _word_suffixes(lowered):
+            insort(self._word_starts, (suffix, name))
+        self._names_bytes += self._name_size(name, lowered)
+        if self._trigrams is not None:
+            self._trigrams.add(name)
+
+    def _remove_name(self, name: str) -> None:
+        lowered = self._lowered.pop(name, None)
+        if lowered is None:
+            return
+        for suffix in _word_suffixes(lowered):
+            index = bisect_left(self._word_starts, (suffix, name))
+            if index < len(self._word_starts) and self._word_starts[index] == (suffix, name):
+                del self._word_starts[index]
+        self._names_bytes -= self._name_size(name, lowered)
+        if self._trigrams is not None:
+            self._trigrams.remove(name)
+
+    @staticmethod
+    def _name_size(name: str, lowered: str) -> int:
+        suffixes = _word_suffixes(lowered)
+        return (
+            sys.getsizeof(name)
+            + sys.getsizeof(lowered)
+            + sum(sys.getsizeof(suffix) for suffix in suffixes)
+            + ENTRY_OVERHEAD_BYTES * (len(suffixes) + 1)
+        )
+
+
+def _clean(names: Iterable[str]) -> Iterable[str]:
+    for name in names:
+        trimmed = name.strip() if name else ""
+        if trimmed:
+            yield trimmed
+
+
+def _word_suffixes(lowered: str) -> list[str]:
+    return [
+        lowered[index:]
+        for index, char in enumerate(lowered)
+        if not char.isspace() and (index == 0 or lowered[index - 1].isspace())
+    ]
+
+
+class WikilinkSuggestionIndex(IWikilinkSuggestionIndex):
+    """
+    Per-process LRU of UserSuggestions, capped by estimated memory.
+
+    A per-user version counter in Redis is bumped after every committed
+    change. The process that made the change patches its own index in place;
+    other processes see a newer version and rebuild on the next request.
+    """
+
+    def __init__(self, redis: Redis, config: WikilinkIndexConfig):
+        self._redis = redis
+        self._max_bytes = int(config.max_memory_mb * 1024 * 1024)
+        self._max_age_seconds = config.max_age_seconds
+        self._users: OrderedDict[UUID, UserSuggestions] = OrderedDict()
+        self._size_bytes = 0
+        self._stats = CacheStats(hits=0, misses=0)
+
+    async def get_version(self, user_id: UUID) -> int | None:
+        try:
+            raw = await self._redis.get(self._key(user_id))
+        except RedisError:
+            logger.warning("Wikilink index version read failed", exc_info=True)
+            return None
+        return int(raw) if raw is not None else 0
+
+    def search(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str,
+        limit: int,
+    ) -> list[WikilinkSuggestion] | None:
+        entry = self._get_current(user_id, version)
+        if entry is None:
+            return None
+        return entry.search(query, limit)
+
+    def search_fuzzy(
+        self,
+        user_id: UUID,
+        version: int,
+        query: str,
+        limit: int,
+        threshold: float,
+    ) -> list[WikilinkSuggestion] | None:
+        entry = self._get_current(user_id, version)
+        if entry is None or not self._fuzzy_fits(entry):
+            return None
+        size_before = entry.size_bytes
+        suggestions = entry.search_fuzzy(query, limit, threshold)
+        self._size_bytes += entry.size_bytes - size_before
+        self._evict()
+        return suggestions
+
+    def fits_fuzzy(self, user_id: UUID, version: int) -> bool:
+        entry = self._users.get(user_id)
+        if entry is None or entry.version != version:
+            # Unknown until the index is loaded.
+            return True
+        return self._fuzzy_fits(entry)
+
+    def load(self, user_id: UUID, version: int, candidates: WikilinkCandidates) -> None:
+        self._drop(user_id)
+        entry = UserSuggestions(version, candidates)
+        if entry.size_bytes > self._max_bytes:
+            # It would only push every other user out and then itself.
+            return
+        self._users[user_id] = entry
+        self._size_bytes += entry.size_bytes
+        self._evict()
+
+    async def apply_changes(
+        self,
+        user_id: UUID,
+        added_titles: Sequence[str] = (),
+        removed_titles: Sequence[str] = (),
+        added_keywords: Sequence[str] = (),
+        removed_keywords: Sequence[str] = (),
+    ) -> None:
+        try:
+            version = await self._redis.incr(self._key(user_id))
+        except RedisError:
+            logger.warning("Wikilink index version bump failed", exc_info=True)
+            self._drop(user_id)
+            return
+
+        entry = self._users.get(user_id)
+        if entry is None:
+            return
+        if entry.version != version - 1:
+            # Another process changed the data in between.
+            self._drop(user_id)
+            return
+
+        self._size_bytes -= entry.size_bytes
+        entry.remove_titles(removed_titles)
+        entry.remove_keywords(removed_keywords)
+        entry.add_titles(added_titles)
+        entry.add_keywords(added_keywords)
+        entry.version = version
+        self._size_bytes += entry.size_bytes
+        self._evict()
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        return {"memory": CacheStats(hits=self._stats.hits, misses=self._stats.misses)}
+
+    def _get_current(self, user_id: UUID, version: int) -> UserSuggestions | None:
+        entry = self._users.get(user_id)
+        if (
+            entry is None
+            or entry.version != version
+            or time.monotonic() - entry.loaded_at > self._max_age_seconds
+        ):
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._users.move_to_end(user_id)
+        return entry
+
+    def _fuzzy_fits(self, entry: UserSuggestions) -> bool:
+        # Building postings that do not fit would evict the entry itself and
+        # rebuild both on every request.
+        return entry.size_bytes + entry.fuzzy_extra_bytes <= self._max_bytes
+
+    def _drop(self, user_id: UUID) -> None:
+        entry = self._users.pop(user_id, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_bytes and self._users:
+            _, entry = self._users.popitem(last=False)
+            self._size_bytes -= entry.size_bytes
+
+    @staticmethod
+    def _key(user_id: UUID) -> str:
+        return f"{VERSION_KEY_PREFIX}{user_id}"
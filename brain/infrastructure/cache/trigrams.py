@@ -0,0 +1,206 @@
+import re
+import sys
+from collections.abc import Callable, Collection, Iterable
+
+import numpy as np
+
+# pg_trgm splits on anything that is not a letter or digit.
+_WORD_RE = re.compile(r"[^\W_]+")
+# Rough cost of one vocabulary entry and of one cached per-name id array.
+VOCABULARY_ENTRY_BYTES = 100
+NAME_ENTRY_BYTES = 200
+# Real titles share a few tens of thousands of distinct trigrams at most.
+ESTIMATED_VOCABULARY_CAP = 65536
+# Added and removed names are handled outside the packed arrays until they
+# make up this share of it.
+PENDING_REPACK_RATIO = 0.05
+DEAD_REPACK_RATIO = 0.25
+MIN_REPACK_CHANGES = 256
+
+
+def trigrams(value: str) -> frozenset[str]:
+    """Trigram set of `value`, extracted the way pg_trgm does it."""
+    result = set()
+    for word in _WORD_RE.findall(value.lower()):
+        padded = f"  {word} "
+        result.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return frozenset(result)
+
+
+def similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    """pg_trgm similarity(): shared trigrams over all distinct trigrams."""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+class TrigramIndex:
+    """
+    Inverted trigram index answering pg_trgm similarity queries.
+
+    Postings are packed into flat numpy arrays, so a query costs one
+    concatenate + bincount over the posting lists of its trigrams instead of
+    a Python loop over every name sharing one of them. Removed names are
+    masked out and added names are scored one by one until there are enough
+    of either to make repacking worth it.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._vocabulary: dict[str, int] = {}
+        self._name_ids: dict[str, np.ndarray] = {}
+        self._pending: dict[str, frozenset[str]] = {}
+        self._ids_bytes = 0
+        for name in names:
+            self._name_ids[name] = self._encode(trigrams(name))
+        self._pack()
+
+    @property
+    def size_bytes(self) -> int:
+        return (
+            VOCABULARY_ENTRY_BYTES * len(self._vocabulary)
+            + NAME_ENTRY_BYTES * len(self._name_ids)
+            + self._ids_bytes
+            + self._sizes.nbytes
+            + self._alive.nbytes
+            + self._offsets.nbytes
+            + self._postings.nbytes
+            + sys.getsizeof(self._names)
+        )
+
+    @staticmethod
+    def estimate_size_bytes(names: Collection[str]) -> int:
+        """
+        Upper estimate of `size_bytes` for an index over `names`.
+
+        A word of n characters has n + 1 trigrams, so the name length bounds
+        the count without extracting them.
+        """
+        total_trigrams = sum(len(name) + 1 for name in names)
+        return (
+            VOCABULARY_ENTRY_BYTES * min(total_trigrams, ESTIMATED_VOCABULARY_CAP)
+            # Names, per-name sizes, alive flags and list slots.
+            + (NAME_ENTRY_BYTES + 13) * len(names)
+            # Every trigram id is held once per name and once in the postings.
+            + 8 * total_trigrams
+        )
+
+    def add(self, name: str) -> None:
+        if name in self._name_ids:
+            return
+        name_trigrams = trigrams(name)
+        self._name_ids[name] = self._encode(name_trigrams)
+        slot = self._slots.get(name)
+        if slot is not None:
+            self._alive[slot] = True
+            self._dead -= 1
+        else:
+            self._pending[name] = name_trigrams
+
+    def remove(self, name: str) -> None:
+        ids = self._name_ids.pop(name, None)
+        if ids is None:
+            return
+        self._ids_bytes -= ids.nbytes
+        if self._pending.pop(name, None) is None:
+            self._alive[self._slots[name]] = False
+            self._dead += 1
+
+    def search(
+        self,
+        query: str,
+        threshold: float,
+        limit: int,
+        preferred: Callable[[str], bool],
+    ) -> list[tuple[float, str]]:
+        """
+        Top `limit` (score, name) pairs scoring at least `threshold`.
+
+        Ordered by score, then `preferred` names, then name.
+        """
+        if len(self._pending) > PENDING_REPACK_RATIO * len(self._names) + MIN_REPACK_CHANGES:
+            self._pack()
+        elif self._dead > DEAD_REPACK_RATIO * len(self._names) + MIN_REPACK_CHANGES:
+            self._pack()
+
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return []
+        best = self._search_packed(query_trigrams, threshold, limit, preferred)
+        for name, name_trigrams in self._pending.items():
+            score = similarity(query_trigrams, name_trigrams)
+            if score >= threshold:
+                best.append((score, name))
+        if self._pending:
+            best.sort(key=lambda item: (-item[0], not preferred(item[1]), item[1]))
+        return best[:limit]
+
+    def _search_packed(
+        self,
+        query_trigrams: frozenset[str],
+        threshold: float,
+        limit: int,
+        preferred: Callable[[str], bool],
+    ) -> list[tuple[float, str]]:
+        # Trigrams first seen after packing only occur in pending names.
+        offsets, postings = self._offsets, self._postings
+        packed = len(offsets) - 1
+        known = [
+            id_
+            for id_ in map(self._vocabulary.get, query_trigrams)
+            if id_ is not None and id_ < packed
+        ]
+        if not known:
+            return []
+
+        shared = np.bincount(
+            np.concatenate([postings[offsets[id_]:offsets[id_ + 1]] for id_ in known]),
+            minlength=len(self._names),
+        )
+        shared[~self._alive] = 0
+        slots = np.flatnonzero(shared)
+        counts = shared[slots]
+        scores = counts / (len(query_trigrams) + self._sizes[slots] - counts)
+        matched = scores >= threshold
+        slots, scores = slots[matched], scores[matched]
+
+        # Keep the best `limit` scores plus everything tied with the last one;
+        # slots follow name order, so they break the remaining ties.
+        if len(slots) > limit:
+            cutoff = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            kept = scores >= cutoff
+            slots, scores = slots[kept], scores[kept]
+        names = self._names
+        not_preferred = np.fromiter(
+            (not preferred(names[slot]) for slot in slots),
+            dtype=bool,
+            count=len(slots),
+        )
+        order = np.lexsort((slots, not_preferred, -scores))[:limit]
+        return [(float(scores[index]), names[slots[index]]) for index in order]
+
+    def _encode(self, name_trigrams: frozenset[str]) -> np.ndarray:
+        vocabulary = self._vocabulary
+        ids = np.fromiter(
+            (vocabulary.setdefault(trigram, len(vocabulary)) for trigram in name_trigrams),
+            dtype=np.int32,
+            count=len(name_trigrams),
+        )
+        self._ids_bytes += ids.nbytes
+        return ids
+
+    def _pack(self) -> None:
+        self._names = sorted(self._name_ids)
+        self._slots = {name: slot for slot, name in enumerate(self._names)}
+        self._pending = {}
+        self._dead = 0
+        self._alive = np.ones(len(self._names), dtype=bool)
+
+        id_arrays = [self._name_ids[name] for name in self._names]
+        self._sizes = np.fromiter(map(len, id_arrays), dtype=np.int32, count=len(id_arrays))
+        all_ids = np.concatenate(id_arrays) if id_arrays else np.zeros(0, dtype=np.int32)
+        owners = np.repeat(np.arange(len(self._names), dtype=np.int32), self._sizes)
+        # Order inside a posting list does not matter, so no stable sort.
+        self._postings = owners[np.argsort(all_ids)]
+        self._offsets = np.zeros(len(self._vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_ids, minlength=len(self._vocabulary)), out=self._offsets[1:])
@@ -0,0 +1,32 @@
+from brain.domain.entities.graph_sync import GraphSyncEvent
+from brain.infrastructure.db.models.graph_sync import GraphSyncEventDB
+
+
+def map_graph_sync_event_to_dm(event: GraphSyncEventDB) -> GraphSyncEvent:
+    return GraphSyncEvent(
+        id=event.id,
+        note_id=event.note_id,
+        user_id=event.user_id,
+        links_changed=event.links_changed,
+        previous_title=event.previous_title,
+        previous_represents_keyword_id=event.previous_represents_keyword_id,
+        attempts=event.attempts,
+        created_at=event.created_at,
+        processed_at=event.processed_at,
+        coalesced=event.coalesced,
+    )
+
+
+def map_graph_sync_event_to_db(event: GraphSyncEvent) -> GraphSyncEventDB:
+    return GraphSyncEventDB(
+        id=event.id,
+        note_id=event.note_id,
+        user_id=event.user_id,
+        links_changed=event.links_changed,
+        previous_title=event.previous_title,
+        previous_represents_keyword_id=event.previous_represents_keyword_id,
+        attempts=event.attempts,
+        created_at=event.created_at,
+        processed_at=event.processed_at,
+        coalesced=event.coalesced,
+    )
@@ -5,3 +5,5 @@ from .note import NoteDB
 from .tg_bot_auth import TelegramBotAuthSessionDB
 from .user import UserDB
 from .s3 import S3FileDB
+from .graph_sync import GraphSyncEventDB
+from .note_link import NoteLinkDB
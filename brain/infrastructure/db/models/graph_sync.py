@@ -0,0 +1,43 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Uuid, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from brain.infrastructure.db.models.base import Base
+from brain.infrastructure.db.models.mixins import utcnow_wrapper
+
+
+class GraphSyncEventDB(Base):
+    __tablename__ = "graph_sync_outbox"
+    __table_args__ = (
+        Index(
+            "ix_graph_sync_outbox_pending",
+            "created_at",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    # No foreign key: the event has to outlive the note it deletes.
+    note_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
+    user_id: Mapped[UUID] = mapped_column(Uuid, nullable=False, index=True)
+    links_changed: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text("true")
+    )
+    previous_title: Mapped[str | None] = mapped_column(
+        String(length=255), nullable=True
+    )
+    previous_represents_keyword_id: Mapped[UUID | None] = mapped_column(
+        Uuid, nullable=True
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow_wrapper, server_default=func.now()
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    coalesced: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text("false")
+    )
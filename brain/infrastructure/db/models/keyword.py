@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint, Uuid
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from brain.infrastructure.db.models.base import Base
@@ -13,6 +13,11 @@ class KeywordDB(Base, CreatedUpdatedMixin):
     __tablename__ = "keywords"
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_keywords_user_id_name"),
+        Index(
+            "ix_keywords_lower_name_trgm",
+            text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
@@ -23,23 +28,31 @@ class KeywordDB(Base, CreatedUpdatedMixin):
     )
     name: Mapped[str] = mapped_column(String(length=255), nullable=False)
 
-    user = relationship("UserDB", back_populates="keywords", lazy="selectin")
+    # Relationships never load implicitly; repositories opt in per query.
+    user = relationship("UserDB", back_populates="keywords", lazy="raise")
     note_keywords = relationship(
         "NoteKeywordDB",
         back_populates="keyword",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     notes = relationship(
         "NoteDB",
         secondary="note_keywords",
         back_populates="keywords",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         overlaps="note_keywords",
     )
 
 
 class NoteKeywordDB(Base):
     __tablename__ = "note_keywords"
+    __table_args__ = (
+        # Notes having a keyword; the primary key covers the other direction.
+        Index("ix_note_keywords_keyword_id", "keyword_id"),
+    )
     __mapper_args__ = {"confirm_deleted_rows": False}
 
     note_id: Mapped[UUID] = mapped_column(
@@ -53,5 +66,5 @@ class NoteKeywordDB(Base):
         primary_key=True,
     )
 
-    note = relationship("NoteDB", back_populates="note_keywords", lazy="selectin", overlaps="notes")
-    keyword = relationship("KeywordDB", back_populates="note_keywords", lazy="selectin", overlaps="notes")
+    note = relationship("NoteDB", back_populates="note_keywords", lazy="raise", overlaps="notes")
+    keyword = relationship("KeywordDB", back_populates="note_keywords", lazy="raise", overlaps="notes")
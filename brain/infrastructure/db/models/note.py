@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import Uuid, String, Text, Column, ForeignKey, UniqueConstraint, JSON
+from sqlalchemy import Uuid, String, Text, Column, Computed, ForeignKey, Index, UniqueConstraint, JSON, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 from brain.infrastructure.db.models.base import Base
@@ -13,6 +14,18 @@ class NoteDB(Base, CreatedUpdatedMixin):
     __tablename__ = "notes"
     __table_args__ = (
         UniqueConstraint("user_id", "title", name="uq_notes_user_id_title"),
+        # Keyset pagination of note lists in both sort orders.
+        Index("ix_notes_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_notes_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Substring and similarity search on titles (pg_trgm).
+        Index(
+            "ix_notes_lower_title_trgm",
+            text("lower(title) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index("ix_notes_search_vector", "search_vector", postgresql_using="gin"),
+        # Link targets when the graph is read from Postgres.
+        Index("ix_notes_represents_keyword_id", "represents_keyword_id"),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
@@ -29,18 +42,33 @@ class NoteDB(Base, CreatedUpdatedMixin):
         nullable=False,
     )
     link_intervals: Mapped[list[list[int]]] = mapped_column(JSON, default=list, nullable=False)
+    # Maintained by Postgres; only full-text search reads it.
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(text, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        deferred_raiseload=True,
+    )
 
-    user = relationship("UserDB", back_populates="notes", lazy="selectin")
+    # Relationships never load implicitly; repositories opt in per query.
+    user = relationship("UserDB", back_populates="notes", lazy="raise")
     note_keywords = relationship(
         "NoteKeywordDB",
         back_populates="note",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
         overlaps="notes",
     )
     keywords = relationship(
         "KeywordDB",
         secondary="note_keywords",
         back_populates="notes",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         overlaps="note_keywords,note,keyword",
     )
@@ -0,0 +1,34 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from brain.infrastructure.db.models.base import Base
+
+
+class NoteLinkDB(Base):
+    __tablename__ = "note_links"
+    __table_args__ = (
+        # Backlinks of a note, already in keyset order.
+        Index("ix_note_links_target_note_id_source_note_id", "target_note_id", "source_note_id"),
+        # Links waiting for a note with their target title.
+        Index("ix_note_links_user_id_target_title", "user_id", "target_title"),
+    )
+
+    source_note_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("notes.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+    target_title: Mapped[str] = mapped_column(Text, primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+    )
+    # NULL while no note has the target title.
+    target_note_id: Mapped[UUID | None] = mapped_column(
+        Uuid,
+        ForeignKey("notes.id", ondelete="SET NULL", onupdate="CASCADE"),
+        nullable=True,
+    )
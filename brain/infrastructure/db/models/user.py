@@ -22,11 +22,12 @@ class UserDB(Base, CreatedUpdatedMixin):
         nullable=True,
     )
 
-    notes = relationship("NoteDB", back_populates="user", lazy="selectin")
-    keywords = relationship("KeywordDB", back_populates="user", lazy="selectin")
+    # Relationships never load implicitly; repositories opt in per query.
+    notes = relationship("NoteDB", back_populates="user", lazy="raise")
+    keywords = relationship("KeywordDB", back_populates="user", lazy="raise")
     profile_picture_file = relationship(
         S3FileDB,
-        lazy="selectin",
+        lazy="raise",
         uselist=False,
         foreign_keys="UserDB.profile_picture_file_id",
     )
@@ -4,6 +4,7 @@ from dishka import Provider, provide, Scope
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
 
 from brain.application.abstractions.repositories.notes import INotesRepository
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.application.abstractions.repositories.s3_files import (
@@ -15,10 +16,15 @@ from brain.application.abstractions.repositories.jwt import (
 from brain.application.abstractions.repositories.tg_bot_auth import (
     ITelegramBotAuthSessionsRepository,
 )
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
 from brain.application.abstractions.config.models import IDatabaseConfig
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 from brain.infrastructure.db.connection import create_engine, create_session_maker
 from brain.infrastructure.db.repositories.hub import RepositoryHub
 from brain.infrastructure.db.repositories.notes import NotesRepository
+from brain.infrastructure.db.repositories.note_links import NoteLinksRepository
 from brain.infrastructure.db.repositories.keywords import KeywordsRepository
 from brain.infrastructure.db.repositories.users import UsersRepository
 from brain.infrastructure.db.repositories.s3_files import S3FilesRepository
@@ -28,6 +34,10 @@ from brain.infrastructure.db.repositories.jwt import (
 from brain.infrastructure.db.repositories.tg_bot_auth import (
     TelegramBotAuthSessionsRepository,
 )
+from brain.infrastructure.db.repositories.graph_sync_outbox import (
+    GraphSyncOutboxRepository,
+)
+from brain.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
 
 
 class DatabaseProvider(Provider):
@@ -50,12 +60,18 @@ class DatabaseProvider(Provider):
         async with pool() as session:
             yield session
 
+    unit_of_work = provide(
+        SqlAlchemyUnitOfWork, scope=Scope.REQUEST, provides=IUnitOfWork
+    )
     users_repository = provide(
         UsersRepository, scope=Scope.REQUEST, provides=IUsersRepository
     )
     notes_repository = provide(
         NotesRepository, scope=Scope.REQUEST, provides=INotesRepository
     )
+    note_links_repository = provide(
+        NoteLinksRepository, scope=Scope.REQUEST, provides=INoteLinksRepository
+    )
     keywords_repository = provide(
         KeywordsRepository, scope=Scope.REQUEST, provides=IKeywordsRepository
     )
@@ -72,6 +88,11 @@ class DatabaseProvider(Provider):
         scope=Scope.REQUEST,
         provides=IJwtRefreshTokensRepository,
     )
+    graph_sync_outbox_repository = provide(
+        GraphSyncOutboxRepository,
+        scope=Scope.REQUEST,
+        provides=IGraphSyncOutboxRepository,
+    )
     hub_repository = provide(
         RepositoryHub, scope=Scope.REQUEST
     )
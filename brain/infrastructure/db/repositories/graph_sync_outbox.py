@@ -0,0 +1,116 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Text, cast, delete, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
+from brain.application.abstractions.repositories.models import GraphSyncOutboxStats
+from brain.domain.entities.graph_sync import GraphSyncEvent
+from brain.infrastructure.db.mappers.graph_sync import (
+    map_graph_sync_event_to_db,
+    map_graph_sync_event_to_dm,
+)
+from brain.infrastructure.db.models.graph_sync import GraphSyncEventDB
+
+
+class GraphSyncOutboxRepository(IGraphSyncOutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, entity: GraphSyncEvent) -> None:
+        db_model = map_graph_sync_event_to_db(entity)
+        self._session.add(db_model)
+        await self._session.flush()
+
+    async def claim_pending(
+        self, limit: int, max_attempts: int, ready_before: datetime
+    ) -> list[GraphSyncEvent]:
+        pending = (
+            GraphSyncEventDB.processed_at.is_(None),
+            GraphSyncEventDB.attempts < max_attempts,
+        )
+        # A note is ready once its oldest pending event has waited out the
+        # window; all of its newer events are claimed along with it.
+        ready_notes = (
+            select(GraphSyncEventDB.note_id)
+            .where(*pending)
+            .group_by(GraphSyncEventDB.note_id)
+            .having(func.min(GraphSyncEventDB.created_at) <= ready_before)
+            .order_by(func.min(GraphSyncEventDB.created_at))
+            .limit(limit)
+            .subquery()
+        )
+        # Row locks only cover events that existed at claim time, so another
+        # worker could still pick up a note's newer events and sync them out
+        # of order. A per-note lock held until commit keeps each note with
+        # one worker; the LIMIT above bounds how many locks are tried.
+        claimed_notes = select(ready_notes.c.note_id).where(
+            func.pg_try_advisory_xact_lock(
+                func.hashtextextended(
+                    func.concat("graph-sync:", cast(ready_notes.c.note_id, Text)), 0
+                )
+            )
+        )
+        query = (
+            select(GraphSyncEventDB)
+            .where(*pending, GraphSyncEventDB.note_id.in_(claimed_notes))
+            .order_by(GraphSyncEventDB.created_at, GraphSyncEventDB.id)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.scalars(query)
+        return [map_graph_sync_event_to_dm(db_model) for db_model in result]
+
+    async def mark_processed(
+        self, event_ids: list[UUID], coalesced: bool = False
+    ) -> None:
+        if not event_ids:
+            return
+        stmt = (
+            update(GraphSyncEventDB)
+            .where(GraphSyncEventDB.id.in_(event_ids))
+            .values(processed_at=datetime.utcnow(), coalesced=coalesced)
+        )
+        await self._session.execute(stmt)
+
+    async def increment_attempts(self, event_ids: list[UUID]) -> None:
+        if not event_ids:
+            return
+        stmt = (
+            update(GraphSyncEventDB)
+            .where(GraphSyncEventDB.id.in_(event_ids))
+            .values(attempts=GraphSyncEventDB.attempts + 1)
+        )
+        await self._session.execute(stmt)
+
+    async def get_stats(self, user_id: UUID, max_attempts: int) -> GraphSyncOutboxStats:
+        unprocessed = GraphSyncEventDB.processed_at.is_(None)
+        retryable = unprocessed & (GraphSyncEventDB.attempts < max_attempts)
+        exhausted = unprocessed & (GraphSyncEventDB.attempts >= max_attempts)
+        query = select(
+            func.count().filter(retryable),
+            func.count().filter(exhausted),
+            func.min(GraphSyncEventDB.created_at).filter(retryable),
+            func.count().filter(~unprocessed),
+            func.count().filter(GraphSyncEventDB.coalesced.is_(True)),
+        ).where(GraphSyncEventDB.user_id == user_id)
+        result = await self._session.execute(query)
+        pending, failed, oldest_pending_at, processed, coalesced = result.one()
+        return GraphSyncOutboxStats(
+            pending=pending,
+            failed=failed,
+            oldest_pending_at=oldest_pending_at,
+            processed=processed,
+            coalesced=coalesced,
+        )
+
+    async def delete_processed_before(self, before: datetime) -> None:
+        stmt = delete(GraphSyncEventDB).where(
+            GraphSyncEventDB.processed_at < before
+        )
+        await self._session.execute(stmt)
+
+    async def delete_all(self) -> None:
+        await self._session.execute(text("DELETE FROM graph_sync_outbox"))
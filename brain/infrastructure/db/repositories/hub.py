@@ -1,11 +1,16 @@
 from dataclasses import dataclass
 
+from brain.application.abstractions.repositories.graph_sync_outbox import (
+    IGraphSyncOutboxRepository,
+)
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
 from brain.application.abstractions.repositories.notes import INotesRepository
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.application.abstractions.repositories.s3_files import (
     IS3FilesRepository,
 )
+from brain.application.abstractions.unit_of_work import IUnitOfWork
 
 
 @dataclass
@@ -14,3 +19,6 @@ class RepositoryHub:
     s3_files: IS3FilesRepository
     notes: INotesRepository
     keywords: IKeywordsRepository
+    note_links: INoteLinksRepository
+    graph_sync_outbox: IGraphSyncOutboxRepository
+    uow: IUnitOfWork
@@ -6,10 +6,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
 from brain.domain.entities.keyword import Keyword
+from brain.domain.entities.note_keyword import NoteKeyword
 from brain.infrastructure.db.models.keyword import KeywordDB
 from brain.infrastructure.db.models.note import NoteDB
 from brain.infrastructure.db.models.keyword import NoteKeywordDB
 
+# Upper bound for IN (...) lists so bulk lookups stay far below
+# the asyncpg bind parameter limit.
+LOOKUP_CHUNK_SIZE = 1000
+
 
 class KeywordsRepository(IKeywordsRepository):
     def __init__(self, session: AsyncSession):
@@ -73,41 +78,90 @@ class KeywordsRepository(IKeywordsRepository):
             index_elements=["user_id", "name"]
         )
         await self._session.execute(stmt)
-        await self._session.commit()
+        await self._session.flush()
+
+    async def upsert_keyword(self, user_id: UUID, name: str) -> UUID:
+        stmt = insert(KeywordDB).values(id=uuid4(), user_id=user_id, name=name.strip())
+        # A no-op update makes RETURNING yield the id of an existing keyword.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "name"],
+            set_={"name": stmt.excluded.name},
+        ).returning(KeywordDB.id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    async def ensure_keyword_ids(
+        self,
+        user_id: UUID,
+        names: list[str],
+    ) -> dict[str, UUID]:
+        normalized = self._normalize(names)
+        keyword_ids: dict[str, UUID] = {}
+        for start in range(0, len(normalized), LOOKUP_CHUNK_SIZE):
+            chunk = normalized[start:start + LOOKUP_CHUNK_SIZE]
+            stmt = insert(KeywordDB).values(
+                [{"id": uuid4(), "user_id": user_id, "name": name} for name in chunk]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "name"],
+                set_={"name": stmt.excluded.name},
+            ).returning(KeywordDB.name, KeywordDB.id)
+            result = await self._session.execute(stmt)
+            keyword_ids.update(result.tuples().all())
+        return keyword_ids
+
+    async def create_note_keywords(self, entities: list[NoteKeyword]) -> None:
+        if not entities:
+            return
+
+        stmt = insert(NoteKeywordDB).on_conflict_do_nothing(
+            index_elements=["note_id", "keyword_id"]
+        )
+        await self._session.execute(
+            stmt,
+            [
+                {"note_id": entity.note_id, "keyword_id": entity.keyword_id}
+                for entity in entities
+            ],
+        )
 
     async def replace_note_keywords(
         self,
         note_id: UUID,
         user_id: UUID,
         names: list[str],
-    ) -> None:
+    ) -> list[str]:
         normalized = self._normalize(names)
-        await self._session.execute(
-            delete(NoteKeywordDB).where(NoteKeywordDB.note_id == note_id)
+        result = await self._session.execute(
+            select(KeywordDB.name, NoteKeywordDB.keyword_id)
+            .join(NoteKeywordDB, NoteKeywordDB.keyword_id == KeywordDB.id)
+            .where(NoteKeywordDB.note_id == note_id)
         )
+        current = {name: keyword_id for name, keyword_id in result.all()}
 
-        if not normalized:
-            await self._session.commit()
-            return
+        wanted = set(normalized)
+        removed = [name for name in current if name not in wanted]
+        added = [name for name in normalized if name not in current]
 
-        await self.ensure_keywords(user_id=user_id, names=normalized)
+        if removed:
+            await self._session.execute(
+                delete(NoteKeywordDB)
+                .where(NoteKeywordDB.note_id == note_id)
+                .where(NoteKeywordDB.keyword_id.in_([current[name] for name in removed]))
+            )
 
-        keyword_ids_stmt = (
-            select(KeywordDB.id)
-            .where(KeywordDB.user_id == user_id)
-            .where(KeywordDB.name.in_(normalized))
-        )
-        result = await self._session.execute(keyword_ids_stmt)
-        keyword_ids = [row[0] for row in result.all()]
-        if not keyword_ids:
-            await self._session.commit()
-            return
+        if added:
+            keyword_ids = await self.ensure_keyword_ids(user_id=user_id, names=added)
+            await self.create_note_keywords(
+                [
+                    NoteKeyword(note_id=note_id, keyword_id=keyword_id, user_id=user_id)
+                    for keyword_id in keyword_ids.values()
+                ]
+            )
 
-        insert_stmt = insert(NoteKeywordDB).values(
-            [{"note_id": note_id, "keyword_id": keyword_id} for keyword_id in keyword_ids]
-        )
-        await self._session.execute(insert_stmt)
-        await self._session.commit()
+        if removed or added:
+            await self._session.flush()
+        return removed
 
     async def get_note_keyword_names(self, note_id: UUID) -> list[str]:
         stmt = (
@@ -123,12 +177,12 @@ class KeywordsRepository(IKeywordsRepository):
         await self._session.execute(
             delete(NoteKeywordDB).where(NoteKeywordDB.note_id == note_id)
         )
-        await self._session.commit()
+        await self._session.flush()
 
-    async def delete_unused_keywords(self, user_id: UUID, names: list[str]) -> None:
+    async def delete_unused_keywords(self, user_id: UUID, names: list[str]) -> list[str]:
         normalized = self._normalize(names)
         if not normalized:
-            return
+            return []
 
         stmt = (
             delete(KeywordDB)
@@ -143,6 +197,8 @@ class KeywordsRepository(IKeywordsRepository):
                 .where(NoteDB.user_id == user_id)
                 .where(NoteDB.represents_keyword_id == KeywordDB.id)
             )
+            .returning(KeywordDB.name)
         )
-        await self._session.execute(stmt)
-        await self._session.commit()
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return list(result.scalars().all())
@@ -0,0 +1,145 @@
+from uuid import UUID
+
+from sqlalchemy import Text, Uuid, and_, column, delete, insert, literal, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.repositories.models import BacklinkSource, NoteLinks
+from brain.application.abstractions.repositories.note_links import INoteLinksRepository
+from brain.infrastructure.db.models.note import NoteDB
+from brain.infrastructure.db.models.note_link import NoteLinkDB
+
+# Rows per VALUES list; two bind parameters each, far below the asyncpg limit.
+LINKS_CHUNK_SIZE = 1000
+
+
+class NoteLinksRepository(INoteLinksRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def replace_links(self, user_id: UUID, links: dict[UUID, list[str]]) -> None:
+        if not links:
+            return
+        source_ids = list(links)
+        for start in range(0, len(source_ids), LINKS_CHUNK_SIZE):
+            await self._session.execute(
+                delete(NoteLinkDB).where(
+                    NoteLinkDB.source_note_id.in_(source_ids[start:start + LINKS_CHUNK_SIZE])
+                )
+            )
+
+        rows = [
+            (source_note_id, target_title)
+            for source_note_id, target_titles in links.items()
+            for target_title in dict.fromkeys(target_titles)
+        ]
+        for start in range(0, len(rows), LINKS_CHUNK_SIZE):
+            new_links = values(
+                column("source_note_id", Uuid),
+                column("target_title", Text),
+                name="new_links",
+            ).data(rows[start:start + LINKS_CHUNK_SIZE])
+            # Titles are unique per user, so the join finds at most one note.
+            resolved = (
+                select(
+                    new_links.c.source_note_id,
+                    new_links.c.target_title,
+                    literal(user_id, Uuid),
+                    NoteDB.id,
+                )
+                .select_from(new_links)
+                .outerjoin(
+                    NoteDB,
+                    and_(
+                        NoteDB.user_id == user_id,
+                        NoteDB.title == new_links.c.target_title,
+                    ),
+                )
+            )
+            await self._session.execute(
+                insert(NoteLinkDB).from_select(
+                    ["source_note_id", "target_title", "user_id", "target_note_id"],
+                    resolved,
+                )
+            )
+
+    async def resolve_targets(self, user_id: UUID, note_ids_by_title: dict[str, UUID]) -> None:
+        items = list(note_ids_by_title.items())
+        for start in range(0, len(items), LINKS_CHUNK_SIZE):
+            targets = values(
+                column("title", Text),
+                column("note_id", Uuid),
+                name="targets",
+            ).data(items[start:start + LINKS_CHUNK_SIZE])
+            await self._session.execute(
+                update(NoteLinkDB)
+                .where(
+                    NoteLinkDB.user_id == user_id,
+                    NoteLinkDB.target_title == targets.c.title,
+                )
+                .values(target_note_id=targets.c.note_id)
+            )
+
+    async def unresolve_target(self, note_id: UUID) -> None:
+        await self._session.execute(
+            update(NoteLinkDB)
+            .where(NoteLinkDB.target_note_id == note_id)
+            .values(target_note_id=None)
+        )
+
+    async def get_backlinks(
+        self,
+        user_id: UUID,
+        note_id: UUID,
+        limit: int,
+        after: UUID | None = None,
+    ) -> list[BacklinkSource]:
+        # One range scan of ix_note_links_target_note_id_source_note_id,
+        # then a primary key lookup per source note.
+        query = (
+            select(
+                NoteDB.id,
+                NoteDB.title,
+                NoteDB.text,
+                NoteDB.updated_at,
+                NoteLinkDB.target_title,
+            )
+            .join(NoteDB, NoteDB.id == NoteLinkDB.source_note_id)
+            .where(
+                NoteLinkDB.target_note_id == note_id,
+                NoteLinkDB.user_id == user_id,
+            )
+            .order_by(NoteLinkDB.source_note_id)
+            .limit(limit)
+        )
+        if after:
+            query = query.where(NoteLinkDB.source_note_id > after)
+        result = await self._session.execute(query)
+        return [
+            BacklinkSource(
+                note_id=row.id,
+                title=row.title,
+                text=row.text,
+                target_title=row.target_title,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
+
+    async def get_user_links(self, user_id: UUID) -> list[NoteLinks]:
+        notes = await self._session.execute(
+            select(NoteDB.id, NoteDB.title).where(NoteDB.user_id == user_id)
+        )
+        by_id = {
+            row.id: NoteLinks(note_id=row.id, title=row.title, targets=[])
+            for row in notes
+        }
+        # Served by ix_note_links_user_id_target_title.
+        links = await self._session.execute(
+            select(NoteLinkDB.source_note_id, NoteLinkDB.target_title)
+            .where(NoteLinkDB.user_id == user_id)
+        )
+        for source_note_id, target_title in links:
+            note = by_id.get(source_note_id)
+            if note is not None:
+                note.targets.append(target_title)
+        return list(by_id.values())
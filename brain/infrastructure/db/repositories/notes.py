@@ -1,13 +1,36 @@
 from datetime import date, datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select, text, func, exists
+from sqlalchemy import (
+    Integer,
+    Select,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    text,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from brain.application.abstractions.repositories.notes import INotesRepository
 from brain.application.abstractions.repositories.models import (
+    WikilinkCandidates,
     WikilinkSuggestion,
     NoteCreationStat,
+    NoteCursor,
+    NoteListFields,
+    NoteListItem,
+    NoteListOrder,
+    NoteSearchCursor,
+    NoteSearchHit,
 )
 from brain.domain.entities.note import Note
 from brain.infrastructure.db.mappers.notes import map_note_to_db, map_note_to_dm
@@ -15,6 +38,46 @@ from brain.infrastructure.db.models.keyword import KeywordDB
 from brain.infrastructure.db.models.note import NoteDB
 from brain.infrastructure.db.models.user import UserDB
 
+# Upper bound for IN (...) lists so bulk lookups stay far below
+# the asyncpg bind parameter limit.
+LOOKUP_CHUNK_SIZE = 1000
+# Rows fetched per round trip when iterating over a server-side cursor.
+STREAM_BATCH_SIZE = 200
+# Text search configuration of notes.search_vector; no stemming, as notes
+# mix languages.
+SEARCH_CONFIG = "simple"
+SNIPPET_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def _contains_pattern(needle: str) -> str:
+    """LIKE pattern matching `needle` literally; served by the pg_trgm indexes."""
+    escaped = (
+        needle.replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+    return f"%{escaped}%"
+
+
+def _match_rank(column, needle: str) -> tuple:
+    """Prefix matches first, then by trigram similarity to the query."""
+    return (
+        column.like(_contains_pattern(needle)[1:]),
+        func.similarity(column, needle),
+    )
+
+
+def _matches(column, needle: str, fuzzy: bool):
+    """Substring match, or pg_trgm's `%` (similarity above the session threshold)."""
+    if fuzzy:
+        return column.op("%")(needle)
+    return column.like(_contains_pattern(needle))
+
+
+def _labeled_rank(column, needle: str) -> tuple:
+    is_prefix, similarity = _match_rank(column, needle)
+    return is_prefix.label("is_prefix"), similarity.label("similarity")
+
 
 class NotesRepository(INotesRepository):
     def __init__(self, session: AsyncSession):
@@ -23,7 +86,29 @@ class NotesRepository(INotesRepository):
     async def create(self, entity: Note):
         db_model = map_note_to_db(entity)
         self._session.add(db_model)
-        await self._session.commit()
+        await self._session.flush()
+
+    async def create_many(self, entities: list[Note]) -> None:
+        if not entities:
+            return
+
+        rows = [
+            {
+                "id": entity.id,
+                "user_id": entity.user_id,
+                "title": entity.title,
+                "text": entity.text,
+                "represents_keyword_id": entity.represents_keyword_id,
+                "created_at": entity.created_at or datetime.utcnow(),
+                "updated_at": entity.updated_at or datetime.utcnow(),
+                "link_intervals": [
+                    [interval.start, interval.end]
+                    for interval in entity.link_intervals
+                ],
+            }
+            for entity in entities
+        ]
+        await self._session.execute(insert(NoteDB), rows)
 
     async def get_by_user_telegram_id(
         self,
@@ -46,6 +131,79 @@ class NotesRepository(INotesRepository):
         notes = [map_note_to_dm(db_model) for db_model in db_models]
         return notes
 
+    async def get_page(
+        self,
+        user_id: UUID,
+        order_by: NoteListOrder,
+        fields: NoteListFields,
+        limit: int | None = None,
+        after: NoteCursor | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        preview_length: int = 0,
+    ) -> list[NoteListItem]:
+        if fields == NoteListFields.FULL:
+            text_column = NoteDB.text
+        elif fields == NoteListFields.PREVIEW:
+            text_column = func.left(NoteDB.text, preview_length)
+        else:
+            text_column = null()
+
+        sort_column = (
+            NoteDB.created_at
+            if order_by == NoteListOrder.CREATED_AT
+            else NoteDB.updated_at
+        )
+        # Served by ix_notes_user_id_{updated,created}_at_id.
+        query = (
+            select(
+                NoteDB.id,
+                NoteDB.title,
+                text_column.label("text"),
+                NoteDB.created_at,
+                NoteDB.updated_at,
+            )
+            .where(NoteDB.user_id == user_id)
+            .order_by(sort_column.desc(), NoteDB.id.desc())
+        )
+        if after:
+            query = query.where(
+                tuple_(sort_column, NoteDB.id) < tuple_(after.sort_value, after.note_id)
+            )
+        if from_date:
+            query = query.where(NoteDB.created_at >= from_date)
+        if to_date:
+            query = query.where(NoteDB.created_at <= to_date)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self._session.execute(query)
+        return [
+            NoteListItem(
+                id=row.id,
+                title=row.title,
+                text=row.text,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
+
+    async def stream_by_user_id(self, user_id: UUID) -> AsyncIterator[Note]:
+        query = (
+            select(NoteDB)
+            .where(NoteDB.user_id == user_id)
+            .order_by(NoteDB.created_at.asc(), NoteDB.id.asc())
+            .options(noload("*"))
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        result = await self._session.stream_scalars(query)
+        try:
+            async for db_model in result:
+                yield map_note_to_dm(db_model)
+        finally:
+            await result.close()
+
     async def get_by_id(self, note_id: UUID) -> Note | None:
         query = (
             select(NoteDB)
@@ -76,27 +234,117 @@ class NotesRepository(INotesRepository):
         user_id: UUID,
         query: str,
         exact_match: bool = False,
+        fuzzy_threshold: float | None = None,
+        limit: int | None = None,
     ) -> list[Note]:
         normalized = (query or "").strip()
         if not normalized:
             return []
 
+        if fuzzy_threshold is not None and not exact_match:
+            await self._set_similarity_threshold(fuzzy_threshold)
+        stmt = self._search_by_title_query(
+            user_id,
+            query,
+            exact_match=exact_match,
+            fuzzy=fuzzy_threshold is not None,
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self._session.execute(stmt)
+        db_models = result.scalars().all()
+        return [map_note_to_dm(db_model) for db_model in db_models]
+
+    @staticmethod
+    def _search_by_title_query(
+        user_id: UUID,
+        query: str,
+        exact_match: bool,
+        fuzzy: bool,
+    ) -> Select:
         stmt = (
             select(NoteDB)
             .where(NoteDB.user_id == user_id)
             .where(NoteDB.title.isnot(None))
         )
         if exact_match:
-            stmt = stmt.where(NoteDB.title == query)
-        else:
-            stmt = stmt.where(
-                func.lower(func.trim(NoteDB.title)).like(f"%{normalized.lower()}%")
+            return stmt.where(NoteDB.title == query).order_by(NoteDB.updated_at.desc())
+
+        needle = query.strip().lower()
+        title = func.lower(NoteDB.title)
+        if fuzzy:
+            return (
+                stmt.where(_matches(title, needle, fuzzy=True))
+                .order_by(func.similarity(title, needle).desc(), NoteDB.updated_at.desc())
+            )
+        return (
+            stmt.where(_matches(title, needle, fuzzy=False))
+            .order_by(
+                *(rank.desc() for rank in _match_rank(title, needle)),
+                NoteDB.updated_at.desc(),
+            )
+        )
+
+    async def search_text(
+        self,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        after: NoteSearchCursor | None = None,
+    ) -> list[NoteSearchHit]:
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(NoteDB.search_vector, tsquery)
+        matches = (
+            select(
+                NoteDB.id,
+                NoteDB.title,
+                NoteDB.text,
+                NoteDB.created_at,
+                NoteDB.updated_at,
+                rank.label("rank"),
+            )
+            .where(NoteDB.user_id == user_id)
+            .where(NoteDB.search_vector.bool_op("@@")(tsquery))
+            .subquery()
+        )
+        page_query = select(matches).order_by(matches.c.rank.desc(), matches.c.id.desc())
+        if after:
+            page_query = page_query.where(
+                tuple_(matches.c.rank, matches.c.id) < tuple_(after.rank, after.note_id)
             )
+        page = page_query.limit(limit).subquery()
 
-        stmt = stmt.order_by(NoteDB.updated_at.desc())
+        # ts_headline re-parses the text, so it only runs for the page.
+        snippet = func.ts_headline(
+            SEARCH_CONFIG,
+            func.coalesce(page.c.text, ""),
+            tsquery,
+            SNIPPET_OPTIONS,
+        )
+        stmt = (
+            select(
+                page.c.id,
+                page.c.title,
+                snippet.label("snippet"),
+                page.c.rank,
+                page.c.created_at,
+                page.c.updated_at,
+            )
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
         result = await self._session.execute(stmt)
-        db_models = result.scalars().all()
-        return [map_note_to_dm(db_model) for db_model in db_models]
+        return [
+            NoteSearchHit(
+                id=row.id,
+                title=row.title,
+                snippet=row.snippet,
+                rank=row.rank,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in result
+        ]
 
     async def update(self, entity: Note):
         query = (
@@ -111,21 +359,17 @@ class NotesRepository(INotesRepository):
         db_model.text = entity.text
         db_model.represents_keyword_id = entity.represents_keyword_id
         db_model.updated_at = entity.updated_at or datetime.utcnow()
-        await self._session.commit()
+        await self._session.flush()
 
     async def delete_all(self):
         await self._session.execute(text("DELETE FROM notes"))
-        await self._session.commit()
+        await self._session.flush()
 
     async def delete_by_id(self, entity_id: UUID):
-        query = (
-            select(NoteDB)
-            .where(NoteDB.id == entity_id)
-        )
-        result = await self._session.execute(query)
-        db_model = result.scalar()
-        await self._session.delete(db_model)
-        await self._session.commit()
+        # Core delete: note_keywords rows go with the ON DELETE CASCADE
+        # foreign key, so no relationship has to be loaded first.
+        await self._session.execute(delete(NoteDB).where(NoteDB.id == entity_id))
+        await self._session.flush()
 
     async def count_notes_by_user_and_title(
         self,
@@ -144,6 +388,49 @@ class NotesRepository(INotesRepository):
         result = await self._session.execute(query)
         return int(result.scalar() or 0)
 
+    async def get_first_free_title_index(self, user_id: UUID, prefix: str) -> int:
+        # Serializes allocation per user until commit, so concurrent creates
+        # from the bot and the API never pick the same index.
+        await self._session.execute(
+            select(func.pg_advisory_xact_lock(
+                func.hashtextextended(f"note-title:{user_id}:{prefix}", 0)
+            ))
+        )
+
+        index = cast(func.substring(NoteDB.title, len(prefix) + 2), Integer)
+        used = (
+            select(index.label("n"))
+            .where(NoteDB.user_id == user_id)
+            .where(NoteDB.title.regexp_match(f"^{prefix} [1-9][0-9]{{0,8}}$"))
+            .cte("used")
+        )
+        candidates = union_all(
+            select(literal(1, Integer).label("n")),
+            select((used.c.n + 1).label("n")),
+        ).subquery("candidates")
+        query = select(func.min(candidates.c.n)).where(
+            ~exists().where(used.c.n == candidates.c.n)
+        )
+        result = await self._session.execute(query)
+        return int(result.scalar_one())
+
+    async def get_existing_titles(
+        self,
+        user_id: UUID,
+        titles: list[str],
+    ) -> set[str]:
+        unique_titles = list(dict.fromkeys(titles))
+        existing: set[str] = set()
+        for start in range(0, len(unique_titles), LOOKUP_CHUNK_SIZE):
+            chunk = unique_titles[start:start + LOOKUP_CHUNK_SIZE]
+            result = await self._session.execute(
+                select(NoteDB.title)
+                .where(NoteDB.user_id == user_id)
+                .where(NoteDB.title.in_(chunk))
+            )
+            existing.update(row[0] for row in result.all())
+        return existing
+
     async def count_keyword_notes_by_user_and_title(
         self,
         user_id: UUID,
@@ -179,70 +466,95 @@ class NotesRepository(INotesRepository):
         result = await self._session.execute(query)
         return int(result.scalar() or 0)
 
+    async def _set_similarity_threshold(self, threshold: float) -> None:
+        # Transaction-local; `%` reads it and can still use the trigram indexes.
+        await self._session.execute(
+            select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+        )
+
+    async def get_wikilink_candidates(self, user_id: UUID) -> WikilinkCandidates:
+        titles = await self._session.execute(
+            select(NoteDB.title)
+            .where(NoteDB.user_id == user_id)
+            .where(NoteDB.represents_keyword_id.isnot(None))
+        )
+        names = await self._session.execute(
+            select(KeywordDB.name).where(KeywordDB.user_id == user_id)
+        )
+        return WikilinkCandidates(
+            note_titles=list(titles.scalars().all()),
+            keyword_names=list(names.scalars().all()),
+        )
+
     async def search_wikilink_suggestions(
         self,
         user_id: UUID,
         query: str,
+        limit: int = 20,
+        fuzzy_threshold: float | None = None,
     ) -> list[WikilinkSuggestion]:
         normalized_query = query.strip().lower()
         if not normalized_query:
             return []
 
-        keyword_note_stmt = (
-            select(NoteDB.title)
+        fuzzy = fuzzy_threshold is not None
+        if fuzzy:
+            await self._set_similarity_threshold(fuzzy_threshold)
+        note_title = func.lower(NoteDB.title)
+        keyword_name = func.lower(KeywordDB.name)
+        keyword_notes = (
+            select(
+                NoteDB.title.label("title"),
+                literal(True).label("represents_keyword"),
+                *_labeled_rank(note_title, normalized_query),
+            )
             .where(NoteDB.user_id == user_id)
             .where(NoteDB.represents_keyword_id.isnot(None))
-            .where(NoteDB.title.isnot(None))
             .where(func.length(func.trim(NoteDB.title)) > 0)
-            .where(func.lower(NoteDB.title).like(f"%{normalized_query}%"))
-            .order_by(NoteDB.title.asc())
+            .where(_matches(note_title, normalized_query, fuzzy))
         )
-        keyword_result = await self._session.execute(keyword_note_stmt)
-
-        seen: set[str] = set()
-        suggestions: list[WikilinkSuggestion] = []
-
-        for (title,) in keyword_result.all():
-            if title is None:
-                continue
-            trimmed = title.strip()
-            if not trimmed or trimmed in seen:
-                continue
-            seen.add(trimmed)
-            suggestions.append(
-                WikilinkSuggestion(
-                    title=trimmed,
-                    represents_keyword=True,
-                )
+        missing_notes = (
+            select(
+                KeywordDB.name.label("title"),
+                literal(False).label("represents_keyword"),
+                *_labeled_rank(keyword_name, normalized_query),
             )
-
-        missing_note_stmt = (
-            select(KeywordDB.name)
             .where(KeywordDB.user_id == user_id)
-            .where(KeywordDB.name.isnot(None))
             .where(func.length(func.trim(KeywordDB.name)) > 0)
-            .where(func.lower(KeywordDB.name).like(f"%{normalized_query}%"))
+            .where(_matches(keyword_name, normalized_query, fuzzy))
             .where(
                 ~exists()
                 .where(NoteDB.user_id == KeywordDB.user_id)
                 .where(NoteDB.title == KeywordDB.name)
                 .where(NoteDB.represents_keyword_id.isnot(None))
             )
-            .order_by(KeywordDB.name.asc())
         )
-        missing_note_result = await self._session.execute(missing_note_stmt)
+        candidates = union_all(keyword_notes, missing_notes).subquery()
+        # A typo can break the prefix, so fuzzy mode ranks on similarity alone.
+        ranking = [] if fuzzy else [candidates.c.is_prefix.desc()]
+        stmt = (
+            select(candidates.c.title, candidates.c.represents_keyword)
+            .order_by(
+                *ranking,
+                candidates.c.similarity.desc(),
+                candidates.c.represents_keyword.desc(),
+                candidates.c.title.asc(),
+            )
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
 
-        for (name,) in missing_note_result.all():
-            if name is None:
-                continue
-            trimmed = name.strip()
-            if not trimmed or trimmed in seen:
+        seen: set[str] = set()
+        suggestions: list[WikilinkSuggestion] = []
+        for title, represents_keyword in result.all():
+            trimmed = title.strip()
+            if trimmed in seen:
                 continue
             seen.add(trimmed)
             suggestions.append(
                 WikilinkSuggestion(
                     title=trimmed,
-                    represents_keyword=False,
+                    represents_keyword=represents_keyword,
                 )
             )
         return suggestions
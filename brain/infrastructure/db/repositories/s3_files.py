@@ -21,7 +21,7 @@ class S3FilesRepository(IS3FilesRepository):
     async def create(self, entity: S3File) -> None:
         db_model = map_s3_file_to_db(entity)
         self._session.add(db_model)
-        await self._session.commit()
+        await self._session.flush()
 
     async def _get_db_by_id(self, entity_id: UUID) -> S3FileDB | None:
         query = select(S3FileDB).where(S3FileDB.id == bindparam("entity_id"))
@@ -36,7 +36,7 @@ class S3FilesRepository(IS3FilesRepository):
         old_db_model.object_name = entity.object_name
         old_db_model.content_type = entity.content_type
         old_db_model.updated_at = datetime.utcnow()
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_by_user_id(self, user_id: UUID) -> S3File | None:
         query = (
@@ -51,4 +51,4 @@ class S3FilesRepository(IS3FilesRepository):
 
     async def delete_all(self) -> None:
         await self._session.execute(text("DELETE FROM s3_files"))
-        await self._session.commit()
+        await self._session.flush()
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from sqlalchemy import select, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from brain.application.abstractions.repositories.users import IUsersRepository
 from brain.domain.entities.user import User
@@ -14,13 +15,19 @@ class UsersRepository(IUsersRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    @staticmethod
+    def _select_user():
+        # The profile picture is part of the domain user; join it into the
+        # same query instead of a second round trip.
+        return select(UserDB).options(joinedload(UserDB.profile_picture_file))
+
     async def create(self, entity: User) -> None:
         db_model = map_user_to_db(entity)
         self._session.add(db_model)
-        await self._session.commit()
+        await self._session.flush()
 
     async def _get_db_by_id(self, entity_id: UUID) -> User | None:
-        query = select(UserDB).where(UserDB.id == bindparam("entity_id"))
+        query = self._select_user().where(UserDB.id == bindparam("entity_id"))
         result = await self._session.execute(
             statement=query,
             params={"entity_id": entity_id},
@@ -34,17 +41,19 @@ class UsersRepository(IUsersRepository):
         old_db_model.last_name = entity.last_name
         old_db_model.profile_picture_file_id = entity.profile_picture_file_id
         old_db_model.updated_at = datetime.utcnow()
-        await self._session.commit()
+        await self._session.flush()
+        # The joined profile picture may no longer match the new file id.
+        self._session.expire(old_db_model, ["profile_picture_file"])
 
     async def get_by_telegram_id(self, telegram_id: int) -> User | None:
-        query = select(UserDB).where(UserDB.telegram_id == telegram_id)
+        query = self._select_user().where(UserDB.telegram_id == telegram_id)
         result = await self._session.execute(query)
         db_model = result.scalar()
         if db_model:
             return map_user_to_dm(db_model)
 
     async def get_by_telegram_id(self, telegram_id: int) -> User | None:
-        query = select(UserDB).where(UserDB.telegram_id == telegram_id)
+        query = self._select_user().where(UserDB.telegram_id == telegram_id)
         result = await self._session.execute(query)
         db_model = result.scalar()
         if db_model:
@@ -57,10 +66,10 @@ class UsersRepository(IUsersRepository):
 
     async def delete_all(self) -> None:
         await self._session.execute(text("DELETE FROM users"))
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_all(self) -> list[User]:
-        query = select(UserDB)
+        query = self._select_user()
         result = await self._session.execute(query)
         db_models = result.scalars().all()
         return [map_user_to_dm(db_model) for db_model in db_models]
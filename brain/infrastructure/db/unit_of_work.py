@@ -0,0 +1,55 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from types import TracebackType
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.unit_of_work import IUnitOfWork
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._depth = 0
+        self._commit_hooks: list[Callable[[], Awaitable[None]]] = []
+
+    async def commit(self) -> None:
+        await self._session.commit()
+        hooks, self._commit_hooks = self._commit_hooks, []
+        for hook in hooks:
+            await hook()
+
+    async def rollback(self) -> None:
+        self._commit_hooks = []
+        await self._session.rollback()
+
+    def add_commit_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        self._commit_hooks.append(hook)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        hooks_count = len(self._commit_hooks)
+        try:
+            async with self._session.begin_nested():
+                yield
+        except BaseException:
+            del self._commit_hooks[hooks_count:]
+            raise
+
+    async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -1,12 +1,15 @@
 from typing import AsyncIterable
 
-from dishka import Provider, provide, Scope
+from dishka import AsyncContainer, Provider, provide, Scope
 from neo4j import AsyncDriver
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from brain.application.abstractions.config.models import INeo4jConfig
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.config.models import GraphBackend, GraphConfig
 from brain.infrastructure.graph.connection import create_driver
 from brain.infrastructure.graph.repositories.notes import NotesGraphRepository
+from brain.infrastructure.graph.repositories.postgres import PostgresNotesGraphRepository
 
 
 class Neo4jProvider(Provider):
@@ -18,8 +21,13 @@ class Neo4jProvider(Provider):
         yield driver
         await driver.close()
 
-    @provide(scope=Scope.REQUEST, provides=INotesGraphRepository)
-    def get_notes_graph_repository(
-        self, driver: AsyncDriver, config: INeo4jConfig
-    ) -> NotesGraphRepository:
+    @provide(scope=Scope.REQUEST)
+    async def get_notes_graph_repository(
+        self, graph_config: GraphConfig, container: AsyncContainer
+    ) -> INotesGraphRepository:
+        # Resolved lazily so the Postgres backend never creates a driver.
+        if graph_config.backend is GraphBackend.POSTGRES:
+            return PostgresNotesGraphRepository(session=await container.get(AsyncSession))
+        driver = await container.get(AsyncDriver)
+        config = await container.get(INeo4jConfig)
         return NotesGraphRepository(driver=driver, database=config.database)
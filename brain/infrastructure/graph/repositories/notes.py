@@ -1,11 +1,48 @@
 from uuid import UUID
 
-from neo4j import AsyncDriver
+from neo4j import AsyncDriver, AsyncManagedTransaction, AsyncSession
 
 from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
 from brain.domain.entities.graph import GraphData, GraphNode, GraphConnection
 from brain.domain.entities.note import Note
 
+# Number of rows sent per UNWIND statement during bulk writes.
+BULK_WRITE_BATCH_SIZE = 500
+
+WALK_SEEDS_QUERY = """
+    CALL {
+        MATCH (k:Keyword {user_id: $user_id})
+        WHERE toLower(k.name) CONTAINS toLower($search_query)
+        RETURN k AS seed
+        UNION
+        MATCH (n:Note {user_id: $user_id})
+        WHERE n.title IS NOT NULL
+        AND toLower(n.title) CONTAINS toLower($search_query)
+        RETURN n AS seed
+    }
+    RETURN elementId(seed) AS node_id
+"""
+
+WALK_EXPAND_QUERY = """
+    UNWIND $frontier AS node_id
+    MATCH (node) WHERE elementId(node) = node_id
+    MATCH (node)-[:HAS_KEYWORD|LINKS_TO]-(neighbour)
+    WHERE neighbour.user_id = $user_id
+    AND (neighbour:Keyword OR (neighbour:Note AND neighbour.title IS NOT NULL))
+    WITH DISTINCT elementId(neighbour) AS neighbour_id
+    WHERE NOT neighbour_id IN $visited
+    RETURN neighbour_id AS node_id
+"""
+
+
+def _limited(query: str, max_rows: int | None) -> str:
+    # One row past the cap tells a cut walk from one that just fits.
+    return query if max_rows is None else f"{query} LIMIT $limit"
+
+
+def _limit(max_rows: int | None) -> int | None:
+    return None if max_rows is None else max_rows + 1
+
 
 class NotesGraphRepository(INotesGraphRepository):
     def __init__(self, driver: AsyncDriver, database: str):
@@ -13,120 +50,176 @@ class NotesGraphRepository(INotesGraphRepository):
         self._database = database
 
     async def upsert_note(self, note: Note):
-        query = """
+        await self._execute_write(
+            """
             MERGE (n:Note {id: $id})
             SET
                 n.user_id = $user_id,
                 n.title = $title,
                 n.text = $text,
                 n.represents_keyword_id = $represents_keyword_id
-        """
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                query,
-                id=str(note.id),
-                user_id=str(note.user_id),
-                title=note.title,
-                text=note.text,
-                represents_keyword_id=str(note.represents_keyword_id),
-            )
+            """,
+            **self._note_params(note),
+        )
 
-    async def sync_connections(
+    async def upsert_notes_bulk(
         self,
-        note: Note,
-        link_targets: list[str],
-        previous_title: str | None = None,
-        previous_represents_keyword_id: UUID | None = None,
+        notes: list[Note],
+        link_targets: dict[UUID, list[str]],
     ):
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
-                """
-                MATCH (n:Note {id: $id})
-                OPTIONAL MATCH (n)-[r]->()
-                WHERE type(r) IN ["LINKS_TO", "HAS_KEYWORD"]
-                DELETE r
-                """,
-                id=str(note.id),
-            )
-
-            if previous_represents_keyword_id and previous_title != note.title:
-                await session.run(
-                    """
-                    MATCH (source:Note)-[r]->(target:Note {id: $id})
-                    WHERE type(r) = "LINKS_TO"
-                    MATCH (source)-[:HAS_KEYWORD]->(:Keyword {
-                        user_id: $user_id,
-                        name: $prev_title
-                    })
-                    DELETE r
-                    """,
-                    id=str(note.id),
-                    user_id=str(note.user_id),
-                    prev_title=previous_title,
-                )
-
-            if link_targets:
-                await session.run(
-                    """
-                    MATCH (source:Note {id: $id})
-                    UNWIND $targets AS target
-                    MERGE (k:Keyword {user_id: $user_id, name: target})
-                    MERGE (source)-[:HAS_KEYWORD]->(k)
-                    """,
-                    id=str(note.id),
-                    user_id=str(note.user_id),
-                    targets=link_targets,
-                )
+        if not notes:
+            return
 
-                await session.run(
-                    """
-                    MATCH (source:Note {id: $id})
-                    UNWIND $targets AS target
-                    MATCH (target_note:Note {user_id: $user_id, title: target})
-                    WHERE
-                        target_note.represents_keyword_id IS NOT NULL
-                        AND target_note.id <> $id
-                    MERGE (source)-[:LINKS_TO]->(target_note)
-                    """,
-                    id=str(note.id),
-                    user_id=str(note.user_id),
-                    targets=link_targets,
-                )
+        rows = [
+            {
+                "id": str(note.id),
+                "user_id": str(note.user_id),
+                "title": note.title,
+                "text": note.text,
+                "represents_keyword_id": str(note.represents_keyword_id),
+                "targets": link_targets.get(note.id, []),
+            }
+            for note in notes
+        ]
+        batches = [
+            rows[start:start + BULK_WRITE_BATCH_SIZE]
+            for start in range(0, len(rows), BULK_WRITE_BATCH_SIZE)
+        ]
 
-            await session.run(
+        # Nodes and keyword edges first, so that link resolution below
+        # sees every imported note regardless of its batch.
+        for batch in batches:
+            await self._execute_write(
                 """
-                MATCH (target:Note {id: $id})
-                MATCH (k:Keyword {user_id: $user_id, name: $title})
-                MATCH (source:Note)-[:HAS_KEYWORD]->(k)
-                WHERE source.id <> target.id
-                MERGE (source)-[:LINKS_TO]->(target)
+                UNWIND $rows AS row
+                MERGE (n:Note {id: row.id})
+                SET
+                    n.user_id = row.user_id,
+                    n.title = row.title,
+                    n.text = row.text,
+                    n.represents_keyword_id = row.represents_keyword_id
+                WITH n, row
+                UNWIND row.targets AS target
+                MERGE (k:Keyword {user_id: row.user_id, name: target})
+                MERGE (n)-[:HAS_KEYWORD]->(k)
                 """,
-                id=str(note.id),
-                user_id=str(note.user_id),
-                title=note.title,
+                rows=batch,
             )
 
-    async def delete_note(self, note_id: UUID):
-        async with self._driver.session(database=self._database) as session:
-            await session.run(
+        for batch in batches:
+            await self._execute_write(
                 """
-                MATCH (n:Note {id: $id})
-                WITH n, n.user_id AS user_id
-                DETACH DELETE n
-                WITH user_id
-                MATCH (k:Keyword {user_id: user_id})
-                WHERE NOT EXISTS {
-                    MATCH (:Note)-[:HAS_KEYWORD]->(k)
+                UNWIND $rows AS row
+                MATCH (n:Note {id: row.id})
+                CALL {
+                    WITH n, row
+                    UNWIND row.targets AS target
+                    MATCH (target_note:Note {user_id: row.user_id, title: target})
+                    WHERE
+                        target_note.represents_keyword_id IS NOT NULL
+                        AND target_note.id <> n.id
+                    MERGE (n)-[:LINKS_TO]->(target_note)
                 }
-                AND NOT EXISTS {
-                    MATCH (m:Note {user_id: user_id, title: k.name})
-                    WHERE m.represents_keyword_id IS NOT NULL
+                CALL {
+                    WITH n, row
+                    MATCH (source:Note)-[:HAS_KEYWORD]->(:Keyword {
+                        user_id: row.user_id,
+                        name: row.title
+                    })
+                    WHERE source.id <> n.id
+                    MERGE (source)-[:LINKS_TO]->(n)
                 }
-                DETACH DELETE k
                 """,
-                id=str(note_id),
+                rows=batch,
             )
 
+    async def sync_connections(
+        self,
+        note: Note,
+        link_targets: list[str],
+        previous_title: str | None = None,
+        previous_represents_keyword_id: UUID | None = None,
+    ):
+        # Incoming links made through the old title are stale only when
+        # a keyword note has been renamed.
+        stale_title = None
+        if previous_represents_keyword_id and previous_title != note.title:
+            stale_title = previous_title
+
+        await self._execute_write(
+            """
+            MERGE (n:Note {id: $id})
+            SET
+                n.user_id = $user_id,
+                n.title = $title,
+                n.text = $text,
+                n.represents_keyword_id = $represents_keyword_id
+            WITH n
+            CALL {
+                WITH n
+                OPTIONAL MATCH (n)-[r:LINKS_TO|HAS_KEYWORD]->()
+                DELETE r
+            }
+            CALL {
+                WITH n
+                WITH n WHERE $stale_title IS NOT NULL
+                MATCH (source:Note)-[r:LINKS_TO]->(n)
+                MATCH (source)-[:HAS_KEYWORD]->(:Keyword {
+                    user_id: $user_id,
+                    name: $stale_title
+                })
+                DELETE r
+            }
+            CALL {
+                WITH n
+                UNWIND $targets AS target
+                MERGE (k:Keyword {user_id: $user_id, name: target})
+                MERGE (n)-[:HAS_KEYWORD]->(k)
+            }
+            CALL {
+                WITH n
+                UNWIND $targets AS target
+                MATCH (target_note:Note {user_id: $user_id, title: target})
+                WHERE
+                    target_note.represents_keyword_id IS NOT NULL
+                    AND target_note.id <> n.id
+                MERGE (n)-[:LINKS_TO]->(target_note)
+            }
+            CALL {
+                WITH n
+                MATCH (source:Note)-[:HAS_KEYWORD]->(:Keyword {
+                    user_id: $user_id,
+                    name: $title
+                })
+                WHERE source.id <> n.id
+                MERGE (source)-[:LINKS_TO]->(n)
+            }
+            """,
+            **self._note_params(note),
+            targets=link_targets,
+            stale_title=stale_title,
+        )
+
+    async def delete_note(self, note_id: UUID):
+        await self._execute_write(
+            """
+            MATCH (n:Note {id: $id})
+            WITH n, n.user_id AS user_id
+            DETACH DELETE n
+            WITH user_id
+            MATCH (k:Keyword {user_id: user_id})
+            WHERE NOT EXISTS {
+                MATCH (:Note)-[:HAS_KEYWORD]->(k)
+            }
+            AND NOT EXISTS {
+                MATCH (m:Note {user_id: user_id, title: k.name})
+                WHERE m.represents_keyword_id IS NOT NULL
+            }
+            DETACH DELETE k
+            """,
+            id=str(note_id),
+        )
+
     async def count_notes_by_user_and_title(self, user_id: UUID, title: str) -> int:
         async with self._driver.session(database=self._database) as session:
             result = await session.run(
@@ -176,6 +269,7 @@ class NotesGraphRepository(INotesGraphRepository):
         user_id: UUID,
         query: str | None = None,
         depth: int = 1,
+        max_nodes: int | None = None,
     ) -> GraphData:
         nodes_query = """
             CALL {
@@ -213,29 +307,9 @@ class NotesGraphRepository(INotesGraphRepository):
                 note_id
         """
 
-        nodes_filtered_query = (
-            "WITH $user_id AS user_id, $search_query AS search_query "
-            "CALL { "
-            "    WITH user_id, search_query "
-            "    MATCH (k:Keyword {user_id: user_id}) "
-            "    WHERE toLower(k.name) CONTAINS toLower(search_query) "
-            "    RETURN k AS seed "
-            "    UNION "
-            "    WITH user_id, search_query "
-            "    MATCH (n:Note {user_id: user_id}) "
-            "    WHERE n.title IS NOT NULL "
-            "    AND toLower(n.title) CONTAINS toLower(search_query) "
-            "    RETURN n AS seed "
-            "} "
-            "WITH DISTINCT seed, user_id "
-            f"MATCH p=(seed)-[*0..{depth}]-(node) "
-            "WHERE all(r IN relationships(p) WHERE "
-            "    type(r) IN ['HAS_KEYWORD', 'LINKS_TO']"
-            ") AND all(n IN nodes(p) WHERE "
-            "    (n:Keyword AND n.user_id = user_id) "
-            "    OR (n:Note AND n.user_id = user_id AND n.title IS NOT NULL) "
-            ") "
-            "WITH DISTINCT node, user_id "
+        nodes_by_id_query = (
+            "UNWIND $node_ids AS node_id "
+            "MATCH (node) WHERE elementId(node) = node_id "
             "RETURN "
             "    CASE WHEN node:Keyword THEN 'keyword' ELSE 'note' END AS kind, "
             "    CASE WHEN node:Keyword "
@@ -243,7 +317,7 @@ class NotesGraphRepository(INotesGraphRepository):
             "        ELSE 'note:' + toString(node.id) END AS id, "
             "    CASE WHEN node:Keyword THEN node.name ELSE node.title END AS title, "
             "    CASE WHEN node:Keyword THEN EXISTS { "
-            "        MATCH (n:Note {user_id: user_id, title: node.name}) "
+            "        MATCH (n:Note {user_id: $user_id, title: node.name}) "
             "        WHERE n.represents_keyword_id IS NOT NULL "
             "    } ELSE NULL END AS has_keyword_note, "
             "    CASE WHEN node:Note "
@@ -254,11 +328,19 @@ class NotesGraphRepository(INotesGraphRepository):
         )
 
         async with self._driver.session(database=self._database) as session:
+            truncated = False
             if query:
+                node_ids, truncated = await self._walk(
+                    session,
+                    user_id=str(user_id),
+                    query=query,
+                    depth=depth,
+                    max_nodes=max_nodes,
+                )
                 result = await session.run(
-                    nodes_filtered_query,
+                    nodes_by_id_query,
                     user_id=str(user_id),
-                    search_query=query,
+                    node_ids=node_ids,
                 )
             else:
                 result = await session.run(
@@ -288,7 +370,7 @@ class NotesGraphRepository(INotesGraphRepository):
                     note_ids.append(record["note_id"])
 
             if not nodes:
-                return GraphData(nodes=[], connections=[])
+                return GraphData(nodes=[], connections=[], truncated=truncated)
 
             connections_query = """
                 MATCH (n:Note)-[:HAS_KEYWORD]->(k:Keyword)
@@ -340,4 +422,74 @@ class NotesGraphRepository(INotesGraphRepository):
                     )
                 )
 
-            return GraphData(nodes=nodes, connections=connections)
+            return GraphData(nodes=nodes, connections=connections, truncated=truncated)
+
+    @staticmethod
+    async def _walk(
+        session: AsyncSession,
+        user_id: str,
+        query: str,
+        depth: int,
+        max_nodes: int | None,
+    ) -> tuple[list[str], bool]:
+        """
+        Element ids of the nodes within `depth` hops of a note or keyword
+        whose name contains `query`, and whether `max_nodes` cut the walk.
+
+        One round trip per level: only the previous level is expanded and
+        visited nodes are skipped, so a keyword hub costs its edges once
+        instead of once per path through it.
+        """
+        result = await session.run(
+            _limited(WALK_SEEDS_QUERY, max_nodes),
+            user_id=user_id,
+            search_query=query,
+            limit=_limit(max_nodes),
+        )
+        visited = [record["node_id"] async for record in result]
+        if max_nodes is not None and len(visited) > max_nodes:
+            return visited[:max_nodes], True
+
+        frontier = visited
+        for _ in range(depth):
+            if not frontier:
+                break
+            remaining = None if max_nodes is None else max_nodes - len(visited)
+            result = await session.run(
+                _limited(WALK_EXPAND_QUERY, remaining),
+                user_id=user_id,
+                frontier=frontier,
+                visited=visited,
+                limit=_limit(remaining),
+            )
+            reached = [record["node_id"] async for record in result]
+            if remaining is not None and len(reached) > remaining:
+                return visited + reached[:remaining], True
+            visited = visited + reached
+            frontier = reached
+        return visited, False
+
+    async def _execute_write(self, query: str, **params):
+        # Managed transactions are retried by the driver on transient
+        # errors (deadlocks, leader switches), unlike `session.run`.
+        async with self._driver.session(database=self._database) as session:
+            await session.execute_write(self._run_and_consume, query, params)
+
+    @staticmethod
+    async def _run_and_consume(
+        tx: AsyncManagedTransaction,
+        query: str,
+        params: dict,
+    ):
+        result = await tx.run(query, params)
+        await result.consume()
+
+    @staticmethod
+    def _note_params(note: Note) -> dict:
+        return {
+            "id": str(note.id),
+            "user_id": str(note.user_id),
+            "title": note.title,
+            "text": note.text,
+            "represents_keyword_id": str(note.represents_keyword_id),
+        }
@@ -0,0 +1,339 @@
+from uuid import UUID
+
+from sqlalchemy import (
+    ARRAY,
+    Uuid,
+    all_,
+    any_,
+    exists,
+    func,
+    literal,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.domain.entities.graph import GraphConnection, GraphData, GraphNode
+from brain.domain.entities.note import Note
+from brain.infrastructure.db.models.keyword import KeywordDB, NoteKeywordDB
+from brain.infrastructure.db.models.note import NoteDB
+
+
+class PostgresNotesGraphRepository(INotesGraphRepository):
+    """
+    The notes graph read straight from notes, keywords and note_keywords.
+
+    A note links to a keyword through note_keywords (has_keyword) and to
+    the note representing that keyword (links_to). Both relations are kept
+    by the keyword sync, so there is nothing to write here: the sync calls
+    are no-ops and reads always see committed data.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def upsert_note(self, note: Note):
+        pass
+
+    async def upsert_notes_bulk(
+        self,
+        notes: list[Note],
+        link_targets: dict[UUID, list[str]],
+    ):
+        pass
+
+    async def sync_connections(
+        self,
+        note: Note,
+        link_targets: list[str],
+        previous_title: str | None = None,
+        previous_represents_keyword_id: UUID | None = None,
+    ):
+        pass
+
+    async def delete_note(self, note_id: UUID):
+        pass
+
+    async def count_notes_by_user_and_title(self, user_id: UUID, title: str) -> int:
+        query = select(
+            exists().where(NoteDB.user_id == user_id, NoteDB.title == title)
+            | exists().where(KeywordDB.user_id == user_id, KeywordDB.name == title)
+        )
+        return int(await self._session.scalar(query))
+
+    async def count_links_between_notes(
+        self, user_id: UUID, from_title: str, to_title: str
+    ) -> int:
+        from_note = aliased(NoteDB)
+        to_note = aliased(NoteDB)
+        from_keywords = (
+            select(NoteKeywordDB.keyword_id)
+            .join(from_note, from_note.id == NoteKeywordDB.note_id)
+            .where(from_note.user_id == user_id, from_note.title == from_title)
+        )
+        direct = (
+            select(func.count(KeywordDB.id))
+            .where(
+                KeywordDB.id.in_(from_keywords),
+                KeywordDB.user_id == user_id,
+                KeywordDB.name == to_title,
+            )
+            .scalar_subquery()
+        )
+        shared = (
+            select(func.count(func.distinct(NoteKeywordDB.keyword_id)))
+            .join(to_note, to_note.id == NoteKeywordDB.note_id)
+            .where(
+                to_note.user_id == user_id,
+                to_note.title == to_title,
+                NoteKeywordDB.keyword_id.in_(from_keywords),
+            )
+            .scalar_subquery()
+        )
+        # Like the Neo4j query, there are no links without the source note.
+        query = select(
+            (direct + shared).label("c")
+        ).where(
+            exists().where(from_note.user_id == user_id, from_note.title == from_title)
+        )
+        return await self._session.scalar(query) or 0
+
+    async def get_graph(
+        self,
+        user_id: UUID,
+        query: str | None = None,
+        depth: int = 1,
+        max_nodes: int | None = None,
+    ) -> GraphData:
+        truncated = False
+        if query:
+            note_ids, keyword_ids, truncated = await self._walk(user_id, query, depth, max_nodes)
+            scoped_notes = (
+                select(NoteDB.id)
+                .where(NoteDB.id == any_(literal(note_ids, ARRAY(Uuid))))
+                .cte("scoped_notes")
+            )
+            scoped_keywords = (
+                select(KeywordDB.id)
+                .where(KeywordDB.id == any_(literal(keyword_ids, ARRAY(Uuid))))
+                .cte("scoped_keywords")
+            )
+        else:
+            scoped_notes = select(NoteDB.id).where(NoteDB.user_id == user_id).cte("scoped_notes")
+            scoped_keywords = (
+                select(KeywordDB.id).where(KeywordDB.user_id == user_id).cte("scoped_keywords")
+            )
+
+        # Keyword nodes are hidden when a note represents that keyword.
+        keyword_note = aliased(NoteDB)
+        visible_keywords = (
+            select(KeywordDB.id, KeywordDB.name)
+            .join(scoped_keywords, scoped_keywords.c.id == KeywordDB.id)
+            .where(
+                ~exists().where(
+                    keyword_note.user_id == KeywordDB.user_id,
+                    keyword_note.title == KeywordDB.name,
+                )
+            )
+            .cte("visible_keywords")
+        )
+        target = aliased(NoteDB)
+        scoped_targets = scoped_notes.alias("scoped_targets")
+        rows = union_all(
+            select(
+                literal_column("'note'").label("kind"),
+                NoteDB.id.label("note_id"),
+                NoteDB.title.label("title"),
+                null().cast(Uuid).label("to_note_id"),
+            ).join(scoped_notes, scoped_notes.c.id == NoteDB.id),
+            select(
+                literal_column("'keyword'"),
+                null().cast(Uuid),
+                visible_keywords.c.name,
+                null().cast(Uuid),
+            ),
+            select(
+                literal_column("'has_keyword'"),
+                NoteKeywordDB.note_id,
+                visible_keywords.c.name,
+                null().cast(Uuid),
+            )
+            .join(scoped_notes, scoped_notes.c.id == NoteKeywordDB.note_id)
+            .join(visible_keywords, visible_keywords.c.id == NoteKeywordDB.keyword_id),
+            select(
+                literal_column("'links_to'"),
+                NoteKeywordDB.note_id,
+                null(),
+                target.id,
+            )
+            .distinct()
+            .join(scoped_notes, scoped_notes.c.id == NoteKeywordDB.note_id)
+            .join(target, target.represents_keyword_id == NoteKeywordDB.keyword_id)
+            .join(scoped_targets, scoped_targets.c.id == target.id)
+            .where(target.id != NoteKeywordDB.note_id),
+        )
+        result = await self._session.execute(rows)
+
+        nodes: list[GraphNode] = []
+        connections: list[GraphConnection] = []
+        for row in result:
+            if row.kind == "note":
+                nodes.append(
+                    GraphNode(
+                        id=f"note:{row.note_id}",
+                        title=row.title,
+                        kind="note",
+                        represents_keyword=True,
+                    )
+                )
+            elif row.kind == "keyword":
+                nodes.append(
+                    GraphNode(
+                        id=f"keyword:{row.title}",
+                        title=row.title,
+                        kind="keyword",
+                        has_keyword_note=False,
+                    )
+                )
+            elif row.kind == "has_keyword":
+                connections.append(
+                    GraphConnection(
+                        from_id=f"note:{row.note_id}",
+                        to_id=f"keyword:{row.title}",
+                        kind="has_keyword",
+                    )
+                )
+            else:
+                connections.append(
+                    GraphConnection(
+                        from_id=f"note:{row.note_id}",
+                        to_id=f"note:{row.to_note_id}",
+                        kind="links_to",
+                    )
+                )
+        return GraphData(nodes=nodes, connections=connections, truncated=truncated)
+
+    async def _walk(
+        self,
+        user_id: UUID,
+        query: str,
+        depth: int,
+        max_nodes: int | None,
+    ) -> tuple[list[UUID], list[UUID], bool]:
+        """
+        Ids of the notes and keywords within `depth` hops of a note or
+        keyword whose name contains `query`, edges taken in both directions,
+        and whether `max_nodes` cut the walk.
+
+        One query per level: only the previous level is expanded and visited
+        nodes are skipped, so nothing is reached twice.
+        """
+        needle = query.lower()
+        seeds = union_all(
+            select(NoteDB.id.label("note_id"), null().cast(Uuid).label("keyword_id"))
+            .where(
+                NoteDB.user_id == user_id,
+                func.lower(NoteDB.title).contains(needle, autoescape=True),
+            ),
+            select(null().cast(Uuid), KeywordDB.id)
+            .where(
+                KeywordDB.user_id == user_id,
+                func.lower(KeywordDB.name).contains(needle, autoescape=True),
+            ),
+        )
+        if max_nodes is not None:
+            # One row past the cap tells a cut walk from one that just fits.
+            seeds = seeds.limit(max_nodes + 1)
+        note_ids, keyword_ids = self._split((await self._session.execute(seeds)).all())
+        if max_nodes is not None and len(note_ids) + len(keyword_ids) > max_nodes:
+            return self._cut(note_ids, [], keyword_ids, [], max_nodes)
+
+        frontier_notes, frontier_keywords = note_ids, keyword_ids
+        for _ in range(depth):
+            if not frontier_notes and not frontier_keywords:
+                break
+            neighbours = self._neighbours(
+                frontier_notes, frontier_keywords, note_ids, keyword_ids
+            )
+            remaining = None
+            if max_nodes is not None:
+                remaining = max_nodes - len(note_ids) - len(keyword_ids)
+                neighbours = neighbours.limit(remaining + 1)
+            reached_notes, reached_keywords = self._split(
+                (await self._session.execute(neighbours)).all()
+            )
+            if remaining is not None and len(reached_notes) + len(reached_keywords) > remaining:
+                return self._cut(note_ids, reached_notes, keyword_ids, reached_keywords, max_nodes)
+            note_ids = note_ids + reached_notes
+            keyword_ids = keyword_ids + reached_keywords
+            frontier_notes, frontier_keywords = reached_notes, reached_keywords
+        return note_ids, keyword_ids, False
+
+    @staticmethod
+    def _neighbours(
+        frontier_notes: list[UUID],
+        frontier_keywords: list[UUID],
+        seen_notes: list[UUID],
+        seen_keywords: list[UUID],
+    ):
+        """Distinct unvisited neighbours of the frontier as (note_id, keyword_id) rows."""
+        # Arrays keep it to four bind parameters however large the walk gets.
+        frontier_notes_array = literal(frontier_notes, ARRAY(Uuid))
+        frontier_keywords_array = literal(frontier_keywords, ARRAY(Uuid))
+        seen_notes_array = literal(seen_notes, ARRAY(Uuid))
+        seen_keywords_array = literal(seen_keywords, ARRAY(Uuid))
+
+        linked = aliased(NoteDB)
+        linking = aliased(NoteKeywordDB)
+        neighbours = union_all(
+            # note -> its keywords
+            select(null().cast(Uuid).label("note_id"), NoteKeywordDB.keyword_id.label("keyword_id"))
+            .where(
+                NoteKeywordDB.note_id == any_(frontier_notes_array),
+                NoteKeywordDB.keyword_id != all_(seen_keywords_array),
+            ),
+            # keyword -> notes having it
+            select(NoteKeywordDB.note_id, null().cast(Uuid))
+            .where(
+                NoteKeywordDB.keyword_id == any_(frontier_keywords_array),
+                NoteKeywordDB.note_id != all_(seen_notes_array),
+            ),
+            # note -> notes it links to
+            select(linked.id, null().cast(Uuid))
+            .join(NoteKeywordDB, NoteKeywordDB.keyword_id == linked.represents_keyword_id)
+            .where(
+                NoteKeywordDB.note_id == any_(frontier_notes_array),
+                linked.id != all_(seen_notes_array),
+            ),
+            # note -> notes linking to it
+            select(linking.note_id, null().cast(Uuid))
+            .join(linked, linked.represents_keyword_id == linking.keyword_id)
+            .where(
+                linked.id == any_(frontier_notes_array),
+                linking.note_id != all_(seen_notes_array),
+            ),
+        ).subquery("neighbours")
+        return select(neighbours.c.note_id, neighbours.c.keyword_id).distinct()
+
+    @staticmethod
+    def _split(rows) -> tuple[list[UUID], list[UUID]]:
+        note_ids = [row.note_id for row in rows if row.note_id is not None]
+        keyword_ids = [row.keyword_id for row in rows if row.keyword_id is not None]
+        return note_ids, keyword_ids
+
+    @staticmethod
+    def _cut(
+        note_ids: list[UUID],
+        reached_notes: list[UUID],
+        keyword_ids: list[UUID],
+        reached_keywords: list[UUID],
+        max_nodes: int,
+    ) -> tuple[list[UUID], list[UUID], bool]:
+        # Notes first: hidden keywords would take room and not show.
+        notes = (note_ids + reached_notes)[:max_nodes - len(keyword_ids)]
+        keywords = (keyword_ids + reached_keywords)[:max_nodes - len(notes)]
+        return notes, keywords, True
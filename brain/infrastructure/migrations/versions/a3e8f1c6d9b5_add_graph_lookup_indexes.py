@@ -0,0 +1,36 @@
+"""Add indexes for reading the notes graph from Postgres
+
+Revision ID: a3e8f1c6d9b5
+Revises: f6a3d8c1e2b4
+Create Date: 2026-10-18 03:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3e8f1c6d9b5"
+down_revision: Union[str, None] = "f6a3d8c1e2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_note_keywords_keyword_id",
+        "note_keywords",
+        ["keyword_id"],
+    )
+    op.create_index(
+        "ix_notes_represents_keyword_id",
+        "notes",
+        ["represents_keyword_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notes_represents_keyword_id", table_name="notes")
+    op.drop_index("ix_note_keywords_keyword_id", table_name="note_keywords")
@@ -0,0 +1,67 @@
+"""Add graph sync outbox
+
+Revision ID: a7e2c4d91b3f
+Revises: c3d1a6b7e9f0
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e2c4d91b3f"
+down_revision: Union[str, None] = "c3d1a6b7e9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "graph_sync_outbox",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("note_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "links_changed",
+            sa.Boolean(),
+            server_default=sa.text("true"),
+            nullable=False,
+        ),
+        sa.Column("previous_title", sa.String(length=255), nullable=True),
+        sa.Column("previous_represents_keyword_id", sa.Uuid(), nullable=True),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_graph_sync_outbox_note_id",
+        "graph_sync_outbox",
+        ["note_id"],
+    )
+    op.create_index(
+        "ix_graph_sync_outbox_pending",
+        "graph_sync_outbox",
+        ["created_at"],
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_graph_sync_outbox_pending", table_name="graph_sync_outbox")
+    op.drop_index("ix_graph_sync_outbox_note_id", table_name="graph_sync_outbox")
+    op.drop_table("graph_sync_outbox")
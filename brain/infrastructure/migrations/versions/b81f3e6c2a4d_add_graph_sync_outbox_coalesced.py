@@ -0,0 +1,35 @@
+"""Add coalesced flag to graph sync outbox
+
+Revision ID: b81f3e6c2a4d
+Revises: a7e2c4d91b3f
+Create Date: 2026-10-18 00:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b81f3e6c2a4d"
+down_revision: Union[str, None] = "a7e2c4d91b3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "graph_sync_outbox",
+        sa.Column(
+            "coalesced",
+            sa.Boolean(),
+            server_default=sa.text("false"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("graph_sync_outbox", "coalesced")
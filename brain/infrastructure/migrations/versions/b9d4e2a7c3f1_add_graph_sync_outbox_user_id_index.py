@@ -0,0 +1,30 @@
+"""Index graph sync outbox events by user
+
+Revision ID: b9d4e2a7c3f1
+Revises: a3e8f1c6d9b5
+Create Date: 2026-10-18 04:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d4e2a7c3f1"
+down_revision: Union[str, None] = "a3e8f1c6d9b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_graph_sync_outbox_user_id",
+        "graph_sync_outbox",
+        ["user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_graph_sync_outbox_user_id", table_name="graph_sync_outbox")
@@ -0,0 +1,36 @@
+"""Add indexes for keyset pagination of notes
+
+Revision ID: c5f0a9d3e1b7
+Revises: b81f3e6c2a4d
+Create Date: 2026-10-18 00:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5f0a9d3e1b7"
+down_revision: Union[str, None] = "b81f3e6c2a4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notes_user_id_updated_at_id",
+        "notes",
+        ["user_id", "updated_at", "id"],
+    )
+    op.create_index(
+        "ix_notes_user_id_created_at_id",
+        "notes",
+        ["user_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notes_user_id_created_at_id", table_name="notes")
+    op.drop_index("ix_notes_user_id_updated_at_id", table_name="notes")
@@ -0,0 +1,35 @@
+"""Add trigram indexes for title and keyword search
+
+Revision ID: d2b7e4f8a6c1
+Revises: c5f0a9d3e1b7
+Create Date: 2026-10-18 00:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b7e4f8a6c1"
+down_revision: Union[str, None] = "c5f0a9d3e1b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_notes_lower_title_trgm "
+        "ON notes USING gin (lower(title) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_keywords_lower_name_trgm "
+        "ON keywords USING gin (lower(name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_keywords_lower_name_trgm", table_name="keywords")
+    op.drop_index("ix_notes_lower_title_trgm", table_name="notes")
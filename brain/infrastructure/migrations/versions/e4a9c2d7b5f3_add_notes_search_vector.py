@@ -0,0 +1,47 @@
+"""Add generated full-text search vector to notes
+
+Revision ID: e4a9c2d7b5f3
+Revises: d2b7e4f8a6c1
+Create Date: 2026-10-18 00:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9c2d7b5f3"
+down_revision: Union[str, None] = "d2b7e4f8a6c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notes",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(text, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_notes_search_vector",
+        "notes",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notes_search_vector", table_name="notes")
+    op.drop_column("notes", "search_vector")
@@ -0,0 +1,83 @@
+"""Add resolved note_links table
+
+Revision ID: f6a3d8c1e2b4
+Revises: e4a9c2d7b5f3
+Create Date: 2026-10-18 02:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a3d8c1e2b4"
+down_revision: Union[str, None] = "e4a9c2d7b5f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The ASCII whitespace str.strip() removes; plain btrim() only drops spaces.
+# Postgres has no \v escape, so the vertical tab is spelled \x0b.
+WHITESPACE = r"E' \t\n\r\f\x0b\x1c\x1d\x1e\x1f'"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "note_links",
+        sa.Column("source_note_id", sa.Uuid(), nullable=False),
+        sa.Column("target_title", sa.Text(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("target_note_id", sa.Uuid(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["source_note_id"], ["notes.id"], ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["target_note_id"], ["notes.id"], ondelete="SET NULL", onupdate="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], ondelete="CASCADE", onupdate="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("source_note_id", "target_title"),
+    )
+    op.create_index(
+        "ix_note_links_target_note_id_source_note_id",
+        "note_links",
+        ["target_note_id", "source_note_id"],
+    )
+    op.create_index(
+        "ix_note_links_user_id_target_title",
+        "note_links",
+        ["user_id", "target_title"],
+    )
+
+    # Same parsing as extract_link_targets: [[Target|alias]] -> "Target".
+    op.execute(
+        f"""
+        INSERT INTO note_links (source_note_id, target_title, user_id, target_note_id)
+        SELECT links.source_note_id, links.target_title, links.user_id, targets.id
+        FROM (
+            SELECT DISTINCT
+                notes.id AS source_note_id,
+                notes.user_id,
+                btrim(split_part(btrim(match[1], {WHITESPACE}), '|', 1), {WHITESPACE})
+                    AS target_title
+            FROM notes
+            CROSS JOIN LATERAL regexp_matches(
+                notes.text, '\\[\\[([^\\[\\]\\n]+)\\]\\]', 'g'
+            ) AS match
+            WHERE position('[[' in notes.text) > 0
+        ) AS links
+        LEFT JOIN notes AS targets
+            ON targets.user_id = links.user_id
+            AND targets.title = links.target_title
+        WHERE links.target_title <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_note_links_user_id_target_title", table_name="note_links")
+    op.drop_index("ix_note_links_target_note_id_source_note_id", table_name="note_links")
+    op.drop_table("note_links")
@@ -0,0 +1,13 @@
+from dishka import Provider, Scope, provide
+
+from brain.application.abstractions.storage.related_notes import IRelatedNotesIndex
+from brain.config.models import RelatedNotesConfig
+from brain.infrastructure.related_notes.storage import FileRelatedNotesIndex
+
+
+class RelatedNotesProvider(Provider):
+    scope = Scope.APP
+
+    @provide(provides=IRelatedNotesIndex)
+    def get_related_notes_index(self, config: RelatedNotesConfig) -> FileRelatedNotesIndex:
+        return FileRelatedNotesIndex(config=config)
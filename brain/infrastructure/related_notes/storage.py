@@ -0,0 +1,392 @@
+import fcntl
+import json
+import os
+import shutil
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+
+from brain.application.abstractions.storage.models import RelatedNote
+from brain.application.abstractions.storage.related_notes import IRelatedNotesIndex
+from brain.config.models import RelatedNotesConfig
+from brain.domain.entities.note import Note
+from brain.infrastructure.related_notes.tfidf import (
+    TfidfMatrix,
+    idf,
+    row_norms,
+    scores_by_row,
+    scores_by_term,
+    top_scores,
+)
+
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = "lock"
+META_FILE = "meta.json"
+TERMS_FILE = "terms.json"
+DELTA_META_FILE = "delta_meta.json"
+# Written on a full rebuild and hard-linked into every later generation.
+BASE_ARRAYS = (
+    "note_ids",
+    "indptr",
+    "indices",
+    "counts",
+    "tf",
+    "term_indptr",
+    "term_rows",
+    "term_tf",
+    "document_frequency",
+)
+BASE_FILES = (*(f"{name}.npy" for name in BASE_ARRAYS), META_FILE, TERMS_FILE)
+# Changed notes go to a delta segment until they, together with the base
+# rows they replaced, make up this share of the base.
+COMPACT_RATIO = 0.1
+MIN_COMPACT_CHANGES = 256
+
+
+@dataclass
+class _MappedVectors:
+    generation: str
+    note_ids: np.ndarray
+    titles: list[str]
+    alive: np.ndarray
+    row_by_id: dict[UUID, int]
+    base_term_count: int
+    indptr: np.ndarray
+    indices: np.ndarray
+    tf: np.ndarray
+    term_indptr: np.ndarray
+    term_rows: np.ndarray
+    term_tf: np.ndarray
+    delta_indptr: np.ndarray
+    delta_indices: np.ndarray
+    delta_tf: np.ndarray
+    idf: np.ndarray
+    norms: np.ndarray
+
+
+@dataclass
+class _Segments:
+    base: TfidfMatrix
+    base_tf: np.ndarray
+    base_document_frequency: np.ndarray
+    removed: np.ndarray
+    delta: TfidfMatrix
+
+
+class FileRelatedNotesIndex(IRelatedNotesIndex):
+    """
+    TF-IDF vectors of each user as .npy files in a shared directory.
+
+    Every write goes to a new generation directory and is published by
+    atomically replacing the CURRENT pointer, so readers never see a half
+    written matrix. Readers memory-map the current generation and keep the
+    most recently used users open.
+
+    A generation is a base matrix plus a delta segment of changed notes and
+    the base rows they replaced. The base is only rewritten when the delta
+    outgrows it; otherwise its files are hard-linked into the new generation
+    and just the delta, IDF and row norms are written. Weights are applied
+    at query time, so scores match a full rebuild exactly.
+    """
+
+    def __init__(self, config: RelatedNotesConfig):
+        self._root = Path(config.storage_dir)
+        self._max_cached_users = config.max_cached_users
+        self._mapped: OrderedDict[UUID, _MappedVectors] = OrderedDict()
+
+    def find_related(self, user_id: UUID, note_id: UUID, limit: int) -> list[RelatedNote] | None:
+        vectors = self._map(user_id)
+        if vectors is None:
+            return None
+        row = vectors.row_by_id.get(note_id)
+        if row is None:
+            return None
+        if not vectors.norms[row]:
+            return []
+
+        base_rows = len(vectors.indptr) - 1
+        if row < base_rows:
+            start, end = vectors.indptr[row], vectors.indptr[row + 1]
+            terms, tf = vectors.indices[start:end], vectors.tf[start:end]
+        else:
+            start, end = vectors.delta_indptr[row - base_rows], vectors.delta_indptr[row - base_rows + 1]
+            terms, tf = vectors.delta_indices[start:end], vectors.delta_tf[start:end]
+        # The other side's idf is folded in here; its norm is divided out below.
+        query = tf * vectors.idf[terms] ** 2 / vectors.norms[row]
+        in_base = terms < vectors.base_term_count
+        products = np.concatenate([
+            scores_by_term(
+                term_indptr=vectors.term_indptr,
+                term_rows=vectors.term_rows,
+                term_tf=vectors.term_tf,
+                terms=terms[in_base],
+                query=query[in_base],
+                row_count=base_rows,
+            ),
+            scores_by_row(
+                indptr=vectors.delta_indptr,
+                indices=vectors.delta_indices,
+                tf=vectors.delta_tf,
+                terms=terms,
+                query=query,
+            ),
+        ])
+        scores = np.divide(
+            products, vectors.norms, out=np.zeros_like(products), where=vectors.norms > 0
+        )
+        scores[~vectors.alive] = 0
+        scores[row] = 0
+        return [
+            RelatedNote(
+                note_id=UUID(bytes=vectors.note_ids[other].tobytes()),
+                title=vectors.titles[other],
+                score=score,
+            )
+            for other, score in top_scores(scores, limit)
+        ]
+
+    def exists(self, user_id: UUID) -> bool:
+        return self._current_generation(user_id) is not None
+
+    def rebuild(self, user_id: UUID, notes: Iterable[Note]) -> None:
+        matrix = TfidfMatrix.build(notes)
+        with self._locked(user_id):
+            self._publish_base(user_id, matrix)
+
+    def apply_changes(
+        self,
+        user_id: UUID,
+        updated: Sequence[Note] = (),
+        deleted_ids: Sequence[UUID] = (),
+    ) -> None:
+        if not updated and not deleted_ids:
+            return
+        with self._locked(user_id):
+            generation = self._current_generation(user_id)
+            if generation is None:
+                # Nothing to patch; the next refresh rebuilds from scratch.
+                return
+            segments = self._read(user_id, generation)
+            changed = {note.id.bytes for note in updated} | {note_id.bytes for note_id in deleted_ids}
+            replaced = [
+                row for row, note_id in enumerate(segments.base.note_ids)
+                if note_id.tobytes() in changed
+            ]
+            segments.removed = np.union1d(segments.removed, replaced).astype(np.int64)
+            segments.delta = segments.delta.with_changes(updated, deleted_ids)
+
+            pending = len(segments.removed) + len(segments.delta.titles)
+            if pending > COMPACT_RATIO * len(segments.base.titles) + MIN_COMPACT_CHANGES:
+                self._publish_base(user_id, self._compact(segments))
+            else:
+                self._publish(user_id, self._generation_files(segments), link_from=generation)
+
+    def drop(self, user_id: UUID) -> None:
+        self._mapped.pop(user_id, None)
+        with self._locked(user_id):
+            self._user_dir(user_id).joinpath(CURRENT_FILE).unlink(missing_ok=True)
+            self._remove_generations(user_id, keep=())
+
+    def _map(self, user_id: UUID) -> _MappedVectors | None:
+        generation = self._current_generation(user_id)
+        if generation is None:
+            self._mapped.pop(user_id, None)
+            return None
+
+        vectors = self._mapped.get(user_id)
+        if vectors is None or vectors.generation != generation:
+            try:
+                vectors = self._open(user_id, generation)
+            except FileNotFoundError:
+                # Superseded and removed while we were opening it.
+                return None
+            self._mapped[user_id] = vectors
+            while len(self._mapped) > self._max_cached_users:
+                self._mapped.popitem(last=False)
+        self._mapped.move_to_end(user_id)
+        return vectors
+
+    def _open(self, user_id: UUID, generation: str) -> _MappedVectors:
+        path = self._user_dir(user_id) / generation
+        delta_meta = json.loads((path / DELTA_META_FILE).read_text())
+        note_ids = np.concatenate([
+            np.load(path / "note_ids.npy"),
+            np.load(path / "delta_note_ids.npy"),
+        ])
+        alive = np.ones(len(note_ids), dtype=bool)
+        alive[np.load(path / "removed.npy")] = False
+        delta_counts = np.load(path / "delta_counts.npy")
+        term_indptr = np.load(path / "term_indptr.npy", mmap_mode="r")
+        return _MappedVectors(
+            generation=generation,
+            note_ids=note_ids,
+            titles=json.loads((path / META_FILE).read_text())["titles"] + delta_meta["titles"],
+            alive=alive,
+            row_by_id={
+                UUID(bytes=note_ids[row].tobytes()): int(row) for row in np.flatnonzero(alive)
+            },
+            base_term_count=len(term_indptr) - 1,
+            indptr=np.load(path / "indptr.npy", mmap_mode="r"),
+            indices=np.load(path / "indices.npy", mmap_mode="r"),
+            tf=np.load(path / "tf.npy", mmap_mode="r"),
+            term_indptr=term_indptr,
+            term_rows=np.load(path / "term_rows.npy", mmap_mode="r"),
+            term_tf=np.load(path / "term_tf.npy", mmap_mode="r"),
+            delta_indptr=np.load(path / "delta_indptr.npy"),
+            delta_indices=np.load(path / "delta_indices.npy"),
+            delta_tf=(1 + np.log(delta_counts)).astype(np.float32),
+            idf=np.load(path / "idf.npy"),
+            norms=np.load(path / "norms.npy"),
+        )
+
+    def _read(self, user_id: UUID, generation: str) -> _Segments:
+        path = self._user_dir(user_id) / generation
+        terms = json.loads((path / TERMS_FILE).read_text())
+        delta_meta = json.loads((path / DELTA_META_FILE).read_text())
+        return _Segments(
+            base=TfidfMatrix(
+                note_ids=np.load(path / "note_ids.npy"),
+                titles=json.loads((path / META_FILE).read_text())["titles"],
+                terms=terms,
+                indptr=np.load(path / "indptr.npy", mmap_mode="r"),
+                indices=np.load(path / "indices.npy", mmap_mode="r"),
+                counts=np.load(path / "counts.npy", mmap_mode="r"),
+            ),
+            base_tf=np.load(path / "tf.npy", mmap_mode="r"),
+            base_document_frequency=np.load(path / "document_frequency.npy"),
+            removed=np.load(path / "removed.npy"),
+            delta=TfidfMatrix(
+                note_ids=np.load(path / "delta_note_ids.npy"),
+                titles=delta_meta["titles"],
+                terms=terms + delta_meta["terms"],
+                indptr=np.load(path / "delta_indptr.npy"),
+                indices=np.load(path / "delta_indices.npy"),
+                counts=np.load(path / "delta_counts.npy"),
+            ),
+        )
+
+    @staticmethod
+    def _compact(segments: _Segments) -> TfidfMatrix:
+        base = segments.base
+        removed_ids = [UUID(bytes=base.note_ids[row].tobytes()) for row in segments.removed]
+        return (
+            base.with_changes(deleted_ids=removed_ids)
+            .append(segments.delta)
+            .without_unused_terms()
+        )
+
+    def _publish_base(self, user_id: UUID, matrix: TfidfMatrix) -> None:
+        tf = matrix.tf()
+        term_indptr, term_rows, term_tf = matrix.by_term(tf)
+        files = {
+            "note_ids.npy": matrix.note_ids,
+            "indptr.npy": matrix.indptr,
+            "indices.npy": matrix.indices,
+            "counts.npy": matrix.counts,
+            "tf.npy": tf,
+            "term_indptr.npy": term_indptr,
+            "term_rows.npy": term_rows,
+            "term_tf.npy": term_tf,
+            "document_frequency.npy": matrix.document_frequency(),
+            META_FILE: {"titles": matrix.titles},
+            TERMS_FILE: matrix.terms,
+        }
+        empty_delta = replace(TfidfMatrix.empty(), terms=matrix.terms)
+        files.update(self._generation_files(_Segments(
+            base=matrix,
+            base_tf=tf,
+            base_document_frequency=files["document_frequency.npy"],
+            removed=np.zeros(0, dtype=np.int64),
+            delta=empty_delta,
+        )))
+        self._publish(user_id, files, link_from=None)
+
+    @staticmethod
+    def _generation_files(segments: _Segments) -> dict[str, object]:
+        base, delta, removed = segments.base, segments.delta, segments.removed
+        document_frequency = delta.document_frequency()
+        document_frequency[:len(base.terms)] += segments.base_document_frequency
+        if len(removed):
+            replaced_terms = np.concatenate(
+                [base.indices[base.indptr[row]:base.indptr[row + 1]] for row in removed]
+            )
+            np.subtract.at(document_frequency, replaced_terms, 1)
+
+        documents = len(base.titles) - len(removed) + len(delta.titles)
+        term_idf = idf(document_frequency, documents)
+        norms = np.concatenate([
+            row_norms(base.rows, base.indices, segments.base_tf, term_idf, len(base.titles)),
+            row_norms(delta.rows, delta.indices, delta.tf(), term_idf, len(delta.titles)),
+        ])
+        return {
+            "removed.npy": removed,
+            "delta_note_ids.npy": delta.note_ids,
+            "delta_indptr.npy": delta.indptr,
+            "delta_indices.npy": delta.indices,
+            "delta_counts.npy": delta.counts,
+            "idf.npy": term_idf,
+            "norms.npy": norms,
+            DELTA_META_FILE: {"titles": delta.titles, "terms": delta.terms[len(base.terms):]},
+        }
+
+    def _publish(
+        self,
+        user_id: UUID,
+        files: dict[str, object],
+        link_from: str | None,
+    ) -> None:
+        user_dir = self._user_dir(user_id)
+        previous = self._current_generation(user_id)
+        generation = str(int(previous) + 1) if previous else "1"
+
+        staging = user_dir / f"{generation}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        if link_from is not None:
+            for name in BASE_FILES:
+                os.link(user_dir / link_from / name, staging / name)
+        for name, content in files.items():
+            if name.endswith(".npy"):
+                np.save(staging / name, content)
+            else:
+                (staging / name).write_text(json.dumps(content))
+        staging.rename(user_dir / generation)
+
+        pointer = user_dir / f"{CURRENT_FILE}.tmp"
+        pointer.write_text(generation)
+        os.replace(pointer, user_dir / CURRENT_FILE)
+        # The previous generation stays for readers that already resolved it.
+        self._remove_generations(user_id, keep=(generation, previous))
+
+    def _remove_generations(self, user_id: UUID, keep: Iterable[str | None]) -> None:
+        kept = set(keep)
+        for path in self._user_dir(user_id).iterdir():
+            if path.is_dir() and path.name not in kept:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _current_generation(self, user_id: UUID) -> str | None:
+        try:
+            return self._user_dir(user_id).joinpath(CURRENT_FILE).read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _locked(self, user_id: UUID) -> Iterator[None]:
+        # Several workers may refresh the same user; the lock keeps one
+        # read-modify-publish cycle from overwriting another.
+        user_dir = self._user_dir(user_id)
+        user_dir.mkdir(parents=True, exist_ok=True)
+        with open(user_dir / LOCK_FILE, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _user_dir(self, user_id: UUID) -> Path:
+        return self._root / str(user_id)
@@ -0,0 +1,231 @@
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+from brain.domain.entities.note import Note
+
+_TOKEN_RE = re.compile(r"[^\W\d_]{2,}")
+# Title words say more about a note than the same words in its body.
+TITLE_WEIGHT = 2.0
+
+
+def term_counts(note: Note) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for token in _TOKEN_RE.findall(note.title.lower()):
+        counts[token] += TITLE_WEIGHT
+    counts.update(_TOKEN_RE.findall((note.text or "").lower()))
+    return counts
+
+
+@dataclass
+class TfidfMatrix:
+    """
+    Raw term counts of a user's notes as a CSR matrix, one row per note.
+
+    Counts are kept instead of weights so changed notes can be swapped in
+    and the IDF of every term recomputed without re-tokenizing the others.
+    """
+
+    note_ids: np.ndarray
+    titles: list[str]
+    terms: list[str]
+    indptr: np.ndarray
+    indices: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "TfidfMatrix":
+        return cls(
+            note_ids=np.zeros((0, 16), dtype=np.uint8),
+            titles=[],
+            terms=[],
+            indptr=np.zeros(1, dtype=np.int64),
+            indices=np.zeros(0, dtype=np.int32),
+            counts=np.zeros(0, dtype=np.float32),
+        )
+
+    @classmethod
+    def build(cls, notes: Iterable[Note]) -> "TfidfMatrix":
+        return cls.empty().with_changes(updated=list(notes))
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row number of every stored value."""
+        return np.repeat(
+            np.arange(len(self.titles), dtype=np.int32),
+            np.diff(self.indptr),
+        )
+
+    def with_changes(
+        self,
+        updated: Sequence[Note] = (),
+        deleted_ids: Sequence[UUID] = (),
+    ) -> "TfidfMatrix":
+        """
+        The matrix with changed notes swapped in and deleted ones removed.
+
+        Term indices stay as they are, new terms are appended, so the
+        result can be scored against anything sharing this vocabulary.
+        """
+        updated = list({note.id: note for note in updated}.values())
+        replaced = {note.id.bytes for note in updated} | {note_id.bytes for note_id in deleted_ids}
+        keep = np.fromiter(
+            (row.tobytes() not in replaced for row in self.note_ids),
+            dtype=bool,
+            count=len(self.note_ids),
+        )
+        kept_values = np.repeat(keep, np.diff(self.indptr))
+
+        vocabulary = {term: index for index, term in enumerate(self.terms)}
+        terms = list(self.terms)
+        new_lengths, new_indices, new_counts = [], [], []
+        for note in updated:
+            counts = term_counts(note)
+            new_lengths.append(len(counts))
+            for term, count in counts.items():
+                index = vocabulary.get(term)
+                if index is None:
+                    index = vocabulary[term] = len(terms)
+                    terms.append(term)
+                new_indices.append(index)
+                new_counts.append(count)
+
+        lengths = np.concatenate([np.diff(self.indptr)[keep], np.array(new_lengths, dtype=np.int64)])
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return TfidfMatrix(
+            note_ids=np.concatenate([
+                self.note_ids[keep],
+                np.frombuffer(b"".join(note.id.bytes for note in updated), dtype=np.uint8).reshape(-1, 16),
+            ]),
+            titles=[title for title, kept in zip(self.titles, keep) if kept] + [note.title for note in updated],
+            terms=terms,
+            indptr=indptr,
+            indices=np.concatenate([self.indices[kept_values], np.array(new_indices, dtype=np.int32)]),
+            counts=np.concatenate([self.counts[kept_values], np.array(new_counts, dtype=np.float32)]),
+        )
+
+    def append(self, other: "TfidfMatrix") -> "TfidfMatrix":
+        """Rows of both matrices; `other` must extend this vocabulary."""
+        return TfidfMatrix(
+            note_ids=np.concatenate([self.note_ids, other.note_ids]),
+            titles=self.titles + other.titles,
+            terms=other.terms,
+            indptr=np.concatenate([self.indptr, other.indptr[1:] + self.indptr[-1]]),
+            indices=np.concatenate([self.indices, other.indices]),
+            counts=np.concatenate([self.counts, other.counts]),
+        )
+
+    def without_unused_terms(self) -> "TfidfMatrix":
+        used = np.bincount(self.indices, minlength=len(self.terms)) > 0
+        if used.all():
+            return self
+        new_index = np.cumsum(used, dtype=np.int32) - 1
+        return TfidfMatrix(
+            note_ids=self.note_ids,
+            titles=self.titles,
+            terms=[term for term, is_used in zip(self.terms, used) if is_used],
+            indptr=self.indptr,
+            indices=new_index[self.indices],
+            counts=self.counts,
+        )
+
+    def by_term(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The same matrix in CSC form: term_indptr, rows and values."""
+        order = np.argsort(self.indices, kind="stable")
+        term_indptr = np.zeros(len(self.terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=len(self.terms)), out=term_indptr[1:])
+        return term_indptr, self.rows[order], values[order]
+
+    def tf(self) -> np.ndarray:
+        """Sublinear term frequencies, aligned with `indices`."""
+        return (1 + np.log(self.counts)).astype(np.float32)
+
+    def document_frequency(self) -> np.ndarray:
+        return np.bincount(self.indices, minlength=len(self.terms)).astype(np.int32)
+
+    def weights(self) -> np.ndarray:
+        """L2-normalized TF-IDF weights, aligned with `indices`."""
+        term_idf = idf(self.document_frequency(), len(self.titles))
+        weights = self.tf() * term_idf[self.indices]
+        norms = row_norms(self.rows, self.indices, self.tf(), term_idf, len(self.titles))
+        return (weights / norms[self.rows]).astype(np.float32)
+
+
+def idf(document_frequency: np.ndarray, documents: int) -> np.ndarray:
+    return np.log((1 + documents) / (1 + document_frequency)) + 1
+
+
+def row_norms(
+    rows: np.ndarray,
+    indices: np.ndarray,
+    tf: np.ndarray,
+    term_idf: np.ndarray,
+    row_count: int,
+) -> np.ndarray:
+    """L2 norm of every row's TF-IDF vector."""
+    weights = tf * term_idf[indices]
+    return np.sqrt(np.bincount(rows, weights=weights * weights, minlength=row_count))
+
+
+def scores_by_term(
+    term_indptr: np.ndarray,
+    term_rows: np.ndarray,
+    term_tf: np.ndarray,
+    terms: np.ndarray,
+    query: np.ndarray,
+    row_count: int,
+) -> np.ndarray:
+    """
+    Dot products of `query` (weights of `terms`) with every row's tf.
+
+    The product is done column-wise: only the posting lists of the query's
+    own terms are read, not the whole matrix.
+    """
+    if not len(terms):
+        return np.zeros(row_count)
+    lengths = term_indptr[terms + 1] - term_indptr[terms]
+    postings = np.concatenate([
+        np.arange(term_indptr[term], term_indptr[term + 1])
+        for term in terms
+    ])
+    products = term_tf[postings] * np.repeat(query, lengths)
+    return np.bincount(term_rows[postings], weights=products, minlength=row_count)
+
+
+def scores_by_row(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    tf: np.ndarray,
+    terms: np.ndarray,
+    query: np.ndarray,
+) -> np.ndarray:
+    """The same dot products over a CSR matrix, for small ones."""
+    row_count = len(indptr) - 1
+    if not len(terms) or not len(indices):
+        return np.zeros(row_count)
+    order = np.argsort(terms)
+    sorted_terms, sorted_query = terms[order], query[order]
+    positions = np.minimum(np.searchsorted(sorted_terms, indices), len(sorted_terms) - 1)
+    matched = sorted_terms[positions] == indices
+    products = np.where(matched, tf * sorted_query[positions], 0)
+    rows = np.repeat(np.arange(row_count), np.diff(indptr))
+    return np.bincount(rows, weights=products, minlength=row_count)
+
+
+def top_scores(scores: np.ndarray, limit: int) -> list[tuple[int, float]]:
+    """(row, score) of the `limit` best positive scores, best first."""
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > limit:
+        best = np.argpartition(scores[candidates], len(candidates) - limit)[len(candidates) - limit:]
+        candidates = candidates[best]
+    # Equal scores are ordered by row.
+    order = np.lexsort((candidates, -scores[candidates]))
+    return [
+        (int(candidates[index]), min(float(scores[candidates[index]]), 1.0))
+        for index in order
+    ]
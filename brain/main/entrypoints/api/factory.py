@@ -13,6 +13,8 @@ from brain.main.log import setup_logging
 from brain.presentation.api.factory import create_bare_app
 from brain.presentation.tgbot.provider import DispatcherProvider, BotProvider
 from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.cache.provider import CacheProvider
+from brain.infrastructure.related_notes.provider import RelatedNotesProvider
 from brain.infrastructure.graph.provider import Neo4jProvider
 from brain.infrastructure.s3.provider import S3Provider
 from brain.main.entrypoints.taskiq.broker import broker as taskiq_broker
@@ -40,6 +42,8 @@ def create_app() -> FastAPI:
         BotProvider(),
         DatabaseConfigProvider(),
         DatabaseProvider(),
+        CacheProvider(),
+        RelatedNotesProvider(),
         Neo4jProvider(),
         S3Provider(),
         InteractorProvider(),
@@ -12,6 +12,8 @@ from brain.infrastructure.s3.provider import S3Provider
 from brain.main.log import setup_logging
 from brain.presentation.tgbot.provider import DispatcherProvider, BotProvider
 from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.cache.provider import CacheProvider
+from brain.infrastructure.related_notes.provider import RelatedNotesProvider
 from brain.infrastructure.graph.provider import Neo4jProvider
 from brain.infrastructure.telegram.provider import TelegramInfrastructureProvider
 from brain.application.interactors.factory import InteractorProvider
@@ -41,6 +43,8 @@ async def main():
         BotProvider(),
         DatabaseConfigProvider(),
         DatabaseProvider(),
+        CacheProvider(),
+        RelatedNotesProvider(),
         Neo4jProvider(),
         S3Provider(),
         InteractorProvider(),
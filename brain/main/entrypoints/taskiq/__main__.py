@@ -7,6 +7,8 @@ def main() -> int:
         "worker",
         "brain.main.entrypoints.taskiq.broker:broker",
         "brain.presentation.tgbot.tasks",
+        "brain.presentation.tasks.graph_sync",
+        "brain.presentation.tasks.related_notes",
     ]
     return subprocess.call(command)
 
@@ -11,6 +11,8 @@ from brain.config.models import Config
 from brain.config.parser import load_config
 from brain.config.provider import ConfigProvider, DatabaseConfigProvider
 from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.cache.provider import CacheProvider
+from brain.infrastructure.related_notes.provider import RelatedNotesProvider
 from brain.infrastructure.graph.provider import Neo4jProvider
 from brain.infrastructure.jwt.provider import JwtProvider
 from brain.infrastructure.s3.provider import S3Provider
@@ -43,6 +45,8 @@ def setup_broker() -> None:
         BotProvider(),
         DatabaseConfigProvider(),
         DatabaseProvider(),
+        CacheProvider(),
+        RelatedNotesProvider(),
         Neo4jProvider(),
         S3Provider(),
         InteractorProvider(),
@@ -17,6 +17,8 @@ def create_bare_app(config: APIConfig) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Read by browser clients for pagination and conditional requests.
+        expose_headers=["X-Next-Cursor", "ETag"],
     )
 
     register_routes(app=app, config=config)
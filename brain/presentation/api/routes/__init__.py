@@ -9,6 +9,7 @@ from .test import router as test_router
 from .notes import get_router as get_notes_router
 from .graph import get_router as get_graph_router
 from .upload import get_router as get_upload_router
+from .metrics import get_router as get_metrics_router
 
 
 def register_routes(app: FastAPI, config: APIConfig):
@@ -20,6 +21,7 @@ def register_routes(app: FastAPI, config: APIConfig):
     root_router.include_router(get_notes_router())
     root_router.include_router(get_graph_router())
     root_router.include_router(get_upload_router())
+    root_router.include_router(get_metrics_router())
     root_router.include_router(test_router)
 
     app.include_router(root_router)
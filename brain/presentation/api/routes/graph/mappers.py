@@ -1,11 +1,17 @@
+from dataclasses import asdict
+from uuid import UUID
+
+from brain.application.interactors.graph.dto import GraphChanges, GraphSyncStatus
 from brain.domain.entities.graph import GraphData, GraphNode, GraphConnection
 from brain.presentation.api.routes.graph.models import (
+    GraphChangesSchema,
     GraphSchema,
     GraphNodeSchema,
     GraphConnectionSchema,
     GraphNodeKindEnum,
     GraphNodeNoteSchema,
     GraphNodeKeywordSchema,
+    GraphSyncStatusSchema,
 )
 
 
@@ -42,4 +48,83 @@ def map_graph_to_schema(graph: GraphData) -> GraphSchema:
             map_graph_connection_to_schema(connection)
             for connection in graph.connections
         ],
+        truncated=graph.truncated,
     )
+
+
+# Positions in the `kinds` column of a columnar graph.
+COLUMNAR_NODE_KINDS = {
+    GraphNodeKindEnum.NOTE.value: 0,
+    GraphNodeKindEnum.KEYWORD.value: 1,
+}
+COLUMNAR_FLAG_REPRESENTS_KEYWORD = 1
+
+
+def map_graph_to_columnar(graph: GraphData) -> dict:
+    """
+    The graph as parallel arrays: node i is ids[i], kinds[i], titles[i]
+    and flags[i], connection j goes from node sources[j] to node
+    targets[j]. A connection to a keyword is has_keyword, one to a note
+    links_to, so its kind is not repeated.
+    """
+    nodes = graph.nodes
+    ids = [node.id for node in nodes]
+    positions = {node_id: position for position, node_id in enumerate(ids)}
+    return {
+        "ids": ids,
+        "kinds": [COLUMNAR_NODE_KINDS[node.kind] for node in nodes],
+        "titles": [node.title for node in nodes],
+        "flags": [
+            COLUMNAR_FLAG_REPRESENTS_KEYWORD if node.represents_keyword else 0
+            for node in nodes
+        ],
+        "sources": [positions[connection.from_id] for connection in graph.connections],
+        "targets": [positions[connection.to_id] for connection in graph.connections],
+        "truncated": graph.truncated,
+    }
+
+
+def map_graph_changes_to_schema(changes: GraphChanges) -> GraphChangesSchema:
+    if changes.snapshot is not None:
+        return GraphChangesSchema(
+            version=changes.version,
+            snapshot=map_graph_to_schema(changes.snapshot),
+        )
+
+    delta = changes.delta
+    return GraphChangesSchema(
+        version=changes.version,
+        removed_node_ids=delta.removed_node_ids,
+        removed_connections=[
+            map_graph_connection_to_schema(connection)
+            for connection in delta.removed_connections
+        ],
+        added_nodes=[map_graph_node_to_schema(node) for node in delta.added_nodes],
+        added_connections=[
+            map_graph_connection_to_schema(connection)
+            for connection in delta.added_connections
+        ],
+    )
+
+
+def map_graph_sync_status_to_schema(
+    sync_status: GraphSyncStatus,
+) -> GraphSyncStatusSchema:
+    return GraphSyncStatusSchema.model_validate(asdict(sync_status))
+
+
+def encode_graph_etag(user_id: UUID, version: int) -> str:
+    # The user is part of the tag: versions of different users collide.
+    return f'"{user_id.hex}-{version}"'
+
+
+def decode_graph_etag(if_none_match: str, user_id: UUID) -> int | None:
+    """Graph version from an If-None-Match header, if it names one of the user."""
+    prefix = f'"{user_id.hex}-'
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag.startswith(prefix) and tag.endswith('"'):
+            version = tag[len(prefix):-1]
+            if version.isdigit():
+                return int(version)
+    return None
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import Literal, TypeAlias
 
@@ -9,6 +10,11 @@ class GraphNodeKindEnum(str, Enum):
     KEYWORD = 'keyword'
 
 
+class GraphFormatEnum(str, Enum):
+    OBJECTS = 'objects'
+    COLUMNAR = 'columnar'
+
+
 class GraphNodeNoteSchema(BaseModel):
     id: str
     type: Literal[GraphNodeKindEnum.NOTE]
@@ -34,3 +40,26 @@ GraphNodeSchema: TypeAlias = GraphNodeNoteSchema | GraphNodeKeywordSchema
 class GraphSchema(BaseModel):
     nodes: list[GraphNodeSchema]
     connections: list[GraphConnectionSchema]
+    truncated: bool = False
+
+
+class GraphChangesSchema(BaseModel):
+    # Pass it as `since` next time; null when only a snapshot is available.
+    version: int | None
+    # Set instead of the lists below when the changes since the requested
+    # version are no longer logged.
+    snapshot: GraphSchema | None = None
+    # Removals apply first: a renamed note is removed and added again.
+    removed_node_ids: list[str] = []
+    removed_connections: list[GraphConnectionSchema] = []
+    added_nodes: list[GraphNodeSchema] = []
+    added_connections: list[GraphConnectionSchema] = []
+
+
+class GraphSyncStatusSchema(BaseModel):
+    pending: int
+    failed: int
+    oldest_pending_at: datetime | None
+    lag_seconds: float
+    processed: int
+    coalesced: int
@@ -1,28 +1,85 @@
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import JSONResponse
 from starlette import status
 
-from brain.application.interactors import GetGraphInteractor
+from brain.application.interactors import (
+    GetGraphChangesInteractor,
+    GetGraphInteractor,
+    GetGraphSyncStatusInteractor,
+)
 from brain.domain.entities.user import User
 from brain.presentation.api.dependencies.auth import get_user_from_request
-from brain.presentation.api.routes.graph.mappers import map_graph_to_schema
-from brain.presentation.api.routes.graph.models import GraphSchema
+from brain.presentation.api.routes.graph.mappers import (
+    decode_graph_etag,
+    encode_graph_etag,
+    map_graph_changes_to_schema,
+    map_graph_to_columnar,
+    map_graph_to_schema,
+    map_graph_sync_status_to_schema,
+)
+from brain.presentation.api.routes.graph.models import (
+    GraphChangesSchema,
+    GraphFormatEnum,
+    GraphSchema,
+    GraphSyncStatusSchema,
+)
+
+# Clients must revalidate, and shared caches must not keep another
+# user's graph.
+GRAPH_CACHE_CONTROL = "private, no-cache"
 
 
 @inject
 async def get_graph(
     interactor: FromDishka[GetGraphInteractor],
+    response: Response,
     query: str | None = Query(default=None, min_length=1),
     depth: int = Query(default=1, ge=0),
+    response_format: GraphFormatEnum = Query(default=GraphFormatEnum.OBJECTS, alias="format"),
+    if_none_match: str | None = Header(default=None),
     user: User = Depends(get_user_from_request),
-) -> GraphSchema:
-    graph = await interactor.get_graph(
+):
+    result = await interactor.get_graph(
         user_id=user.id,
         query=query,
         depth=depth,
+        known_version=decode_graph_etag(if_none_match, user.id) if if_none_match else None,
     )
-    return map_graph_to_schema(graph)
+    headers = {}
+    if result.version is not None:
+        headers = {
+            "ETag": encode_graph_etag(user.id, result.version),
+            "Cache-Control": GRAPH_CACHE_CONTROL,
+        }
+        if result.graph is None:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if response_format is GraphFormatEnum.COLUMNAR:
+        # Plain lists, serialized as is: no model per node and connection.
+        return JSONResponse(map_graph_to_columnar(result.graph), headers=headers)
+    response.headers.update(headers)
+    return map_graph_to_schema(result.graph)
+
+
+@inject
+async def get_graph_changes(
+    interactor: FromDishka[GetGraphChangesInteractor],
+    since: int = Query(ge=0),
+    user: User = Depends(get_user_from_request),
+) -> GraphChangesSchema:
+    changes = await interactor.get_changes(user_id=user.id, since=since)
+    return map_graph_changes_to_schema(changes)
+
+
+@inject
+async def get_graph_sync_status(
+    interactor: FromDishka[GetGraphSyncStatusInteractor],
+    user: User = Depends(get_user_from_request),
+) -> GraphSyncStatusSchema:
+    sync_status = await interactor.get_status(user_id=user.id)
+    return map_graph_sync_status_to_schema(sync_status)
 
 
 def get_router() -> APIRouter:
@@ -35,4 +92,20 @@ def get_router() -> APIRouter:
         summary="Get graph nodes and connections",
         status_code=status.HTTP_200_OK,
     )
+    router.add_api_route(
+        path="/changes",
+        endpoint=get_graph_changes,
+        methods=["GET"],
+        response_model=GraphChangesSchema,
+        summary="Get graph changes since a version",
+        status_code=status.HTTP_200_OK,
+    )
+    router.add_api_route(
+        path="/sync-status",
+        endpoint=get_graph_sync_status,
+        methods=["GET"],
+        response_model=GraphSyncStatusSchema,
+        summary="Get graph sync outbox lag",
+        status_code=status.HTTP_200_OK,
+    )
     return router
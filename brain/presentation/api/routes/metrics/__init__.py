@@ -0,0 +1 @@
+from .views import get_router
@@ -0,0 +1,8 @@
+from dataclasses import asdict
+
+from brain.application.interactors.metrics.dto import CacheMetric
+from brain.presentation.api.routes.metrics.models import CacheMetricSchema
+
+
+def map_cache_metric_to_schema(metric: CacheMetric) -> CacheMetricSchema:
+    return CacheMetricSchema.model_validate(asdict(metric))
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CacheMetricSchema(BaseModel):
+    cache: str
+    tier: str
+    hits: int
+    misses: int
+    hit_rate: float
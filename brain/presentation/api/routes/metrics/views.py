@@ -0,0 +1,32 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from brain.application.interactors import GetCacheMetricsInteractor
+from brain.domain.entities.user import User
+from brain.presentation.api.dependencies.auth import get_user_from_request
+from brain.presentation.api.routes.metrics.mappers import map_cache_metric_to_schema
+from brain.presentation.api.routes.metrics.models import CacheMetricSchema
+
+
+@inject
+async def get_cache_metrics(
+    interactor: FromDishka[GetCacheMetricsInteractor],
+    user: User = Depends(get_user_from_request),
+) -> list[CacheMetricSchema]:
+    metrics = await interactor.get_metrics()
+    return [map_cache_metric_to_schema(metric) for metric in metrics]
+
+
+def get_router() -> APIRouter:
+    router = APIRouter(prefix="/metrics", tags=["Metrics"])
+    router.add_api_route(
+        path="/caches",
+        endpoint=get_cache_metrics,
+        methods=["GET"],
+        response_model=list[CacheMetricSchema],
+        summary="Get cache hit rates of this API process",
+        status_code=status.HTTP_200_OK,
+    )
+    return router
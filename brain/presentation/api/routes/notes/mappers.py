@@ -1,8 +1,14 @@
+import base64
+import json
 from dataclasses import asdict
-
+from datetime import datetime
 from uuid import UUID
 
-from brain.application.interactors.notes.dto import CreateNote, UpdateNote
+from brain.application.interactors.notes.dto import (
+    CreateNote,
+    UpdateNote,
+    ImportNotesResult,
+)
 from brain.domain.entities.note import Note
 from brain.domain.entities.user import User
 from brain.presentation.api.routes.notes.models import (
@@ -11,10 +17,20 @@ from brain.presentation.api.routes.notes.models import (
     UpdateNoteSchema,
     WikilinkSuggestionSchema,
     NoteCreationStatSchema,
+    ImportNotesResultSchema,
+    NoteSearchHitSchema,
+    RelatedNoteSchema,
+    BacklinkSchema,
 )
+from brain.application.abstractions.storage.models import RelatedNote
 from brain.application.abstractions.repositories.models import (
+    Backlink,
     WikilinkSuggestion,
     NoteCreationStat,
+    NoteCursor,
+    NoteListItem,
+    NoteSearchCursor,
+    NoteSearchHit,
 )
 from brain.application.types import Unset
 
@@ -25,6 +41,66 @@ def map_note_to_read_schema(note: Note) -> ReadNoteSchema:
     return ReadNoteSchema.model_validate(payload)
 
 
+def map_note_list_item_to_read_schema(item: NoteListItem) -> ReadNoteSchema:
+    return ReadNoteSchema.model_validate(asdict(item))
+
+
+def _encode_cursor(values: list) -> str:
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(value: str) -> list:
+    padded = value + "=" * (-len(value) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_note_cursor(cursor: NoteCursor) -> str:
+    return _encode_cursor([cursor.sort_value.isoformat(), str(cursor.note_id)])
+
+
+def decode_note_cursor(value: str) -> NoteCursor:
+    """Raises ValueError for anything encode_note_cursor could not produce."""
+    try:
+        sort_value, note_id = _decode_cursor(value)
+        return NoteCursor(
+            sort_value=datetime.fromisoformat(sort_value),
+            note_id=UUID(note_id),
+        )
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_note_search_cursor(cursor: NoteSearchCursor) -> str:
+    return _encode_cursor([cursor.rank, str(cursor.note_id)])
+
+
+def decode_note_search_cursor(value: str) -> NoteSearchCursor:
+    """Raises ValueError for anything encode_note_search_cursor could not produce."""
+    try:
+        rank, note_id = _decode_cursor(value)
+        return NoteSearchCursor(rank=float(rank), note_id=UUID(note_id))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def encode_backlink_cursor(note_id: UUID) -> str:
+    return _encode_cursor([str(note_id)])
+
+
+def decode_backlink_cursor(value: str) -> UUID:
+    """Raises ValueError for anything encode_backlink_cursor could not produce."""
+    try:
+        (note_id,) = _decode_cursor(value)
+        return UUID(note_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def map_note_search_hit_to_schema(hit: NoteSearchHit) -> NoteSearchHitSchema:
+    return NoteSearchHitSchema.model_validate(asdict(hit))
+
+
 def map_create_schema_to_dto(
     schema: CreateNoteSchema,
     user: User,
@@ -55,7 +131,30 @@ def map_wikilink_suggestion_to_schema(
     return WikilinkSuggestionSchema.model_validate(asdict(suggestion))
 
 
+def map_related_note_to_schema(related: RelatedNote) -> RelatedNoteSchema:
+    return RelatedNoteSchema(
+        id=related.note_id,
+        title=related.title,
+        score=related.score,
+    )
+
+
+def map_backlink_to_schema(backlink: Backlink) -> BacklinkSchema:
+    return BacklinkSchema(
+        id=backlink.note_id,
+        title=backlink.title,
+        snippet=backlink.snippet,
+        updated_at=backlink.updated_at,
+    )
+
+
 def map_note_creation_stat_to_schema(
     stat: NoteCreationStat,
 ) -> NoteCreationStatSchema:
     return NoteCreationStatSchema.model_validate(asdict(stat))
+
+
+def map_import_result_to_schema(
+    result: ImportNotesResult,
+) -> ImportNotesResultSchema:
+    return ImportNotesResultSchema.model_validate(asdict(result))
@@ -12,6 +12,28 @@ class ReadNoteSchema(BaseModel):
     updated_at: datetime
 
 
+class NoteSearchHitSchema(BaseModel):
+    id: UUID
+    title: str
+    snippet: str
+    rank: float
+    created_at: datetime
+    updated_at: datetime
+
+
+class RelatedNoteSchema(BaseModel):
+    id: UUID
+    title: str
+    score: float
+
+
+class BacklinkSchema(BaseModel):
+    id: UUID
+    title: str
+    snippet: str
+    updated_at: datetime
+
+
 class CreateNoteSchema(BaseModel):
     title: str | None = None
     text: str | None = None
@@ -31,3 +53,8 @@ class WikilinkSuggestionSchema(BaseModel):
 class NoteCreationStatSchema(BaseModel):
     date: date
     count: int
+
+
+class ImportNotesResultSchema(BaseModel):
+    imported: int
+    skipped: int
@@ -4,20 +4,29 @@ from uuid import UUID
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import Depends, APIRouter, HTTPException, Query, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from starlette import status
 
 from brain.application.interactors import (
     CreateNoteInteractor,
     DeleteNoteInteractor,
+    GetBacklinksInteractor,
     GetNoteInteractor,
     GetNoteCreationStatsInteractor,
-    GetNotesInteractor,
+    GetRelatedNotesInteractor,
+    ListNotesInteractor,
+    SearchNotesInteractor,
     SearchNotesByTitleInteractor,
     SearchWikilinkSuggestionsInteractor,
     UpdateNoteInteractor,
     ExportNotesInteractor,
     ImportNotesInteractor,
 )
+from brain.application.abstractions.repositories.models import (
+    NoteListFields,
+    NoteListOrder,
+)
+from brain.application.interactors.notes.dto import GetBacklinks, ListNotes, SearchNotes
 from brain.application.interactors.notes.exceptions import (
     NoteNotFoundException,
     KeywordNotFoundException,
@@ -27,11 +36,22 @@ from brain.application.interactors.notes.exceptions import (
 from brain.domain.entities.user import User
 from brain.presentation.api.dependencies.auth import get_user_from_request
 from brain.presentation.api.routes.notes.mappers import (
+    decode_backlink_cursor,
+    decode_note_cursor,
+    decode_note_search_cursor,
+    encode_backlink_cursor,
+    encode_note_cursor,
+    encode_note_search_cursor,
+    map_backlink_to_schema,
     map_create_schema_to_dto,
+    map_note_list_item_to_read_schema,
+    map_note_search_hit_to_schema,
     map_note_to_read_schema,
+    map_related_note_to_schema,
     map_update_schema_to_dto,
     map_wikilink_suggestion_to_schema,
     map_note_creation_stat_to_schema,
+    map_import_result_to_schema,
 )
 from brain.presentation.api.routes.notes.models import (
     ReadNoteSchema,
@@ -39,24 +59,52 @@ from brain.presentation.api.routes.notes.models import (
     UpdateNoteSchema,
     WikilinkSuggestionSchema,
     NoteCreationStatSchema,
+    ImportNotesResultSchema,
+    NoteSearchHitSchema,
+    RelatedNoteSchema,
+    BacklinkSchema,
 )
+from brain.presentation.tasks.triggers import kick_graph_sync
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 @inject
 async def get_notes(
-        interactor: FromDishka[GetNotesInteractor],
+        interactor: FromDishka[ListNotesInteractor],
+        response: Response,
         from_date: datetime | None = Query(None),
         to_date: datetime | None = Query(None),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: str | None = Query(None),
+        order_by: NoteListOrder = Query(NoteListOrder.UPDATED_AT),
+        fields: NoteListFields = Query(NoteListFields.FULL),
         user: User = Depends(get_user_from_request),
 ):
-    notes = await interactor.get_notes(
-        user.telegram_id,
-        from_date=from_date,
-        to_date=to_date,
+    try:
+        after = decode_note_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    page = await interactor.list_notes(
+        ListNotes(
+            user_id=user.id,
+            order_by=order_by,
+            fields=fields,
+            limit=limit,
+            cursor=after,
+            from_date=from_date,
+            to_date=to_date,
+        )
     )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_note_cursor(page.next_cursor)
     return [
-        map_note_to_read_schema(note)
-        for note in notes
+        map_note_list_item_to_read_schema(item)
+        for item in page.items
     ]
 
 
@@ -64,11 +112,15 @@ async def get_notes(
 async def get_wikilink_suggestions(
         interactor: FromDishka[SearchWikilinkSuggestionsInteractor],
         query: str = Query(..., min_length=1),
+        limit: int = Query(20, ge=1, le=100),
+        fuzzy: bool = Query(False),
         user: User = Depends(get_user_from_request),
 ):
     suggestions = await interactor.search_wikilink_suggestions(
         user_id=user.id,
         query=query,
+        limit=limit,
+        fuzzy=fuzzy,
     )
     return [
         map_wikilink_suggestion_to_schema(suggestion)
@@ -76,17 +128,51 @@ async def get_wikilink_suggestions(
     ]
 
 
+@inject
+async def search_notes(
+        interactor: FromDishka[SearchNotesInteractor],
+        response: Response,
+        query: str = Query(..., min_length=1),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: str | None = Query(None),
+        user: User = Depends(get_user_from_request),
+):
+    try:
+        after = decode_note_search_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    page = await interactor.search(
+        SearchNotes(
+            user_id=user.id,
+            query=query,
+            limit=limit,
+            cursor=after,
+        )
+    )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_note_search_cursor(page.next_cursor)
+    return [
+        map_note_search_hit_to_schema(hit)
+        for hit in page.items
+    ]
+
+
 @inject
 async def search_notes_by_title(
         interactor: FromDishka[SearchNotesByTitleInteractor],
         query: str = Query(..., min_length=1),
         exact_match: bool = Query(False),
+        fuzzy: bool = Query(False),
         user: User = Depends(get_user_from_request),
 ):
     notes = await interactor.search(
         user_id=user.id,
         query=query,
         exact_match=exact_match,
+        fuzzy=fuzzy,
     )
     return [
         map_note_to_read_schema(note)
@@ -94,6 +180,83 @@ async def search_notes_by_title(
     ]
 
 
+@inject
+async def get_related_notes(
+        get_note_interactor: FromDishka[GetNoteInteractor],
+        related_interactor: FromDishka[GetRelatedNotesInteractor],
+        note_id: UUID,
+        limit: int = Query(10, ge=1, le=50),
+        user: User = Depends(get_user_from_request),
+):
+    # Answered from the user's own vectors; only notes the worker has not
+    # indexed yet need a lookup to tell "not yours" from "not ready".
+    related = await related_interactor.get_related(user.id, note_id, limit)
+    if related is None:
+        note = await get_note_interactor.get_note_by_id(note_id)
+        if not note:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        if note.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Forbidden",
+            )
+        related = []
+    return [
+        map_related_note_to_schema(item)
+        for item in related
+    ]
+
+
+@inject
+async def get_backlinks(
+        get_note_interactor: FromDishka[GetNoteInteractor],
+        backlinks_interactor: FromDishka[GetBacklinksInteractor],
+        response: Response,
+        note_id: UUID,
+        limit: int = Query(20, ge=1, le=100),
+        cursor: str | None = Query(None),
+        user: User = Depends(get_user_from_request),
+):
+    try:
+        after = decode_backlink_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    # Links are scoped to the user, so a hit is already authorized; only an
+    # empty first page needs a lookup to tell "no backlinks" from "not yours".
+    page = await backlinks_interactor.get_backlinks(
+        GetBacklinks(
+            user_id=user.id,
+            note_id=note_id,
+            limit=limit,
+            cursor=after,
+        )
+    )
+    if not page.items and after is None:
+        note = await get_note_interactor.get_note_by_id(note_id)
+        if not note:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found"
+            )
+        if note.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Forbidden",
+            )
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_backlink_cursor(page.next_cursor)
+    return [
+        map_backlink_to_schema(backlink)
+        for backlink in page.items
+    ]
+
+
 @inject
 async def create_note(
         create_interactor: FromDishka[CreateNoteInteractor],
@@ -119,6 +282,7 @@ async def create_note(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Keyword not found",
         )
+    await kick_graph_sync()
     note = await get_note_interactor.get_note_by_id(note_id)
     return map_note_to_read_schema(note)
 
@@ -150,6 +314,7 @@ async def delete_note(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Note not found"
         )
+    await kick_graph_sync()
 
 
 @inject
@@ -198,6 +363,7 @@ async def update_note(
             detail="Keyword not found",
         )
 
+    await kick_graph_sync()
     return map_note_to_read_schema(updated_note)
 
 
@@ -206,9 +372,9 @@ async def export_notes(
         interactor: FromDishka[ExportNotesInteractor],
         user: User = Depends(get_user_from_request),
 ):
-    zip_bytes = await interactor.export_notes(user.telegram_id)
-    return Response(
-        content=zip_bytes,
+    chunks = await interactor.export_notes(user.telegram_id)
+    return StreamingResponse(
+        content=chunks,
         media_type="application/zip",
         headers={"Content-Disposition": "attachment; filename=notes_export.zip"},
     )
@@ -225,11 +391,11 @@ async def import_notes(
 
     content = await file.read()
     try:
-        await interactor.import_notes(user.telegram_id, content)
+        result = await interactor.import_notes(user.telegram_id, content)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid zip file")
 
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return map_import_result_to_schema(result)
 
 
 @inject
@@ -251,7 +417,7 @@ def get_router() -> APIRouter:
         endpoint=get_notes,
         methods=["GET"],
         response_model=list[ReadNoteSchema],
-        summary="Get user notes",
+        summary="Get user notes, newest first; the next page cursor is in X-Next-Cursor",
         status_code=status.HTTP_200_OK
     )
     router.add_api_route(
@@ -262,6 +428,14 @@ def get_router() -> APIRouter:
         summary="Search wikilink suggestions",
         status_code=status.HTTP_200_OK
     )
+    router.add_api_route(
+        path='/search',
+        endpoint=search_notes,
+        methods=["GET"],
+        response_model=list[NoteSearchHitSchema],
+        summary="Full-text search over note titles and text (websearch syntax)",
+        status_code=status.HTTP_200_OK
+    )
     router.add_api_route(
         path='/search/by-title',
         endpoint=search_notes_by_title,
@@ -286,6 +460,22 @@ def get_router() -> APIRouter:
         summary="Create note",
         status_code=status.HTTP_201_CREATED
     )
+    router.add_api_route(
+        path='/{note_id}/related',
+        endpoint=get_related_notes,
+        methods=["GET"],
+        response_model=list[RelatedNoteSchema],
+        summary="Get the notes most similar in wording (TF-IDF cosine similarity)",
+        status_code=status.HTTP_200_OK,
+    )
+    router.add_api_route(
+        path='/{note_id}/backlinks',
+        endpoint=get_backlinks,
+        methods=["GET"],
+        response_model=list[BacklinkSchema],
+        summary="Get notes linking to this note, with the text around each link",
+        status_code=status.HTTP_200_OK,
+    )
     router.add_api_route(
         path='/{note_id}',
         endpoint=delete_note,
@@ -312,7 +502,8 @@ def get_router() -> APIRouter:
         path='/import',
         endpoint=import_notes,
         methods=["POST"],
+        response_model=ImportNotesResultSchema,
         summary="Import notes",
-        status_code=status.HTTP_204_NO_CONTENT,
+        status_code=status.HTTP_200_OK,
     )
     return router
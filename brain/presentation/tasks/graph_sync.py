@@ -0,0 +1,47 @@
+import asyncio
+import logging
+
+from dishka.integrations.taskiq import FromDishka, inject
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from brain.application.interactors import ProcessGraphSyncOutboxInteractor
+from brain.config.models import GraphSyncConfig
+from brain.main.entrypoints.taskiq.broker import broker
+
+logger = logging.getLogger(__name__)
+
+# Set by the kick that waits out the current coalesce window.
+KICK_KEY = "graph-sync:kick"
+
+
+# Writers kick this task after commit; the periodic run picks up
+# anything whose kick was lost or skipped.
+@broker.task(schedule=[{"interval": 30}])
+@inject(patch_module=True)
+async def process_graph_sync_outbox_task(
+    interactor: FromDishka[ProcessGraphSyncOutboxInteractor],
+    config: FromDishka[GraphSyncConfig],
+    redis: FromDishka[Redis],
+    wait_for_window: bool = False,
+) -> None:
+    if wait_for_window:
+        if not await _claim_window(redis, config.coalesce_window_seconds):
+            # Another kick is already waiting out this window.
+            return
+        # Let the coalesce window of the edit that kicked us run out, so
+        # the burst it belongs to is picked up in one go.
+        await asyncio.sleep(config.coalesce_window_seconds)
+    processed = await interactor.process()
+    if processed:
+        logger.info("Applied %s graph sync events", processed)
+
+
+async def _claim_window(redis: Redis, window_seconds: float) -> bool:
+    try:
+        return bool(
+            await redis.set(KICK_KEY, 1, nx=True, px=max(1, int(window_seconds * 1000)))
+        )
+    except RedisError:
+        logger.warning("Graph sync kick dedupe failed", exc_info=True)
+        return True
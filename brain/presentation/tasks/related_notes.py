@@ -0,0 +1,20 @@
+import logging
+
+from dishka.integrations.taskiq import FromDishka, inject
+
+from brain.application.interactors import BackfillRelatedNotesInteractor
+from brain.main.entrypoints.taskiq.broker import broker
+
+logger = logging.getLogger(__name__)
+
+
+# Outbox processing only refreshes users whose notes change; this builds
+# the index of everyone else.
+@broker.task(schedule=[{"interval": 3600}])
+@inject(patch_module=True)
+async def backfill_related_notes_task(
+    interactor: FromDishka[BackfillRelatedNotesInteractor],
+) -> None:
+    built = await interactor.backfill()
+    if built:
+        logger.info("Built related notes indexes for %s users", built)
@@ -0,0 +1,14 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def kick_graph_sync() -> None:
+    """Ask the worker to drain the graph sync outbox right away."""
+    try:
+        # Local import to avoid circular dependency with the broker.
+        from brain.presentation.tasks.graph_sync import process_graph_sync_outbox_task
+        await process_graph_sync_outbox_task.kiq(wait_for_window=True)
+    except Exception:
+        # Not fatal: the event is already committed to the outbox.
+        logger.warning("Failed to enqueue graph sync", exc_info=True)
@@ -4,6 +4,7 @@ from dishka import AsyncContainer
 from brain.application.interactors.notes.dto import CreateNote
 from brain.application.interactors import CreateNoteInteractor
 from brain.application.interactors.users.exceptions import UserNotFoundException
+from brain.presentation.tasks.triggers import kick_graph_sync
 
 
 async def handle_message(m: Message, dishka_container: AsyncContainer):
@@ -16,6 +17,7 @@ async def handle_message(m: Message, dishka_container: AsyncContainer):
                 text=m.text,
             )
         )
+        await kick_graph_sync()
     except UserNotFoundException:
         await m.reply(f"Вы не авторизованы")
     except Exception as e:
@@ -8,7 +8,9 @@ from brain.config.provider import ConfigProvider
 from brain.config.models import Config
 from brain.config.parser import load_config
 from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.cache.provider import CacheProvider
 from tests.fixtures.db_provider import TestDbProvider
+from tests.fixtures.redis_provider import TestRedisConfigProvider
 from tests.fixtures.graph_provider import TestGraphProvider
 
 
@@ -36,6 +38,8 @@ async def dishka():
         ConfigProvider(),
         TestDbProvider(),
         DatabaseProvider(),
+        TestRedisConfigProvider(),
+        CacheProvider(),
         TestGraphProvider(),
         InteractorProvider(),
         JwtProvider(),
@@ -0,0 +1,30 @@
+import os
+from collections.abc import Iterator
+
+from dishka import Provider, Scope, provide
+from testcontainers.community.redis import RedisContainer
+
+from brain.config.models import Config, RedisConfig
+
+
+class TestRedisConfigProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_redis_config(self, config: Config) -> Iterator[RedisConfig]:
+        password = "test"
+        redis = RedisContainer("redis:6", password=password)
+        if os.name == "nt":
+            redis.get_container_host_ip = lambda: "localhost"
+        try:
+            redis.start()
+            redis_config = RedisConfig(
+                host=redis.get_container_host_ip(),
+                port=int(redis.get_exposed_port(redis.port)),
+                db=0,
+                password=password,
+            )
+            config.redis = redis_config
+            yield redis_config
+        finally:
+            redis.stop()
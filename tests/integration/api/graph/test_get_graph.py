@@ -0,0 +1,133 @@
+import pytest
+from starlette import status
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("depth", "truncated"), [(1, False), (50, True)])
+async def test_get_graph_reports_depth_cap_as_truncated(
+    notes_app,
+    api_client,
+    depth: int,
+    truncated: bool,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]]"},
+        )
+
+        # action: depth beyond GRAPH__MAX_DEPTH is capped, not rejected
+        response = await client.request(
+            method="GET",
+            url="/api/graph",
+            params={"query": "Alpha", "depth": depth},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["truncated"] is truncated
+    assert {node["title"] for node in body["nodes"]} == {"Alpha", "Beta"}
+
+
+@pytest.mark.asyncio
+async def test_get_graph_answers_matching_etag_with_not_modified(
+    notes_app,
+    api_client,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]]"},
+        )
+        first = await client.request(method="GET", url="/api/graph")
+        etag = first.headers["ETag"]
+
+        # action
+        response = await client.request(
+            method="GET",
+            url="/api/graph",
+            headers={"If-None-Match": etag},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_graph_etag_changes_after_note_write(
+    notes_app,
+    api_client,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]]"},
+        )
+        etag = (await client.request(method="GET", url="/api/graph")).headers["ETag"]
+
+        # action
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Gamma", "text": "See [[Alpha]]"},
+        )
+        response = await client.request(
+            method="GET",
+            url="/api/graph",
+            headers={"If-None-Match": etag},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert {node["title"] for node in response.json()["nodes"]} == {"Alpha", "Beta", "Gamma"}
+
+
+@pytest.mark.asyncio
+async def test_get_graph_columnar_format_matches_objects(
+    notes_app,
+    api_client,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]] and [[Gamma]]"},
+        )
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Gamma", "text": ""},
+        )
+        objects = (await client.request(method="GET", url="/api/graph")).json()
+
+        # action
+        response = await client.request(
+            method="GET",
+            url="/api/graph",
+            params={"format": "columnar"},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" in response.headers
+    body = response.json()
+    kinds = ["note", "keyword"]
+    assert {
+        (node_id, kinds[kind], title)
+        for node_id, kind, title in zip(body["ids"], body["kinds"], body["titles"])
+    } == {(node["id"], node["type"], node["title"]) for node in objects["nodes"]}
+    assert {
+        (body["ids"][source], body["ids"][target])
+        for source, target in zip(body["sources"], body["targets"])
+    } == {(connection["from_id"], connection["to_id"]) for connection in objects["connections"]}
@@ -0,0 +1,72 @@
+import pytest
+from starlette import status
+
+
+@pytest.mark.asyncio
+async def test_graph_changes_return_delta_since_version(
+    notes_app,
+    api_client,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]]"},
+        )
+        version = (
+            await client.request(method="GET", url="/api/graph/changes", params={"since": 0})
+        ).json()["version"]
+
+        # action: Beta stops being a bare keyword
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Beta", "text": ""},
+        )
+        response = await client.request(
+            method="GET",
+            url="/api/graph/changes",
+            params={"since": version},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["version"] == version + 1
+    assert body["snapshot"] is None
+    assert body["removed_node_ids"] == ["keyword:Beta"]
+    assert [node["title"] for node in body["added_nodes"]] == ["Beta"]
+    assert [connection["kind"] for connection in body["removed_connections"]] == ["has_keyword"]
+    assert [connection["kind"] for connection in body["added_connections"]] == ["links_to"]
+
+
+@pytest.mark.asyncio
+async def test_graph_changes_return_snapshot_for_unknown_version(
+    notes_app,
+    api_client,
+):
+    # setup
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Alpha", "text": "See [[Beta]]"},
+        )
+        version = (
+            await client.request(method="GET", url="/api/graph/changes", params={"since": 0})
+        ).json()["version"]
+
+        # action: a version this Redis never handed out
+        response = await client.request(
+            method="GET",
+            url="/api/graph/changes",
+            params={"since": version + 1000},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["version"] == version
+    assert {node["title"] for node in body["snapshot"]["nodes"]} == {"Alpha", "Beta"}
+    assert body["added_nodes"] == []
@@ -0,0 +1,128 @@
+from uuid import uuid4
+
+import pytest
+from starlette import status
+
+from brain.domain.entities.graph_sync import GraphSyncEvent
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+
+
+@pytest.mark.asyncio
+async def test_sync_status_reports_pending_events(
+    notes_app,
+    api_client,
+):
+    # setup: create a note, which queues a graph sync event
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Queued", "text": "See [[Other]]"},
+        )
+
+        # action: request sync status before the worker runs
+        response = await client.request(
+            method="GET",
+            url="/api/graph/sync-status",
+        )
+
+    # check: the event is pending and lag is reported
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["pending"] == 1
+    assert body["failed"] == 0
+    assert body["oldest_pending_at"] is not None
+    assert body["lag_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_sync_status_is_empty_after_processing(
+    notes_app,
+    api_client,
+    sync_graph,
+):
+    # setup: create a note and drain the outbox
+    async with api_client(notes_app) as client:
+        await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Synced", "text": "text"},
+        )
+    processed = await sync_graph()
+
+    # action: request sync status
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/graph/sync-status",
+        )
+
+    # check: nothing is left pending
+    assert processed == 1
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["pending"] == 0
+    assert body["oldest_pending_at"] is None
+    assert body["lag_seconds"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_status_counts_coalesced_edits(
+    notes_app,
+    api_client,
+    sync_graph,
+):
+    # setup: create a note and edit it twice before the worker runs
+    async with api_client(notes_app) as client:
+        create_response = await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Draft", "text": "See [[One]]"},
+        )
+        note_id = create_response.json()["id"]
+        for text in ("See [[Two]]", "See [[Three]]"):
+            await client.request(
+                method="PATCH",
+                url=f"/api/notes/{note_id}",
+                json={"text": text},
+            )
+    processed = await sync_graph()
+
+    # action: request sync status
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/graph/sync-status",
+        )
+
+    # check: three events were handled by a single sync
+    assert processed == 3
+    body = response.json()
+    assert body["processed"] == 3
+    assert body["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_status_ignores_other_users_events(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+):
+    # setup: another user's edit is waiting for the worker
+    await repo_hub.graph_sync_outbox.add(
+        GraphSyncEvent(id=uuid4(), note_id=uuid4(), user_id=uuid4())
+    )
+    await repo_hub.uow.commit()
+
+    # action
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/graph/sync-status",
+        )
+
+    # check: the current user has nothing queued
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["pending"] == 0
+    assert body["oldest_pending_at"] is None
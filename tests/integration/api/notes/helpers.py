@@ -29,4 +29,5 @@ async def create_keyword_note(
         updated_at=updated_at,
     )
     await repo_hub.notes.create(note)
+    await repo_hub.uow.commit()
     return note
@@ -0,0 +1,112 @@
+from uuid import uuid4
+
+import pytest
+from starlette import status
+
+
+async def create_note(client, title: str, text: str) -> str:
+    response = await client.request(
+        method="POST",
+        url="/api/notes",
+        json={"title": title, "text": text},
+    )
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_backlinks_are_paginated_with_snippets(
+    notes_app,
+    api_client,
+):
+    # setup: three notes link to the target, one does not
+    async with api_client(notes_app) as client:
+        target = await create_note(client, "Target", "")
+        sources = [
+            await create_note(client, f"Source {index}", f"Line\nSee [[Target|the target]] for {index}")
+            for index in range(3)
+        ]
+        await create_note(client, "Unrelated", "No links here")
+
+    # action: walk the pages
+    pages = []
+    cursor = None
+    async with api_client(notes_app) as client:
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.request(
+                method="GET",
+                url=f"/api/notes/{target}/backlinks",
+                params=params,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+    # check: every source once, ordered by id, with the line around the link
+    items = [item for page in pages for item in page]
+    assert [len(page) for page in pages] == [2, 1]
+    assert [item["id"] for item in items] == sorted(sources)
+    assert {item["snippet"] for item in items} == {
+        f"See [[Target|the target]] for {index}" for index in range(3)
+    }
+
+
+@pytest.mark.asyncio
+async def test_backlinks_follow_creates_renames_and_edits(
+    notes_app,
+    api_client,
+):
+    # setup: a link written before its target exists
+    async with api_client(notes_app) as client:
+        source = await create_note(client, "Source", "Plan for [[Later]]")
+        later = await create_note(client, "Later", "")
+        resolved = await client.request(method="GET", url=f"/api/notes/{later}/backlinks")
+
+        # action: rename the target, then drop the link from the text
+        await client.request(
+            method="PATCH",
+            url=f"/api/notes/{later}",
+            json={"title": "Renamed"},
+        )
+        renamed = await client.request(method="GET", url=f"/api/notes/{later}/backlinks")
+        await client.request(
+            method="PATCH",
+            url=f"/api/notes/{source}",
+            json={"text": "Plan for [[Renamed]]"},
+        )
+        relinked = await client.request(method="GET", url=f"/api/notes/{later}/backlinks")
+        await client.request(
+            method="PATCH",
+            url=f"/api/notes/{source}",
+            json={"text": "No plan"},
+        )
+        unlinked = await client.request(method="GET", url=f"/api/notes/{later}/backlinks")
+
+    # check
+    assert [item["id"] for item in resolved.json()] == [source]
+    assert renamed.json() == []
+    assert [item["id"] for item in relinked.json()] == [source]
+    assert unlinked.json() == []
+
+
+@pytest.mark.asyncio
+async def test_backlinks_of_missing_note(
+    notes_app,
+    api_client,
+):
+    # action
+    async with api_client(notes_app) as client:
+        missing = await client.request(method="GET", url=f"/api/notes/{uuid4()}/backlinks")
+        bad_cursor = await client.request(
+            method="GET",
+            url=f"/api/notes/{uuid4()}/backlinks",
+            params={"cursor": "not-a-cursor"},
+        )
+
+    # check
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+    assert bad_cursor.status_code == status.HTTP_400_BAD_REQUEST
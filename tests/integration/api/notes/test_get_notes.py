@@ -62,3 +62,125 @@ async def test_get_notes_with_date_filters(
     payload = response.json()
     returned_ids = {item["id"] for item in payload}
     assert returned_ids == {str(in_range_note.id)}
+
+
+async def _create_dated_notes(repo_hub: RepositoryHub, user, count: int):
+    notes = []
+    for index in range(count):
+        moment = datetime(year=2024, month=3, day=1, hour=index)
+        notes.append(
+            await create_keyword_note(
+                repo_hub=repo_hub,
+                user=user,
+                title=f"Page Note {index}",
+                text="x" * 500,
+                created_at=moment,
+                updated_at=moment,
+            )
+        )
+    return notes
+
+
+@pytest.mark.asyncio
+async def test_get_notes_keyset_pagination(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: five notes with increasing timestamps
+    notes = await _create_dated_notes(repo_hub, user, count=5)
+
+    # action: walk the list two notes at a time
+    pages = []
+    cursor = None
+    async with api_client(notes_app) as client:
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.request(
+                method="GET",
+                url="/api/notes",
+                params=params,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            pages.append([item["id"] for item in response.json()])
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+    # check: newest first, no gaps or duplicates, last page has no cursor
+    expected = [str(note.id) for note in reversed(notes)]
+    assert pages == [expected[0:2], expected[2:4], expected[4:5]]
+
+
+@pytest.mark.asyncio
+async def test_get_notes_default_page_size(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: more notes than fit on the default page
+    await _create_dated_notes(repo_hub, user, count=21)
+
+    # action
+    async with api_client(notes_app) as client:
+        response = await client.request(method="GET", url="/api/notes")
+        too_large = await client.request(
+            method="GET",
+            url="/api/notes",
+            params={"limit": 101},
+        )
+
+    # check: twenty notes and a cursor to the rest, large pages are rejected
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 20
+    assert response.headers.get("X-Next-Cursor")
+    assert too_large.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_get_notes_projections(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup
+    await _create_dated_notes(repo_hub, user, count=1)
+
+    # action
+    async with api_client(notes_app) as client:
+        summary = await client.request(
+            method="GET",
+            url="/api/notes",
+            params={"fields": "summary"},
+        )
+        preview = await client.request(
+            method="GET",
+            url="/api/notes",
+            params={"fields": "preview"},
+        )
+
+    # check: summary drops text, preview truncates it
+    assert summary.json()[0]["text"] is None
+    assert summary.json()[0]["title"] == "Page Note 0"
+    assert preview.json()[0]["text"] == "x" * 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["garbage", "W10", "WyJ4IiwieSJd"])
+async def test_get_notes_invalid_cursor(notes_app, api_client, cursor):
+    # action
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/notes",
+            params={"cursor": cursor},
+        )
+
+    # check
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
@@ -6,23 +6,29 @@ import pytest
 from starlette import status
 
 from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.api.notes.helpers import create_keyword_note
 
 
-def make_zip_with_note(title: str, text: str | None) -> bytes:
+def make_zip_with_notes(notes: list[tuple[str, str | None]]) -> bytes:
     buffer = io.BytesIO()
     with zipfile.ZipFile(
         file=buffer,
         mode="w",
         compression=zipfile.ZIP_DEFLATED,
     ) as zip_file:
-        payload = {"title": title, "text": text}
-        zip_file.writestr(
-            zinfo_or_arcname=f"{title}.json",
-            data=json.dumps(payload),
-        )
+        for title, text in notes:
+            payload = {"title": title, "text": text}
+            zip_file.writestr(
+                zinfo_or_arcname=f"{title}.json",
+                data=json.dumps(payload),
+            )
     return buffer.getvalue()
 
 
+def make_zip_with_note(title: str, text: str | None) -> bytes:
+    return make_zip_with_notes([(title, text)])
+
+
 @pytest.mark.asyncio
 async def test_import_notes_success(
     notes_app,
@@ -42,7 +48,8 @@ async def test_import_notes_success(
         )
 
     # check: note created in database
-    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"imported": 1, "skipped": 0}
     stored = await repo_hub.notes.get_by_title(
         user_id=user.id,
         title="Imported Note",
@@ -52,6 +59,46 @@ async def test_import_notes_success(
     assert stored.text == "Imported Body"
 
 
+@pytest.mark.asyncio
+async def test_import_notes_skips_existing_titles_and_links_notes(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: one note already exists, the archive links two new notes
+    await create_keyword_note(repo_hub=repo_hub, user=user, title="Existing")
+    zip_bytes = make_zip_with_notes([
+        ("Existing", "Duplicate"),
+        ("Source", "See [[Target]]"),
+        ("Target", "Plain"),
+    ])
+
+    # action: upload zip file
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="POST",
+            url="/api/notes/import",
+            files={"file": ("notes.zip", zip_bytes, "application/zip")},
+        )
+
+    # check: duplicate skipped, link stored as note keyword
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"imported": 2, "skipped": 1}
+    existing = await repo_hub.notes.get_by_title(
+        user_id=user.id,
+        title="Existing",
+        exact_match=True,
+    )
+    assert existing.text is None
+    source = await repo_hub.notes.get_by_title(
+        user_id=user.id,
+        title="Source",
+        exact_match=True,
+    )
+    assert await repo_hub.keywords.get_note_keyword_names(source.id) == ["Target"]
+
+
 @pytest.mark.asyncio
 async def test_import_notes_invalid_extension(notes_app, api_client):
     # setup: prepare a non-zip file upload
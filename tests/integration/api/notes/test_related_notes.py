@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+import pytest
+from starlette import status
+
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.api.notes.helpers import create_keyword_note
+
+
+async def create_note(client, title: str, text: str) -> str:
+    response = await client.request(
+        method="POST",
+        url="/api/notes",
+        json={"title": title, "text": text},
+    )
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_related_notes_follow_text_updates(
+    notes_app,
+    api_client,
+    sync_graph,
+):
+    # setup: the worker indexes three notes
+    async with api_client(notes_app) as client:
+        bread = await create_note(client, "Sourdough", "Feed the starter and bake sourdough bread")
+        rye = await create_note(client, "Rye", "Rye bread with a sourdough starter")
+        ml = await create_note(client, "Gradients", "Gradient descent with a small learning rate")
+    await sync_graph()
+
+    # action: ask before and after the third note is rewritten
+    async with api_client(notes_app) as client:
+        before = await client.request(method="GET", url=f"/api/notes/{bread}/related")
+        await client.request(
+            method="PATCH",
+            url=f"/api/notes/{ml}",
+            json={"text": "Sourdough starter feeding and bread baking"},
+        )
+    await sync_graph()
+    async with api_client(notes_app) as client:
+        after = await client.request(
+            method="GET",
+            url=f"/api/notes/{bread}/related",
+            params={"limit": 2},
+        )
+
+    # check: the edit is picked up incrementally
+    assert before.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in before.json()] == [rye]
+    assert {item["id"] for item in after.json()} == {rye, ml}
+    assert all(0 < item["score"] <= 1 for item in after.json())
+
+
+@pytest.mark.asyncio
+async def test_related_notes_empty_until_indexed(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: a note the worker has not seen yet
+    note = await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Fresh",
+        text="Just written",
+    )
+
+    # action
+    async with api_client(notes_app) as client:
+        fresh = await client.request(method="GET", url=f"/api/notes/{note.id}/related")
+        missing = await client.request(method="GET", url=f"/api/notes/{uuid4()}/related")
+
+    # check
+    assert fresh.status_code == status.HTTP_200_OK
+    assert fresh.json() == []
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,123 @@
+import pytest
+from starlette import status
+
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.api.notes.helpers import create_keyword_note
+
+
+@pytest.mark.asyncio
+async def test_search_notes_ranks_title_matches_first(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: the word appears in one title and in another note's body
+    in_title = await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Gardening plan",
+        text="Seeds and soil",
+    )
+    in_text = await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Weekend",
+        text="Spent the morning on gardening with friends",
+    )
+    await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Unrelated",
+        text="Nothing to see",
+    )
+
+    # action
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/notes/search",
+            params={"query": "gardening"},
+        )
+
+    # check: title weight wins, body hit carries a highlighted snippet
+    assert response.status_code == status.HTTP_200_OK
+    payload = response.json()
+    assert [item["id"] for item in payload] == [str(in_title.id), str(in_text.id)]
+    assert "<b>gardening</b>" in payload[1]["snippet"]
+    assert payload[0]["rank"] > payload[1]["rank"]
+
+
+@pytest.mark.asyncio
+async def test_search_notes_supports_websearch_syntax(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup
+    kept = await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Trip",
+        text="Train to the mountains",
+    )
+    await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Commute",
+        text="Train to the office",
+    )
+
+    # action
+    async with api_client(notes_app) as client:
+        response = await client.request(
+            method="GET",
+            url="/api/notes/search",
+            params={"query": "train -office"},
+        )
+
+    # check
+    assert [item["id"] for item in response.json()] == [str(kept.id)]
+
+
+@pytest.mark.asyncio
+async def test_search_notes_keyset_pagination(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: equal ranks, so the id breaks ties between pages
+    notes = [
+        await create_keyword_note(
+            repo_hub=repo_hub,
+            user=user,
+            title=f"Entry {index}",
+            text="daily log",
+        )
+        for index in range(5)
+    ]
+
+    # action
+    seen = []
+    cursor = None
+    async with api_client(notes_app) as client:
+        while True:
+            params = {"query": "log", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.request(
+                method="GET",
+                url="/api/notes/search",
+                params=params,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+    # check: every note exactly once
+    assert sorted(seen) == sorted(str(note.id) for note in notes)
+    assert len(seen) == len(set(seen))
@@ -72,3 +72,40 @@ async def test_search_notes_by_title_exact_match_true(
     assert response.status_code == status.HTTP_200_OK
     payload = response.json()
     assert [item["title"] for item in payload] == ["Test Note"]
+
+
+@pytest.mark.asyncio
+async def test_search_notes_by_title_fuzzy(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: no title contains the misspelled query
+    for title in ["Neural network", "Neural networks", "Cooking"]:
+        await create_keyword_note(
+            repo_hub=repo_hub,
+            user=user,
+            title=title,
+            text="Content",
+        )
+
+    # action
+    async with api_client(notes_app) as client:
+        substring = await client.request(
+            method="GET",
+            url="/api/notes/search/by-title",
+            params={"query": "neurl netwrk"},
+        )
+        fuzzy = await client.request(
+            method="GET",
+            url="/api/notes/search/by-title",
+            params={"query": "neurl netwrk", "fuzzy": "true"},
+        )
+
+    # check: only fuzzy mode finds them, closest first
+    assert substring.json() == []
+    assert [item["title"] for item in fuzzy.json()] == [
+        "Neural network",
+        "Neural networks",
+    ]
@@ -20,6 +20,7 @@ async def test_get_wikilink_suggestions(
         text="Text",
     )
     await repo_hub.keywords.ensure_keywords(user_id=user.id, names=["Beta"])
+    await repo_hub.uow.commit()
 
     # action: request wikilink suggestions
     async with api_client(notes_app) as client:
@@ -35,3 +36,50 @@ async def test_get_wikilink_suggestions(
         {"title": "Alpha", "represents_keyword": True},
         {"title": "Beta", "represents_keyword": False},
     ]
+
+
+@pytest.mark.asyncio
+async def test_wikilink_suggestions_follow_note_writes(
+    notes_app,
+    api_client,
+    repo_hub: RepositoryHub,
+    user,
+):
+    # setup: the first request builds the in-memory index
+    await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Project alpha",
+        text="Text",
+    )
+
+    async def suggest(client) -> list[str]:
+        response = await client.request(
+            method="GET",
+            url="/api/notes/wikilink-suggestions",
+            params={"query": "proj"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return [item["title"] for item in response.json()]
+
+    async with api_client(notes_app) as client:
+        before = await suggest(client)
+
+        # action: create, then rename a note
+        created = await client.request(
+            method="POST",
+            url="/api/notes",
+            json={"title": "Project beta", "text": "Body"},
+        )
+        after_create = await suggest(client)
+        await client.request(
+            method="PATCH",
+            url=f"/api/notes/{created.json()['id']}",
+            json={"title": "Projection"},
+        )
+        after_rename = await suggest(client)
+
+    # check: every write is visible on the next keystroke
+    assert before == ["Project alpha"]
+    assert after_create == ["Project beta", "Project alpha"]
+    assert after_rename == ["Projection", "Project alpha"]
@@ -68,6 +68,7 @@ async def test_get_me_returns_user_info(
     await repo_hub.s3_files.create(entity=profile_picture)
     user.profile_picture_file_id = profile_picture.id
     await repo_hub.users.update(entity=user)
+    await repo_hub.uow.commit()
 
     stored_user = await repo_hub.users.get_by_id(entity_id=user.id)
     auth_interactor = await dishka_request.get(AuthInteractor)
@@ -0,0 +1,24 @@
+from collections.abc import Callable
+
+import pytest
+import pytest_asyncio
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.integration.benchmarks.helpers import format_stats
+
+
+@pytest.fixture
+def report(request: pytest.FixtureRequest) -> Callable[[str, dict[str, float]], None]:
+    """Write latency stats to the terminal, even with output capture on."""
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+
+    def write(name: str, stats: dict[str, float]) -> None:
+        reporter.write_line(f"[benchmark] {name}: {format_stats(stats)}")
+
+    return write
+
+
+@pytest_asyncio.fixture
+async def session(dishka_request: AsyncContainer) -> AsyncSession:
+    return await dishka_request.get(AsyncSession)
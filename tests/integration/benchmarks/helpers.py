@@ -0,0 +1,128 @@
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState
+
+from brain.domain.entities.note import Note
+from brain.domain.entities.note_keyword import NoteKeyword
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+
+INSERT_CHUNK_SIZE = 5000
+WORDS = [
+    "alpha", "budget", "cluster", "daily", "essay", "feature", "garden",
+    "history", "idea", "journal", "kernel", "lecture", "meeting", "network",
+    "outline", "project", "question", "review", "summary", "travel",
+    "update", "vector", "weekly", "yoga", "zettel",
+]
+
+
+def make_titles(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{' '.join(rng.sample(WORDS, 3))} {index}"
+        for index in range(count)
+    ]
+
+
+async def seed_keyword_notes(
+    repo_hub: RepositoryHub,
+    user_id: UUID,
+    titles: list[str],
+    text_for: Callable[[int, str], str] = lambda index, title: "",
+) -> list[UUID]:
+    """Bulk create one keyword and one keyword note per title."""
+    note_ids = []
+    for start in range(0, len(titles), INSERT_CHUNK_SIZE):
+        chunk = titles[start:start + INSERT_CHUNK_SIZE]
+        keyword_ids = await repo_hub.keywords.ensure_keyword_ids(user_id, chunk)
+        notes = [
+            Note(
+                id=uuid4(),
+                user_id=user_id,
+                title=title,
+                text=text_for(start + offset, title),
+                represents_keyword_id=keyword_ids[title],
+            )
+            for offset, title in enumerate(chunk)
+        ]
+        await repo_hub.notes.create_many(notes)
+        note_ids.extend(note.id for note in notes)
+    await repo_hub.uow.commit()
+    return note_ids
+
+
+async def seed_note_keywords(
+    repo_hub: RepositoryHub,
+    user_id: UUID,
+    link_targets: dict[UUID, list[str]],
+) -> None:
+    """Bulk create the note keywords of wikilinks to seeded keyword notes."""
+    targets = sorted({target for targets in link_targets.values() for target in targets})
+    keyword_ids = await repo_hub.keywords.ensure_keyword_ids(user_id, targets)
+    note_keywords = [
+        NoteKeyword(note_id=note_id, keyword_id=keyword_ids[target], user_id=user_id)
+        for note_id, targets in link_targets.items()
+        for target in targets
+    ]
+    for start in range(0, len(note_keywords), INSERT_CHUNK_SIZE):
+        await repo_hub.keywords.create_note_keywords(
+            note_keywords[start:start + INSERT_CHUNK_SIZE]
+        )
+    await repo_hub.uow.commit()
+
+
+async def analyze(session: AsyncSession) -> None:
+    """Refresh planner statistics after a bulk load."""
+    for table in ("notes", "keywords", "note_keywords"):
+        await session.execute(text(f"ANALYZE {table}"))
+
+
+async def explain(session: AsyncSession, run: Callable[[], Awaitable[object]]) -> str:
+    """EXPLAIN of the last ORM query `run` executes."""
+    statements = []
+
+    def capture(state: ORMExecuteState) -> None:
+        statements.append(state.statement)
+
+    event.listen(session.sync_session, "do_orm_execute", capture)
+    try:
+        await run()
+    finally:
+        event.remove(session.sync_session, "do_orm_execute", capture)
+    connection = await session.connection()
+    compiled = statements[-1].compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    result = await connection.exec_driver_sql(f"EXPLAIN {compiled}")
+    return "\n".join(row[0] for row in result)
+
+
+async def measure(
+    run: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 5,
+) -> dict[str, float]:
+    """Latency percentiles of `run` in milliseconds."""
+    for _ in range(warmup):
+        await run()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "max": max(samples),
+    }
+
+
+def format_stats(stats: dict[str, float]) -> str:
+    return " ".join(f"{key}={value:.2f}ms" for key, value in stats.items())
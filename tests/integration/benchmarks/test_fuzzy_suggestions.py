@@ -0,0 +1,73 @@
+import itertools
+import random
+from collections.abc import Callable
+
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.interactors import SearchWikilinkSuggestionsInteractor
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.benchmarks.helpers import (
+    analyze,
+    make_titles,
+    measure,
+    seed_keyword_notes,
+)
+
+TITLES_COUNT = 50_000
+P95_BUDGET_MS = 20
+
+
+def make_typos(titles: list[str], count: int, seed: int = 0) -> list[str]:
+    """Titles with one letter dropped or swapped for a neighbour."""
+    rng = random.Random(seed)
+    queries = []
+    for title in rng.sample(titles, count):
+        index = rng.randrange(len(title) - 1)
+        if rng.random() < 0.5:
+            queries.append(title[:index] + title[index + 1:])
+        else:
+            queries.append(title[:index] + title[index + 1] + title[index] + title[index + 2:])
+    return queries
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_fuzzy_suggestions_p95_at_50k_titles(
+    dishka_request: AsyncContainer,
+    repo_hub: RepositoryHub,
+    session: AsyncSession,
+    user: User,
+    report: Callable[[str, dict[str, float]], None],
+):
+    # setup
+    titles = make_titles(TITLES_COUNT)
+    await seed_keyword_notes(repo_hub, user.id, titles)
+    await analyze(session)
+    interactor = await dishka_request.get(SearchWikilinkSuggestionsInteractor)
+    queries = itertools.cycle(make_typos(titles, 100))
+
+    # action: the warmup builds the index, the measured calls only read it
+    in_memory = await measure(
+        lambda: interactor.search_wikilink_suggestions(
+            user_id=user.id,
+            query=next(queries),
+            fuzzy=True,
+        ),
+        iterations=300,
+    )
+    sql = await measure(
+        lambda: repo_hub.notes.search_wikilink_suggestions(
+            user_id=user.id,
+            query=next(queries),
+            fuzzy_threshold=0.3,
+        ),
+        iterations=50,
+    )
+
+    # check
+    report("fuzzy wikilink suggestions, in-memory, 50k titles", in_memory)
+    report("fuzzy wikilink suggestions, sql, 50k titles", sql)
+    assert in_memory["p95"] < P95_BUDGET_MS
@@ -0,0 +1,84 @@
+import itertools
+import random
+from collections.abc import Callable
+
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from brain.infrastructure.graph.repositories.postgres import PostgresNotesGraphRepository
+from tests.integration.benchmarks.helpers import (
+    analyze,
+    make_titles,
+    measure,
+    seed_keyword_notes,
+    seed_note_keywords,
+)
+
+LINKS_PER_NOTE = 3
+QUERIES = ["review 1", "garden 42", "zettel 7", "weekly 3"]
+
+
+def make_links(titles: list[str], seed: int = 0) -> list[list[str]]:
+    rng = random.Random(seed)
+    return [rng.sample(titles, LINKS_PER_NOTE) for _ in titles]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("notes_count", [1_000, 10_000, 100_000])
+async def test_graph_reads_postgres_vs_neo4j(
+    dishka_request: AsyncContainer,
+    repo_hub: RepositoryHub,
+    session: AsyncSession,
+    user: User,
+    notes_count: int,
+    report: Callable[[str, dict[str, float]], None],
+):
+    # setup: the same linked notes in Postgres and in Neo4j
+    titles = make_titles(notes_count)
+    links = make_links(titles)
+    note_ids = await seed_keyword_notes(
+        repo_hub,
+        user.id,
+        titles,
+        text_for=lambda index, title: " ".join(f"[[{target}]]" for target in links[index]),
+    )
+    link_targets = dict(zip(note_ids, links))
+    await seed_note_keywords(repo_hub, user.id, link_targets)
+    await analyze(session)
+    notes = [note async for note in repo_hub.notes.stream_by_user_id(user.id)]
+    neo4j_repo = await dishka_request.get(INotesGraphRepository)
+    await neo4j_repo.upsert_notes_bulk(notes, link_targets)
+    postgres_repo = PostgresNotesGraphRepository(session=session)
+    iterations = max(3, 30_000 // notes_count)
+    queries = itertools.cycle(QUERIES)
+
+    # action
+    results = {}
+    for name, repo in (("neo4j", neo4j_repo), ("postgres", postgres_repo)):
+        results[f"{name} full graph"] = await measure(
+            lambda: repo.get_graph(user_id=user.id),
+            iterations=iterations,
+            warmup=1,
+        )
+        results[f"{name} query depth 2"] = await measure(
+            lambda: repo.get_graph(user_id=user.id, query=next(queries), depth=2),
+            iterations=50,
+        )
+    note = notes[0]
+    neo4j_write = await measure(
+        lambda: neo4j_repo.sync_connections(note, link_targets[note.id]),
+        iterations=50,
+    )
+
+    # check: both backends return the same graph
+    expected = await neo4j_repo.get_graph(user_id=user.id, query=QUERIES[0], depth=2)
+    actual = await postgres_repo.get_graph(user_id=user.id, query=QUERIES[0], depth=2)
+    assert {node.id for node in actual.nodes} == {node.id for node in expected.nodes}
+    for name, stats in results.items():
+        report(f"{name}, {notes_count} notes", stats)
+    report(f"neo4j sync_connections (skipped by postgres), {notes_count} notes", neo4j_write)
@@ -0,0 +1,103 @@
+import itertools
+from collections.abc import Callable
+
+import pytest
+from dishka import AsyncContainer
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.config.models import GraphIndexConfig
+from brain.domain.entities.user import User
+from brain.infrastructure.cache.graph import NotesGraphIndex
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.benchmarks.helpers import (
+    analyze,
+    make_titles,
+    measure,
+    seed_keyword_notes,
+)
+from tests.integration.benchmarks.test_graph_backends import QUERIES, make_links
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("notes_count", [1_000, 10_000, 100_000])
+async def test_graph_reads_in_memory_vs_cypher(
+    dishka_request: AsyncContainer,
+    repo_hub: RepositoryHub,
+    session: AsyncSession,
+    user: User,
+    notes_count: int,
+    report: Callable[[str, dict[str, float]], None],
+):
+    # setup: the same linked notes in note_links and in Neo4j
+    titles = make_titles(notes_count)
+    links = make_links(titles)
+    note_ids = await seed_keyword_notes(
+        repo_hub,
+        user.id,
+        titles,
+        text_for=lambda index, title: " ".join(f"[[{target}]]" for target in links[index]),
+    )
+    link_targets = dict(zip(note_ids, links))
+    await repo_hub.note_links.replace_links(user.id, link_targets)
+    await repo_hub.uow.commit()
+    await analyze(session)
+    notes = [note async for note in repo_hub.notes.stream_by_user_id(user.id)]
+    neo4j_repo = await dishka_request.get(INotesGraphRepository)
+    await neo4j_repo.upsert_notes_bulk(notes, link_targets)
+    # A private index, so the budget and version are independent of the app's.
+    graph_index = NotesGraphIndex(
+        redis=await dishka_request.get(Redis),
+        config=GraphIndexConfig(max_memory_mb=1024),
+    )
+    user_links = await repo_hub.note_links.get_user_links(user.id)
+    version = await graph_index.get_version(user.id)
+    iterations = max(3, 30_000 // notes_count)
+    queries = itertools.cycle(QUERIES)
+
+    async def load():
+        graph_index.load(user.id, version, await repo_hub.note_links.get_user_links(user.id))
+
+    async def from_index(query=None, depth=1):
+        return graph_index.get_graph(user.id, version, query, depth)
+
+    # action
+    results = {
+        "neo4j full graph": await measure(
+            lambda: neo4j_repo.get_graph(user_id=user.id),
+            iterations=iterations,
+            warmup=1,
+        ),
+        "neo4j query depth 2": await measure(
+            lambda: neo4j_repo.get_graph(user_id=user.id, query=next(queries), depth=2),
+            iterations=50,
+        ),
+        "in-memory load from note_links": await measure(load, iterations=iterations, warmup=1),
+        "in-memory full graph": await measure(from_index, iterations=iterations, warmup=1),
+        "in-memory query depth 2": await measure(
+            lambda: from_index(query=next(queries), depth=2),
+            iterations=200,
+        ),
+    }
+    note = user_links[0]
+    patch = await measure(
+        lambda: graph_index.apply_changes(
+            user.id,
+            updated=[NoteLinks(note_id=note.note_id, title=note.title, targets=note.targets)],
+        ),
+        iterations=50,
+    )
+
+    # check: both paths return the same nodes
+    graph_index.load(user.id, await graph_index.get_version(user.id), user_links)
+    expected = await neo4j_repo.get_graph(user_id=user.id, query=QUERIES[0], depth=2)
+    actual = graph_index.get_graph(
+        user.id, await graph_index.get_version(user.id), QUERIES[0], 2
+    )
+    assert {node.id for node in actual.nodes} == {node.id for node in expected.nodes}
+    for name, stats in results.items():
+        report(f"{name}, {notes_count} notes", stats)
+    report(f"in-memory apply_changes (one note), {notes_count} notes", patch)
@@ -0,0 +1,89 @@
+import json
+from collections.abc import Callable
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+
+from brain.domain.entities.graph import GraphConnection, GraphData, GraphNode
+from brain.presentation.api.routes.graph.mappers import (
+    map_graph_to_columnar,
+    map_graph_to_schema,
+)
+from brain.presentation.api.routes.graph.models import GraphSchema
+from tests.integration.benchmarks.helpers import make_titles, measure
+
+
+def make_graph(notes_count: int, links_per_note: int) -> GraphData:
+    """Notes linking to the next notes, every other link a dangling keyword."""
+    titles = make_titles(notes_count)
+    note_ids = [f"note:{uuid4()}" for _ in titles]
+    nodes = [
+        GraphNode(id=note_id, title=title, kind="note", represents_keyword=True)
+        for note_id, title in zip(note_ids, titles)
+    ]
+    connections = []
+    for index, note_id in enumerate(note_ids):
+        for offset in range(1, links_per_note + 1):
+            target = (index + offset) % notes_count
+            if offset % 2:
+                connections.append(
+                    GraphConnection(from_id=note_id, to_id=note_ids[target], kind="links_to")
+                )
+            else:
+                keyword_id = f"keyword:{titles[target]} draft"
+                connections.append(
+                    GraphConnection(from_id=note_id, to_id=keyword_id, kind="has_keyword")
+                )
+    keyword_ids = {connection.to_id for connection in connections if connection.kind == "has_keyword"}
+    nodes.extend(
+        GraphNode(id=keyword_id, title=keyword_id.removeprefix("keyword:"), kind="keyword")
+        for keyword_id in keyword_ids
+    )
+    return GraphData(nodes=nodes, connections=connections)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+@pytest.mark.parametrize("notes_count", [1_000, 5_000, 20_000])
+async def test_graph_wire_format_objects_vs_columnar(
+    notes_count: int,
+    report: Callable[[str, dict[str, float]], None],
+):
+    # setup: four connections per note, so 20k edges at 5k notes
+    graph = make_graph(notes_count, links_per_note=4)
+    app = FastAPI()
+
+    @app.get("/objects", response_model=GraphSchema)
+    async def objects():
+        return map_graph_to_schema(graph)
+
+    @app.get("/columnar")
+    async def columnar():
+        return JSONResponse(map_graph_to_columnar(graph))
+
+    iterations = max(5, 50_000 // notes_count)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # action
+        results = {
+            path: await measure(
+                lambda: client.request(method="GET", url=f"/{path}"),
+                iterations=iterations,
+                warmup=2,
+            )
+            for path in ("objects", "columnar")
+        }
+        sizes = {}
+        for path in results:
+            response = await client.request(method="GET", url=f"/{path}")
+            sizes[path] = len(response.content)
+
+    # check: both formats describe the same graph
+    columnar_body = map_graph_to_columnar(graph)
+    objects_body = json.loads(GraphSchema.model_validate(map_graph_to_schema(graph)).model_dump_json())
+    assert columnar_body["ids"] == [node["id"] for node in objects_body["nodes"]]
+    assert len(columnar_body["sources"]) == len(objects_body["connections"])
+    for path, stats in results.items():
+        report(f"GET /graph format={path}, {notes_count} notes, {sizes[path] // 1024} KiB", stats)
@@ -0,0 +1,58 @@
+import itertools
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.benchmarks.helpers import (
+    analyze,
+    explain,
+    make_titles,
+    measure,
+    seed_keyword_notes,
+)
+
+TITLES_COUNT = 100_000
+QUERIES = ["rev", "review", "jour", "weekly up", "garden 42", "zett", "ject sum"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_title_search_p95_at_100k_titles(
+    repo_hub: RepositoryHub,
+    session: AsyncSession,
+    user: User,
+    report: Callable[[str, dict[str, float]], None],
+):
+    # setup
+    await seed_keyword_notes(repo_hub, user.id, make_titles(TITLES_COUNT))
+    await analyze(session)
+    queries = itertools.cycle(QUERIES)
+
+    # action
+    suggestions = await measure(
+        lambda: repo_hub.notes.search_wikilink_suggestions(
+            user_id=user.id,
+            query=next(queries),
+            limit=20,
+        ),
+        iterations=200,
+    )
+    by_title = await measure(
+        lambda: repo_hub.notes.search_by_title(
+            user_id=user.id,
+            query=next(queries),
+        ),
+        iterations=50,
+    )
+    plan = await explain(
+        session,
+        lambda: repo_hub.notes.search_by_title(user_id=user.id, query="review"),
+    )
+
+    # check
+    report("wikilink suggestions, 100k titles", suggestions)
+    report("search by title, 100k titles", by_title)
+    assert "ix_notes_lower_title_trgm" in plan
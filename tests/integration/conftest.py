@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from uuid import uuid4
 
@@ -8,15 +9,19 @@ from dishka import AsyncContainer, make_async_container
 from alembic.config import Config as AlembicConfig
 
 from brain.application.abstractions.config.models import IDatabaseConfig
+from brain.application.interactors import ProcessGraphSyncOutboxInteractor
 from brain.application.interactors.factory import InteractorProvider
-from brain.config.models import Config
+from brain.config.models import Config, GraphSyncConfig, RelatedNotesConfig
 from brain.config.parser import load_config
 from brain.config.provider import ConfigProvider
 from brain.domain.entities.user import User
 from brain.infrastructure.db.provider import DatabaseProvider
+from brain.infrastructure.cache.provider import CacheProvider
+from brain.infrastructure.related_notes.provider import RelatedNotesProvider
 from brain.infrastructure.db.repositories.hub import RepositoryHub
 from brain.infrastructure.jwt.provider import JwtProvider
 from tests.fixtures.db_provider import TestDbProvider
+from tests.fixtures.redis_provider import TestRedisConfigProvider
 from tests.fixtures.profile_picture_storage_provider import TestProfilePictureStorageProvider
 from tests.fixtures.graph_provider import TestGraphProvider, TestNeo4jConfigProvider
 from tests.fixtures.profile_picture_provider import TestProfilePictureProvider
@@ -36,15 +41,23 @@ async def alembic_config(dishka: AsyncContainer) -> AlembicConfig:
 
 
 @pytest_asyncio.fixture(scope="session")
-async def dishka():
+async def dishka(tmp_path_factory: pytest.TempPathFactory):
     config = load_config(
         config_class=Config,
         env_file_path="tests/.env"
     )
+    # Tests drain the outbox right after writing, so nothing is held back.
+    config.graph_sync = GraphSyncConfig(coalesce_window_seconds=0)
+    config.related_notes = RelatedNotesConfig(
+        storage_dir=str(tmp_path_factory.mktemp("related_notes")),
+    )
     container = make_async_container(
         ConfigProvider(),
         TestDbProvider(),
         DatabaseProvider(),
+        TestRedisConfigProvider(),
+        CacheProvider(),
+        RelatedNotesProvider(),
         TestNeo4jConfigProvider(),
         TestGraphProvider(),
         TestProfilePictureStorageProvider(),
@@ -73,6 +86,8 @@ async def clear_db(repo_hub: RepositoryHub):
     await repo_hub.s3_files.delete_all()
     await repo_hub.users.delete_all()
     await repo_hub.notes.delete_all()
+    await repo_hub.graph_sync_outbox.delete_all()
+    await repo_hub.uow.commit()
 
 
 @pytest_asyncio.fixture
@@ -92,4 +107,12 @@ async def user(repo_hub: RepositoryHub) -> User:
         last_name="Smith",
     )
     await repo_hub.users.create(user)
+    await repo_hub.uow.commit()
     return user
+
+
+@pytest_asyncio.fixture
+async def sync_graph(dishka_request: AsyncContainer) -> Callable[[], Awaitable[int]]:
+    # Graph updates go through the outbox; tests drain it in place of the worker.
+    interactor = await dishka_request.get(ProcessGraphSyncOutboxInteractor)
+    return interactor.process
@@ -0,0 +1,51 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from brain.application.abstractions.caches import IPrincipalCache
+from brain.application.interactors import CreateNoteInteractor
+from brain.application.interactors.auth.interactor import AuthInteractor
+from brain.application.interactors.notes.dto import CreateNote
+from brain.domain.entities.user import User
+
+
+@pytest.mark.asyncio
+async def test_authorize_by_token_runs_single_query(
+    dishka: AsyncContainer,
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup: user owns notes and keywords that must not be loaded
+    create_interactor = await dishka_request.get(CreateNoteInteractor)
+    for index in range(5):
+        await create_interactor.create_note(
+            CreateNote(
+                by_user_telegram_id=user.telegram_id,
+                title=f"Note {index}",
+                text=f"Links [[Topic {index}]]",
+            )
+        )
+    auth_interactor = await dishka_request.get(AuthInteractor)
+    tokens = await auth_interactor.login(user.telegram_id)
+    principal_cache = await dishka.get(IPrincipalCache)
+    await principal_cache.invalidate(user.id)
+
+    engine = await dishka.get(AsyncEngine)
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        # action: authorize in a fresh request, as the API does
+        async with dishka() as request_container:
+            interactor = await request_container.get(AuthInteractor)
+            authorized = await interactor.authorize_by_token(tokens.access_token)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    # check: on a cache miss the user comes back from exactly one query
+    assert authorized.id == user.id
+    assert len(statements) == 1, statements
@@ -0,0 +1,75 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from brain.application.abstractions.caches import IPrincipalCache
+from brain.application.interactors import UserInteractor
+from brain.application.interactors.auth.interactor import AuthInteractor
+from brain.application.interactors.users.dto import CreateOrUpdateUser
+from brain.domain.entities.user import User
+
+
+async def _authorize(dishka: AsyncContainer, access_token: str) -> User:
+    async with dishka() as request_container:
+        interactor = await request_container.get(AuthInteractor)
+        return await interactor.authorize_by_token(access_token)
+
+
+@pytest.mark.asyncio
+async def test_authorize_by_token_served_from_cache(
+    dishka: AsyncContainer,
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup
+    auth_interactor = await dishka_request.get(AuthInteractor)
+    tokens = await auth_interactor.login(user.telegram_id)
+    await _authorize(dishka, tokens.access_token)
+
+    engine = await dishka.get(AsyncEngine)
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        # action
+        authorized = await _authorize(dishka, tokens.access_token)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    # check
+    assert authorized.id == user.id
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cached_principal(
+    dishka: AsyncContainer,
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup
+    auth_interactor = await dishka_request.get(AuthInteractor)
+    tokens = await auth_interactor.login(user.telegram_id)
+    await _authorize(dishka, tokens.access_token)
+
+    # action
+    async with dishka() as request_container:
+        user_interactor = await request_container.get(UserInteractor)
+        await user_interactor.create_or_update_user(
+            CreateOrUpdateUser(
+                telegram_id=user.telegram_id,
+                username=user.username,
+                first_name="Renamed",
+                last_name=user.last_name,
+            )
+        )
+    authorized = await _authorize(dishka, tokens.access_token)
+
+    # check
+    assert authorized.first_name == "Renamed"
+    principal_cache = await dishka.get(IPrincipalCache)
+    assert principal_cache.get_stats()["total"].hits >= 1
@@ -0,0 +1,69 @@
+import pytest
+from dishka import AsyncContainer
+
+from brain.application.abstractions.caches.graph import INotesGraphIndex
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.application.interactors import GetGraphInteractor, UpdateNoteInteractor
+from brain.application.interactors.notes.dto import UpdateNote
+from brain.domain.entities.user import User
+from tests.integration.interactors.graph.test_graph_interactor import (
+    connection_tuples,
+    seed_graph_data,
+)
+from tests.integration.repositories.test_postgres_notes_graph import graph_snapshot
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "depth"),
+    [
+        (None, 1),
+        ("Beta", 0),
+        ("Beta", 1),
+        ("Beta", 2),
+        ("orphan", 1),
+        ("a", 3),
+        ("missing", 2),
+    ],
+)
+async def test_graph_index_matches_graph_repository(
+    dishka_request: AsyncContainer,
+    user: User,
+    query: str | None,
+    depth: int,
+):
+    # setup
+    await seed_graph_data(dishka_request, user)
+    interactor = await dishka_request.get(GetGraphInteractor)
+    graph_repo = await dishka_request.get(INotesGraphRepository)
+
+    # action
+    from_index = await interactor.get_graph(user_id=user.id, query=query, depth=depth)
+    from_repo = await graph_repo.get_graph(user_id=user.id, query=query, depth=depth)
+
+    # check
+    assert graph_snapshot(from_index) == graph_snapshot(from_repo)
+
+
+@pytest.mark.asyncio
+async def test_graph_index_is_patched_by_note_updates(
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup: the first read loads the graph into memory
+    _, beta_id, gamma_id = await seed_graph_data(dishka_request, user)
+    interactor = await dishka_request.get(GetGraphInteractor)
+    graph_index = await dishka_request.get(INotesGraphIndex)
+    await interactor.get_graph(user_id=user.id)
+    misses = graph_index.get_stats()["memory"].misses
+
+    # action: Beta stops linking to Gamma, before the worker has run
+    update_interactor = await dishka_request.get(UpdateNoteInteractor)
+    await update_interactor.update_note(UpdateNote(note_id=beta_id, text="no links"))
+    graph = await interactor.get_graph(user_id=user.id)
+
+    # check: served from the patched graph, without a reload
+    assert (f"note:{beta_id}", f"note:{gamma_id}", "links_to") not in connection_tuples(
+        graph.connections
+    )
+    assert graph_index.get_stats()["memory"].misses == misses
@@ -2,7 +2,11 @@ import pytest
 
 from dishka import AsyncContainer
 
-from brain.application.interactors import CreateNoteInteractor, GetGraphInteractor
+from brain.application.interactors import (
+    CreateNoteInteractor,
+    GetGraphInteractor,
+    ProcessGraphSyncOutboxInteractor,
+)
 from brain.application.interactors.notes.dto import CreateNote
 from brain.domain.entities.user import User
 
@@ -34,6 +38,8 @@ async def seed_graph_data(
             text="",
         )
     )
+    sync_interactor = await dishka_request.get(ProcessGraphSyncOutboxInteractor)
+    await sync_interactor.process()
     return alpha_id, beta_id, gamma_id
 
 
@@ -54,11 +60,14 @@ async def test_get_graph_without_query_returns_nodes_and_connections(
     dishka_request: AsyncContainer,
     user: User,
 ):
+    # setup
     alpha_id, beta_id, gamma_id = await seed_graph_data(dishka_request, user)
     interactor = await dishka_request.get(GetGraphInteractor)
 
+    # action
     graph = await interactor.get_graph(user_id=user.id)
 
+    # check: every note and the dangling keyword, with their links
     expected_nodes = {
         f"note:{alpha_id}",
         f"note:{beta_id}",
@@ -85,35 +94,37 @@ async def test_get_graph_query_depth_limits_connected_nodes(
     dishka_request: AsyncContainer,
     user: User,
 ):
+    # setup
     alpha_id, beta_id, gamma_id = await seed_graph_data(dishka_request, user)
     interactor = await dishka_request.get(GetGraphInteractor)
 
+    # action
     graph_depth_0 = await interactor.get_graph(
         user_id=user.id,
         query="Beta",
         depth=0,
     )
-    assert node_ids(graph_depth_0.nodes) == {
-        f"note:{beta_id}",
-    }
-
     graph_depth_1 = await interactor.get_graph(
         user_id=user.id,
         query="Beta",
         depth=1,
     )
+    graph_depth_2 = await interactor.get_graph(
+        user_id=user.id,
+        query="Beta",
+        depth=2,
+    )
+
+    # check: each level of depth adds the next ring of neighbours
+    assert node_ids(graph_depth_0.nodes) == {
+        f"note:{beta_id}",
+    }
     assert "keyword:Orphan" not in node_ids(graph_depth_1.nodes)
     assert {
         f"note:{alpha_id}",
         f"note:{beta_id}",
         f"note:{gamma_id}",
     }.issubset(node_ids(graph_depth_1.nodes))
-
-    graph_depth_2 = await interactor.get_graph(
-        user_id=user.id,
-        query="Beta",
-        depth=2,
-    )
     assert "keyword:Orphan" in node_ids(graph_depth_2.nodes)
 
 
@@ -122,15 +133,18 @@ async def test_get_graph_query_returns_connected_nodes(
     dishka_request: AsyncContainer,
     user: User,
 ):
+    # setup
     alpha_id, beta_id, _ = await seed_graph_data(dishka_request, user)
     interactor = await dishka_request.get(GetGraphInteractor)
 
+    # action
     graph = await interactor.get_graph(
         user_id=user.id,
         query="Orphan",
         depth=1,
     )
 
+    # check: only the keyword and the note linking to it
     assert node_ids(graph.nodes) == {
         "keyword:Orphan",
         f"note:{alpha_id}",
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from dishka import AsyncContainer
 from brain.application.interactors import CreateNoteInteractor
@@ -48,6 +50,33 @@ async def test_note_autogenerates_title_when_missing(
     assert note.represents_keyword_id is not None
 
 
+@pytest.mark.asyncio
+async def test_concurrent_untitled_notes_get_distinct_titles(
+    dishka: AsyncContainer,
+    user: User,
+    repo_hub: RepositoryHub,
+):
+    # setup
+    data = CreateNote(
+        by_user_telegram_id=user.telegram_id,
+        title=None,
+        text="Some note text",
+    )
+
+    async def create_in_own_request() -> str:
+        async with dishka() as request_container:
+            create_interactor = await request_container.get(CreateNoteInteractor)
+            note_id = await create_interactor.create_note(data)
+        note = await repo_hub.notes.get_by_id(note_id)
+        return note.title
+
+    # action
+    titles = await asyncio.gather(*(create_in_own_request() for _ in range(3)))
+
+    # check
+    assert sorted(titles) == ["Untitled 1", "Untitled 2", "Untitled 3"]
+
+
 @pytest.mark.asyncio
 async def test_note_unique_by_title(
     dishka_request: AsyncContainer,
@@ -94,6 +123,7 @@ async def test_note_creation_with_wikilinks(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
@@ -110,6 +140,8 @@ async def test_note_creation_with_wikilinks(
     note = await repo_hub.notes.get_by_id(note_id)
     assert note.title == "Source"
     
+    await sync_graph()
+
     # Verify Target Keyword Created
     target_kw = await repo_hub.keywords.get_by_user_and_name(user.id, "Target")
     assert target_kw is not None
@@ -130,6 +162,7 @@ async def test_note_creation_auto_title_with_links(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
@@ -142,6 +175,7 @@ async def test_note_creation_auto_title_with_links(
     note_id = await create_interactor.create_note(data)
     note = await repo_hub.notes.get_by_id(note_id)
     
+    await sync_graph()
     # Verify link established using generated title
     links_count = await graph_repo.count_links_between_notes(user.id, note.title, "Linked")
     assert links_count == 1
@@ -13,6 +13,7 @@ from brain.infrastructure.db.models.keyword import KeywordDB, NoteKeywordDB
 async def test_keywords_deleted_when_last_link_removed(
     dishka_request: AsyncContainer,
     user: User,
+    sync_graph,
 ):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     delete_interactor = await dishka_request.get(DeleteNoteInteractor)
@@ -32,6 +33,7 @@ async def test_keywords_deleted_when_last_link_removed(
             text="Linking [[Omega]] too",
         )
     )
+    await sync_graph()
 
     result = await session.execute(
         select(KeywordDB).where(KeywordDB.user_id == user.id, KeywordDB.name == "Omega")
@@ -9,7 +9,7 @@ from brain.domain.entities.user import User
 
 
 @pytest.mark.asyncio
-async def test_note_graph_links_to_notes_by_title(dishka_request, user: User):
+async def test_note_graph_links_to_notes_by_title(dishka_request, user: User, sync_graph):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     notes_graph_repo = await dishka_request.get(INotesGraphRepository)
 
@@ -28,6 +28,7 @@ async def test_note_graph_links_to_notes_by_title(dishka_request, user: User):
         )
     )
 
+    await sync_graph()
     count = await notes_graph_repo.count_notes_by_user_and_title(
         user_id=user.id, title="Root"
     )
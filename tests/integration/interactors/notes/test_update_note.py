@@ -20,6 +20,7 @@ async def test_note_update_requires_title(
     user: User,
     repo_hub: RepositoryHub,
 ):
+    # setup
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
@@ -30,6 +31,8 @@ async def test_note_update_requires_title(
             text="Note",
         )
     )
+
+    # action / check: a note cannot lose its title
     with pytest.raises(NoteTitleRequiredException):
         await update_interactor.update_note(
             UpdateNote(
@@ -46,6 +49,7 @@ async def test_note_duplicate_title_conflict(
     user: User,
     repo_hub: RepositoryHub,
 ):
+    # setup: two notes with different titles
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
@@ -65,6 +69,7 @@ async def test_note_duplicate_title_conflict(
         )
     )
 
+    # action / check: renaming onto the other title is rejected
     with pytest.raises(NoteTitleAlreadyExistsException):
         await update_interactor.update_note(
             UpdateNote(
@@ -80,36 +85,38 @@ async def test_note_update_renaming(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
+    # setup
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
-    # Create original
     note_id = await create_interactor.create_note(CreateNote(
         by_user_telegram_id=user.telegram_id,
         title="OldName",
         text="Text",
     ))
 
-    # Rename
+    # action: rename the note
     await update_interactor.update_note(UpdateNote(
         note_id=note_id,
         title="NewName",
         text="Text",
     ))
+    await sync_graph()
 
-    # Verify PG
+    # check: Postgres has the new title
     note = await repo_hub.notes.get_by_id(note_id)
     assert note.title == "NewName"
 
-    # Verify Graph (Old node gone/renamed, New node exists)
+    # check: graph has the new node and not the old one
     old_count = await graph_repo.count_notes_by_user_and_title(user.id, "OldName")
     assert old_count == 0
     new_count = await graph_repo.count_notes_by_user_and_title(user.id, "NewName")
     assert new_count == 1
     
-    # Verify Keyword persistence
+    # check: the title keyword follows the rename
     kw = await repo_hub.keywords.get_by_id(note.represents_keyword_id)
     assert kw.name == "NewName"
 
@@ -119,7 +126,9 @@ async def test_note_update_content_links(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
+    # setup
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
@@ -130,14 +139,15 @@ async def test_note_update_content_links(
         text="Refers [[A]]",
     ))
 
-    # Update: remove A, add B
+    # action: remove A, add B
     await update_interactor.update_note(UpdateNote(
         note_id=note_id,
         title="Linker",
         text="Refers [[B]]",
     ))
+    await sync_graph()
 
-    # Verify Graph
+    # check: graph links follow the text
     count_a = await graph_repo.count_links_between_notes(user.id, "Linker", "A")
     assert count_a == 0
     
@@ -151,9 +161,10 @@ async def test_note_update_patch(
     user: User,
     repo_hub: RepositoryHub,
 ):
+    # setup
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
-    
+
     note_id = await create_interactor.create_note(CreateNote(
         by_user_telegram_id=user.telegram_id,
         title="Patcher",
@@ -161,16 +172,17 @@ async def test_note_update_patch(
     ))
 
     patch_str = get_patches_str("Hello world", "Hello patched")
-    
+
+    # action: apply the patch
     updated_note = await update_interactor.update_note(UpdateNote(
         note_id=note_id,
         title="Patcher",
         text=None,
         patch=patch_str
     ))
-    
+
+    # check: both the result and the stored note are patched
     assert updated_note.text == "Hello patched"
-    
     db_note = await repo_hub.notes.get_by_id(note_id)
     assert db_note.text == "Hello patched"
 
@@ -180,29 +192,30 @@ async def test_note_update_keyword_gc(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
+    # setup: a note linking to "Temporary"
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
 
-    # 1. Create note linking to "Temporary"
     note_id = await create_interactor.create_note(CreateNote(
         by_user_telegram_id=user.telegram_id,
         title="Holder",
         text="Links [[Temporary]]",
     ))
-    
-    # Verify keyword exists
+    await sync_graph()
     kw = await repo_hub.keywords.get_by_user_and_name(user.id, "Temporary")
     assert kw is not None
 
-    # 2. Update note to remove link
+    # action: remove the link
     await update_interactor.update_note(UpdateNote(
         note_id=note_id,
         title="Holder",
         text="Cleaning up links",
     ))
-    
-    # 3. Verify keyword "Temporary" is gone (Garbage Collected)
+    await sync_graph()
+
+    # check: keyword "Temporary" is garbage collected
     kw_after = await repo_hub.keywords.get_by_user_and_name(user.id, "Temporary")
     assert kw_after is None
 
@@ -211,8 +224,10 @@ async def test_note_update_keyword_gc(
 async def test_note_update_not_found(
     dishka_request: AsyncContainer,
 ):
+    # setup
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
-    
+
+    # action / check
     with pytest.raises(NoteNotFoundException):
         await update_interactor.update_note(UpdateNote(
             note_id=uuid4(),
@@ -226,29 +241,31 @@ async def test_note_update_removes_wikilink_connection(
     dishka_request: AsyncContainer,
     user: User,
     repo_hub: RepositoryHub,
+    sync_graph,
 ):
+    # setup: a note with a wikilink
     create_interactor = await dishka_request.get(CreateNoteInteractor)
     update_interactor = await dishka_request.get(UpdateNoteInteractor)
     graph_repo = await dishka_request.get(INotesGraphRepository)
 
-    # 1. Create a note with a wikilink
     note_id = await create_interactor.create_note(CreateNote(
         by_user_telegram_id=user.telegram_id,
         title="Source",
         text="This refers to [[Target]]",
     ))
 
-    # Verify link exists initially
+    await sync_graph()
     initial_count = await graph_repo.count_links_between_notes(user.id, "Source", "Target")
     assert initial_count == 1
 
-    # 2. Update the note to remove the wikilink
+    # action: remove the wikilink
     await update_interactor.update_note(UpdateNote(
         note_id=note_id,
         title="Source",
         text="No links here anymore",
     ))
+    await sync_graph()
 
-    # 3. Verify link is gone
+    # check: the link is gone
     final_count = await graph_repo.count_links_between_notes(user.id, "Source", "Target")
     assert final_count == 0
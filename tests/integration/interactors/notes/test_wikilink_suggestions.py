@@ -1,6 +1,6 @@
 import pytest
 from dishka import AsyncContainer
-from brain.application.interactors import CreateNoteInteractor
+from brain.application.interactors import CreateNoteInteractor, SearchWikilinkSuggestionsInteractor
 from brain.application.interactors.notes.dto import CreateNote
 from brain.domain.entities.user import User
 from brain.infrastructure.db.repositories.hub import RepositoryHub
@@ -11,6 +11,7 @@ async def test_wikilink_suggestions_include_keyword_notes_and_missing_keywords(
     dishka_request: AsyncContainer,
     repo_hub: RepositoryHub,
     user: User,
+    sync_graph,
 ):
     create_interactor = await dishka_request.get(CreateNoteInteractor)
 
@@ -50,11 +51,89 @@ async def test_wikilink_suggestions_include_keyword_notes_and_missing_keywords(
             text="Delta text",
         )
     )
+    await sync_graph()
 
     suggestions = await repo_hub.notes.search_wikilink_suggestions(
         user_id=user.id,
         query="ta",
     )
 
-    assert [s.title for s in suggestions] == ["Beta", "Delta", "Zeta"]
+    # no prefix matches; the longer "Delta" is least similar to the query
+    assert [s.title for s in suggestions] == ["Beta", "Zeta", "Delta"]
     assert [s.represents_keyword for s in suggestions] == [True, True, True]
+
+
+@pytest.mark.asyncio
+async def test_wikilink_suggestions_rank_prefix_first_and_respect_limit(
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup
+    await repo_hub.keywords.ensure_keywords(
+        user_id=user.id,
+        names=["Paper review", "Review", "Reviewer notes", "Weekly review"],
+    )
+    await repo_hub.uow.commit()
+
+    # action
+    suggestions = await repo_hub.notes.search_wikilink_suggestions(
+        user_id=user.id,
+        query="review",
+        limit=3,
+    )
+
+    # check: prefix matches lead, then the most similar titles
+    assert [s.title for s in suggestions] == ["Review", "Reviewer notes", "Paper review"]
+
+
+@pytest.mark.asyncio
+async def test_wikilink_suggestions_treat_like_wildcards_literally(
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup
+    await repo_hub.keywords.ensure_keywords(
+        user_id=user.id,
+        names=["100% done", "1000 done"],
+    )
+    await repo_hub.uow.commit()
+
+    # action
+    suggestions = await repo_hub.notes.search_wikilink_suggestions(
+        user_id=user.id,
+        query="100%",
+    )
+
+    # check
+    assert [s.title for s in suggestions] == ["100% done"]
+
+
+@pytest.mark.asyncio
+async def test_wikilink_suggestions_fuzzy_sql_matches_in_memory_index(
+    dishka_request: AsyncContainer,
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup
+    await repo_hub.keywords.ensure_keywords(
+        user_id=user.id,
+        names=["Neural network", "Neural networks", "Network topology", "Cooking"],
+    )
+    await repo_hub.uow.commit()
+    interactor = await dishka_request.get(SearchWikilinkSuggestionsInteractor)
+
+    # action
+    from_sql = await repo_hub.notes.search_wikilink_suggestions(
+        user_id=user.id,
+        query="neurl netwrk",
+        fuzzy_threshold=0.3,
+    )
+    from_index = await interactor.search_wikilink_suggestions(
+        user_id=user.id,
+        query="neurl netwrk",
+        fuzzy=True,
+    )
+
+    # check: both paths find the same typo matches in the same order
+    assert [s.title for s in from_sql] == ["Neural network", "Neural networks"]
+    assert from_index == from_sql
@@ -0,0 +1,33 @@
+import pytest
+
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+from tests.integration.api.notes.helpers import create_keyword_note
+
+
+@pytest.mark.asyncio
+async def test_replace_note_keywords_touches_only_changed_links(
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup: note linking to Alpha and Beta
+    note = await create_keyword_note(
+        repo_hub=repo_hub,
+        user=user,
+        title="Source",
+        text="[[Alpha]] [[Beta]]",
+    )
+    await repo_hub.keywords.replace_note_keywords(note.id, user.id, ["Alpha", "Beta"])
+    beta = await repo_hub.keywords.get_by_user_and_name(user.id, "Beta")
+
+    # action: swap Alpha for Gamma
+    removed = await repo_hub.keywords.replace_note_keywords(
+        note.id, user.id, ["Beta", "Gamma", " Gamma "]
+    )
+
+    # check: only the dropped name is reported and kept links stay intact
+    assert removed == ["Alpha"]
+    names = await repo_hub.keywords.get_note_keyword_names(note.id)
+    assert sorted(names) == ["Beta", "Gamma"]
+    beta_after = await repo_hub.keywords.get_by_user_and_name(user.id, "Beta")
+    assert beta_after.id == beta.id
@@ -0,0 +1,40 @@
+import pytest
+
+from brain.domain.entities.user import User
+from brain.infrastructure.db.repositories.hub import RepositoryHub
+
+
+@pytest.mark.asyncio
+async def test_upsert_keyword_returns_existing_id(
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup: keyword already exists
+    first_id = await repo_hub.keywords.upsert_keyword(user.id, name="Topic")
+
+    # action: upsert the same name again
+    second_id = await repo_hub.keywords.upsert_keyword(user.id, name="Topic")
+
+    # check: the same keyword is returned
+    assert second_id == first_id
+
+
+@pytest.mark.asyncio
+async def test_ensure_keyword_ids_maps_new_and_existing_names(
+    repo_hub: RepositoryHub,
+    user: User,
+):
+    # setup: one of the names already exists
+    existing_id = await repo_hub.keywords.upsert_keyword(user.id, name="Old")
+
+    # action: upsert a batch with duplicates and padding
+    keyword_ids = await repo_hub.keywords.ensure_keyword_ids(
+        user_id=user.id,
+        names=["Old", "New", " New "],
+    )
+
+    # check: every normalized name maps to its keyword
+    assert set(keyword_ids) == {"Old", "New"}
+    assert keyword_ids["Old"] == existing_id
+    new_keyword = await repo_hub.keywords.get_by_user_and_name(user.id, "New")
+    assert keyword_ids["New"] == new_keyword.id
@@ -0,0 +1,113 @@
+import pytest
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
+from brain.domain.entities.user import User
+from brain.infrastructure.graph.repositories.postgres import PostgresNotesGraphRepository
+from tests.integration.interactors.graph.test_graph_interactor import (
+    connection_tuples,
+    node_by_id,
+    seed_graph_data,
+)
+
+
+def graph_snapshot(graph):
+    nodes = {
+        node_id: (node.title, node.kind, node.represents_keyword, node.has_keyword_note)
+        for node_id, node in node_by_id(graph.nodes).items()
+    }
+    return nodes, connection_tuples(graph.connections)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "depth"),
+    [
+        (None, 1),
+        ("Beta", 0),
+        ("Beta", 1),
+        ("Beta", 2),
+        ("orphan", 1),
+        ("a", 3),
+        ("missing", 2),
+    ],
+)
+async def test_postgres_graph_matches_neo4j(
+    dishka_request: AsyncContainer,
+    user: User,
+    query: str | None,
+    depth: int,
+):
+    # setup: the same notes synced to Neo4j and stored in Postgres
+    await seed_graph_data(dishka_request, user)
+    neo4j_repo = await dishka_request.get(INotesGraphRepository)
+    postgres_repo = PostgresNotesGraphRepository(
+        session=await dishka_request.get(AsyncSession),
+    )
+
+    # action
+    expected = await neo4j_repo.get_graph(user_id=user.id, query=query, depth=depth)
+    actual = await postgres_repo.get_graph(user_id=user.id, query=query, depth=depth)
+
+    # check
+    assert graph_snapshot(actual) == graph_snapshot(expected)
+
+
+@pytest.mark.asyncio
+async def test_postgres_graph_counts_match_neo4j(
+    dishka_request: AsyncContainer,
+    user: User,
+):
+    # setup
+    await seed_graph_data(dishka_request, user)
+    neo4j_repo = await dishka_request.get(INotesGraphRepository)
+    postgres_repo = PostgresNotesGraphRepository(
+        session=await dishka_request.get(AsyncSession),
+    )
+    pairs = [("Alpha", "Beta"), ("Beta", "Gamma"), ("Alpha", "Orphan"), ("Gamma", "Alpha")]
+
+    # action
+    expected_links = [
+        await neo4j_repo.count_links_between_notes(user.id, from_title, to_title)
+        for from_title, to_title in pairs
+    ]
+    actual_links = [
+        await postgres_repo.count_links_between_notes(user.id, from_title, to_title)
+        for from_title, to_title in pairs
+    ]
+    actual_titles = [
+        await postgres_repo.count_notes_by_user_and_title(user.id, title)
+        for title in ("Alpha", "Orphan", "Missing")
+    ]
+
+    # check
+    assert actual_links == expected_links
+    assert actual_titles == [1, 1, 0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["neo4j", "postgres"])
+@pytest.mark.parametrize(("max_nodes", "truncated"), [(2, True), (100, False)])
+async def test_graph_walk_stops_at_max_nodes(
+    dishka_request: AsyncContainer,
+    user: User,
+    backend: str,
+    max_nodes: int,
+    truncated: bool,
+):
+    # setup
+    await seed_graph_data(dishka_request, user)
+    repo = await dishka_request.get(INotesGraphRepository)
+    if backend == "postgres":
+        repo = PostgresNotesGraphRepository(session=await dishka_request.get(AsyncSession))
+    uncapped = await repo.get_graph(user_id=user.id, query="Beta", depth=2)
+
+    # action
+    graph = await repo.get_graph(user_id=user.id, query="Beta", depth=2, max_nodes=max_nodes)
+
+    # check
+    assert graph.truncated is truncated
+    assert len(graph.nodes) <= max_nodes
+    if not truncated:
+        assert graph_snapshot(graph) == graph_snapshot(uncapped)
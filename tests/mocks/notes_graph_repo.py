@@ -65,6 +65,17 @@ class DummyNotesGraphRepository(INotesGraphRepository):
             if old_title in user_links:
                 user_links[note.title] = user_links.pop(old_title)
 
+    async def upsert_notes_bulk(
+        self,
+        notes: list[Note],
+        link_targets: dict[UUID, list[str]],
+    ):
+        for note in notes:
+            await self.upsert_note(note)
+            self._get_user_links(note.user_id)[note.title] = set(
+                link_targets.get(note.id, [])
+            )
+
     async def sync_connections(
         self,
         note: Note,
@@ -72,6 +83,7 @@ class DummyNotesGraphRepository(INotesGraphRepository):
         previous_title: str | None = None,
         previous_represents_keyword_id: UUID | None = None,
     ):
+        await self.upsert_note(note)
         user_links = self._get_user_links(note.user_id)
         user_links[note.title] = set(link_targets)
 
@@ -111,6 +123,7 @@ class DummyNotesGraphRepository(INotesGraphRepository):
         user_id: UUID,
         query: str | None = None,
         depth: int = 1,
+        max_nodes: int | None = None,
     ) -> GraphData:
         user_notes = self._get_user_notes(user_id)
         notes_by_title = self._get_notes_by_title(user_id)
@@ -168,6 +181,7 @@ class DummyNotesGraphRepository(INotesGraphRepository):
                     adjacency[to_id].add(from_id)
 
         # Determine reachable nodes by query/depth.
+        truncated = False
         if query:
             query_lower = query.lower()
             seeds = [
@@ -178,13 +192,16 @@ class DummyNotesGraphRepository(INotesGraphRepository):
             if not seeds:
                 return GraphData(nodes=[], connections=[])
 
+            if max_nodes is not None and len(seeds) > max_nodes:
+                seeds = seeds[:max_nodes]
+                truncated = True
             distances: dict[str, int] = {}
             queue: deque[str] = deque()
             for seed in seeds:
                 distances[seed] = 0
                 queue.append(seed)
 
-            while queue:
+            while queue and not truncated:
                 node_id = queue.popleft()
                 current_depth = distances[node_id]
                 if current_depth >= depth:
@@ -192,6 +209,9 @@ class DummyNotesGraphRepository(INotesGraphRepository):
                 for neighbor in adjacency.get(node_id, set()):
                     if neighbor in distances:
                         continue
+                    if max_nodes is not None and len(distances) >= max_nodes:
+                        truncated = True
+                        break
                     distances[neighbor] = current_depth + 1
                     queue.append(neighbor)
 
@@ -246,4 +266,4 @@ class DummyNotesGraphRepository(INotesGraphRepository):
             for f, t, k in connection_set
         ]
 
-        return GraphData(nodes=nodes, connections=connections)
+        return GraphData(nodes=nodes, connections=connections, truncated=truncated)
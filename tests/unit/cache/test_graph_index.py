@@ -0,0 +1,484 @@
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import NoteLinks
+from brain.config.models import GraphCacheConfig, GraphIndexConfig
+from brain.domain.entities.graph import GraphConnection, GraphData, GraphNode
+from brain.infrastructure.cache.graph import GraphCache, NotesGraphIndex, UserGraph
+from tests.unit.cache.test_principal_cache import DummyRedis as DummyKeyValueRedis
+from tests.unit.cache.test_wikilink_index import DummyRedis as DummyCounterRedis
+
+
+class DummyRedis(DummyCounterRedis):
+    """Version counters plus the list commands and pipelines of the change log."""
+
+    def __init__(self):
+        super().__init__()
+        self.lists: dict[str, list[bytes]] = {}
+
+    async def set(self, key, value, nx=False):
+        self._check()
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def rpush(self, key, value):
+        self._check()
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    async def ltrim(self, key, start, end):
+        self._check()
+        values = self.lists.get(key, [])
+        self.lists[key] = values[start:len(values) + end + 1 if end < 0 else end + 1]
+
+    async def lrange(self, key, start, end):
+        self._check()
+        values = self.lists.get(key, [])
+        return values[start:len(values) + end + 1 if end < 0 else end + 1]
+
+    async def pexpire(self, key, milliseconds):
+        self._check()
+
+    def pipeline(self, transaction=True):
+        return DummyPipeline(self)
+
+
+class DummyPipeline:
+    def __init__(self, redis: DummyRedis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((getattr(self._redis, name), args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self._redis._check()
+        return [await command(*args, **kwargs) for command, args, kwargs in self._commands]
+
+
+def _note(title: str, *targets: str) -> NoteLinks:
+    return NoteLinks(note_id=uuid4(), title=title, targets=list(targets))
+
+
+def _titles(graph: GraphData) -> set[tuple[str, str]]:
+    return {(node.kind, node.title) for node in graph.nodes}
+
+
+def _connections(graph: GraphData) -> set[tuple[str, str, str]]:
+    titles = {node.id: node.title for node in graph.nodes}
+    return {
+        (titles[connection.from_id], connection.kind, titles[connection.to_id])
+        for connection in graph.connections
+    }
+
+
+def test_user_graph_full_graph_hides_keywords_of_notes():
+    # setup
+    entry = UserGraph(
+        version=0,
+        notes=[
+            _note("Alpha", "Beta", "Orphan", "Beta"),
+            _note("Beta", "Alpha"),
+            _note("Gamma"),
+        ],
+    )
+
+    # action
+    graph = entry.get_graph(query=None, depth=1)
+
+    # check
+    assert _titles(graph) == {
+        ("note", "Alpha"),
+        ("note", "Beta"),
+        ("note", "Gamma"),
+        ("keyword", "Orphan"),
+    }
+    assert _connections(graph) == {
+        ("Alpha", "links_to", "Beta"),
+        ("Alpha", "has_keyword", "Orphan"),
+        ("Beta", "links_to", "Alpha"),
+    }
+
+
+@pytest.mark.parametrize(
+    ("depth", "expected"),
+    [
+        (0, {"Alpha"}),
+        (1, {"Alpha", "Hub"}),
+        (2, {"Alpha", "Hub", "Beta"}),
+        (3, {"Alpha", "Hub", "Beta", "Gamma"}),
+        (10, {"Alpha", "Hub", "Beta", "Gamma"}),
+    ],
+)
+def test_user_graph_query_walks_depth_hops_both_ways(depth, expected):
+    # setup
+    entry = UserGraph(
+        version=0,
+        notes=[
+            _note("Alpha", "Hub"),
+            _note("Beta", "Hub"),
+            _note("Gamma", "Beta"),
+            _note("Unrelated"),
+        ],
+    )
+
+    # action
+    graph = entry.get_graph(query="ALPH", depth=depth)
+
+    # check
+    assert {title for _, title in _titles(graph)} == expected
+
+
+def test_user_graph_walks_through_hidden_keywords():
+    # setup: both notes link to "Target", which is a note itself
+    entry = UserGraph(
+        version=0,
+        notes=[_note("Alpha", "Target"), _note("Beta", "Target"), _note("Target")],
+    )
+
+    # action
+    graph = entry.get_graph(query="alpha", depth=2)
+
+    # check: Beta is reached over the hidden keyword, which is not returned
+    assert _titles(graph) == {("note", "Alpha"), ("note", "Target"), ("note", "Beta")}
+    assert _connections(graph) == {
+        ("Alpha", "links_to", "Target"),
+        ("Beta", "links_to", "Target"),
+    }
+
+
+def test_user_graph_changes_in_place():
+    # setup
+    alpha, beta, target = _note("Alpha", "Target"), _note("Beta", "Target"), _note("Target")
+    entry = UserGraph(version=0, notes=[alpha, beta, target])
+
+    # action: the target is renamed away and Beta is deleted
+    entry.set_note(NoteLinks(note_id=target.note_id, title="Renamed", targets=["Alpha"]))
+    entry.remove_note(beta.note_id)
+
+    # check: Alpha's link dangles and shows up as a keyword again
+    graph = entry.get_graph(query=None, depth=1)
+    assert _titles(graph) == {("note", "Alpha"), ("note", "Renamed"), ("keyword", "Target")}
+    assert _connections(graph) == {
+        ("Alpha", "has_keyword", "Target"),
+        ("Renamed", "links_to", "Alpha"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_index_serves_only_current_version():
+    # setup
+    redis = DummyRedis()
+    writer = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    reader = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    user_id = uuid4()
+    notes = [_note("Alpha")]
+    for index in (writer, reader):
+        version = await index.get_version(user_id)
+        index.load(user_id, version, notes)
+
+    # action: the writer commits a new note
+    await writer.apply_changes(user_id, updated=[_note("Beta", "Alpha")])
+    version = await reader.get_version(user_id)
+
+    # check: the writer patched itself, the reader has to reload
+    graph = writer.get_graph(user_id, version)
+    assert _connections(graph) == {("Beta", "links_to", "Alpha")}
+    assert reader.get_graph(user_id, version) is None
+    assert reader.get_stats()["memory"].misses == 1
+
+
+@pytest.mark.asyncio
+async def test_index_drops_local_entry_when_version_bump_fails():
+    # setup
+    redis = DummyRedis()
+    index = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    user_id = uuid4()
+    alpha = _note("Alpha")
+    index.load(user_id, 0, [alpha])
+
+    # action
+    redis.fail = True
+    await index.apply_changes(user_id, deleted_ids=[alpha.note_id])
+
+    # check
+    assert await index.get_version(user_id) is None
+    assert index.get_graph(user_id, 0) is None
+
+
+def test_index_evicts_least_recently_used_users_over_memory_cap():
+    # setup: room for about one user
+    notes = [_note(f"Note number {index}", f"Note number {index + 1}") for index in range(200)]
+    one_user_mb = UserGraph(0, notes).size_bytes / (1024 * 1024)
+    index = NotesGraphIndex(
+        redis=DummyRedis(),
+        config=GraphIndexConfig(max_memory_mb=one_user_mb * 1.5),
+    )
+    first, second = uuid4(), uuid4()
+
+    # action
+    index.load(first, 0, notes)
+    index.load(second, 0, notes)
+
+    # check
+    assert index.get_graph(first, 0) is None
+    assert index.get_graph(second, 0) is not None
+
+
+@pytest.mark.parametrize(
+    ("max_nodes", "expected_notes", "truncated"),
+    [
+        (None, 11, False),
+        (12, 11, False),
+        (5, 4, True),
+        (1, 1, True),
+    ],
+)
+def test_user_graph_walk_stops_at_max_nodes(max_nodes, expected_notes, truncated):
+    # setup: ten notes around one keyword hub
+    entry = UserGraph(
+        version=0,
+        notes=[_note("Hub note", "Hub")] + [_note(f"Spoke {index}", "Hub") for index in range(10)],
+    )
+
+    # action
+    graph = entry.get_graph(query="hub note", depth=2, max_nodes=max_nodes)
+
+    # check: the "Hub" keyword takes one of the visited slots
+    assert sum(node.kind == "note" for node in graph.nodes) == expected_notes
+    assert graph.truncated is truncated
+
+
+def _graph(truncated: bool = False) -> GraphData:
+    return GraphData(
+        nodes=[
+            GraphNode(id="note:1", title="Alpha", kind="note", represents_keyword=True),
+            GraphNode(id="keyword:Beta", title="Beta", kind="keyword", has_keyword_note=False),
+        ],
+        connections=[GraphConnection(from_id="note:1", to_id="keyword:Beta", kind="has_keyword")],
+        truncated=truncated,
+    )
+
+
+@pytest.mark.asyncio
+async def test_graph_cache_entries_are_scoped_by_version_and_query():
+    # setup
+    cache = GraphCache(redis=DummyKeyValueRedis(), config=GraphCacheConfig())
+    user_id = uuid4()
+
+    # action
+    await cache.set(user_id, 3, "alpha", 2, _graph(truncated=True))
+
+    # check
+    assert await cache.get(user_id, 3, "alpha", 2) == _graph(truncated=True)
+    assert await cache.get(user_id, 4, "alpha", 2) is None
+    assert await cache.get(user_id, 3, "alpha", 1) is None
+    assert await cache.get(user_id, 3, None, 2) is None
+    stats = cache.get_stats()["redis"]
+    assert (stats.hits, stats.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_graph_cache_skips_oversized_graphs():
+    # setup
+    cache = GraphCache(redis=DummyKeyValueRedis(), config=GraphCacheConfig(max_entry_kb=0))
+    user_id = uuid4()
+
+    # action
+    await cache.set(user_id, 1, None, 1, _graph())
+
+    # check
+    assert await cache.get(user_id, 1, None, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_graph_cache_degrades_to_miss_when_redis_is_down():
+    # setup
+    redis = DummyKeyValueRedis()
+    cache = GraphCache(redis=redis, config=GraphCacheConfig())
+    user_id = uuid4()
+    redis.fail = True
+
+    # action
+    await cache.set(user_id, 1, None, 1, _graph())
+
+    # check
+    assert await cache.get(user_id, 1, None, 1) is None
+    assert cache.get_stats()["redis"].misses == 1
+
+
+def _elements(graph: GraphData) -> tuple[set, set]:
+    return (
+        {(node.id, node.title, node.kind) for node in graph.nodes},
+        {(connection.from_id, connection.to_id, connection.kind) for connection in graph.connections},
+    )
+
+
+def _apply_delta(elements: tuple[set, set], delta) -> tuple[set, set]:
+    nodes, connections = elements
+    nodes = {node for node in nodes if node[0] not in delta.removed_node_ids}
+    nodes |= {(node.id, node.title, node.kind) for node in delta.added_nodes}
+    connections = connections - {
+        (connection.from_id, connection.to_id, connection.kind)
+        for connection in delta.removed_connections
+    }
+    connections |= {
+        (connection.from_id, connection.to_id, connection.kind)
+        for connection in delta.added_connections
+    }
+    return nodes, connections
+
+
+@pytest.mark.asyncio
+async def test_index_delta_turns_old_graph_into_current_one():
+    # setup: a reader holds version 0, a writer makes a few changes
+    redis = DummyRedis()
+    writer = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    reader = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    user_id = uuid4()
+    alpha, beta = _note("Alpha", "Gamma", "Hub"), _note("Beta", "Hub")
+    start = await reader.get_version(user_id)
+    reader.load(user_id, start, [alpha, beta])
+    old_graph = _elements(reader.get_graph(user_id, start))
+    gamma = _note("Gamma", "Beta")
+    renamed = NoteLinks(note_id=beta.note_id, title="Delta", targets=["Alpha"])
+
+    # action: Gamma takes a linked keyword, Beta is renamed and Alpha deleted
+    await writer.apply_changes(user_id, updated=[gamma])
+    await writer.apply_changes(user_id, updated=[renamed], previous=[beta])
+    await writer.apply_changes(user_id, deleted_ids=[alpha.note_id], previous=[alpha])
+    log = await reader.get_change_log(user_id, since=start)
+    reader.load(user_id, log.version, [gamma, renamed])
+    delta = reader.get_delta(user_id, log.version, log.changes)
+
+    # check
+    assert log.version == start + 3
+    assert _apply_delta(old_graph, delta) == _elements(reader.get_graph(user_id, log.version))
+    assert set(delta.removed_node_ids) == {
+        f"note:{alpha.note_id}", f"note:{beta.note_id}", "keyword:Gamma", "keyword:Hub",
+    }
+    assert {node.title for node in delta.added_nodes} == {"Gamma", "Delta", "Alpha", "Beta"}
+
+
+@pytest.mark.asyncio
+async def test_index_change_log_nets_out_changes_of_the_same_note():
+    # setup
+    index = NotesGraphIndex(redis=DummyRedis(), config=GraphIndexConfig())
+    user_id = uuid4()
+    temporary, kept = _note("Temporary"), _note("Kept")
+    edited = NoteLinks(note_id=kept.note_id, title="Kept", targets=["Link"])
+    start = await index.get_version(user_id)
+    await index.apply_changes(user_id, updated=[temporary, kept])
+
+    # action
+    await index.apply_changes(user_id, deleted_ids=[temporary.note_id], previous=[temporary])
+    await index.apply_changes(user_id, updated=[edited], previous=[kept])
+    log = await index.get_change_log(user_id, since=start)
+
+    # check: the short-lived note leaves no trace
+    assert log.version == start + 3
+    assert [(change.before, change.after) for change in log.changes] == [(None, edited)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("behind", [3, -1])
+async def test_index_change_log_does_not_reach_truncated_or_future_versions(behind):
+    # setup: the log keeps two entries
+    index = NotesGraphIndex(
+        redis=DummyRedis(),
+        config=GraphIndexConfig(change_log_max_entries=2),
+    )
+    user_id = uuid4()
+    for title in ("One", "Two", "Three"):
+        await index.apply_changes(user_id, updated=[_note(title)])
+    version = await index.get_version(user_id)
+
+    # action
+    log = await index.get_change_log(user_id, since=version - behind)
+
+    # check
+    assert log.version == version
+    assert log.changes is None
+    assert len((await index.get_change_log(user_id, since=version - 2)).changes) == 2
+    assert (await index.get_change_log(user_id, since=version)).changes == []
+
+
+@pytest.mark.asyncio
+async def test_index_change_log_treats_large_writes_as_gap():
+    # setup
+    index = NotesGraphIndex(redis=DummyRedis(), config=GraphIndexConfig())
+    user_id = uuid4()
+    start = await index.get_version(user_id)
+
+    # action
+    await index.apply_changes(user_id, updated=[_note(f"Note {number}") for number in range(101)])
+    await index.apply_changes(user_id, updated=[_note("Small")])
+
+    # check
+    assert (await index.get_change_log(user_id, since=start)).changes is None
+    assert len((await index.get_change_log(user_id, since=start + 1)).changes) == 1
+
+
+@pytest.mark.asyncio
+async def test_index_change_log_is_unavailable_without_redis():
+    # setup
+    redis = DummyRedis()
+    index = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    redis.fail = True
+
+    # action / check
+    assert await index.get_change_log(uuid4(), since=0) is None
+
+
+@pytest.mark.asyncio
+async def test_index_version_never_repeats_after_redis_loses_it():
+    # setup
+    redis = DummyRedis()
+    index = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    user_id = uuid4()
+    await index.apply_changes(user_id, updated=[_note("Alpha")])
+    before = await index.get_version(user_id)
+
+    # action: Redis is flushed, then the counter is read and bumped again
+    redis.values.clear()
+    redis.lists.clear()
+    reseeded = await index.get_version(user_id)
+    await index.apply_changes(user_id, updated=[_note("Beta")])
+
+    # check: no version handed out before the flush comes back
+    assert reseeded > before
+    assert await index.get_version(user_id) == reseeded + 1
+    assert (await index.get_change_log(user_id, since=before)).changes is None
+
+
+@pytest.mark.asyncio
+async def test_index_logs_write_lost_while_redis_was_down_as_gap():
+    # setup
+    redis = DummyRedis()
+    index = NotesGraphIndex(redis=redis, config=GraphIndexConfig())
+    user_id = uuid4()
+    before = await index.get_version(user_id)
+    redis.fail = True
+    await index.apply_changes(user_id, updated=[_note("Alpha")])
+    redis.fail = False
+
+    # action
+    version = await index.get_version(user_id)
+    log = await index.get_change_log(user_id, since=before)
+
+    # check: the version moved on and no delta skips the lost write
+    assert version == before + 1
+    assert log.version == version
+    assert log.changes is None
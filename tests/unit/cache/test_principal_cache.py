@@ -0,0 +1,145 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from brain.config.models import PrincipalCacheConfig
+from brain.domain.entities.user import User
+from brain.infrastructure.cache.lru import TTLLRUCache
+from brain.infrastructure.cache.principals import PrincipalCache
+
+
+class DummyRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.fail = False
+
+    async def get(self, key):
+        self._check()
+        return self.values.get(key)
+
+    async def set(self, key, value, px=None):
+        self._check()
+        self.values[key] = value
+
+    async def delete(self, key):
+        self._check()
+        self.values.pop(key, None)
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("redis is down")
+
+
+def _make_user() -> User:
+    return User(id=uuid4(), telegram_id=1, first_name="Test", username="test")
+
+
+def _make_cache(redis: DummyRedis, local_ttl_seconds: float = 5.0) -> PrincipalCache:
+    return PrincipalCache(
+        redis=redis,
+        config=PrincipalCacheConfig(
+            local_ttl_seconds=local_ttl_seconds,
+            local_max_entries=2,
+            redis_ttl_seconds=60.0,
+        ),
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    # setup
+    cache = TTLLRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # action
+    cache.set("c", 3)
+
+    # check
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_expires_entries(freezer):
+    # setup
+    cache = TTLLRUCache(max_entries=2, ttl_seconds=5)
+    cache.set("a", 1)
+
+    # action
+    freezer.tick(delta=timedelta(seconds=6))
+
+    # check
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+async def test_principal_cache_counts_hits_per_tier():
+    # setup
+    redis = DummyRedis()
+    writer = _make_cache(redis)
+    reader = _make_cache(redis)
+    user = _make_user()
+    await writer.set(user)
+
+    # action
+    missing = await reader.get(uuid4())
+    from_redis = await reader.get(user.id)
+    from_local = await reader.get(user.id)
+
+    # check
+    assert missing is None
+    assert from_redis == user
+    assert from_local == user
+    stats = reader.get_stats()
+    assert (stats["local"].hits, stats["local"].misses) == (1, 2)
+    assert (stats["redis"].hits, stats["redis"].misses) == (1, 1)
+    assert (stats["total"].hits, stats["total"].misses) == (2, 1)
+    assert stats["total"].hit_rate == 2 / 3
+
+
+async def test_principal_cache_returns_copies():
+    # setup
+    redis = DummyRedis()
+    cache = _make_cache(redis)
+    user = _make_user()
+    await cache.set(user)
+
+    # action
+    cached = await cache.get(user.id)
+    cached.first_name = "Changed"
+
+    # check
+    assert (await cache.get(user.id)).first_name == "Test"
+
+
+async def test_principal_cache_invalidate_drops_both_tiers():
+    # setup
+    redis = DummyRedis()
+    cache = _make_cache(redis)
+    user = _make_user()
+    await cache.set(user)
+
+    # action
+    await cache.invalidate(user.id)
+
+    # check
+    assert redis.values == {}
+    assert await cache.get(user.id) is None
+
+
+async def test_principal_cache_degrades_to_miss_when_redis_fails():
+    # setup
+    redis = DummyRedis()
+    redis.fail = True
+    cache = _make_cache(redis)
+    user = _make_user()
+
+    # action
+    await cache.set(user)
+    await cache.invalidate(user.id)
+
+    # check
+    assert await cache.get(user.id) is None
+    assert cache.get_stats()["redis"].misses == 1
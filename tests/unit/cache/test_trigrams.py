@@ -0,0 +1,66 @@
+import pytest
+
+from brain.infrastructure.cache.trigrams import TrigramIndex, similarity, trigrams
+
+
+def test_trigrams_match_pg_trgm_extraction():
+    # SELECT show_trgm('Cat, cat!') -> {"  c"," ca","at ",cat}
+    assert trigrams("Cat, cat!") == {"  c", " ca", "cat", "at "}
+    assert trigrams("--") == frozenset()
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        ("word", "word", 1.0),
+        ("word", "", 0.0),
+        # SELECT similarity('neurl netwrk', 'Neural network') -> 0.4117647
+        ("neurl netwrk", "Neural network", 7 / 17),
+    ],
+)
+def test_similarity_matches_pg_trgm(left, right, expected):
+    assert similarity(trigrams(left), trigrams(right)) == pytest.approx(expected)
+
+
+def _brute_force(names, query, threshold, limit):
+    query_trigrams = trigrams(query)
+    scored = [(similarity(query_trigrams, trigrams(name)), name) for name in names]
+    scored = [item for item in scored if item[0] >= threshold]
+    return sorted(scored, key=lambda item: (-item[0], item[1]))[:limit]
+
+
+def test_trigram_index_matches_brute_force_through_changes():
+    # setup
+    names = {f"Weekly review {number}" for number in range(40)} | {"Neural network", "Networking"}
+    index = TrigramIndex(names)
+
+    # action: removals are masked, additions stay pending, then get repacked
+    index.remove("Weekly review 7")
+    index.remove("Networking")
+    index.add("Neural networks")
+    index.add("Networking")
+    names = (names - {"Weekly review 7"}) | {"Neural networks"}
+    pending = index.search("weekly reviw 7", 0.3, limit=5, preferred=lambda name: False)
+    for number in range(1000):
+        index.add(f"Daily log {number}")
+        names.add(f"Daily log {number}")
+    repacked = index.search("weekly reviw 7", 0.3, limit=5, preferred=lambda name: False)
+
+    # check
+    assert pending == repacked == _brute_force(names, "weekly reviw 7", 0.3, 5)
+    assert index.search("neurl netwrk", 0.3, limit=3, preferred=lambda name: False) == (
+        _brute_force(names, "neurl netwrk", 0.3, 3)
+    )
+
+
+def test_trigram_index_prefers_names_on_equal_scores():
+    # setup
+    index = TrigramIndex(["Alpha", "alpha"])
+
+    # action
+    plain = index.search("alpha", 0.3, limit=2, preferred=lambda name: False)
+    preferred = index.search("alpha", 0.3, limit=2, preferred=lambda name: name == "alpha")
+
+    # check
+    assert [name for _, name in plain] == ["Alpha", "alpha"]
+    assert [name for _, name in preferred] == ["alpha", "Alpha"]
@@ -0,0 +1,259 @@
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from brain.application.abstractions.repositories.models import (
+    WikilinkCandidates,
+    WikilinkSuggestion,
+)
+from brain.config.models import WikilinkIndexConfig
+from brain.infrastructure.cache.suggestions import (
+    UserSuggestions,
+    WikilinkSuggestionIndex,
+)
+from brain.infrastructure.cache.trigrams import TrigramIndex
+
+
+class DummyRedis:
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.fail = False
+
+    async def get(self, key):
+        self._check()
+        value = self.values.get(key)
+        return str(value).encode() if value is not None else None
+
+    async def incr(self, key):
+        self._check()
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("redis is down")
+
+
+def _titles(suggestions: list[WikilinkSuggestion]) -> list[str]:
+    return [suggestion.title for suggestion in suggestions]
+
+
+def test_user_suggestions_rank_prefix_word_start_then_infix():
+    # setup
+    entry = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(
+            note_titles=["Review", "Weekly review", "Preview notes"],
+            keyword_names=["Reviewer", "Review"],
+        ),
+    )
+
+    # action
+    suggestions = entry.search("review", limit=10)
+
+    # check
+    assert suggestions == [
+        WikilinkSuggestion(title="Review", represents_keyword=True),
+        WikilinkSuggestion(title="Reviewer", represents_keyword=False),
+        WikilinkSuggestion(title="Weekly review", represents_keyword=True),
+        WikilinkSuggestion(title="Preview notes", represents_keyword=True),
+    ]
+
+
+def test_user_suggestions_limit_and_blank_query():
+    # setup
+    entry = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(
+            note_titles=[f"Day {index}" for index in range(50)],
+            keyword_names=["  ", ""],
+        ),
+    )
+
+    # action / check
+    assert len(entry.search("day", limit=5)) == 5
+    assert entry.search("   ", limit=5) == []
+
+
+def test_user_suggestions_apply_changes_in_place():
+    # setup
+    entry = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(note_titles=["Alpha"], keyword_names=["Alpha", "Beta"]),
+    )
+
+    # action: the note goes away, its keyword stays; a keyword is deleted
+    entry.remove_titles(["Alpha"])
+    entry.remove_keywords(["Beta"])
+    entry.add_titles(["Gamma"])
+
+    # check
+    assert entry.search("a", limit=10) == [
+        WikilinkSuggestion(title="Alpha", represents_keyword=False),
+        WikilinkSuggestion(title="Gamma", represents_keyword=True),
+    ]
+    rebuilt = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(note_titles=["Gamma"], keyword_names=["Alpha"]),
+    )
+    assert entry.size_bytes == rebuilt.size_bytes
+
+
+@pytest.mark.asyncio
+async def test_index_serves_only_current_version():
+    # setup
+    redis = DummyRedis()
+    writer = WikilinkSuggestionIndex(redis=redis, config=WikilinkIndexConfig())
+    reader = WikilinkSuggestionIndex(redis=redis, config=WikilinkIndexConfig())
+    user_id = uuid4()
+    candidates = WikilinkCandidates(note_titles=["Alpha"], keyword_names=[])
+    for index in (writer, reader):
+        version = await index.get_version(user_id)
+        index.load(user_id, version, candidates)
+
+    # action: the writer commits a new title
+    await writer.apply_changes(user_id, added_titles=["Alpine"])
+    version = await reader.get_version(user_id)
+
+    # check: the writer patched itself, the reader has to rebuild
+    assert _titles(writer.search(user_id, version, "alp", 10)) == ["Alpha", "Alpine"]
+    assert reader.search(user_id, version, "alp", 10) is None
+    assert reader.get_stats()["memory"].misses == 1
+
+
+@pytest.mark.asyncio
+async def test_index_drops_local_entry_when_version_bump_fails():
+    # setup
+    redis = DummyRedis()
+    index = WikilinkSuggestionIndex(redis=redis, config=WikilinkIndexConfig())
+    user_id = uuid4()
+    index.load(user_id, 0, WikilinkCandidates(note_titles=["Alpha"], keyword_names=[]))
+
+    # action
+    redis.fail = True
+    await index.apply_changes(user_id, removed_titles=["Alpha"])
+
+    # check
+    assert await index.get_version(user_id) is None
+    assert index.search(user_id, 0, "alp", 10) is None
+
+
+def test_index_evicts_least_recently_used_users_over_memory_cap():
+    # setup: room for about one user
+    candidates = WikilinkCandidates(
+        note_titles=[f"Note number {index}" for index in range(200)],
+        keyword_names=[],
+    )
+    one_user_mb = UserSuggestions(0, candidates).size_bytes / (1024 * 1024)
+    index = WikilinkSuggestionIndex(
+        redis=DummyRedis(),
+        config=WikilinkIndexConfig(max_memory_mb=one_user_mb * 1.5),
+    )
+    first, second = uuid4(), uuid4()
+
+    # action
+    index.load(first, 0, candidates)
+    index.load(second, 0, candidates)
+
+    # check
+    assert index.search(first, 0, "note", 1) is None
+    assert index.search(second, 0, "note", 1) is not None
+
+
+def test_index_never_keeps_user_over_memory_cap():
+    # setup
+    small = WikilinkCandidates(note_titles=["Alpha"], keyword_names=[])
+    large = WikilinkCandidates(
+        note_titles=[f"Note number {index}" for index in range(200)],
+        keyword_names=[],
+    )
+    small_mb = UserSuggestions(0, small).size_bytes / (1024 * 1024)
+    index = WikilinkSuggestionIndex(
+        redis=DummyRedis(),
+        config=WikilinkIndexConfig(max_memory_mb=small_mb * 2),
+    )
+    first, second = uuid4(), uuid4()
+    index.load(first, 0, small)
+
+    # action
+    index.load(second, 0, large)
+
+    # check: the oversized entry is skipped and evicts nobody
+    assert index.search(second, 0, "note", 1) is None
+    assert _titles(index.search(first, 0, "alp", 1)) == ["Alpha"]
+
+
+def test_user_suggestions_fuzzy_search_tolerates_typos():
+    # setup
+    entry = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(
+            note_titles=["Neural network", "Network topology"],
+            keyword_names=["Neural networks", "Cooking"],
+        ),
+    )
+
+    # action
+    suggestions = entry.search_fuzzy("neurl netwrk", limit=10, threshold=0.3)
+
+    # check
+    assert suggestions == [
+        WikilinkSuggestion(title="Neural network", represents_keyword=True),
+        WikilinkSuggestion(title="Neural networks", represents_keyword=False),
+    ]
+    assert entry.search_fuzzy("neurl netwrk", limit=1, threshold=0.3) == suggestions[:1]
+    assert entry.search_fuzzy("neurl netwrk", limit=10, threshold=0.9) == []
+
+
+def test_user_suggestions_fuzzy_postings_follow_changes():
+    # setup: postings are built by the first fuzzy search
+    entry = UserSuggestions(
+        version=0,
+        candidates=WikilinkCandidates(note_titles=["Gardening"], keyword_names=[]),
+    )
+    assert _titles(entry.search_fuzzy("gardnening", limit=5, threshold=0.3)) == ["Gardening"]
+
+    # action
+    entry.remove_titles(["Gardening"])
+    entry.add_keywords(["Garden plan"])
+
+    # check
+    assert _titles(entry.search_fuzzy("gardn plan", limit=5, threshold=0.3)) == ["Garden plan"]
+    assert entry.search_fuzzy("gardnening", limit=5, threshold=0.5) == []
+
+
+def test_index_skips_fuzzy_postings_that_do_not_fit():
+    # setup: room for the prefix index but not for its trigram postings
+    candidates = WikilinkCandidates(
+        note_titles=[f"Note number {index}" for index in range(200)],
+        keyword_names=[],
+    )
+    entry = UserSuggestions(0, candidates)
+    index = WikilinkSuggestionIndex(
+        redis=DummyRedis(),
+        config=WikilinkIndexConfig(
+            max_memory_mb=(entry.size_bytes + entry.fuzzy_extra_bytes / 2) / (1024 * 1024),
+        ),
+    )
+    user_id = uuid4()
+    index.load(user_id, 0, candidates)
+
+    # action
+    fuzzy = index.search_fuzzy(user_id, 0, "nte numbr", 5, threshold=0.3)
+
+    # check: fuzzy goes elsewhere, prefix search keeps working
+    assert fuzzy is None
+    assert index.fits_fuzzy(user_id, 0) is False
+    assert index.search(user_id, 0, "note", 1) is not None
+
+
+def test_trigram_size_estimate_covers_built_index():
+    # setup
+    names = [f"note number {index}" for index in range(500)]
+
+    # action
+    estimate = TrigramIndex.estimate_size_bytes(names)
+
+    # check
+    assert TrigramIndex(names).size_bytes <= estimate
@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from brain.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def make_uow() -> tuple[SqlAlchemyUnitOfWork, AsyncMock]:
+    session = AsyncMock()
+    return SqlAlchemyUnitOfWork(session), session
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_on_success():
+    # setup: build unit of work over a mocked session
+    uow, session = make_uow()
+
+    # action: exit the block without errors
+    async with uow:
+        pass
+
+    # check: transaction is committed once
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error():
+    # setup: build unit of work over a mocked session
+    uow, session = make_uow()
+
+    # action: raise inside the block
+    with pytest.raises(RuntimeError):
+        async with uow:
+            raise RuntimeError("boom")
+
+    # check: transaction is rolled back and not committed
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_nested_unit_of_work_commits_only_outermost():
+    # setup: build unit of work over a mocked session
+    uow, session = make_uow()
+
+    # action: enter the unit of work twice
+    async with uow:
+        async with uow:
+            pass
+        # check: inner block does not commit
+        session.commit.assert_not_awaited()
+
+    # check: outer block commits once
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_runs_commit_hooks_after_outer_commit():
+    # setup: a hook registered inside a nested block
+    uow, session = make_uow()
+    hook = AsyncMock()
+
+    # action
+    async with uow:
+        async with uow:
+            uow.add_commit_hook(hook)
+        hook.assert_not_awaited()
+
+    # check: runs once, after the commit
+    session.commit.assert_awaited_once()
+    hook.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_drops_commit_hooks_on_rollback():
+    # setup
+    uow, session = make_uow()
+    hook = AsyncMock()
+
+    # action: the block fails, then a later transaction commits
+    with pytest.raises(RuntimeError):
+        async with uow:
+            uow.add_commit_hook(hook)
+            raise RuntimeError("boom")
+    async with uow:
+        pass
+
+    # check
+    hook.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_savepoint_failure_keeps_outer_transaction():
+    # setup: a savepoint over a mocked nested transaction
+    uow, session = make_uow()
+    savepoint = MagicMock()
+    savepoint.__aenter__ = AsyncMock(return_value=savepoint)
+    savepoint.__aexit__ = AsyncMock(return_value=False)
+    session.begin_nested = MagicMock(return_value=savepoint)
+    kept_hook = AsyncMock()
+    dropped_hook = AsyncMock()
+
+    # action: the savepoint block fails, the outer block goes on
+    async with uow:
+        uow.add_commit_hook(kept_hook)
+        with pytest.raises(RuntimeError):
+            async with uow.savepoint():
+                uow.add_commit_hook(dropped_hook)
+                raise RuntimeError("boom")
+
+    # check: only the savepoint is undone, the outer transaction commits
+    assert savepoint.__aexit__.await_args.args[0] is RuntimeError
+    session.rollback.assert_not_awaited()
+    session.commit.assert_awaited_once()
+    kept_hook.assert_awaited_once()
+    dropped_hook.assert_not_awaited()
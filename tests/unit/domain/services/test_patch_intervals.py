@@ -0,0 +1,65 @@
+from brain.domain.services.diffs import apply_patch_exact, get_patches_str
+from brain.domain.services.wikilinks import (
+    extract_link_intervals,
+    update_link_intervals,
+)
+from brain.domain.value_objects import TextEdit
+
+
+def test_apply_patch_exact_returns_edits_in_original_coordinates():
+    # setup: two separate edits in one patch
+    old_text = "alpha beta gamma delta"
+    new_text = "alpha BETA gamma delta!"
+    patch_text = get_patches_str(old_text, new_text)
+
+    # action: apply the patch
+    result = apply_patch_exact(old_text, patch_text)
+
+    # check: text matches and edits point into the old text
+    assert result is not None
+    text, edits = result
+    assert text == new_text
+    assert edits == [TextEdit(6, 10, "BETA"), TextEdit(22, 22, "!")]
+
+
+def test_apply_patch_exact_rejects_moved_hunks():
+    # setup: patch made against a different base text
+    patch_text = get_patches_str("Hello world", "Hello there")
+
+    # action: apply it to text where the context moved
+    result = apply_patch_exact("Oh. Hello world", patch_text)
+
+    # check: caller has to fall back to fuzzy application
+    assert result is None
+
+
+def test_update_link_intervals_reparses_only_touched_lines():
+    # setup: edit replaces the link target on the second line
+    old_text = "[[Keep]]\nsee [[Old]] here\n[[Tail]]"
+    new_text = "[[Keep]]\nsee [[Newer]] here\n[[Tail]]"
+    _, edits = apply_patch_exact(old_text, get_patches_str(old_text, new_text))
+
+    # action: maintain intervals from the edits
+    intervals, targets_changed = update_link_intervals(
+        old_text, new_text, extract_link_intervals(old_text), edits
+    )
+
+    # check: intervals match a full rescan and the target change is detected
+    assert intervals == extract_link_intervals(new_text)
+    assert targets_changed is True
+
+
+def test_update_link_intervals_ignores_alias_only_edits():
+    # setup: only the alias of a link changes
+    old_text = "see [[Target|one]]"
+    new_text = "see [[Target|two]]"
+    _, edits = apply_patch_exact(old_text, get_patches_str(old_text, new_text))
+
+    # action: maintain intervals from the edits
+    intervals, targets_changed = update_link_intervals(
+        old_text, new_text, extract_link_intervals(old_text), edits
+    )
+
+    # check: the linked note is the same
+    assert intervals == extract_link_intervals(new_text)
+    assert targets_changed is False
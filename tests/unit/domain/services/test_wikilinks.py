@@ -0,0 +1,36 @@
+from brain.domain.services.wikilinks import extract_link_context
+
+
+def test_extract_link_context_returns_the_line_of_the_link():
+    # setup
+    text = "First line\nSee [[Target|alias]] here\nLast line"
+
+    # action
+    snippet = extract_link_context(text, "Target")
+
+    # check
+    assert snippet == "See [[Target|alias]] here"
+
+
+def test_extract_link_context_cuts_long_lines_at_words():
+    # setup
+    text = " ".join(["before"] * 20) + " [[Target]] " + " ".join(["after"] * 20)
+
+    # action
+    snippet = extract_link_context(text, "Target", radius=20)
+
+    # check
+    assert snippet == "…before before [[Target]] after after after…"
+
+
+def test_extract_link_context_skips_other_targets():
+    # setup
+    text = "[[Other]] and [[ Target ]]"
+
+    # action
+    snippet = extract_link_context(text, "Target")
+    missing = extract_link_context(text, "Missing")
+
+    # check
+    assert snippet == "[[Other]] and [[ Target ]]"
+    assert missing == ""
@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.interactors.graph.get_graph import GetGraphInteractor
+from brain.config.models import GraphConfig
+from brain.domain.entities.graph import GraphData, GraphNode
+
+
+def make_interactor(version: int | None = 1, cached: GraphData | None = None):
+    graph_repo = AsyncMock()
+    graph_repo.get_graph.side_effect = lambda **kwargs: GraphData(nodes=[], connections=[])
+    graph_index = MagicMock()
+    graph_index.get_version = AsyncMock(return_value=version)
+    graph_index.get_graph.side_effect = lambda *args: GraphData(nodes=[], connections=[])
+    graph_cache = AsyncMock()
+    graph_cache.get.return_value = cached
+    interactor = GetGraphInteractor(
+        notes_graph_repo=graph_repo,
+        note_links_repo=AsyncMock(),
+        graph_index=graph_index,
+        graph_cache=graph_cache,
+        graph_config=GraphConfig(max_depth=3, max_nodes=100),
+    )
+    return interactor, graph_repo, graph_index, graph_cache
+
+
+@pytest.mark.asyncio
+async def test_get_graph_caps_depth_and_marks_result_truncated():
+    # setup
+    interactor, _, graph_index, graph_cache = make_interactor()
+    user_id = uuid4()
+
+    # action
+    result = await interactor.get_graph(user_id=user_id, query="alpha", depth=50)
+
+    # check: the cached graph is the one for the capped depth
+    graph_index.get_graph.assert_called_once_with(user_id, 1, "alpha", 3, 100)
+    graph_cache.set.assert_awaited_once_with(user_id, 1, "alpha", 3, result.graph)
+    assert result.graph.truncated is True
+    assert result.version == 1
+
+
+@pytest.mark.asyncio
+async def test_get_graph_within_caps_is_not_truncated():
+    # setup
+    interactor, _, _, _ = make_interactor()
+
+    # action
+    result = await interactor.get_graph(user_id=uuid4(), query="alpha", depth=3)
+
+    # check
+    assert result.graph.truncated is False
+
+
+@pytest.mark.asyncio
+async def test_get_graph_passes_caps_to_repository_without_redis():
+    # setup
+    interactor, graph_repo, _, graph_cache = make_interactor(version=None)
+    user_id = uuid4()
+
+    # action
+    result = await interactor.get_graph(user_id=user_id, query="alpha", depth=7)
+
+    # check
+    graph_repo.get_graph.assert_awaited_once_with(
+        user_id=user_id,
+        query="alpha",
+        depth=3,
+        max_nodes=100,
+    )
+    graph_cache.get.assert_not_awaited()
+    assert result.graph.truncated is True
+    assert result.version is None
+
+
+@pytest.mark.asyncio
+async def test_get_graph_skips_everything_for_known_version():
+    # setup
+    interactor, graph_repo, graph_index, graph_cache = make_interactor(version=5)
+
+    # action
+    result = await interactor.get_graph(user_id=uuid4(), known_version=5)
+
+    # check
+    assert result.graph is None
+    assert result.version == 5
+    graph_cache.get.assert_not_awaited()
+    graph_index.get_graph.assert_not_called()
+    graph_repo.get_graph.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_graph_serves_cached_graph_without_walking():
+    # setup
+    cached = GraphData(nodes=[GraphNode(id="note:1", title="Alpha", kind="note")], connections=[])
+    interactor, _, graph_index, graph_cache = make_interactor(version=5, cached=cached)
+
+    # action: a stale ETag does not match the current version
+    result = await interactor.get_graph(user_id=uuid4(), known_version=4)
+
+    # check
+    assert result.graph == cached
+    assert result.version == 5
+    graph_index.get_graph.assert_not_called()
+    graph_cache.set.assert_not_awaited()
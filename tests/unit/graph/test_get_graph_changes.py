@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.caches.models import GraphChangeLog
+from brain.application.interactors.graph.get_graph_changes import GetGraphChangesInteractor
+from brain.domain.entities.graph import GraphData, GraphDelta
+
+EMPTY_DELTA = GraphDelta(
+    added_nodes=[],
+    removed_node_ids=[],
+    added_connections=[],
+    removed_connections=[],
+)
+
+
+def make_interactor(log: GraphChangeLog | None):
+    graph_repo = AsyncMock()
+    graph_repo.get_graph.return_value = GraphData(nodes=[], connections=[])
+    graph_index = MagicMock()
+    graph_index.get_change_log = AsyncMock(return_value=log)
+    interactor = GetGraphChangesInteractor(
+        notes_graph_repo=graph_repo,
+        note_links_repo=AsyncMock(),
+        graph_index=graph_index,
+    )
+    return interactor, graph_repo, graph_index
+
+
+@pytest.mark.asyncio
+async def test_get_changes_loads_graph_for_delta():
+    # setup: the logged version is not in memory yet
+    interactor, graph_repo, graph_index = make_interactor(GraphChangeLog(version=4, changes=[]))
+    graph_index.get_delta.side_effect = [None, EMPTY_DELTA]
+    user_id = uuid4()
+
+    # action
+    changes = await interactor.get_changes(user_id=user_id, since=3)
+
+    # check
+    graph_index.load.assert_called_once()
+    assert changes.version == 4
+    assert changes.delta == EMPTY_DELTA
+    assert changes.snapshot is None
+    graph_repo.get_graph.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_changes_falls_back_to_snapshot_when_log_is_truncated():
+    # setup
+    interactor, _, graph_index = make_interactor(GraphChangeLog(version=9, changes=None))
+    snapshot = GraphData(nodes=[], connections=[])
+    graph_index.get_graph.return_value = snapshot
+    user_id = uuid4()
+
+    # action
+    changes = await interactor.get_changes(user_id=user_id, since=1)
+
+    # check
+    graph_index.get_graph.assert_called_once_with(user_id, 9)
+    graph_index.get_delta.assert_not_called()
+    assert changes.version == 9
+    assert changes.delta is None
+    assert changes.snapshot is snapshot
+
+
+@pytest.mark.asyncio
+async def test_get_changes_reads_graph_backend_without_redis():
+    # setup
+    interactor, graph_repo, _ = make_interactor(None)
+    user_id = uuid4()
+
+    # action
+    changes = await interactor.get_changes(user_id=user_id, since=1)
+
+    # check
+    graph_repo.get_graph.assert_awaited_once_with(user_id=user_id)
+    assert changes.version is None
+    assert changes.snapshot == GraphData(nodes=[], connections=[])
@@ -0,0 +1,256 @@
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.exc import DBAPIError
+
+from brain.application.interactors.graph.process_sync_outbox import (
+    ProcessGraphSyncOutboxInteractor,
+)
+from brain.config.models import GraphSyncConfig
+from brain.domain.entities.graph_sync import GraphSyncEvent
+from brain.domain.entities.note import Note
+
+
+def make_interactor(
+    events: list[GraphSyncEvent],
+    notes: dict,
+    related_notes_service: AsyncMock | None = None,
+):
+    outbox_repo = AsyncMock()
+    outbox_repo.claim_pending = AsyncMock(return_value=events)
+    notes_repo = AsyncMock()
+    notes_repo.get_by_id = AsyncMock(side_effect=lambda note_id: notes.get(note_id))
+    graph_repo = AsyncMock()
+    keyword_sync_service = AsyncMock()
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    uow.savepoint = MagicMock(side_effect=nullcontext)
+    interactor = ProcessGraphSyncOutboxInteractor(
+        outbox_repo=outbox_repo,
+        notes_repo=notes_repo,
+        notes_graph_repo=graph_repo,
+        keyword_sync_service=keyword_sync_service,
+        related_notes_service=related_notes_service or AsyncMock(),
+        graph_sync_config=GraphSyncConfig(coalesce_window_seconds=2),
+        suggestion_index=AsyncMock(),
+        uow=uow,
+    )
+    return interactor, outbox_repo, graph_repo, keyword_sync_service
+
+
+def make_note(text: str | None = None) -> Note:
+    return Note(
+        id=uuid4(),
+        user_id=uuid4(),
+        title="Source",
+        text=text,
+        represents_keyword_id=uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_rebuilds_connections_from_current_note():
+    # setup: pending event for a note that links to another note
+    note = make_note("See [[Target]]")
+    event = GraphSyncEvent(
+        id=uuid4(),
+        note_id=note.id,
+        user_id=note.user_id,
+        previous_title="Old",
+    )
+    interactor, outbox_repo, graph_repo, _ = make_interactor([event], {note.id: note})
+
+    # action: process the outbox
+    processed = await interactor.process()
+
+    # check: graph synced from current text and event marked processed
+    assert processed == 1
+    graph_repo.sync_connections.assert_awaited_once_with(
+        note,
+        ["Target"],
+        previous_title="Old",
+        previous_represents_keyword_id=None,
+    )
+    outbox_repo.mark_processed.assert_any_await([event.id])
+
+
+@pytest.mark.asyncio
+async def test_process_only_upserts_node_when_links_unchanged():
+    # setup: pending event without link changes
+    note = make_note("plain")
+    event = GraphSyncEvent(
+        id=uuid4(),
+        note_id=note.id,
+        user_id=note.user_id,
+        links_changed=False,
+    )
+    interactor, _, graph_repo, keyword_sync_service = make_interactor([event], {note.id: note})
+
+    # action: process the outbox
+    await interactor.process()
+
+    # check: only node properties are written
+    graph_repo.upsert_note.assert_awaited_once_with(note)
+    graph_repo.sync_connections.assert_not_awaited()
+    keyword_sync_service.sync.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_deletes_node_for_missing_note():
+    # setup: pending event for a note that no longer exists
+    note_id = uuid4()
+    event = GraphSyncEvent(id=uuid4(), note_id=note_id, user_id=uuid4())
+    interactor, outbox_repo, graph_repo, _ = make_interactor([event], {})
+
+    # action: process the outbox
+    await interactor.process()
+
+    # check: node is removed from the graph
+    graph_repo.delete_note.assert_awaited_once_with(note_id)
+    outbox_repo.mark_processed.assert_any_await([event.id])
+
+
+@pytest.mark.asyncio
+async def test_process_keeps_failed_event_pending():
+    # setup: graph write fails for the only event
+    note = make_note("See [[Target]]")
+    event = GraphSyncEvent(id=uuid4(), note_id=note.id, user_id=note.user_id)
+    interactor, outbox_repo, graph_repo, _ = make_interactor([event], {note.id: note})
+    graph_repo.sync_connections.side_effect = RuntimeError("neo4j down")
+
+    # action: process the outbox
+    processed = await interactor.process()
+
+    # check: attempt is recorded and event is not marked processed
+    assert processed == 0
+    outbox_repo.increment_attempts.assert_awaited_once_with([event.id])
+    outbox_repo.mark_processed.assert_any_await([])
+
+
+@pytest.mark.asyncio
+async def test_process_db_error_does_not_block_other_notes():
+    # setup: keyword sync of the first note hits a database error
+    broken = make_note("See [[Target]]")
+    healthy = make_note("See [[Other]]")
+    broken_event = GraphSyncEvent(id=uuid4(), note_id=broken.id, user_id=broken.user_id)
+    healthy_event = GraphSyncEvent(
+        id=uuid4(), note_id=healthy.id, user_id=healthy.user_id
+    )
+    interactor, outbox_repo, graph_repo, keyword_sync_service = make_interactor(
+        [broken_event, healthy_event],
+        {broken.id: broken, healthy.id: healthy},
+    )
+    error = DBAPIError("INSERT INTO keywords", {}, Exception("deadlock detected"))
+    keyword_sync_service.sync.side_effect = [error, []]
+
+    # action: process the outbox
+    processed = await interactor.process()
+
+    # check: only the failed note is retried, the other one is marked processed
+    assert processed == 1
+    outbox_repo.increment_attempts.assert_awaited_once_with([broken_event.id])
+    outbox_repo.mark_processed.assert_any_await([healthy_event.id])
+    graph_repo.sync_connections.assert_awaited_once_with(
+        healthy,
+        ["Other"],
+        previous_title=None,
+        previous_represents_keyword_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_collapses_events_of_the_same_note():
+    # setup: a burst of edits, only the middle one touching links
+    note = make_note("See [[Target]]")
+    events = [
+        GraphSyncEvent(
+            id=uuid4(),
+            note_id=note.id,
+            user_id=note.user_id,
+            links_changed=links_changed,
+            previous_title=previous_title,
+        )
+        for links_changed, previous_title in [
+            (False, "First"),
+            (True, "Second"),
+            (False, "Third"),
+        ]
+    ]
+    interactor, outbox_repo, graph_repo, keyword_sync_service = make_interactor(
+        events, {note.id: note}
+    )
+
+    # action: process the outbox
+    processed = await interactor.process()
+
+    # check: one keyword and graph sync using the earliest previous state
+    assert processed == 3
+    keyword_sync_service.sync.assert_awaited_once_with(note)
+    graph_repo.sync_connections.assert_awaited_once_with(
+        note,
+        ["Target"],
+        previous_title="First",
+        previous_represents_keyword_id=None,
+    )
+    outbox_repo.mark_processed.assert_any_await([events[2].id])
+    outbox_repo.mark_processed.assert_any_await(
+        [events[0].id, events[1].id], coalesced=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_claims_only_notes_past_the_window():
+    # setup: nothing pending
+    interactor, outbox_repo, _, _ = make_interactor([], {})
+
+    # action: process the outbox
+    before = datetime.utcnow()
+    await interactor.process()
+    after = datetime.utcnow()
+
+    # check: events younger than the window are left for a later run
+    ready_before = outbox_repo.claim_pending.call_args.kwargs["ready_before"]
+    window = timedelta(seconds=2)
+    assert before - window <= ready_before <= after - window
+
+
+@pytest.mark.asyncio
+async def test_process_refreshes_related_notes_per_user():
+    # setup: an edited note and a deleted one of the same user
+    note = make_note("plain")
+    deleted_id = uuid4()
+    events = [
+        GraphSyncEvent(id=uuid4(), note_id=note.id, user_id=note.user_id, links_changed=False),
+        GraphSyncEvent(id=uuid4(), note_id=deleted_id, user_id=note.user_id),
+    ]
+    related_notes_service = AsyncMock()
+    interactor, _, _, _ = make_interactor(events, {note.id: note}, related_notes_service)
+
+    # action: process the outbox
+    await interactor.process()
+
+    # check: one refresh with the current note and the deleted id
+    related_notes_service.refresh.assert_awaited_once_with(note.user_id, [note], [deleted_id])
+
+
+@pytest.mark.asyncio
+async def test_process_drops_related_notes_index_when_refresh_fails():
+    # setup: vectors cannot be written
+    note = make_note("plain")
+    event = GraphSyncEvent(id=uuid4(), note_id=note.id, user_id=note.user_id)
+    related_notes_service = AsyncMock()
+    related_notes_service.refresh.side_effect = OSError("disk full")
+    interactor, outbox_repo, _, _ = make_interactor([event], {note.id: note}, related_notes_service)
+
+    # action: process the outbox
+    processed = await interactor.process()
+
+    # check: graph sync still counts, the index is dropped for a later rebuild
+    assert processed == 1
+    outbox_repo.mark_processed.assert_any_await([event.id])
+    related_notes_service.drop.assert_awaited_once_with(note.user_id)
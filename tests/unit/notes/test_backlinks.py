@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import BacklinkSource
+from brain.application.interactors.notes.dto import GetBacklinks
+from brain.application.interactors.notes.get_backlinks import GetBacklinksInteractor
+
+
+def make_sources(count: int) -> list[BacklinkSource]:
+    return [
+        BacklinkSource(
+            note_id=uuid4(),
+            title=f"Source {index}",
+            text="[[Target]]",
+            target_title="Target",
+            updated_at=datetime(2024, 1, 1),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_backlinks_returns_cursor_when_more_rows_exist():
+    # setup: the repository has one row more than requested
+    sources = make_sources(3)
+    note_links_repo = AsyncMock()
+    note_links_repo.get_backlinks.return_value = sources
+    interactor = GetBacklinksInteractor(note_links_repo=note_links_repo)
+    data = GetBacklinks(user_id=uuid4(), note_id=uuid4(), limit=2)
+
+    # action
+    page = await interactor.get_backlinks(data)
+
+    # check: the extra row is dropped and marks the next page
+    note_links_repo.get_backlinks.assert_awaited_once_with(
+        user_id=data.user_id,
+        note_id=data.note_id,
+        limit=3,
+        after=None,
+    )
+    assert [item.note_id for item in page.items] == [source.note_id for source in sources[:2]]
+    assert page.next_cursor == sources[1].note_id
+
+
+@pytest.mark.asyncio
+async def test_get_backlinks_last_page_has_no_cursor():
+    # setup
+    sources = make_sources(2)
+    note_links_repo = AsyncMock()
+    note_links_repo.get_backlinks.return_value = sources
+    interactor = GetBacklinksInteractor(note_links_repo=note_links_repo)
+
+    # action
+    page = await interactor.get_backlinks(
+        GetBacklinks(user_id=uuid4(), note_id=uuid4(), limit=2, cursor=uuid4())
+    )
+
+    # check
+    assert [item.note_id for item in page.items] == [source.note_id for source in sources]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_backlinks_cuts_snippet_around_the_link():
+    # setup: a linking note with several lines of text
+    source = BacklinkSource(
+        note_id=uuid4(),
+        title="Source",
+        text="first line\nsee [[Target|the target]] here\nlast line",
+        target_title="Target",
+        updated_at=datetime(2024, 1, 1),
+    )
+    note_links_repo = AsyncMock()
+    note_links_repo.get_backlinks.return_value = [source]
+    interactor = GetBacklinksInteractor(note_links_repo=note_links_repo)
+
+    # action
+    page = await interactor.get_backlinks(
+        GetBacklinks(user_id=uuid4(), note_id=uuid4(), limit=2)
+    )
+
+    # check: only the line with the link is kept
+    [backlink] = page.items
+    assert backlink.title == "Source"
+    assert backlink.snippet == "see [[Target|the target]] here"
+    assert backlink.updated_at == source.updated_at
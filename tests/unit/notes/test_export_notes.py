@@ -30,13 +30,17 @@ async def test_export_notes():
         text="Content",
         represents_keyword_id=None
     )
-    mock_notes_repo.get_by_user_telegram_id.return_value = [note]
+    async def stream_notes(user_id):
+        yield note
+
+    mock_notes_repo.stream_by_user_id = stream_notes
     
     # Execute
-    zip_bytes = await interactor.export_notes(user_id)
+    chunks = await interactor.export_notes(user_id)
+    zip_bytes = b"".join([chunk async for chunk in chunks])
     
     # Verify
-    assert zip_bytes is not None
+    assert zip_bytes
 
     
     with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
@@ -47,4 +51,39 @@ async def test_export_notes():
             data = json.load(f)
             assert data["title"] == note_title
             assert data["text"] == "Content"
-            assert data["id"] == str(note_id)
\ No newline at end of file
+            assert data["id"] == str(note_id)
+
+
+@pytest.mark.asyncio
+async def test_export_notes_streams_one_chunk_per_note():
+    # setup: several notes coming from the repository cursor
+    mock_user_interactor = AsyncMock()
+    mock_notes_repo = AsyncMock()
+    interactor = ExportNotesInteractor(mock_user_interactor, mock_notes_repo)
+    mock_user = Mock(id=uuid4(), telegram_id=123)
+    mock_user_interactor.get_user_by_telegram_id.return_value = mock_user
+    notes = [
+        Note(
+            id=uuid4(),
+            user_id=mock_user.id,
+            title=f"Note {index}",
+            text="Content " * 100,
+            represents_keyword_id=uuid4(),
+        )
+        for index in range(3)
+    ]
+
+    async def stream_notes(user_id):
+        for note in notes:
+            yield note
+
+    mock_notes_repo.stream_by_user_id = stream_notes
+
+    # action: consume export stream
+    chunks = [chunk async for chunk in await interactor.export_notes(123)]
+
+    # check: entries are emitted incrementally and form a valid archive
+    assert len(chunks) == len(notes) + 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.namelist() == ["Note 0.json", "Note 1.json", "Note 2.json"]
+        assert zf.testzip() is None
@@ -2,93 +2,131 @@ import pytest
 import json
 import zipfile
 import io
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from brain.application.interactors.notes.import_notes import ImportNotesInteractor
-from brain.application.interactors.notes.exceptions import NoteTitleAlreadyExistsException
 from uuid import uuid4
 
 
+def make_zip(files: dict[str, str]) -> bytes:
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return zip_buffer.getvalue()
+
+
+def make_interactor(existing_titles: set[str]):
+    user = Mock(id=uuid4(), telegram_id=123)
+    user_interactor = AsyncMock()
+    user_interactor.get_user_by_telegram_id.return_value = user
+
+    notes_repo = AsyncMock()
+    notes_repo.get_existing_titles.return_value = set(existing_titles)
+
+    keywords_repo = AsyncMock()
+    keywords_repo.ensure_keyword_ids.side_effect = (
+        lambda user_id, names: {name: uuid4() for name in names}
+    )
+
+    graph_repo = AsyncMock()
+    note_links_repo = AsyncMock()
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+
+    interactor = ImportNotesInteractor(
+        get_user_interactor=user_interactor,
+        notes_repo=notes_repo,
+        keywords_repo=keywords_repo,
+        notes_graph_repo=graph_repo,
+        note_links_repo=note_links_repo,
+        graph_index=AsyncMock(),
+        suggestion_index=AsyncMock(),
+        uow=uow,
+    )
+    return interactor, user, notes_repo, keywords_repo, graph_repo, uow
+
+
 @pytest.mark.asyncio
 async def test_import_notes():
-    # Setup
-    user_id = 123
-    mock_user_interactor = AsyncMock()
-    mock_notes_repo = AsyncMock()
-    mock_graph_repo = AsyncMock()
-    mock_keyword_service = AsyncMock()
-    mock_title_service = AsyncMock()
-    mock_sync_service = AsyncMock()
-    
-    interactor = ImportNotesInteractor(
-        mock_user_interactor,
-        mock_notes_repo,
-        mock_graph_repo,
-        mock_keyword_service,
-        mock_title_service,
-        mock_sync_service
+    # setup: archive with one note linking to another keyword
+    interactor, user, notes_repo, keywords_repo, graph_repo, uow = make_interactor(
+        existing_titles=set(),
     )
-    
-    mock_user = Mock(id=uuid4(), telegram_id=user_id)
-    mock_user_interactor.get_user_by_telegram_id.return_value = mock_user
-    
-    # Create valid zip
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w") as zf:
-        note_data = {
+    zip_bytes = make_zip({
+        "Imported Note.json": json.dumps({
             "title": "Imported Note",
-            "text": "Imported Content",
-        }
-        zf.writestr("Imported Note.json", json.dumps(note_data))
-    
-    zip_bytes = zip_buffer.getvalue()
-    
-    # Mock behavior
-    mock_keyword_service.ensure_keyword_for_title.return_value = uuid4()
-    
-    # Execute
-    await interactor.import_notes(user_id, zip_bytes)
-    
-    # Verify
-    mock_title_service.ensure_unique_title.assert_called_with(mock_user.id, "Imported Note")
-    mock_notes_repo.create.assert_called_once()
-    saved_note = mock_notes_repo.create.call_args[0][0]
-    assert saved_note.title == "Imported Note"
-    assert saved_note.text == "Imported Content"
-    mock_graph_repo.upsert_note.assert_called_once_with(saved_note)
-    mock_sync_service.sync.assert_called_once_with(saved_note)
+            "text": "Imported [[Content]]",
+        }),
+    })
+
+    # action: import archive
+    result = await interactor.import_notes(user.telegram_id, zip_bytes)
+
+    # check: note, keywords and links are written in one bulk pass
+    assert result.imported == 1
+    assert result.skipped == 0
+    notes_repo.get_existing_titles.assert_called_once_with(
+        user_id=user.id,
+        titles=["Imported Note"],
+    )
+    notes_repo.create_many.assert_called_once()
+    saved_notes = notes_repo.create_many.call_args[0][0]
+    assert [note.title for note in saved_notes] == ["Imported Note"]
+    assert saved_notes[0].text == "Imported [[Content]]"
+
+    saved_links = keywords_repo.create_note_keywords.call_args[0][0]
+    assert [link.note_id for link in saved_links] == [saved_notes[0].id]
+
+    graph_repo.upsert_notes_bulk.assert_called_once_with(
+        saved_notes,
+        {saved_notes[0].id: ["Content"]},
+    )
+    interactor._note_links_repo.replace_links.assert_awaited_once_with(
+        user_id=user.id,
+        links={saved_notes[0].id: ["Content"]},
+    )
+    uow.__aexit__.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_import_skip_existing():
-    # Setup
-    user_id = 123
-    mock_user_interactor = AsyncMock()
-    mock_notes_repo = AsyncMock()
-    mock_graph_repo = AsyncMock()
-    mock_keyword_service = AsyncMock()
-    mock_title_service = AsyncMock()
-    mock_sync_service = AsyncMock()
-    
-    interactor = ImportNotesInteractor(
-        mock_user_interactor,
-        mock_notes_repo,
-        mock_graph_repo,
-        mock_keyword_service,
-        mock_title_service,
-        mock_sync_service
+    # setup: one title already exists, another is duplicated inside the archive
+    interactor, user, notes_repo, _, graph_repo, _ = make_interactor(
+        existing_titles={"Existing"},
     )
-    
-    mock_user = Mock(id=uuid4(), telegram_id=user_id)
-    mock_user_interactor.get_user_by_telegram_id.return_value = mock_user
-    
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w") as zf:
-        zf.writestr("Existing.json", json.dumps({"title": "Existing", "text": "Content"}))
-    
-    mock_title_service.ensure_unique_title.side_effect = NoteTitleAlreadyExistsException()
-    
-    # Execute
-    await interactor.import_notes(user_id, zip_buffer.getvalue())
-    
-    # Verify
-    mock_notes_repo.create.assert_not_called()
+    zip_bytes = make_zip({
+        "Existing.json": json.dumps({"title": "Existing", "text": "Content"}),
+        "Fresh.json": json.dumps({"title": "Fresh", "text": "First"}),
+        "Fresh copy.json": json.dumps({"title": "Fresh", "text": "Second"}),
+        "broken.json": "{not json",
+    })
+
+    # action: import archive
+    result = await interactor.import_notes(user.telegram_id, zip_bytes)
+
+    # check: only the first unique new note is imported
+    assert result.imported == 1
+    assert result.skipped == 3
+    saved_notes = notes_repo.create_many.call_args[0][0]
+    assert [(note.title, note.text) for note in saved_notes] == [("Fresh", "First")]
+
+
+@pytest.mark.asyncio
+async def test_import_nothing_new_skips_writes():
+    # setup: archive where every note already exists
+    interactor, user, notes_repo, _, graph_repo, _ = make_interactor(
+        existing_titles={"Existing"},
+    )
+    zip_bytes = make_zip({
+        "Existing.json": json.dumps({"title": "Existing", "text": "Content"}),
+    })
+
+    # action: import archive
+    result = await interactor.import_notes(user.telegram_id, zip_bytes)
+
+    # check: nothing is written
+    assert result.imported == 0
+    assert result.skipped == 1
+    notes_repo.create_many.assert_not_called()
+    graph_repo.upsert_notes_bulk.assert_not_called()
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import (
+    NoteCursor,
+    NoteListFields,
+    NoteListItem,
+    NoteListOrder,
+)
+from brain.application.interactors.notes.dto import ListNotes
+from brain.application.interactors.notes.list_notes import ListNotesInteractor
+
+
+class DummyNotesRepository:
+    def __init__(self, items: list[NoteListItem]):
+        self._items = items
+        self.calls: list[dict] = []
+
+    async def get_page(self, **kwargs) -> list[NoteListItem]:
+        self.calls.append(kwargs)
+        items = self._items
+        after = kwargs["after"]
+        if after:
+            items = [
+                item for item in items
+                if (item.updated_at, item.id) < (after.sort_value, after.note_id)
+            ]
+        limit = kwargs["limit"]
+        return items[:limit] if limit is not None else items
+
+
+def _make_items(count: int) -> list[NoteListItem]:
+    start = datetime(2024, 1, 1)
+    items = [
+        NoteListItem(
+            id=uuid4(),
+            title=f"Note {index}",
+            text=None,
+            created_at=start + timedelta(hours=index),
+            updated_at=start + timedelta(hours=index),
+        )
+        for index in range(count)
+    ]
+    return sorted(items, key=lambda item: (item.updated_at, item.id), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_list_notes_returns_cursor_only_when_more_rows():
+    # setup
+    items = _make_items(3)
+    repo = DummyNotesRepository(items)
+    interactor = ListNotesInteractor(notes_repo=repo)
+    user_id = uuid4()
+
+    # action
+    first = await interactor.list_notes(ListNotes(user_id=user_id, limit=2))
+    second = await interactor.list_notes(
+        ListNotes(user_id=user_id, limit=2, cursor=first.next_cursor)
+    )
+
+    # check
+    assert first.items == items[:2]
+    assert first.next_cursor == NoteCursor(
+        sort_value=items[1].updated_at,
+        note_id=items[1].id,
+    )
+    assert second.items == items[2:]
+    assert second.next_cursor is None
+    assert repo.calls[0]["limit"] == 3
+
+
+@pytest.mark.asyncio
+async def test_list_notes_without_limit_returns_default_page():
+    # setup: more notes than fit on the default page
+    items = _make_items(25)
+    repo = DummyNotesRepository(items)
+    interactor = ListNotesInteractor(notes_repo=repo)
+
+    # action
+    page = await interactor.list_notes(
+        ListNotes(
+            user_id=uuid4(),
+            order_by=NoteListOrder.CREATED_AT,
+            fields=NoteListFields.SUMMARY,
+        )
+    )
+
+    # check: the page is bounded and points at the rest
+    assert page.items == items[:20]
+    assert page.next_cursor == NoteCursor(
+        sort_value=items[19].created_at,
+        note_id=items[19].id,
+    )
+    assert repo.calls[0]["limit"] == 21
+    assert repo.calls[0]["fields"] == NoteListFields.SUMMARY
+
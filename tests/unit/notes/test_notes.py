@@ -21,6 +21,13 @@ class DummyNotesRepository:
     ) -> int:
         return 1 if title in self._existing_titles.get(user_id, set()) else 0
 
+    async def get_first_free_title_index(self, user_id: UUID, prefix: str) -> int:
+        titles = self._existing_titles.get(user_id, set())
+        index = 1
+        while f"{prefix} {index}" in titles:
+            index += 1
+        return index
+
 
 @pytest.mark.asyncio
 async def test_create_title_autogenerates_first_free_untitled():
@@ -33,6 +40,22 @@ async def test_create_title_autogenerates_first_free_untitled():
     assert title == "Untitled 2"
 
 
+@pytest.mark.asyncio
+async def test_create_title_reuses_gap_in_untitled_sequence():
+    # setup
+    user_id = uuid4()
+    repo = DummyNotesRepository(
+        existing_titles={user_id: {"Untitled 1", "Untitled 3"}}
+    )
+    service = NoteTitleService(repo)
+
+    # action
+    title = await service.resolve_create_title(user_id=user_id, title=None)
+
+    # check
+    assert title == "Untitled 2"
+
+
 @pytest.mark.asyncio
 async def test_update_title_requires_value():
     user_id = uuid4()
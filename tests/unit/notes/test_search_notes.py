@@ -0,0 +1,79 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from brain.application.abstractions.repositories.models import (
+    NoteSearchCursor,
+    NoteSearchHit,
+)
+from brain.application.interactors.notes.dto import SearchNotes
+from brain.application.interactors.notes.search_notes import SearchNotesInteractor
+
+
+class DummyNotesRepository:
+    def __init__(self, hits: list[NoteSearchHit]):
+        self._hits = hits
+        self.calls: list[dict] = []
+
+    async def search_text(self, **kwargs) -> list[NoteSearchHit]:
+        self.calls.append(kwargs)
+        hits = self._hits
+        after = kwargs["after"]
+        if after:
+            hits = [
+                hit for hit in hits
+                if (hit.rank, hit.id) < (after.rank, after.note_id)
+            ]
+        return hits[:kwargs["limit"]]
+
+
+def _make_hits(ranks: list[float]) -> list[NoteSearchHit]:
+    now = datetime(2024, 1, 1)
+    hits = [
+        NoteSearchHit(
+            id=uuid4(),
+            title=f"Note {index}",
+            snippet="<b>match</b>",
+            rank=rank,
+            created_at=now,
+            updated_at=now,
+        )
+        for index, rank in enumerate(ranks)
+    ]
+    return sorted(hits, key=lambda hit: (hit.rank, hit.id), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_search_notes_pages_by_rank():
+    # setup
+    hits = _make_hits([0.9, 0.5, 0.5])
+    repo = DummyNotesRepository(hits)
+    interactor = SearchNotesInteractor(notes_repo=repo)
+    user_id = uuid4()
+
+    # action
+    first = await interactor.search(SearchNotes(user_id=user_id, query="match", limit=2))
+    second = await interactor.search(
+        SearchNotes(user_id=user_id, query="match", limit=2, cursor=first.next_cursor)
+    )
+
+    # check
+    assert first.items == hits[:2]
+    assert first.next_cursor == NoteSearchCursor(rank=hits[1].rank, note_id=hits[1].id)
+    assert second.items == hits[2:]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_search_notes_skips_blank_query():
+    # setup
+    repo = DummyNotesRepository(_make_hits([1.0]))
+    interactor = SearchNotesInteractor(notes_repo=repo)
+
+    # action
+    page = await interactor.search(SearchNotes(user_id=uuid4(), query="   "))
+
+    # check
+    assert page.items == []
+    assert repo.calls == []
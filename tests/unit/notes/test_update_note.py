@@ -6,12 +6,12 @@ from brain.application.interactors.notes.update_note import UpdateNoteInteractor
 from brain.application.interactors.notes.dto import UpdateNote
 from brain.domain.entities.note import Note
 from brain.domain.value_objects import LinkInterval
+from brain.domain.services.diffs import get_patches_str
 from brain.application.abstractions.repositories.notes import INotesRepository
-from brain.application.abstractions.repositories.notes_graph import INotesGraphRepository
 from brain.application.abstractions.repositories.keywords import IKeywordsRepository
+from brain.application.abstractions.repositories.models import NoteLinks
 from brain.application.services.keyword_notes import KeywordNoteService
 from brain.application.services.note_titles import NoteTitleService
-from brain.application.services.note_keyword_sync import NoteKeywordSyncService
 
 # Mock interfaces if they are abstract classes
 # Or just use AsyncMock if they are flexible enough.
@@ -24,11 +24,23 @@ def notes_repo():
     return repo
 
 @pytest.fixture
-def notes_graph_repo():
+def graph_sync_outbox_repo():
     repo = AsyncMock()
-    repo.upsert_note = AsyncMock()
+    repo.add = AsyncMock()
     return repo
 
+@pytest.fixture
+def note_links_repo():
+    return AsyncMock()
+
+@pytest.fixture
+def graph_index():
+    return AsyncMock()
+
+@pytest.fixture
+def suggestion_index():
+    return AsyncMock()
+
 @pytest.fixture
 def keywords_repo():
     repo = AsyncMock()
@@ -48,24 +60,28 @@ def note_title_service():
     return service
 
 @pytest.fixture
-def keyword_sync_service():
-    service = AsyncMock()
-    service.sync = AsyncMock()
-    return service
+def uow():
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    return uow
 
 @pytest.fixture
-def interactor(notes_repo, notes_graph_repo, keywords_repo, keyword_note_service, note_title_service, keyword_sync_service):
+def interactor(notes_repo, keywords_repo, keyword_note_service, note_title_service, graph_sync_outbox_repo, note_links_repo, graph_index, suggestion_index, uow):
     return UpdateNoteInteractor(
         notes_repo=notes_repo,
-        notes_graph_repo=notes_graph_repo,
         keywords_repo=keywords_repo,
         keyword_note_service=keyword_note_service,
         note_title_service=note_title_service,
-        keyword_sync_service=keyword_sync_service,
+        graph_sync_outbox_repo=graph_sync_outbox_repo,
+        note_links_repo=note_links_repo,
+        graph_index=graph_index,
+        suggestion_index=suggestion_index,
+        uow=uow,
     )
 
 @pytest.mark.asyncio
-async def test_update_note_with_text_updates_full_content(interactor, notes_repo, keyword_sync_service):
+async def test_update_note_with_text_updates_full_content(interactor, notes_repo, graph_sync_outbox_repo):
     note_id = uuid4()
     original_text = "Original"
     new_text = "New content"
@@ -85,11 +101,15 @@ async def test_update_note_with_text_updates_full_content(interactor, notes_repo
     updated_note = await interactor.update_note(dto)
     
     assert updated_note.text == new_text
-    keyword_sync_service.sync.assert_called_once()
+    # Graph rebuild is queued with the previous state
+    event = graph_sync_outbox_repo.add.call_args.args[0]
+    assert event.note_id == note_id
+    assert event.links_changed is True
+    assert event.previous_title == "Title"
     assert len(updated_note.link_intervals) == 0
 
 @pytest.mark.asyncio
-async def test_update_note_with_patch_applies_correctly(interactor, notes_repo, keyword_sync_service):
+async def test_update_note_with_patch_applies_correctly(interactor, notes_repo, graph_sync_outbox_repo):
     # original: "Hello world"
     # patch: change "world" to "Friends"
     # new: "Hello Friends"
@@ -119,14 +139,12 @@ async def test_update_note_with_patch_applies_correctly(interactor, notes_repo,
     updated_note = await interactor.update_note(dto)
     
     assert updated_note.text == "Hello Friends"
-    keyword_sync_service.sync.assert_called_once() # Called because no old intervals to optimize against? Or just because default is true.
-    # note.link_intervals was empty, so diff check happened between "" and "", or skipped?
-    # Logic: if note.link_intervals and note_data.patch:
-    # Here link_intervals is empty. So optimization block SKIPPED.
-    # Should sync graph = True.
+    # The note has no links at all, so only the patched line is re-parsed
+    # and nothing link-related changed.
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is False
 
 @pytest.mark.asyncio
-async def test_update_note_optimizes_sync_when_links_untouched(interactor, notes_repo, keyword_sync_service):
+async def test_update_note_optimizes_sync_when_links_untouched(interactor, notes_repo, graph_sync_outbox_repo):
     # original: "Hello [[Link]] world"
     # interval for [[Link]]: starts at 6. Len 8? "[[Link]]".
     # text: "Hello [[Link]] world"
@@ -158,15 +176,16 @@ async def test_update_note_optimizes_sync_when_links_untouched(interactor, notes
     updated_note = await interactor.update_note(dto)
     
     assert updated_note.text == "Hello [[Link]] Environment"
-    # Optimization should trigger: sync NOT called
-    keyword_sync_service.sync.assert_not_called()
+    # Optimization should trigger: update is still queued, but only for node properties
+    event = graph_sync_outbox_repo.add.call_args.args[0]
+    assert event.links_changed is False
     
     # Intervals should be updated (re-parsed)
     # Positions might stay same if change is AFTER link.
     assert updated_note.link_intervals == [LinkInterval(6, 14)]
 
 @pytest.mark.asyncio
-async def test_update_note_syncs_when_link_modified(interactor, notes_repo, keyword_sync_service):
+async def test_update_note_syncs_when_link_modified(interactor, notes_repo, graph_sync_outbox_repo):
     # original: "Hello [[Link]] world"
     note_id = uuid4()
     original_text = "Hello [[Link]] world"
@@ -191,15 +210,15 @@ async def test_update_note_syncs_when_link_modified(interactor, notes_repo, keyw
     updated_note = await interactor.update_note(dto)
     
     assert updated_note.text == "Hello [[Zelda]] world"
-    # Optimization should FAIL -> Sync CALLED
-    keyword_sync_service.sync.assert_called_once()
+    # Optimization should FAIL -> links resynced
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is True
     
     # New interval length likely different
     # [[Zelda]] len 9.
     assert updated_note.link_intervals == [LinkInterval(6, 15)]
 
 @pytest.mark.asyncio
-async def test_update_note_syncs_when_new_link_added(interactor, notes_repo, keyword_sync_service):
+async def test_update_note_syncs_when_new_link_added(interactor, notes_repo, graph_sync_outbox_repo):
     # original: "Hello world"
     note_id = uuid4()
     original_text = "Hello world"
@@ -238,5 +257,196 @@ async def test_update_note_syncs_when_new_link_added(interactor, notes_repo, key
     
     await interactor.update_note(dto)
     
-    # Sync MUST be called because of new brackets in patch
-    keyword_sync_service.sync.assert_called_once()
+    # Links MUST be resynced because of new brackets in patch
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is True
+
+@pytest.mark.asyncio
+async def test_update_note_rename_cleans_up_previous_title_keyword(interactor, notes_repo, keywords_repo, graph_sync_outbox_repo, suggestion_index, uow):
+    # setup: the old title keyword is no longer used anywhere
+    note_id = uuid4()
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Old",
+        text="Text",
+        represents_keyword_id=uuid4(),
+        link_intervals=[]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+    keywords_repo.delete_unused_keywords.return_value = ["Old"]
+
+    dto = UpdateNote(note_id=note_id, title="New")
+
+    # action: rename the note
+    await interactor.update_note(dto)
+
+    # check: old title keyword is dropped right away, link keywords wait for the worker
+    keywords_repo.delete_unused_keywords.assert_awaited_once_with(
+        user_id=existing_note.user_id,
+        names=["Old"],
+    )
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is True
+    # Suggestions follow the rename once the transaction commits
+    hooks = [call.args[0] for call in uow.add_commit_hook.call_args_list]
+    suggestion_hooks = [hook for hook in hooks if hook.func is suggestion_index.apply_changes]
+    assert len(suggestion_hooks) == 1
+    assert suggestion_hooks[0].keywords == {
+        "user_id": existing_note.user_id,
+        "added_titles": ["New"],
+        "removed_titles": ["Old"],
+        "added_keywords": ["New"],
+        "removed_keywords": ["Old"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_note_patch_shifts_intervals_after_edit(interactor, notes_repo, graph_sync_outbox_repo):
+    # setup: grow the first line; both links move but stay the same
+    note_id = uuid4()
+    original_text = "Intro\nSee [[A]]\nAnd [[B]]"
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Title",
+        text=original_text,
+        represents_keyword_id=uuid4(),
+        link_intervals=[LinkInterval(10, 15), LinkInterval(20, 25)]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+
+    new_text = "Longer intro\nSee [[A]]\nAnd [[B]]"
+    dto = UpdateNote(note_id=note_id, patch=get_patches_str(original_text, new_text))
+
+    # action: apply the patch
+    updated_note = await interactor.update_note(dto)
+
+    # check: intervals shift with the text and links count as untouched
+    assert updated_note.text == new_text
+    assert updated_note.link_intervals == [LinkInterval(17, 22), LinkInterval(27, 32)]
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is False
+
+
+@pytest.mark.asyncio
+async def test_update_note_fuzzy_patch_falls_back_to_full_diff(interactor, notes_repo, graph_sync_outbox_repo):
+    # setup: patch was made against a slightly different base text
+    note_id = uuid4()
+    patch_text = get_patches_str("Hello [[Link]] world", "Hello [[Link]] there")
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Title",
+        text="Hi! Hello [[Link]] world",
+        represents_keyword_id=uuid4(),
+        link_intervals=[LinkInterval(10, 18)]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+
+    dto = UpdateNote(note_id=note_id, patch=patch_text)
+
+    # action: apply the patch
+    updated_note = await interactor.update_note(dto)
+
+    # check: intervals are recomputed from the full diff
+    assert updated_note.text == "Hi! Hello [[Link]] there"
+    assert updated_note.link_intervals == [LinkInterval(10, 18)]
+    assert graph_sync_outbox_repo.add.call_args.args[0].links_changed is False
+
+
+@pytest.mark.asyncio
+async def test_update_note_rename_repoints_incoming_links(interactor, notes_repo, note_links_repo):
+    # setup
+    note_id = uuid4()
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Old",
+        text="Text",
+        represents_keyword_id=uuid4(),
+        link_intervals=[]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+
+    # action: rename the note
+    await interactor.update_note(UpdateNote(note_id=note_id, title="New"))
+
+    # check: links to "Old" dangle, dangling links to "New" now point here
+    note_links_repo.unresolve_target.assert_awaited_once_with(note_id)
+    note_links_repo.resolve_targets.assert_awaited_once_with(
+        user_id=existing_note.user_id,
+        note_ids_by_title={"New": note_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_note_keeps_links_when_untouched(interactor, notes_repo, note_links_repo):
+    # setup: the patch edits text outside the link
+    note_id = uuid4()
+    original_text = "See [[Link]] here"
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Title",
+        text=original_text,
+        represents_keyword_id=uuid4(),
+        link_intervals=[LinkInterval(4, 12)]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+    patch_text = get_patches_str(original_text, "See [[Link]] there")
+
+    # action
+    await interactor.update_note(UpdateNote(note_id=note_id, patch=patch_text))
+
+    # check: stored links are left alone
+    note_links_repo.replace_links.assert_not_awaited()
+    note_links_repo.unresolve_target.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_note_rename_patches_graph_index_after_commit(interactor, notes_repo, graph_index, uow):
+    # setup
+    note_id = uuid4()
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Old",
+        text="See [[Link]]",
+        represents_keyword_id=uuid4(),
+        link_intervals=[LinkInterval(4, 12)]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+
+    # action: rename the note
+    await interactor.update_note(UpdateNote(note_id=note_id, title="New"))
+
+    # check: the index is patched by the commit hook, not before
+    graph_index.apply_changes.assert_not_awaited()
+    (hook,), _ = uow.add_commit_hook.call_args_list[0]
+    await hook()
+    graph_index.apply_changes.assert_awaited_once_with(
+        user_id=existing_note.user_id,
+        updated=[NoteLinks(note_id=note_id, title="New", targets=["Link"])],
+        previous=[NoteLinks(note_id=note_id, title="Old", targets=["Link"])],
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_note_keeps_graph_index_when_links_untouched(interactor, notes_repo, uow):
+    # setup: the patch edits text outside the link
+    note_id = uuid4()
+    original_text = "See [[Link]] here"
+    existing_note = Note(
+        id=note_id,
+        user_id=uuid4(),
+        title="Title",
+        text=original_text,
+        represents_keyword_id=uuid4(),
+        link_intervals=[LinkInterval(4, 12)]
+    )
+    notes_repo.get_by_id.return_value = existing_note
+    patch_text = get_patches_str(original_text, "See [[Link]] there")
+
+    # action
+    await interactor.update_note(UpdateNote(note_id=note_id, patch=patch_text))
+
+    # check: no index patch is scheduled
+    uow.add_commit_hook.assert_not_called()
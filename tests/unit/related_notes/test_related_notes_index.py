@@ -0,0 +1,165 @@
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from brain.config.models import RelatedNotesConfig
+from brain.domain.entities.note import Note
+from brain.infrastructure.related_notes import storage
+from brain.infrastructure.related_notes.storage import FileRelatedNotesIndex
+from brain.infrastructure.related_notes.tfidf import TfidfMatrix, term_counts
+
+
+def make_note(user_id, title: str, text: str) -> Note:
+    return Note(id=uuid4(), user_id=user_id, title=title, text=text, represents_keyword_id=uuid4())
+
+
+@pytest.fixture
+def index(tmp_path) -> FileRelatedNotesIndex:
+    return FileRelatedNotesIndex(RelatedNotesConfig(storage_dir=str(tmp_path)))
+
+
+@pytest.fixture
+def notes():
+    user_id = uuid4()
+    return [
+        make_note(user_id, "Sourdough", "Feed the starter, then bake the sourdough bread."),
+        make_note(user_id, "Rye bread", "Rye bread needs a sourdough starter too."),
+        make_note(user_id, "Gradient descent", "Learning rate and gradient steps."),
+        make_note(user_id, "Backprop", "Gradient of the loss through each layer."),
+    ]
+
+
+def test_term_counts_weight_title_words():
+    # setup
+    note = make_note(uuid4(), "Bread", "Bread and [[Rye]] 2024")
+
+    # action
+    counts = term_counts(note)
+
+    # check: numbers and one-letter tokens are dropped, brackets ignored
+    assert counts == {"bread": 3, "and": 1, "rye": 1}
+
+
+def test_weights_are_unit_length_per_note(notes):
+    # setup
+    matrix = TfidfMatrix.build(notes)
+
+    # action
+    weights = matrix.weights()
+
+    # check
+    norms = np.bincount(matrix.rows, weights=weights * weights)
+    assert norms == pytest.approx([1.0] * len(notes), rel=1e-5)
+
+
+def test_find_related_ranks_by_shared_wording(index, notes):
+    # setup
+    user_id = notes[0].user_id
+    index.rebuild(user_id, notes)
+
+    # action
+    related = index.find_related(user_id, notes[0].id, limit=3)
+
+    # check: the other bread note first, never the note itself
+    assert [item.note_id for item in related][:1] == [notes[1].id]
+    assert all(item.note_id != notes[0].id for item in related)
+    assert related == sorted(related, key=lambda item: -item.score)
+    assert 0 < related[0].score <= 1
+    assert index.find_related(user_id, uuid4(), limit=3) is None
+    assert index.find_related(uuid4(), notes[0].id, limit=3) is None
+
+
+def test_apply_changes_matches_full_rebuild(tmp_path, index, notes):
+    # setup
+    user_id = notes[0].user_id
+    index.rebuild(user_id, notes)
+    notes[2].text = "Sourdough starter feeding schedule and bread"
+    added = make_note(user_id, "Baguette", "White bread, no sourdough.")
+    rebuilt = FileRelatedNotesIndex(RelatedNotesConfig(storage_dir=str(tmp_path / "rebuilt")))
+    rebuilt.rebuild(user_id, [notes[0], notes[1], notes[2], added])
+
+    # action: one edit, one new note, one deletion
+    index.apply_changes(user_id, updated=[notes[2], added], deleted_ids=[notes[3].id])
+
+    # check: same neighbours and scores as building from scratch
+    for note in (notes[0], notes[2], added):
+        patched = index.find_related(user_id, note.id, limit=5)
+        expected = rebuilt.find_related(user_id, note.id, limit=5)
+        assert {item.note_id: item.score for item in patched} == pytest.approx(
+            {item.note_id: item.score for item in expected}
+        )
+    assert index.find_related(user_id, notes[3].id, limit=5) is None
+
+
+def test_readers_pick_up_new_generations(tmp_path, notes):
+    # setup: one process writes, another reads
+    user_id = notes[0].user_id
+    config = RelatedNotesConfig(storage_dir=str(tmp_path))
+    writer, reader = FileRelatedNotesIndex(config), FileRelatedNotesIndex(config)
+    writer.rebuild(user_id, notes)
+    before = reader.find_related(user_id, notes[0].id, limit=5)
+
+    # action
+    writer.apply_changes(user_id, deleted_ids=[notes[1].id])
+    after = reader.find_related(user_id, notes[0].id, limit=5)
+
+    # check: the reader sees the deletion, old generations are cleaned up
+    assert notes[1].id in [item.note_id for item in before]
+    assert notes[1].id not in [item.note_id for item in after]
+    generations = [path.name for path in (tmp_path / str(user_id)).iterdir() if path.is_dir()]
+    assert sorted(generations) == ["1", "2"]
+
+
+def test_drop_removes_index(index, notes):
+    # setup
+    user_id = notes[0].user_id
+    index.rebuild(user_id, notes)
+
+    # action
+    index.drop(user_id)
+
+    # check: patches are ignored until the next rebuild
+    assert not index.exists(user_id)
+    index.apply_changes(user_id, updated=notes[:1])
+    assert not index.exists(user_id)
+    assert index.find_related(user_id, notes[0].id, limit=5) is None
+
+
+def test_small_changes_link_the_base_instead_of_rewriting_it(tmp_path, index, notes):
+    # setup
+    user_id = notes[0].user_id
+    index.rebuild(user_id, notes)
+    notes[0].text = "Only the starter changed"
+
+    # action
+    index.apply_changes(user_id, updated=notes[:1])
+
+    # check: both generations share the base files, the edit is in the delta
+    first, second = tmp_path / str(user_id) / "1", tmp_path / str(user_id) / "2"
+    assert (first / "indices.npy").stat().st_ino == (second / "indices.npy").stat().st_ino
+    assert np.load(second / "removed.npy").tolist() == [0]
+    assert len(np.load(second / "delta_note_ids.npy")) == 1
+
+
+def test_compaction_matches_full_rebuild(tmp_path, monkeypatch, index, notes):
+    # setup: every change outgrows the delta
+    monkeypatch.setattr(storage, "MIN_COMPACT_CHANGES", 0)
+    user_id = notes[0].user_id
+    index.rebuild(user_id, notes)
+    notes[1].text = "Rye flour and gradient steps"
+    rebuilt = FileRelatedNotesIndex(RelatedNotesConfig(storage_dir=str(tmp_path / "rebuilt")))
+    rebuilt.rebuild(user_id, notes[1:])
+
+    # action
+    index.apply_changes(user_id, updated=[notes[1]], deleted_ids=[notes[0].id])
+
+    # check: the delta was folded into a new base
+    current = tmp_path / str(user_id) / "2"
+    assert len(np.load(current / "delta_note_ids.npy")) == 0
+    for note in notes[1:]:
+        patched = index.find_related(user_id, note.id, limit=5)
+        expected = rebuilt.find_related(user_id, note.id, limit=5)
+        assert {item.note_id: item.score for item in patched} == pytest.approx(
+            {item.note_id: item.score for item in expected}
+        )
@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from brain.application.interactors.notes.exceptions import KeywordNotFoundException
+from brain.application.services.keyword_notes import KeywordNoteService
+
+
+@pytest.mark.asyncio
+async def test_ensure_keyword_for_title_uses_single_upsert():
+    # setup: repository upsert returns the keyword id
+    user_id = uuid4()
+    keyword_id = uuid4()
+    keywords_repo = AsyncMock()
+    keywords_repo.upsert_keyword = AsyncMock(return_value=keyword_id)
+    service = KeywordNoteService(keywords_repo=keywords_repo)
+
+    # action: ensure keyword for a note title
+    result = await service.ensure_keyword_for_title(user_id=user_id, title="Topic")
+
+    # check: one upsert call, no lookups
+    assert result == keyword_id
+    keywords_repo.upsert_keyword.assert_awaited_once_with(user_id, name="Topic")
+    keywords_repo.get_by_user_and_name.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ensure_keyword_for_title_rejects_blank_title():
+    # setup: service with an untouched repository
+    keywords_repo = AsyncMock()
+    service = KeywordNoteService(keywords_repo=keywords_repo)
+
+    # action / check: blank titles cannot represent a keyword
+    with pytest.raises(KeywordNotFoundException):
+        await service.ensure_keyword_for_title(user_id=uuid4(), title="  ")
+    keywords_repo.upsert_keyword.assert_not_awaited()
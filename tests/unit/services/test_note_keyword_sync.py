@@ -0,0 +1,35 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from brain.application.services.note_keyword_sync import NoteKeywordSyncService
+from brain.domain.entities.note import Note
+
+
+@pytest.mark.asyncio
+async def test_sync_replaces_links_and_drops_removed_keywords():
+    # setup: note used to link to Old and Kept, now links to Kept and New
+    note = Note(
+        id=uuid4(),
+        user_id=uuid4(),
+        title="Source",
+        text="See [[Kept]] and [[New]]",
+        represents_keyword_id=uuid4(),
+    )
+    keywords_repo = AsyncMock()
+    keywords_repo.replace_note_keywords = AsyncMock(return_value=["Old"])
+    keywords_repo.delete_unused_keywords = AsyncMock(return_value=["Old"])
+    service = NoteKeywordSyncService(keywords_repo=keywords_repo)
+
+    # action: sync keywords for the current text
+    deleted = await service.sync(note)
+
+    # check: links are replaced and only the removed keyword is collected
+    keywords_repo.replace_note_keywords.assert_awaited_once_with(
+        note.id, note.user_id, ["Kept", "New"]
+    )
+    keywords_repo.delete_unused_keywords.assert_awaited_once_with(
+        user_id=note.user_id,
+        names=["Old"],
+    )
+    assert deleted == ["Old"]
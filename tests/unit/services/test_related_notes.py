@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from brain.application.services.related_notes import RelatedNotesService
+from brain.domain.entities.note import Note
+
+
+def make_note(user_id) -> Note:
+    return Note(id=uuid4(), user_id=user_id, title="Note", represents_keyword_id=uuid4())
+
+
+def make_service(notes: list[Note], exists: bool):
+    async def stream(user_id):
+        for note in notes:
+            yield note
+
+    notes_repo = AsyncMock()
+    notes_repo.stream_by_user_id = MagicMock(side_effect=stream)
+    index = MagicMock()
+    index.exists.return_value = exists
+    return RelatedNotesService(notes_repo=notes_repo, related_notes_index=index), index
+
+
+@pytest.mark.asyncio
+async def test_refresh_patches_existing_index():
+    # setup
+    user_id = uuid4()
+    note = make_note(user_id)
+    deleted_id = uuid4()
+    service, index = make_service([], exists=True)
+
+    # action
+    await service.refresh(user_id, [note], [deleted_id])
+
+    # check: only the changed rows are touched
+    index.apply_changes.assert_called_once_with(user_id, [note], [deleted_id])
+    index.rebuild.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_missing_index_from_all_notes():
+    # setup
+    user_id = uuid4()
+    notes = [make_note(user_id), make_note(user_id)]
+    service, index = make_service(notes, exists=False)
+
+    # action
+    await service.refresh(user_id, notes[:1], [])
+
+    # check
+    index.rebuild.assert_called_once_with(user_id, notes)
+    index.apply_changes.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exists", [True, False])
+async def test_backfill_builds_only_missing_index(exists: bool):
+    # setup
+    user_id = uuid4()
+    notes = [make_note(user_id)]
+    service, index = make_service(notes, exists=exists)
+
+    # action
+    built = await service.backfill(user_id)
+
+    # check
+    assert built is not exists
+    assert index.rebuild.call_count == (0 if exists else 1)